@@ -0,0 +1,249 @@
+#!/usr/bin/env python3
+"""
+Incremental dependency engine for BlackBox5 task coordination.
+
+Keeps, per task, the number of dependencies that are not yet resolved and
+a set of tasks that are ready to start (unresolved themselves, with every
+dependency resolved). Resolving a task only touches its direct dependents,
+so "what can start now?" is answered from the ready set instead of walking
+the graph on every poll.
+
+Adding an edge that would close a cycle raises DependencyCycleError.
+"""
+
+from typing import Dict, Iterable, List, Optional, Set
+
+
+class DependencyCycleError(ValueError):
+    """Raised when adding a dependency would create a cycle."""
+
+    def __init__(self, cycle: List[str]):
+        self.cycle = cycle
+        super().__init__(f"Dependency cycle: {' -> '.join(cycle)}")
+
+
+class DependencyEngine:
+    """
+    Dependency graph with incrementally maintained readiness.
+
+    A dependency that is not a known task counts as unresolved, so tasks
+    waiting on missing work are never reported ready.
+
+    Example:
+        ```python
+        engine = DependencyEngine()
+        engine.add_task("build")
+        engine.add_task("deploy", depends_on=["build"])
+        engine.ready_tasks()      # ["build"]
+        engine.resolve("build")   # ["deploy"] became ready
+        ```
+    """
+
+    def __init__(self):
+        self._dependencies: Dict[str, List[str]] = {}   # task -> depends on
+        self._dependents: Dict[str, List[str]] = {}     # task -> blocks
+        self._unresolved: Dict[str, int] = {}           # task -> unresolved deps
+        self._resolved: Set[str] = set()
+        self._ready: Set[str] = set()
+        self._order: Dict[str, int] = {}
+        self._next_order = 0
+
+    # ========== Tasks ==========
+
+    def __contains__(self, task_id: str) -> bool:
+        return task_id in self._order
+
+    def __len__(self) -> int:
+        return len(self._order)
+
+    def add_task(
+        self,
+        task_id: str,
+        depends_on: Iterable[str] = (),
+        resolved: bool = False,
+        check_cycles: bool = False
+    ):
+        """
+        Register a task (or update its resolved flag if already known).
+
+        Args:
+            task_id: Task to register
+            depends_on: Tasks it depends on
+            resolved: Whether the task itself is already done
+            check_cycles: Reject edges that close a cycle (bulk loads of
+                existing data usually skip this and tolerate cycles; tasks
+                on a cycle are simply never ready)
+        """
+        if task_id not in self._order:
+            self._order[task_id] = self._next_order
+            self._next_order += 1
+            self._dependencies.setdefault(task_id, [])
+            self._unresolved[task_id] = sum(
+                1 for dep in self._dependencies[task_id] if dep not in self._resolved
+            )
+            # Dependents that counted this task as missing still count it
+            # as unresolved until it is resolved
+            self._update_ready(task_id)
+
+        for dep in depends_on:
+            self.add_dependency(task_id, dep, check_cycles=check_cycles)
+
+        if resolved:
+            self.resolve(task_id)
+        else:
+            self.unresolve(task_id)
+
+    def remove_task(self, task_id: str):
+        """Forget a task and all of its edges."""
+        if task_id not in self._order:
+            return
+        for dep in list(self._dependencies.get(task_id, [])):
+            self.remove_dependency(task_id, dep)
+        # Dependents keep the edge; the task now counts as missing
+        if task_id in self._resolved:
+            self._resolved.discard(task_id)
+            for dependent in self._dependents.get(task_id, []):
+                self._unresolved[dependent] += 1
+                self._ready.discard(dependent)
+        del self._order[task_id]
+        self._unresolved.pop(task_id, None)
+        self._ready.discard(task_id)
+        if not self._dependents.get(task_id):
+            self._dependents.pop(task_id, None)
+            self._dependencies.pop(task_id, None)
+
+    # ========== Edges ==========
+
+    def add_dependency(self, task_id: str, depends_on: str, check_cycles: bool = True):
+        """
+        Record that task_id depends on depends_on.
+
+        Raises:
+            DependencyCycleError: If check_cycles and the edge closes a cycle
+        """
+        dependencies = self._dependencies.setdefault(task_id, [])
+        if depends_on in dependencies:
+            return
+        if check_cycles:
+            cycle = self._find_path(depends_on, task_id)
+            if cycle is not None:
+                raise DependencyCycleError([task_id] + cycle)
+
+        dependencies.append(depends_on)
+        self._dependents.setdefault(depends_on, []).append(task_id)
+        if task_id in self._unresolved and depends_on not in self._resolved:
+            self._unresolved[task_id] += 1
+            self._ready.discard(task_id)
+
+    def remove_dependency(self, task_id: str, depends_on: str):
+        """Remove an edge, possibly making task_id ready."""
+        dependencies = self._dependencies.get(task_id, [])
+        if depends_on not in dependencies:
+            return
+        dependencies.remove(depends_on)
+        dependents = self._dependents.get(depends_on, [])
+        if task_id in dependents:
+            dependents.remove(task_id)
+        if task_id in self._unresolved and depends_on not in self._resolved:
+            self._unresolved[task_id] -= 1
+            self._update_ready(task_id)
+
+    def _find_path(self, start: str, target: str) -> Optional[List[str]]:
+        """Find a dependency path from start to target (iterative DFS)."""
+        if start == target:
+            return [start]
+        parents: Dict[str, Optional[str]] = {start: None}
+        stack = [start]
+        while stack:
+            node = stack.pop()
+            for dep in self._dependencies.get(node, ()):
+                if dep in parents:
+                    continue
+                parents[dep] = node
+                if dep == target:
+                    path = [dep]
+                    while parents[path[-1]] is not None:
+                        path.append(parents[path[-1]])
+                    return list(reversed(path))
+                stack.append(dep)
+        return None
+
+    # ========== Resolution ==========
+
+    def resolve(self, task_id: str) -> List[str]:
+        """
+        Mark a task done; O(out-degree).
+
+        Returns:
+            Dependents that became ready as a result
+        """
+        if task_id in self._resolved:
+            return []
+        if task_id not in self._order:
+            self.add_task(task_id)
+        self._resolved.add(task_id)
+        self._ready.discard(task_id)
+
+        newly_ready = []
+        for dependent in self._dependents.get(task_id, []):
+            if dependent not in self._unresolved:
+                continue
+            self._unresolved[dependent] -= 1
+            if self._update_ready(dependent):
+                newly_ready.append(dependent)
+        return newly_ready
+
+    def unresolve(self, task_id: str):
+        """Mark a task not done (e.g. reopened); O(out-degree)."""
+        if task_id not in self._resolved:
+            self._update_ready(task_id)
+            return
+        self._resolved.discard(task_id)
+        for dependent in self._dependents.get(task_id, []):
+            if dependent in self._unresolved:
+                self._unresolved[dependent] += 1
+                self._ready.discard(dependent)
+        self._update_ready(task_id)
+
+    def _update_ready(self, task_id: str) -> bool:
+        """Refresh a task's ready membership; returns True if it became ready."""
+        if (task_id in self._order and task_id not in self._resolved
+                and self._unresolved.get(task_id, 0) == 0):
+            if task_id in self._ready:
+                return False
+            self._ready.add(task_id)
+            return True
+        self._ready.discard(task_id)
+        return False
+
+    # ========== Queries ==========
+
+    def is_resolved(self, task_id: str) -> bool:
+        return task_id in self._resolved
+
+    def is_ready(self, task_id: str) -> bool:
+        """O(1): task is not done and all of its dependencies are."""
+        return task_id in self._ready
+
+    def unresolved_count(self, task_id: str) -> int:
+        """Number of dependencies of a task that are not yet resolved."""
+        return self._unresolved.get(task_id, 0)
+
+    @property
+    def ready(self) -> Set[str]:
+        """Ready task IDs (live view; do not mutate)."""
+        return self._ready
+
+    def ready_tasks(self) -> List[str]:
+        """Ready task IDs in registration order."""
+        return sorted(self._ready, key=self._order.__getitem__)
+
+    def get_dependencies(self, task_id: str) -> List[str]:
+        return list(self._dependencies.get(task_id, []))
+
+    def get_dependents(self, task_id: str) -> List[str]:
+        return list(self._dependents.get(task_id, []))
+
+    def get_blockers(self, task_id: str) -> List[str]:
+        """Dependencies of a task that are not yet resolved."""
+        return [dep for dep in self._dependencies.get(task_id, []) if dep not in self._resolved]
@@ -11,15 +11,19 @@ This system provides persistent memory for the managerial agent to track:
 - Metrics and trends over time
 """
 
-import json
 import os
-from datetime import datetime, timezone
+import time
+from collections import deque
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
-from typing import Dict, List, Any, Optional
-from dataclasses import dataclass, field, asdict
+from typing import Deque, Dict, Iterable, List, Any, Optional
+from dataclasses import dataclass, field, asdict, fields
 from enum import Enum
 import pickle
 
+from ..dependency_engine import DependencyEngine
+from .memory_log import MemoryLog
+
 
 class EventType(Enum):
     """Types of events to track"""
@@ -60,7 +64,12 @@ class Event:
 
 @dataclass
 class TaskHistory:
-    """Complete history of a task"""
+    """Complete history of a task
+
+    events holds the task's events still within ManagementMemory's
+    retention limits; expired events are dropped from the history too and
+    only survive as counts in the event_rollup metrics entries.
+    """
     task_id: str
     title: str
     created_at: str
@@ -86,6 +95,10 @@ class TaskHistory:
         data['events'] = [e.to_dict() for e in self.events]
         return data
 
+    def fields_dict(self) -> Dict:
+        """Convert to dictionary without the event list (for delta persistence)"""
+        return {f.name: getattr(self, f.name) for f in fields(self) if f.name != 'events'}
+
 
 @dataclass
 class AgentPerformance:
@@ -105,12 +118,50 @@ class AgentPerformance:
 
 @dataclass
 class DependencyGraph:
-    """Track task dependencies"""
+    """Track task dependencies
+
+    The edge lists are kept as plain dicts for persistence; readiness is
+    maintained incrementally by a DependencyEngine, so resolving a task
+    costs O(dependents) and ready tasks are read from a set.
+    """
     dependencies: Dict[str, List[str]] = field(default_factory=dict)  # task_id -> [depends_on]
     dependents: Dict[str, List[str]] = field(default_factory=dict)  # task_id -> [blocks]
+    engine: DependencyEngine = field(default_factory=DependencyEngine, repr=False, compare=False)
+
+    def __post_init__(self):
+        self.rebuild()
+
+    def rebuild(
+        self,
+        tasks: Optional[List[str]] = None,
+        resolved: Optional[List[str]] = None
+    ):
+        """Rebuild the engine from the edge lists (after loading)
+
+        Args:
+            tasks: Additional known tasks without dependencies
+            resolved: Tasks that are already completed
+        """
+        self.engine = DependencyEngine()
+        for task_id in tasks or []:
+            self.engine.add_task(task_id)
+        for task_id, deps in self.dependencies.items():
+            self.engine.add_task(task_id)
+            for dep in deps:
+                self.engine.add_dependency(task_id, dep, check_cycles=False)
+        for task_id in resolved or []:
+            self.engine.resolve(task_id)
 
     def add_dependency(self, task_id: str, depends_on: str):
-        """Add a dependency relationship"""
+        """Add a dependency relationship
+
+        Raises:
+            DependencyCycleError: If the dependency would create a cycle
+        """
+        if task_id not in self.engine:
+            self.engine.add_task(task_id)
+        self.engine.add_dependency(task_id, depends_on)
+
         if task_id not in self.dependencies:
             self.dependencies[task_id] = []
         if depends_on not in self.dependencies[task_id]:
@@ -123,6 +174,8 @@ class DependencyGraph:
 
     def remove_dependency(self, task_id: str, depends_on: str):
         """Remove a dependency relationship"""
+        self.engine.remove_dependency(task_id, depends_on)
+
         if task_id in self.dependencies and depends_on in self.dependencies[task_id]:
             self.dependencies[task_id].remove(depends_on)
 
@@ -131,39 +184,84 @@ class DependencyGraph:
 
     def get_blockers(self, task_id: str) -> List[str]:
         """Get tasks blocking this task"""
-        blockers = []
-        for dep in self.dependencies.get(task_id, []):
-            blockers.append(dep)
-        return blockers
+        return list(self.dependencies.get(task_id, []))
 
     def get_blocked_by(self, task_id: str) -> List[str]:
         """Get tasks blocked by this task"""
         return self.dependents.get(task_id, [])
 
+    def get_unresolved_blockers(self, task_id: str) -> List[str]:
+        """Get dependencies of this task that are not yet completed"""
+        return self.engine.get_blockers(task_id)
+
+    def mark_completed(self, task_id: str) -> List[str]:
+        """Resolve a task; returns tasks that became ready"""
+        return self.engine.resolve(task_id)
+
+    def mark_reopened(self, task_id: str):
+        """Unresolve a task"""
+        self.engine.unresolve(task_id)
+
+    def get_ready_tasks(self) -> List[str]:
+        """Get tasks whose dependencies are all completed (O(ready))"""
+        return self.engine.ready_tasks()
+
 
 class ManagementMemory:
     """
     Persistent memory system for managerial agent.
 
     Stores all events, histories, and state for comprehensive
-    task and agent tracking.
+    task and agent tracking. Changes are appended to a segmented log
+    (see MemoryLog) rather than rewriting every collection on each write.
+
+    Events are kept in record (time) order and indexed by type and task,
+    so event queries walk an index from the newest end instead of
+    filtering and sorting everything. With max_events or
+    event_retention_days set, the oldest events are dropped (from their
+    task histories too) and rolled up into the metrics history as per-type
+    counts. Without either limit events are kept forever.
     """
 
+    # Minimum seconds between age-based retention sweeps
+    RETENTION_CHECK_INTERVAL = 60.0
+
     def __init__(
         self,
-        memory_path: str = "~/.blackbox5/5-project-memory/management"
+        memory_path: str = "~/.blackbox5/5-project-memory/management",
+        segment_max_bytes: int = 4 * 1024 * 1024,
+        background_compaction: bool = True,
+        max_events: Optional[int] = None,
+        event_retention_days: Optional[float] = None
     ):
         """
         Initialize management memory
 
         Args:
             memory_path: Path to store memory data
+            segment_max_bytes: Log segment size that triggers a snapshot
+            background_compaction: Fold closed segments into the snapshot
+                in a background thread (synchronously if False)
+            max_events: Keep at most this many events (unbounded if None)
+            event_retention_days: Drop events older than this (kept if None)
         """
         self.memory_path = Path(memory_path)
         self.memory_path.mkdir(parents=True, exist_ok=True)
+        self._log = MemoryLog(
+            self.memory_path,
+            segment_max_bytes=segment_max_bytes,
+            background=background_compaction
+        )
+
+        # Retention
+        self.max_events = max_events
+        self.event_retention_days = event_retention_days
+        self._next_retention_check = 0.0
 
         # Data structures
-        self._events: List[Event] = []
+        self._events: Deque[Event] = deque()
+        self._events_by_type: Dict[EventType, Deque[Event]] = {}
+        self._events_by_task: Dict[str, Deque[Event]] = {}
         self._task_histories: Dict[str, TaskHistory] = {}
         self._agent_performance: Dict[str, AgentPerformance] = {}
         self._dependency_graph = DependencyGraph()
@@ -204,13 +302,14 @@ class ManagementMemory:
             details=details
         )
 
-        self._events.append(event)
+        self._index_event(event)
 
         # Add to task history if applicable
         if task_id and task_id in self._task_histories:
             self._task_histories[task_id].add_event(event)
 
-        self._save()
+        self._log.append("event", v=event.to_dict())
+        self._apply_retention()
         return event
 
     def get_events(
@@ -228,19 +327,111 @@ class ManagementMemory:
             limit: Maximum number of events
 
         Returns:
-            List of events
+            List of events, most recent first
         """
-        events = self._events
+        by_type = self._events_by_type.get(event_type) if event_type else None
+        by_task = self._events_by_task.get(task_id) if task_id else None
+
+        if event_type and task_id:
+            if by_type is None or by_task is None:
+                return []
+            # Walk the smaller index and filter on the other key
+            if len(by_type) <= len(by_task):
+                candidates: Iterable[Event] = (e for e in reversed(by_type) if e.task_id == task_id)
+            else:
+                candidates = (e for e in reversed(by_task) if e.event_type == event_type)
+        elif event_type:
+            candidates = reversed(by_type) if by_type is not None else ()
+        elif task_id:
+            candidates = reversed(by_task) if by_task is not None else ()
+        else:
+            candidates = reversed(self._events)
 
-        if event_type:
-            events = [e for e in events if e.event_type == event_type]
+        events = []
+        for event in candidates:
+            if len(events) >= limit:
+                break
+            events.append(event)
+        return events
 
-        if task_id:
-            events = [e for e in events if e.task_id == task_id]
+    def _index_event(self, event: Event):
+        """Append an event to the time-ordered deque and its indexes"""
+        self._events.append(event)
+        self._events_by_type.setdefault(event.event_type, deque()).append(event)
+        if event.task_id:
+            self._events_by_task.setdefault(event.task_id, deque()).append(event)
+
+    def _expire_oldest(self, count: int) -> List[Event]:
+        """Remove the oldest events from the deque and indexes"""
+        expired = []
+        for _ in range(min(count, len(self._events))):
+            event = self._events.popleft()
+            # The oldest event overall is also the oldest in its indexes
+            by_type = self._events_by_type[event.event_type]
+            by_type.popleft()
+            if not by_type:
+                del self._events_by_type[event.event_type]
+            if event.task_id:
+                by_task = self._events_by_task[event.task_id]
+                by_task.popleft()
+                if not by_task:
+                    del self._events_by_task[event.task_id]
+            expired.append(event)
+
+        # Task histories hold their events in the same order, so the expired
+        # ones are at the front of each history
+        trim: Dict[str, int] = {}
+        for event in expired:
+            history = self._task_histories.get(event.task_id) if event.task_id else None
+            if history is None:
+                continue
+            start = trim.get(event.task_id, 0)
+            if start < len(history.events) and history.events[start] == event:
+                trim[event.task_id] = start + 1
+        for task_id, count in trim.items():
+            del self._task_histories[task_id].events[:count]
+        return expired
+
+    def _apply_retention(self):
+        """Drop events beyond the retention limits, rolling them up into metrics"""
+        expire = 0
+
+        if self.max_events is not None:
+            # Trim in batches (10% slack) so each rollup covers many events
+            slack = max(1, self.max_events // 10)
+            if len(self._events) > self.max_events + slack:
+                expire = len(self._events) - self.max_events
+
+        if self.event_retention_days is not None:
+            now = time.monotonic()
+            if now >= self._next_retention_check:
+                self._next_retention_check = now + self.RETENTION_CHECK_INTERVAL
+                cutoff = (
+                    datetime.now(timezone.utc) - timedelta(days=self.event_retention_days)
+                ).isoformat()
+                aged = 0
+                for event in self._events:
+                    if event.timestamp >= cutoff:
+                        break
+                    aged += 1
+                expire = max(expire, aged)
+
+        if not expire:
+            return
 
-        # Return most recent first
-        events = sorted(events, key=lambda e: e.timestamp, reverse=True)
-        return events[:limit]
+        expired = self._expire_oldest(expire)
+        self._log.append("expire", v=len(expired))
+
+        counts: Dict[str, int] = {}
+        for event in expired:
+            counts[event.event_type.value] = counts.get(event.event_type.value, 0) + 1
+        self.record_metrics({
+            "kind": "event_rollup",
+            "period_start": expired[0].timestamp,
+            "period_end": expired[-1].timestamp,
+            "events": len(expired),
+            "by_type": counts,
+        })
 
     # =========================================================================
     # TASK HISTORY
@@ -260,7 +451,10 @@ class ManagementMemory:
         )
 
         self._task_histories[task_id] = history
-        self._save()
+        if task_id not in self._dependency_graph.engine:
+            self._dependency_graph.engine.add_task(task_id)
+        # A recreated history starts empty after a reload too
+        self._log.append("history_new", k=task_id, v=history.fields_dict())
         return history
 
     def get_task_history(self, task_id: str) -> Optional[TaskHistory]:
@@ -284,7 +478,9 @@ class ManagementMemory:
             completed = datetime.fromisoformat(history.completion_time.replace('Z', '+00:00'))
             history.total_duration = (completed - created).total_seconds()
 
-            self._save()
+            if final_status == "completed":
+                self._dependency_graph.mark_completed(task_id)
+            self._save_history(history)
 
     def record_task_monitoring(
         self,
@@ -330,7 +526,7 @@ class ManagementMemory:
             }
             history.monitor_history.append(monitor_entry)
 
-            self._save()
+            self._save_history(history)
 
     def get_task_monitoring_history(
         self,
@@ -409,7 +605,7 @@ class ManagementMemory:
         )
 
         self._agent_performance[task_id] = perf
-        self._save()
+        self._log.append("perf", k=task_id, v=asdict(perf))
         return perf
 
     def track_agent_completion(
@@ -449,7 +645,7 @@ class ManagementMemory:
         else:
             perf.quality_score = 0.0
 
-        self._save()
+        self._log.append("perf", k=task_id, v=asdict(perf))
 
     def get_agent_performance(self, task_id: str) -> Optional[AgentPerformance]:
         """Get agent performance data"""
@@ -482,22 +678,22 @@ class ManagementMemory:
     def add_dependency(self, task_id: str, depends_on: str):
         """Add a dependency"""
         self._dependency_graph.add_dependency(task_id, depends_on)
+        self._log.append("dep_add", k=task_id, v=depends_on)
         self.record_event(
             EventType.DEPENDENCY_ADDED,
             task_id=task_id,
             depends_on=depends_on
         )
-        self._save()
 
     def remove_dependency(self, task_id: str, depends_on: str):
         """Remove a dependency"""
         self._dependency_graph.remove_dependency(task_id, depends_on)
+        self._log.append("dep_remove", k=task_id, v=depends_on)
         self.record_event(
             EventType.DEPENDENCY_REMOVED,
             task_id=task_id,
             depends_on=depends_on
         )
-        self._save()
 
     def get_blockers(self, task_id: str) -> List[str]:
         """Get tasks blocking this task"""
@@ -507,6 +703,14 @@ class ManagementMemory:
         """Get tasks blocked by this task"""
         return self._dependency_graph.get_blocked_by(task_id)
 
+    def get_unresolved_blockers(self, task_id: str) -> List[str]:
+        """Get dependencies of this task that are not yet completed"""
+        return self._dependency_graph.get_unresolved_blockers(task_id)
+
+    def get_ready_tasks(self) -> List[str]:
+        """Get known, unfinished tasks whose dependencies are all completed"""
+        return self._dependency_graph.get_ready_tasks()
+
     # =========================================================================
     # MERGE TRACKING
     # =========================================================================
@@ -524,13 +728,13 @@ class ManagementMemory:
             "method": merge_method,
             "status": "attempted"
         }
+        self._log.append("merge", k=task_id, v=self._merge_decisions[task_id])
         self.record_event(
             EventType.MERGE_ATTEMPTED,
             task_id=task_id,
             branch=branch,
             method=merge_method
         )
-        self._save()
 
     def record_merge_success(
         self,
@@ -544,12 +748,12 @@ class ManagementMemory:
                 "completed_at": datetime.now(timezone.utc).isoformat(),
                 "commit_hash": commit_hash
             })
+            self._log.append("merge", k=task_id, v=self._merge_decisions[task_id])
         self.record_event(
             EventType.MERGE_SUCCEEDED,
             task_id=task_id,
             commit_hash=commit_hash
         )
-        self._save()
 
     def record_merge_failure(
         self,
@@ -563,12 +767,12 @@ class ManagementMemory:
                 "failed_at": datetime.now(timezone.utc).isoformat(),
                 "error": error
             })
+            self._log.append("merge", k=task_id, v=self._merge_decisions[task_id])
         self.record_event(
             EventType.MERGE_FAILED,
             task_id=task_id,
             error=error
         )
-        self._save()
 
     # =========================================================================
     # METRICS HISTORY
@@ -578,7 +782,7 @@ class ManagementMemory:
         """Record metrics snapshot"""
         metrics["timestamp"] = datetime.now(timezone.utc).isoformat()
         self._metrics_history.append(metrics)
-        self._save()
+        self._log.append("metrics", v=metrics)
 
     def get_metrics_history(
         self,
@@ -628,128 +832,89 @@ class ManagementMemory:
     # PERSISTENCE
     # =========================================================================
 
-    def _save(self):
-        """Save memory to disk"""
-        # Save events
-        with open(self.memory_path / "events.json", 'w') as f:
-            json.dump([e.to_dict() for e in self._events], f, indent=2)
-
-        # Save task histories
-        with open(self.memory_path / "task_histories.json", 'w') as f:
-            json.dump(
-                {k: v.to_dict() for k, v in self._task_histories.items()},
-                f,
-                indent=2,
-                default=str  # Handle datetime and other non-serializable types
-            )
-
-        # Save agent performance
-        with open(self.memory_path / "agent_performance.json", 'w') as f:
-            json.dump(
-                {k: asdict(v) for k, v in self._agent_performance.items()},
-                f,
-                indent=2
-            )
-
-        # Save dependency graph
-        with open(self.memory_path / "dependency_graph.json", 'w') as f:
-            json.dump({
-                "dependencies": self._dependency_graph.dependencies,
-                "dependents": self._dependency_graph.dependents
-            }, f, indent=2)
+    def _save_history(self, history: TaskHistory):
+        """Persist a task history's fields (its events are logged separately)"""
+        self._log.append("history", k=history.task_id, v=history.fields_dict())
 
-        # Save merge decisions
-        with open(self.memory_path / "merge_decisions.json", 'w') as f:
-            json.dump(self._merge_decisions, f, indent=2)
+    def compact(self):
+        """Fold the whole log into the snapshot now"""
+        self._log.compact()
 
-        # Save metrics history
-        with open(self.memory_path / "metrics_history.json", 'w') as f:
-            json.dump(self._metrics_history, f, indent=2)
+    def close(self):
+        """Stop background compaction and close the log"""
+        self._log.close()
 
     def _load(self):
-        """Load memory from disk"""
+        """Load memory from disk (snapshot plus log tail)"""
+        state = self._log.load()
+
         # Load events
-        events_file = self.memory_path / "events.json"
-        if events_file.exists():
-            with open(events_file) as f:
-                events_data = json.load(f)
-                self._events = [
-                    Event(
-                        event_type=EventType(e["event_type"]),
-                        timestamp=e["timestamp"],
-                        task_id=e.get("task_id"),
-                        task_title=e.get("task_title"),
-                        details=e.get("details", {})
-                    )
-                    for e in events_data
-                ]
+        for e in state["events"]:
+            self._index_event(Event(
+                event_type=EventType(e["event_type"]),
+                timestamp=e["timestamp"],
+                task_id=e.get("task_id"),
+                task_title=e.get("task_title"),
+                details=e.get("details", {})
+            ))
 
         # Load task histories
-        histories_file = self.memory_path / "task_histories.json"
-        if histories_file.exists():
-            with open(histories_file) as f:
-                histories_data = json.load(f)
-                for task_id, history_data in histories_data.items():
-                    history = TaskHistory(
-                        task_id=history_data["task_id"],
-                        title=history_data["title"],
-                        created_at=history_data["created_at"],
-                        final_status=history_data.get("final_status"),
-                        completion_time=history_data.get("completion_time"),
-                        total_duration=history_data.get("total_duration"),
-                        monitored_at=history_data.get("monitored_at"),
-                        monitored_by=history_data.get("monitored_by"),
-                        monitor_history=history_data.get("monitor_history", [])
-                    )
-                    # Restore events
-                    for event_data in history_data.get("events", []):
-                        event = Event(
-                            event_type=EventType(event_data["event_type"]),
-                            timestamp=event_data["timestamp"],
-                            task_id=event_data.get("task_id"),
-                            task_title=event_data.get("task_title"),
-                            details=event_data.get("details", {})
-                        )
-                        history.events.append(event)
-                    self._task_histories[task_id] = history
+        for task_id, history_data in state["task_histories"].items():
+            history = TaskHistory(
+                task_id=history_data["task_id"],
+                title=history_data["title"],
+                created_at=history_data["created_at"],
+                final_status=history_data.get("final_status"),
+                completion_time=history_data.get("completion_time"),
+                total_duration=history_data.get("total_duration"),
+                monitored_at=history_data.get("monitored_at"),
+                monitored_by=history_data.get("monitored_by"),
+                monitor_history=history_data.get("monitor_history", [])
+            )
+            # Restore events
+            for event_data in history_data.get("events", []):
+                event = Event(
+                    event_type=EventType(event_data["event_type"]),
+                    timestamp=event_data["timestamp"],
+                    task_id=event_data.get("task_id"),
+                    task_title=event_data.get("task_title"),
+                    details=event_data.get("details", {})
+                )
+                history.events.append(event)
+            self._task_histories[task_id] = history
 
         # Load agent performance
-        perf_file = self.memory_path / "agent_performance.json"
-        if perf_file.exists():
-            with open(perf_file) as f:
-                perf_data = json.load(f)
-                for task_id, agent_perf in perf_data.items():
-                    self._agent_performance[task_id] = AgentPerformance(**agent_perf)
+        for task_id, agent_perf in state["agent_performance"].items():
+            self._agent_performance[task_id] = AgentPerformance(**agent_perf)
 
         # Load dependency graph
-        dep_file = self.memory_path / "dependency_graph.json"
-        if dep_file.exists():
-            with open(dep_file) as f:
-                dep_data = json.load(f)
-                self._dependency_graph.dependencies = dep_data.get("dependencies", {})
-                self._dependency_graph.dependents = dep_data.get("dependents", {})
+        dep_data = state["dependency_graph"]
+        self._dependency_graph.dependencies = dep_data.get("dependencies", {})
+        self._dependency_graph.dependents = dep_data.get("dependents", {})
+        self._dependency_graph.rebuild(tasks=list(self._task_histories), resolved=[
+            task_id for task_id, history in self._task_histories.items()
+            if history.final_status == "completed"
+        ])
 
         # Load merge decisions
-        merge_file = self.memory_path / "merge_decisions.json"
-        if merge_file.exists():
-            with open(merge_file) as f:
-                self._merge_decisions = json.load(f)
+        self._merge_decisions = state["merge_decisions"]
 
         # Load metrics history
-        metrics_file = self.memory_path / "metrics_history.json"
-        if metrics_file.exists():
-            with open(metrics_file) as f:
-                self._metrics_history = json.load(f)
+        self._metrics_history = state["metrics_history"]
+
+        self._apply_retention()
 
     def clear(self):
         """Clear all memory"""
-        self._events = []
+        self._events = deque()
+        self._events_by_type = {}
+        self._events_by_task = {}
         self._task_histories = {}
         self._agent_performance = {}
         self._dependency_graph = DependencyGraph()
         self._merge_decisions = {}
         self._metrics_history = []
-        self._save()
+        self._log.append("clear")
 
 
 # =============================================================================
@@ -0,0 +1,400 @@
+#!/usr/bin/env python3
+"""
+Append-only storage engine for ManagementMemory.
+
+Every change is written as one small JSON record to the current segment
+file (log/segment-NNNNNN.jsonl), so recording an event costs O(1) no matter
+how much history exists. When a segment fills up it is closed and a
+background thread folds the closed segments into snapshot.json, then
+deletes them. Startup reads the snapshot and replays the remaining tail.
+
+Records are deltas against the plain-dict state below:
+
+    {"events": [...], "task_histories": {...}, "agent_performance": {...},
+     "dependency_graph": {"dependencies": {...}, "dependents": {...}},
+     "merge_decisions": {...}, "metrics_history": [...]}
+
+which is the same shape as the legacy per-collection JSON files, so
+existing memory directories are migrated on first load.
+"""
+
+import json
+import logging
+import os
+import threading
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+# Legacy files written by ManagementMemory before the log existed
+LEGACY_FILES = {
+    "events": "events.json",
+    "task_histories": "task_histories.json",
+    "agent_performance": "agent_performance.json",
+    "dependency_graph": "dependency_graph.json",
+    "merge_decisions": "merge_decisions.json",
+    "metrics_history": "metrics_history.json",
+}
+
+
+def empty_state() -> Dict[str, Any]:
+    """Get an empty plain-dict memory state."""
+    return {
+        "events": [],
+        "task_histories": {},
+        "agent_performance": {},
+        "dependency_graph": {"dependencies": {}, "dependents": {}},
+        "merge_decisions": {},
+        "metrics_history": [],
+    }
+
+
+def apply_record(state: Dict[str, Any], record: Dict[str, Any]) -> None:
+    """
+    Apply one log record to a plain-dict state.
+
+    Record ops:
+        event: append an event (and add it to its task's history)
+        expire: drop the oldest N events (retention), also from task histories
+        history: upsert a task history's fields, keeping its events
+        history_new: replace a task history, starting with no events
+        perf: replace an agent performance entry
+        dep_add / dep_remove: change one dependency edge
+        merge: replace a merge decision
+        metrics: append a metrics snapshot
+        clear: drop everything
+    """
+    op = record["op"]
+    value = record.get("v")
+
+    if op == "event":
+        state["events"].append(value)
+        history = state["task_histories"].get(value.get("task_id"))
+        if history is not None:
+            history.setdefault("events", []).append(value)
+    elif op == "expire":
+        trim: Dict[str, int] = {}
+        for event in state["events"][:value]:
+            history = state["task_histories"].get(event.get("task_id"))
+            if history is None:
+                continue
+            events = history.setdefault("events", [])
+            start = trim.get(event["task_id"], 0)
+            if start < len(events) and events[start] == event:
+                trim[event["task_id"]] = start + 1
+        for task_id, count in trim.items():
+            del state["task_histories"][task_id]["events"][:count]
+        del state["events"][:value]
+    elif op == "history":
+        existing = state["task_histories"].get(record["k"])
+        events = existing.get("events", []) if existing else []
+        state["task_histories"][record["k"]] = dict(value, events=events)
+    elif op == "history_new":
+        state["task_histories"][record["k"]] = dict(value, events=[])
+    elif op == "perf":
+        state["agent_performance"][record["k"]] = value
+    elif op == "dep_add":
+        task_id, depends_on = record["k"], value
+        dependencies = state["dependency_graph"]["dependencies"].setdefault(task_id, [])
+        if depends_on not in dependencies:
+            dependencies.append(depends_on)
+        dependents = state["dependency_graph"]["dependents"].setdefault(depends_on, [])
+        if task_id not in dependents:
+            dependents.append(task_id)
+    elif op == "dep_remove":
+        task_id, depends_on = record["k"], value
+        dependencies = state["dependency_graph"]["dependencies"].get(task_id, [])
+        if depends_on in dependencies:
+            dependencies.remove(depends_on)
+        dependents = state["dependency_graph"]["dependents"].get(depends_on, [])
+        if task_id in dependents:
+            dependents.remove(task_id)
+    elif op == "merge":
+        state["merge_decisions"][record["k"]] = value
+    elif op == "metrics":
+        state["metrics_history"].append(value)
+    elif op == "clear":
+        state.clear()
+        state.update(empty_state())
+    else:
+        logger.warning(f"Ignoring unknown memory log op: {op}")
+
+
+class MemoryLog:
+    """
+    Segmented append-only log with background snapshot compaction.
+
+    Example:
+        ```python
+        log = MemoryLog(memory_path)
+        state = log.load()                  # snapshot + tail, as plain dicts
+        log.append("event", v=event.to_dict())
+        log.close()
+        ```
+    """
+
+    def __init__(
+        self,
+        memory_path: Path,
+        segment_max_bytes: int = 4 * 1024 * 1024,
+        background: bool = True
+    ):
+        """
+        Initialize the log.
+
+        Args:
+            memory_path: Directory holding snapshot.json and log/
+            segment_max_bytes: Size at which the current segment is closed
+            background: Compact closed segments in a daemon thread
+        """
+        self.memory_path = Path(memory_path)
+        self.log_dir = self.memory_path / "log"
+        self.snapshot_file = self.memory_path / "snapshot.json"
+        self.segment_max_bytes = segment_max_bytes
+        self.background = background
+
+        self._lock = threading.Lock()
+        self._compact_lock = threading.Lock()
+        self._file = None
+        self._segment = 0
+        self._segment_bytes = 0
+        self._records_since_snapshot = 0
+
+        self._wakeup = threading.Event()
+        self._stopping = False
+        self._thread: Optional[threading.Thread] = None
+
+    # ========== Layout ==========
+
+    def _segment_path(self, index: int) -> Path:
+        return self.log_dir / f"segment-{index:06d}.jsonl"
+
+    def _segments(self) -> List[int]:
+        if not self.log_dir.exists():
+            return []
+        indexes = []
+        for path in self.log_dir.glob("segment-*.jsonl"):
+            try:
+                indexes.append(int(path.stem.split("-", 1)[1]))
+            except ValueError:
+                continue
+        return sorted(indexes)
+
+    # ========== Loading ==========
+
+    def _read_snapshot(self) -> Optional[Dict[str, Any]]:
+        try:
+            with open(self.snapshot_file) as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return None
+
+    def _read_legacy(self) -> Optional[Dict[str, Any]]:
+        state = empty_state()
+        found = False
+        for collection, filename in LEGACY_FILES.items():
+            path = self.memory_path / filename
+            if path.exists():
+                with open(path) as f:
+                    state[collection] = json.load(f)
+                found = True
+        return state if found else None
+
+    def _replay(self, state: Dict[str, Any], index: int) -> int:
+        """Apply one segment to a state; returns the number of records."""
+        count = 0
+        with open(self._segment_path(index)) as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    # Torn write at the end of a segment after a crash
+                    logger.warning(f"Skipping corrupt record in {self._segment_path(index).name}")
+                    continue
+                apply_record(state, record)
+                count += 1
+        return count
+
+    def load(self) -> Dict[str, Any]:
+        """
+        Load the state (snapshot plus log tail) and open a fresh segment.
+
+        Returns:
+            Plain-dict state
+        """
+        snapshot = self._read_snapshot()
+        if snapshot is not None:
+            state = snapshot["state"]
+            first_segment = snapshot.get("next_segment", 0)
+        else:
+            state = self._read_legacy() or empty_state()
+            first_segment = 0
+
+        segments = self._segments()
+        tail = []
+        for index in segments:
+            if index < first_segment:
+                # Already folded into the snapshot; left over from an
+                # interrupted compaction
+                self._remove_segment(index)
+                continue
+            self._records_since_snapshot += self._replay(state, index)
+            tail.append(index)
+
+        self.log_dir.mkdir(parents=True, exist_ok=True)
+        self._segment = max(segments + [first_segment - 1]) + 1
+        self._open_segment()
+
+        # The replayed tail is closed now; fold it into the snapshot
+        if tail:
+            self._request_compaction()
+        return state
+
+    # ========== Appending ==========
+
+    def _open_segment(self):
+        self._file = open(self._segment_path(self._segment), 'a', encoding='utf-8')
+        self._segment_bytes = self._file.tell()
+
+    def append(self, op: str, k: Optional[str] = None, v: Any = None):
+        """
+        Append one record to the current segment.
+
+        Args:
+            op: Record op (see apply_record)
+            k: Key within the collection, if the op is keyed
+            v: Record value
+        """
+        record = {"op": op}
+        if k is not None:
+            record["k"] = k
+        if v is not None:
+            record["v"] = v
+        line = json.dumps(record, separators=(',', ':'), default=str) + "\n"
+
+        with self._lock:
+            if self._file is None:
+                self.log_dir.mkdir(parents=True, exist_ok=True)
+                self._open_segment()
+            self._file.write(line)
+            self._file.flush()
+            self._segment_bytes += len(line)
+            self._records_since_snapshot += 1
+            if self._segment_bytes >= self.segment_max_bytes:
+                self._rotate()
+                rotated = True
+            else:
+                rotated = False
+
+        if rotated:
+            self._request_compaction()
+
+    def _rotate(self):
+        """Close the current segment and start the next one (lock held)."""
+        if self._file is not None:
+            self._file.close()
+        self._segment += 1
+        self._open_segment()
+
+    # ========== Compaction ==========
+
+    def _request_compaction(self):
+        if not self.background:
+            self.compact()
+            return
+        if self._thread is None or not self._thread.is_alive():
+            self._thread = threading.Thread(
+                target=self._compaction_loop,
+                name="management-memory-compactor",
+                daemon=True
+            )
+            self._thread.start()
+        self._wakeup.set()
+
+    def _compaction_loop(self):
+        while True:
+            self._wakeup.wait()
+            self._wakeup.clear()
+            if self._stopping:
+                return
+            try:
+                self.compact(rotate=False)
+            except Exception as e:
+                logger.error(f"Management memory compaction failed: {e}")
+
+    def compact(self, rotate: bool = True):
+        """
+        Fold closed segments into the snapshot and delete them.
+
+        Works only from the snapshot file and closed segments, never from
+        the live in-memory state, so writers are not blocked.
+
+        Args:
+            rotate: Close the current segment first so it is included
+        """
+        with self._compact_lock:
+            with self._lock:
+                if rotate and self._segment_bytes:
+                    self._rotate()
+                live_segment = self._segment
+
+            closed = [index for index in self._segments() if index < live_segment]
+            if not closed:
+                return
+
+            snapshot = self._read_snapshot()
+            if snapshot is not None:
+                state = snapshot["state"]
+                first_segment = snapshot.get("next_segment", 0)
+            else:
+                state = self._read_legacy() or empty_state()
+                first_segment = 0
+
+            for index in closed:
+                if index >= first_segment:
+                    self._replay(state, index)
+
+            tmp_path = self.snapshot_file.with_suffix(f".{os.getpid()}.tmp")
+            with open(tmp_path, 'w') as f:
+                json.dump(
+                    {"next_segment": live_segment, "state": state},
+                    f, separators=(',', ':'), default=str
+                )
+            tmp_path.replace(self.snapshot_file)
+
+            for index in closed:
+                self._remove_segment(index)
+            with self._lock:
+                self._records_since_snapshot = 0
+
+    def _remove_segment(self, index: int):
+        try:
+            self._segment_path(index).unlink()
+        except OSError:
+            pass
+
+    @property
+    def pending_records(self) -> int:
+        """Records written since the last snapshot."""
+        return self._records_since_snapshot
+
+    def close(self, compact: bool = False):
+        """
+        Stop the compactor and close the current segment.
+
+        Args:
+            compact: Fold everything into the snapshot before closing
+        """
+        self._stopping = True
+        self._wakeup.set()
+        if self._thread is not None:
+            self._thread.join(timeout=5.0)
+        if compact:
+            self.compact()
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
@@ -21,6 +21,8 @@ import subprocess
 import os
 from pathlib import Path
 
+from ..dependency_engine import DependencyCycleError, DependencyEngine
+
 
 class TaskStatus(Enum):
     """Vibe Kanban task statuses"""
@@ -151,6 +153,7 @@ class VibeKanbanManager:
         # Tracking
         self._task_cache: Dict[str, TaskInfo] = {}
         self._agent_states: Dict[str, AgentState] = {}
+        self._dependencies = DependencyEngine()
 
     # =========================================================================
     # TASK MANAGEMENT
@@ -174,6 +177,9 @@ class VibeKanbanManager:
 
         Returns:
             TaskInfo object
+
+        Raises:
+            DependencyCycleError: If the dependencies would create a cycle
         """
         payload = {
             "project_id": self.project_id,
@@ -193,6 +199,7 @@ class VibeKanbanManager:
             dependencies=dependencies or []
         )
 
+        self._track_task(task)
         self._task_cache[task.id] = task
         return task
 
@@ -202,7 +209,7 @@ class VibeKanbanManager:
             return self._task_cache[task_id]
 
         result = self._api_call("GET", f"/tasks/{task_id}")
-        return self._parse_task(result)
+        return self._track_task(self._parse_task(result))
 
     def list_tasks(
         self,
@@ -219,6 +226,7 @@ class VibeKanbanManager:
 
         # Update cache
         for task in tasks:
+            self._track_task(task)
             self._task_cache[task.id] = task
 
         return tasks
@@ -240,7 +248,7 @@ class VibeKanbanManager:
             payload["status"] = status.value
 
         result = self._api_call("PUT", f"/tasks/{task_id}", json=payload)
-        return self._parse_task(result)
+        return self._track_task(self._parse_task(result))
 
     def delete_task(self, task_id: str) -> bool:
         """Delete a task"""
@@ -248,6 +256,7 @@ class VibeKanbanManager:
             self._api_call("DELETE", f"/tasks/{task_id}")
             if task_id in self._task_cache:
                 del self._task_cache[task_id]
+            self._dependencies.remove_task(task_id)
             return True
         except Exception as e:
             print(f"Failed to delete task {task_id}: {e}")
@@ -557,35 +566,65 @@ class VibeKanbanManager:
     # =========================================================================
 
     def set_dependencies(self, task_id: str, depends_on: List[str]) -> bool:
-        """Set task dependencies"""
+        """Set task dependencies
+
+        Raises:
+            DependencyCycleError: If the dependencies would create a cycle
+        """
         task = self.get_task(task_id)
-        task.dependencies = depends_on
+        engine = self._dependencies
+        previous = engine.get_dependencies(task_id)
+        for dep_id in previous:
+            engine.remove_dependency(task_id, dep_id)
+        try:
+            for dep_id in depends_on:
+                engine.add_dependency(task_id, dep_id)
+        except DependencyCycleError:
+            for dep_id in depends_on:
+                engine.remove_dependency(task_id, dep_id)
+            for dep_id in previous:
+                engine.add_dependency(task_id, dep_id, check_cycles=False)
+            raise
+        task.dependencies = engine.get_dependencies(task_id)
         return True
 
     def get_blockers(self, task_id: str) -> List[str]:
         """Get tasks blocking this task"""
-        task = self.get_task(task_id)
-        blockers = []
+        if task_id not in self._dependencies:
+            self.get_task(task_id)
 
-        for dep_id in task.dependencies:
-            dep_task = self.get_task(dep_id)
-            if dep_task.status not in [TaskStatus.DONE, TaskStatus.CANCELLED]:
-                blockers.append(dep_id)
+        # Fetch dependencies whose status has not been seen yet
+        for dep_id in self._dependencies.get_blockers(task_id):
+            if dep_id not in self._dependencies:
+                self.get_task(dep_id)
 
-        return blockers
+        return self._dependencies.get_blockers(task_id)
 
     def get_dependents(self, task_id: str) -> List[str]:
         """Get tasks that depend on this task"""
-        dependents = []
-        for t in self.list_tasks():
-            if task_id in t.dependencies:
-                dependents.append(t.id)
-        return dependents
+        return self._dependencies.get_dependents(task_id)
 
     def can_start(self, task_id: str) -> bool:
         """Check if task can start (no uncompleted dependencies)"""
         return len(self.get_blockers(task_id)) == 0
 
+    def get_ready_tasks(self) -> List[str]:
+        """Get open tasks whose dependencies are all done (from tracked state)"""
+        return self._dependencies.ready_tasks()
+
+    def _track_task(self, task: TaskInfo) -> TaskInfo:
+        """Sync a fetched task's status and dependencies with the dependency engine"""
+        engine = self._dependencies
+        if task.dependencies:
+            for dep_id in task.dependencies:
+                engine.add_dependency(task.id, dep_id, check_cycles=True)
+        engine.add_task(
+            task.id,
+            resolved=task.status in (TaskStatus.DONE, TaskStatus.CANCELLED)
+        )
+        task.dependencies = engine.get_dependencies(task.id)
+        return task
+
     # =========================================================================
     # METRICS & REPORTING
     # =========================================================================
@@ -608,7 +647,7 @@ class VibeKanbanManager:
             elif task.last_attempt_failed:
                 metrics.failed += 1
 
-            if self.get_blockers(task.id):
+            if self._dependencies.unresolved_count(task.id):
                 metrics.blocked += 1
 
         return metrics
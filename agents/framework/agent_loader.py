@@ -5,15 +5,20 @@ This module provides dynamic agent loading and registration functionality.
 Discovers agents from configured paths and manages the agent registry.
 """
 
+import ast
 import asyncio
+import hashlib
 import importlib
 import importlib.util
 import inspect
+import json
 import logging
+from collections.abc import Mapping
 from pathlib import Path
-from typing import Dict, List, Optional, Type
+from typing import Any, Dict, Iterator, List, Optional, Set, Type
 
 from .base_agent import BaseAgent, AgentConfig, AgentTask, AgentResult
+from .definition_cache import DefinitionCache, parse_yaml_file, snapshot_path
 
 # Import Claude Code execution mixin for YAML agents
 import sys
@@ -24,6 +29,180 @@ from interface.client.ClaudeCodeAgentMixin import ClaudeCodeAgentMixin
 
 logger = logging.getLogger(__name__)
 
+# Bump when the manifest layout changes so stale files are rebuilt
+MANIFEST_VERSION = 1
+
+# Default location for persisted agent manifests
+DEFAULT_MANIFEST_DIR = Path.home() / ".blackbox5" / ".cache"
+
+
+def _file_digest(data: bytes) -> str:
+    return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+
+def _scan_classes(source: bytes) -> List[List[Any]]:
+    """
+    List top-level classes in a module without importing it.
+
+    Returns:
+        [class_name, [base names]] pairs; dotted bases keep their last part
+    """
+    classes = []
+    for node in ast.parse(source).body:
+        if not isinstance(node, ast.ClassDef):
+            continue
+        bases = []
+        for base in node.bases:
+            if isinstance(base, ast.Name):
+                bases.append(base.id)
+            elif isinstance(base, ast.Attribute):
+                bases.append(base.attr)
+        classes.append([node.name, bases])
+    return classes
+
+
+class AgentManifest:
+    """
+    Persistent index of Python agent classes, built from an AST scan.
+
+    Each entry records a file's mtime, size and content hash together with
+    the classes it defines. Only files whose stat changed are re-read, and
+    only files whose hash changed are re-parsed. Candidate agent classes
+    are those that inherit, directly or through other scanned classes, from
+    BaseAgent; they are confirmed with issubclass when first imported.
+    """
+
+    def __init__(self, agents_path: Path, manifest_path: Path):
+        self.agents_path = agents_path
+        self.manifest_path = manifest_path
+        self._files: Dict[str, Dict[str, Any]] = {}
+        self._dirty = False
+        self.scanned = 0
+        self._load()
+
+    def _load(self):
+        try:
+            with open(self.manifest_path, 'r') as f:
+                data = json.load(f)
+            if data.get('version') == MANIFEST_VERSION:
+                self._files = data.get('files', {})
+        except (OSError, ValueError):
+            self._files = {}
+
+    def save(self):
+        """Write the manifest if it changed"""
+        if not self._dirty:
+            return
+        try:
+            self.manifest_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.manifest_path.with_suffix('.tmp')
+            with open(tmp_path, 'w') as f:
+                json.dump({'version': MANIFEST_VERSION, 'files': self._files}, f)
+            tmp_path.replace(self.manifest_path)
+            self._dirty = False
+        except OSError as e:
+            logger.debug(f"Could not save agent manifest: {e}")
+
+    def refresh(self, python_files: List[Path]) -> Set[str]:
+        """
+        Bring entries up to date with the given files.
+
+        Returns:
+            Relative paths whose content changed or that were removed
+        """
+        self.scanned = 0
+        changed: Set[str] = set()
+        seen = set()
+        for py_file in python_files:
+            rel = py_file.relative_to(self.agents_path).as_posix()
+            seen.add(rel)
+            try:
+                st = py_file.stat()
+            except OSError:
+                continue
+
+            entry = self._files.get(rel)
+            if entry and entry['mtime_ns'] == st.st_mtime_ns and entry['size'] == st.st_size:
+                continue
+
+            try:
+                source = py_file.read_bytes()
+            except OSError:
+                continue
+            digest = _file_digest(source)
+            if entry is None or entry['hash'] != digest:
+                try:
+                    classes = _scan_classes(source)
+                except (SyntaxError, ValueError) as e:
+                    logger.debug(f"Could not parse {py_file}: {e}")
+                    classes = []
+                entry = {'classes': classes}
+                self.scanned += 1
+                changed.add(rel)
+            entry.update(mtime_ns=st.st_mtime_ns, size=st.st_size, hash=digest)
+            self._files[rel] = entry
+            self._dirty = True
+
+        for rel in set(self._files) - seen:
+            del self._files[rel]
+            changed.add(rel)
+            self._dirty = True
+
+        return changed
+
+    def agent_classes(self) -> Dict[str, str]:
+        """
+        Map candidate agent class names to their file (relative path).
+
+        Names are resolved to a fixpoint so subclasses of other scanned
+        agents are included. The first file (in path order) wins a name.
+        """
+        known: Set[str] = {'BaseAgent'}
+        changed = True
+        while changed:
+            changed = False
+            for entry in self._files.values():
+                for name, bases in entry['classes']:
+                    if name not in known and known.intersection(bases):
+                        known.add(name)
+                        changed = True
+
+        index: Dict[str, str] = {}
+        for rel in sorted(self._files):
+            for name, bases in self._files[rel]['classes']:
+                if (name != 'BaseAgent' and name in known
+                        and not name.startswith('_') and name not in index):
+                    index[name] = rel
+        return index
+
+
+class LazyAgentRegistry(Mapping):
+    """
+    Read-only mapping of agent names to instances.
+
+    Names come from the manifest and YAML definitions; an agent's module is
+    imported and the agent instantiated on first access. Agents that fail
+    to load behave as missing keys.
+    """
+
+    def __init__(self, loader: 'AgentLoader'):
+        self._loader = loader
+
+    def __getitem__(self, name: str) -> 'BaseAgent':
+        agent = self._loader.get_agent(name)
+        if agent is None:
+            raise KeyError(name)
+        return agent
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._loader.list_agents())
+
+    def __len__(self) -> int:
+        return len(self._loader.list_agents())
+
+    def __repr__(self) -> str:
+        return f"LazyAgentRegistry({self._loader.list_agents()!r})"
+
 
 class AgentLoader:
     """
@@ -31,14 +210,19 @@ class AgentLoader:
 
     Discovers, loads, and manages agent classes from configured directories.
     Supports both Python modules and YAML-based agent definitions.
+
+    Python agents are discovered from a persisted AST manifest and imported
+    lazily on first use, so start-up does not import the agent tree.
     """
 
-    def __init__(self, agents_path: Optional[Path] = None):
+    def __init__(self, agents_path: Optional[Path] = None, manifest_path: Optional[Path] = None):
         """
         Initialize the agent loader.
 
         Args:
             agents_path: Path to directory containing agent definitions
+            manifest_path: Where to persist the Python agent manifest
+                (defaults to a per-path file under ~/.blackbox5/.cache)
         """
         # Default to the agents directory (parent of this core module)
         if agents_path is None:
@@ -49,109 +233,155 @@ class AgentLoader:
         self._loaded_agents: Dict[str, Type[BaseAgent]] = {}
         self._agent_instances: Dict[str, BaseAgent] = {}
 
+        if manifest_path is None:
+            path_key = hashlib.blake2b(
+                str(Path(agents_path).resolve()).encode('utf-8'), digest_size=8
+            ).hexdigest()
+            manifest_path = DEFAULT_MANIFEST_DIR / f"agent_manifest_{path_key}.json"
+        self._manifest = AgentManifest(Path(agents_path), manifest_path)
+        self._yaml_cache = DefinitionCache(
+            snapshot_path("agent_yaml", agents_path, manifest_path.parent),
+            parse_yaml_file
+        )
+        self._python_index: Dict[str, str] = {}
+        self._modules: Dict[str, Any] = {}
+        self._failed: Set[str] = set()
+        self._registry = LazyAgentRegistry(self)
+
         logger.info(f"AgentLoader initialized with path: {self.agents_path}")
 
-    async def load_all(self) -> Dict[str, BaseAgent]:
+    async def load_all(self) -> Mapping:
         """
-        Load all available agents from the configured path.
+        Discover all available agents from the configured path.
 
         Searches for agent definitions in:
-        1. Python modules with BaseAgent subclasses
+        1. Python modules with BaseAgent subclasses (via the manifest)
         2. YAML agent definition files
 
+        Python agent modules are not imported here; each agent is imported
+        and instantiated on first lookup.
+
         Returns:
-            Dictionary mapping agent names to agent instances
+            Mapping of agent names to agent instances (loaded on access)
         """
         logger.info("Loading all agents...")
 
-        # Load Python agents
+        # Index Python agents
         await self._load_python_agents()
 
         # Load YAML agents
         await self._load_yaml_agents()
 
-        # Instantiate all loaded agent classes
-        for name, agent_class in self._loaded_agents.items():
-            if name not in self._agent_instances:
-                try:
-                    # Get config from agent class
-                    if hasattr(agent_class, 'get_default_config'):
-                        config = agent_class.get_default_config()
-                    else:
-                        # Create default config
-                        config = AgentConfig(
-                            name=name,
-                            full_name=agent_class.__name__,
-                            role=agent_class.__name__.replace('Agent', ''),
-                            category='general',
-                            description=f"Auto-generated config for {agent_class.__name__}"
-                        )
-
-                    instance = agent_class(config)
-                    self._agent_instances[name] = instance
-                    logger.info(f"Instantiated agent: {name}")
-
-                except Exception as e:
-                    logger.error(f"Failed to instantiate agent {name}: {e}")
-
-        logger.info(f"Loaded {len(self._agent_instances)} agents")
-
-        return self._agent_instances
+        logger.info(f"Discovered {len(self.list_agents())} agents")
 
-    async def _load_python_agents(self) -> None:
-        """Load agents from Python modules."""
-        if not self.agents_path.exists():
-            logger.warning(f"Agents path does not exist: {self.agents_path}")
-            return
+        return self._registry
+
+    def _instantiate(self, name: str, agent_class: Type[BaseAgent]) -> Optional[BaseAgent]:
+        """Create an agent instance from its class."""
+        try:
+            # Get config from agent class
+            if hasattr(agent_class, 'get_default_config'):
+                config = agent_class.get_default_config()
+            else:
+                # Create default config
+                config = AgentConfig(
+                    name=name,
+                    full_name=agent_class.__name__,
+                    role=agent_class.__name__.replace('Agent', ''),
+                    category='general',
+                    description=f"Auto-generated config for {agent_class.__name__}"
+                )
 
-        # Find all Python files
-        python_files = list(self.agents_path.rglob("*.py"))
+            instance = agent_class(config)
+            logger.info(f"Instantiated agent: {name}")
+            return instance
 
-        for py_file in python_files:
+        except Exception as e:
+            logger.error(f"Failed to instantiate agent {name}: {e}")
+            return None
+
+    def _python_files(self) -> List[Path]:
+        """Python files that may define agents."""
+        framework_dir = Path(__file__).parent.resolve()
+        files = []
+        for py_file in sorted(self.agents_path.rglob("*.py")):
             # Skip __init__ and test files
             if py_file.name.startswith("__") or "test" in py_file.name.lower():
                 continue
+            # Framework modules are infrastructure, not agent definitions
+            if py_file.parent.resolve() == framework_dir:
+                continue
+            files.append(py_file)
+        return files
 
-            try:
-                await self._load_agent_from_file(py_file)
-            except Exception as e:
-                logger.debug(f"Failed to load agents from {py_file}: {e}")
+    async def _load_python_agents(self) -> None:
+        """Index agents from Python modules, re-scanning only changed files."""
+        if not self.agents_path.exists():
+            logger.warning(f"Agents path does not exist: {self.agents_path}")
+            return
+
+        changed = self._manifest.refresh(self._python_files())
+        self._manifest.save()
+
+        # Forget modules and failures for files that changed on disk
+        for rel_path in changed:
+            self._modules.pop(rel_path, None)
+        self._failed = {
+            name for name in self._failed
+            if self._python_index.get(name) not in changed
+        }
+        self._python_index = self._manifest.agent_classes()
+        logger.debug(
+            f"Agent manifest: {len(self._python_index)} Python agents, "
+            f"{self._manifest.scanned} files re-scanned"
+        )
 
-    async def _load_agent_from_file(self, file_path: Path) -> None:
+    def _import_agent_module(self, rel_path: str):
         """
-        Load agent classes from a Python file.
+        Import an agent module once, under a name unique to its path.
 
         Args:
-            file_path: Path to Python file
+            rel_path: File path relative to agents_path
         """
-        # Create module spec
-        module_name = file_path.stem
+        if rel_path in self._modules:
+            return self._modules[rel_path]
+
+        file_path = self.agents_path / rel_path
+        module_name = "_blackbox5_agents." + ".".join(Path(rel_path).with_suffix('').parts)
         spec = importlib.util.spec_from_file_location(module_name, file_path)
 
+        module = None
         if spec is None or spec.loader is None:
             logger.debug(f"Could not create spec for {file_path}")
-            return
-
-        # Load module
-        module = importlib.util.module_from_spec(spec)
-        sys_modules = sys.modules  # type: ignore
-        sys_modules[module_name] = module
-
-        try:
-            spec.loader.exec_module(module)
-        except Exception as e:
-            logger.debug(f"Failed to load module {module_name}: {e}")
-            return
-
-        # Find BaseAgent subclasses
-        for name, obj in inspect.getmembers(module):
-            if (inspect.isclass(obj) and
-                issubclass(obj, BaseAgent) and
-                obj is not BaseAgent and
-                not obj.__name__.startswith('_')):
-
-                logger.info(f"Found agent class: {name} in {file_path}")
-                self._loaded_agents[name] = obj
+        else:
+            module = importlib.util.module_from_spec(spec)
+            sys.modules[module_name] = module
+            try:
+                spec.loader.exec_module(module)
+            except Exception as e:
+                logger.debug(f"Failed to load module {module_name}: {e}")
+                sys.modules.pop(module_name, None)
+                module = None
+
+        self._modules[rel_path] = module
+        return module
+
+    def _resolve_python_agent(self, name: str) -> Optional[Type[BaseAgent]]:
+        """Import the module defining a manifest agent and return its class."""
+        rel_path = self._python_index.get(name)
+        if rel_path is None:
+            return None
+
+        module = self._import_agent_module(rel_path)
+        obj = getattr(module, name, None) if module is not None else None
+        if (inspect.isclass(obj) and
+            issubclass(obj, BaseAgent) and
+            obj is not BaseAgent):
+
+            logger.info(f"Found agent class: {name} in {rel_path}")
+            self._loaded_agents[name] = obj
+            return obj
+        return None
 
     async def _load_yaml_agents(self) -> None:
         """
@@ -159,33 +389,45 @@ class AgentLoader:
 
         YAML agents are converted to Python classes dynamically.
         """
+        try:
+            import yaml
+        except ImportError:
+            logger.warning("PyYAML not installed, skipping YAML agents")
+            return
+
         yaml_files = list(self.agents_path.rglob("*.yaml")) + list(self.agents_path.rglob("*.yml"))
 
-        for yaml_file in yaml_files:
-            # Skip non-agent YAML files (look for agent or specialist in filename)
-            if "agent" not in yaml_file.name.lower() and "specialist" not in yaml_file.name.lower():
+        # Skip non-agent YAML files (look for agent or specialist in filename)
+        yaml_files = [
+            yaml_file for yaml_file in yaml_files
+            if "agent" in yaml_file.name.lower() or "specialist" in yaml_file.name.lower()
+        ]
+
+        # Parse changed files concurrently; unchanged ones come from the snapshot
+        for yaml_file, data, error in self._yaml_cache.load(yaml_files):
+            if error:
+                logger.debug(f"Failed to load agent from {yaml_file}: {error}")
                 continue
 
             try:
-                await self._load_agent_from_yaml(yaml_file)
+                await self._load_agent_from_yaml(yaml_file, data)
             except Exception as e:
                 logger.debug(f"Failed to load agent from {yaml_file}: {e}")
 
-    async def _load_agent_from_yaml(self, yaml_file: Path) -> None:
+    async def _load_agent_from_yaml(self, yaml_file: Path, data: Optional[Dict[str, Any]] = None) -> None:
         """
         Load an agent from a YAML definition file.
 
         Args:
             yaml_file: Path to YAML file
+            data: Already parsed file content (parsed here if omitted)
         """
-        try:
-            import yaml
-        except ImportError:
-            logger.warning("PyYAML not installed, skipping YAML agents")
-            return
-
-        with open(yaml_file, 'r') as f:
-            data = yaml.safe_load(f)
+        if data is None:
+            try:
+                data = parse_yaml_file(yaml_file)
+            except ImportError:
+                logger.warning("PyYAML not installed, skipping YAML agents")
+                return
 
         if not data or 'agent' not in data:
             return
@@ -386,7 +628,7 @@ class AgentLoader:
 
     def get_agent(self, name: str) -> Optional[BaseAgent]:
         """
-        Get an agent instance by name.
+        Get an agent instance by name, loading it on first use.
 
         Args:
             name: Agent name
@@ -394,16 +636,36 @@ class AgentLoader:
         Returns:
             Agent instance or None if not found
         """
-        return self._agent_instances.get(name)
+        agent = self._agent_instances.get(name)
+        if agent is not None or name in self._failed:
+            return agent
+
+        agent_class = self._loaded_agents.get(name) or self._resolve_python_agent(name)
+        if agent_class is None:
+            if name in self._python_index:
+                self._failed.add(name)
+            return None
+
+        agent = self._instantiate(name, agent_class)
+        if agent is None:
+            self._failed.add(name)
+            return None
+        self._agent_instances[name] = agent
+        return agent
 
     def list_agents(self) -> List[str]:
         """
-        List all loaded agent names.
+        List all discovered agent names.
 
         Returns:
             List of agent names
         """
-        return list(self._agent_instances.keys())
+        names = [name for name in self._python_index if name not in self._failed]
+        names.extend(
+            name for name in self._loaded_agents
+            if name not in self._python_index and name not in self._failed
+        )
+        return names
 
     def get_agent_info(self, name: str) -> Optional[Dict[str, any]]:
         """
@@ -430,11 +692,15 @@ class AgentLoader:
         Returns:
             Reloaded agent instance or None if not found
         """
-        # Remove old instance
-        if name in self._agent_instances:
-            del self._agent_instances[name]
-
-        # Reload all agents
+        # Remove old instance, class and module
+        self._agent_instances.pop(name, None)
+        self._loaded_agents.pop(name, None)
+        self._failed.discard(name)
+        rel_path = self._python_index.get(name)
+        if rel_path is not None:
+            self._modules.pop(rel_path, None)
+
+        # Re-index changed files
         await self.load_all()
 
         return self.get_agent(name)
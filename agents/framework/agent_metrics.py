@@ -0,0 +1,208 @@
+"""
+Agent Metrics for Blackbox 5
+
+Low-overhead instrumentation for agent executions:
+- Spans: wall-clock timings per agent and phase (validate, before,
+  execute, after, skill_load)
+- Token counters per agent and kind (skill, execution)
+- A per-process aggregator exporting p50/p95/p99 from fixed log-scale
+  histograms, so recording is O(1) and memory does not grow with traffic
+"""
+
+import math
+import threading
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+
+class BudgetExceededError(Exception):
+    """Raised when an execution exceeds its token or time budget."""
+
+
+class Histogram:
+    """
+    Fixed log-scale histogram.
+
+    Buckets grow by a constant ratio (2 ** (1 / buckets_per_octave)), so
+    percentiles are accurate to within that ratio over the whole range.
+    Recording computes the bucket index directly; nothing is sorted.
+    """
+
+    __slots__ = ("minimum", "buckets_per_octave", "counts", "count", "total", "max")
+
+    def __init__(self, minimum: float = 1e-6, buckets_per_octave: int = 8, octaves: int = 40):
+        self.minimum = minimum
+        self.buckets_per_octave = buckets_per_octave
+        self.counts: List[int] = [0] * (octaves * buckets_per_octave + 1)
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def record(self, value: float) -> None:
+        """Add one observation."""
+        self.count += 1
+        self.total += value
+        if value > self.max:
+            self.max = value
+        if value <= self.minimum:
+            index = 0
+        else:
+            index = min(
+                len(self.counts) - 1,
+                int(math.log2(value / self.minimum) * self.buckets_per_octave) + 1
+            )
+        self.counts[index] += 1
+
+    def _upper_bound(self, index: int) -> float:
+        return self.minimum * 2 ** (index / self.buckets_per_octave)
+
+    def percentile(self, p: float) -> float:
+        """Get an upper estimate of the p-th percentile (0-100)."""
+        if not self.count:
+            return 0.0
+        rank = max(1, math.ceil(self.count * p / 100.0))
+        seen = 0
+        for index, bucket in enumerate(self.counts):
+            seen += bucket
+            if seen >= rank:
+                return min(self._upper_bound(index), self.max)
+        return self.max
+
+    def summary(self) -> Dict[str, float]:
+        """Get count, mean, max and p50/p95/p99."""
+        return {
+            "count": self.count,
+            "mean": self.total / self.count if self.count else 0.0,
+            "max": self.max,
+            "p50": self.percentile(50),
+            "p95": self.percentile(95),
+            "p99": self.percentile(99),
+        }
+
+
+class Span:
+    """Timing context for one phase; records into an AgentMetrics on exit."""
+
+    __slots__ = ("_metrics", "_agent", "_phase", "_start", "elapsed")
+
+    def __init__(self, metrics: "AgentMetrics", agent: str, phase: str):
+        self._metrics = metrics
+        self._agent = agent
+        self._phase = phase
+        self.elapsed = 0.0
+
+    def __enter__(self) -> "Span":
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> bool:
+        self.elapsed = time.perf_counter() - self._start
+        self._metrics.record_span(self._agent, self._phase, self.elapsed)
+        return False
+
+
+class AgentMetrics:
+    """
+    Per-process aggregator of agent spans and token spend.
+
+    Example:
+        ```python
+        metrics = get_agent_metrics()
+        with metrics.span("architect", "execute"):
+            ...
+        metrics.record_tokens("architect", "execution", 1200)
+        metrics.export()["architect"]["spans"]["execute"]["p95"]
+        ```
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._spans: Dict[Tuple[str, str], Histogram] = {}
+        self._tokens: Dict[Tuple[str, str], int] = {}
+        self._execution_tokens: Dict[str, Histogram] = {}
+        self._outcomes: Dict[Tuple[str, str], int] = {}
+
+    def span(self, agent: str, phase: str) -> Span:
+        """Time a phase: `with metrics.span(agent, phase): ...`"""
+        return Span(self, agent, phase)
+
+    def record_span(self, agent: str, phase: str, seconds: float) -> None:
+        """Record a phase duration in seconds."""
+        key = (agent, phase)
+        with self._lock:
+            histogram = self._spans.get(key)
+            if histogram is None:
+                histogram = self._spans[key] = Histogram()
+            histogram.record(seconds)
+
+    def record_tokens(self, agent: str, kind: str, count: int) -> None:
+        """Add to an agent's token counter for a kind of spend."""
+        if count <= 0:
+            return
+        key = (agent, kind)
+        with self._lock:
+            self._tokens[key] = self._tokens.get(key, 0) + count
+
+    def record_execution(self, agent: str, outcome: str, tokens: int) -> None:
+        """Record one finished execution and the tokens it spent."""
+        key = (agent, outcome)
+        with self._lock:
+            self._outcomes[key] = self._outcomes.get(key, 0) + 1
+            histogram = self._execution_tokens.get(agent)
+            if histogram is None:
+                histogram = self._execution_tokens[agent] = Histogram(minimum=1.0, octaves=32)
+            histogram.record(tokens)
+
+    def export(self, agent: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Export aggregated metrics.
+
+        Args:
+            agent: Only export this agent (all agents if None)
+
+        Returns:
+            {agent: {"spans": {phase: summary}, "tokens": {kind: total},
+                     "tokens_per_execution": summary, "executions": {outcome: n}}}
+        """
+        def entry(name: str) -> Dict[str, Any]:
+            return exported.setdefault(name, {
+                "spans": {}, "tokens": {}, "tokens_per_execution": {}, "executions": {}
+            })
+
+        exported: Dict[str, Dict[str, Any]] = {}
+        with self._lock:
+            for (name, phase), histogram in self._spans.items():
+                if agent is None or name == agent:
+                    entry(name)["spans"][phase] = histogram.summary()
+            for (name, kind), total in self._tokens.items():
+                if agent is None or name == agent:
+                    entry(name)["tokens"][kind] = total
+            for name, histogram in self._execution_tokens.items():
+                if agent is None or name == agent:
+                    entry(name)["tokens_per_execution"] = histogram.summary()
+            for (name, outcome), total in self._outcomes.items():
+                if agent is None or name == agent:
+                    entry(name)["executions"][outcome] = total
+        return exported
+
+    def reset(self) -> None:
+        """Drop all recorded metrics."""
+        with self._lock:
+            self._spans.clear()
+            self._tokens.clear()
+            self._execution_tokens.clear()
+            self._outcomes.clear()
+
+
+_agent_metrics: Optional[AgentMetrics] = None
+_agent_metrics_lock = threading.Lock()
+
+
+def get_agent_metrics() -> AgentMetrics:
+    """Get the process-wide AgentMetrics instance."""
+    global _agent_metrics
+    if _agent_metrics is None:
+        with _agent_metrics_lock:
+            if _agent_metrics is None:
+                _agent_metrics = AgentMetrics()
+    return _agent_metrics
@@ -11,16 +11,59 @@ Extended with Tier 2 Agent Skills support:
 """
 
 import asyncio
+import contextvars
 import logging
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Dict, List, Optional, Set, Union
 from enum import Enum
 
+from .agent_metrics import AgentMetrics, BudgetExceededError, get_agent_metrics
+
 logger = logging.getLogger(__name__)
 
+# Rough estimate: 1 token ≈ 4 characters
+CHARS_PER_TOKEN = 4
+
+
+def _estimate_tokens(text: str) -> int:
+    """Estimate the token count of text."""
+    return len(text) // CHARS_PER_TOKEN
+
+
+def _reported_tokens(result: 'AgentResult') -> int:
+    """
+    Get the tokens an agent reported in its result metadata.
+
+    Accepts either an OpenAI-style "usage" dict or a "tokens_used" count.
+    """
+    metadata = result.metadata or {}
+    usage = metadata.get("usage")
+    if isinstance(usage, dict):
+        return int(usage.get("total_tokens") or 0)
+    return int(metadata.get("tokens_used") or 0)
+
+
+class _ExecutionBudget:
+    """Token spend of one execute_with_hooks call."""
+
+    __slots__ = ("agent", "tokens", "live_tokens")
+
+    def __init__(self, agent: 'BaseAgent'):
+        self.agent = agent
+        self.tokens = 0
+        self.live_tokens = 0
+
+
+# The budget of the execution running in the current task. Each asyncio task
+# gets its own copy of the context, so concurrent executions of the same agent
+# never see each other's spend.
+_current_budget: contextvars.ContextVar[Optional[_ExecutionBudget]] = contextvars.ContextVar(
+    "agent_execution_budget", default=None
+)
+
 
 class AgentStatus(Enum):
     """Agent execution status."""
@@ -42,6 +85,8 @@ class AgentConfig:
     tools: List[str] = field(default_factory=list)
     temperature: float = 0.7
     max_tokens: int = 4096
+    max_execution_seconds: Optional[float] = None  # hard time budget per execution
+    max_execution_tokens: Optional[int] = None     # hard token budget per execution
     metadata: Dict[str, Any] = field(default_factory=dict)
 
 
@@ -97,8 +142,12 @@ class BaseAgent(ABC):
 
         # Tier 2 Skills support (NEW)
         self._loaded_skills: Dict[str, str] = {}  # skill_name -> content
+        self._full_skills: Set[str] = set()  # loaded with full content
         self._skill_manager: Optional['SkillManager'] = None
 
+        # Instrumentation and budget enforcement
+        self._metrics: AgentMetrics = get_agent_metrics()
+
         logger.info(f"Initialized agent: {self.name} ({self.role})")
 
     @property
@@ -199,7 +248,10 @@ class BaseAgent(ABC):
         Execute task with before/after hooks.
 
         This is the recommended way to execute tasks as it ensures
-        all hooks are called properly.
+        all hooks are called properly. Each phase is timed and token spend
+        is recorded in the process-wide AgentMetrics. If the config sets
+        max_execution_seconds or max_execution_tokens, an execution that
+        exceeds either is cancelled and returns a failed result.
 
         Args:
             task: The task to execute
@@ -207,10 +259,13 @@ class BaseAgent(ABC):
         Returns:
             AgentResult containing the execution outcome
         """
-        import time
+        metrics = self._metrics
 
         # Validate task
-        if not await self.validate_task(task):
+        with metrics.span(self.name, "validate"):
+            valid = await self.validate_task(task)
+        if not valid:
+            metrics.record_execution(self.name, "rejected", 0)
             return AgentResult(
                 success=False,
                 output="",
@@ -218,21 +273,64 @@ class BaseAgent(ABC):
             )
 
         # Call before hook
-        await self.before_execution(task)
+        with metrics.span(self.name, "before"):
+            await self.before_execution(task)
 
         # Execute task and measure duration
-        start_time = time.time()
-        try:
-            result = await self.execute(task)
-        except Exception as e:
-            logger.error(f"Agent {self.name} failed to execute task {task.id}: {e}")
-            result = AgentResult(
-                success=False,
-                output="",
-                error=str(e)
-            )
-
-        end_time = time.time()
+        budget = _ExecutionBudget(self)
+        budget_token = _current_budget.set(budget)
+        outcome = "success"
+        with metrics.span(self.name, "execute") as span:
+            timeout = self.config.max_execution_seconds
+            loop = asyncio.get_running_loop()
+            deadline = None
+            try:
+                if timeout is not None:
+                    deadline = loop.time() + timeout
+                    result = await asyncio.wait_for(self.execute(task), timeout)
+                else:
+                    result = await self.execute(task)
+            except asyncio.TimeoutError as e:
+                if deadline is not None and loop.time() >= deadline:
+                    outcome = "budget_exceeded"
+                    logger.warning(
+                        f"Agent {self.name} exceeded its {timeout}s time budget on task {task.id}"
+                    )
+                    result = AgentResult(
+                        success=False,
+                        output="",
+                        error=f"Execution exceeded time budget of {timeout}s"
+                    )
+                else:
+                    # Raised by the agent itself (e.g. an upstream request timed out)
+                    logger.error(f"Agent {self.name} failed to execute task {task.id}: {e!r}")
+                    result = AgentResult(
+                        success=False,
+                        output="",
+                        error=str(e) or "Timed out"
+                    )
+            except BudgetExceededError as e:
+                outcome = "budget_exceeded"
+                logger.warning(f"Agent {self.name} cancelled on task {task.id}: {e}")
+                result = AgentResult(success=False, output="", error=str(e))
+            except Exception as e:
+                logger.error(f"Agent {self.name} failed to execute task {task.id}: {e}")
+                result = AgentResult(
+                    success=False,
+                    output="",
+                    error=str(e)
+                )
+            finally:
+                _current_budget.reset(budget_token)
+
+        # Tokens reported in the result that were not already recorded live
+        unrecorded = _reported_tokens(result) - budget.live_tokens
+        if unrecorded > 0:
+            metrics.record_tokens(self.name, "execution", unrecorded)
+            budget.tokens += unrecorded
+        if outcome == "success" and not result.success:
+            outcome = "failure"
+        metrics.record_execution(self.name, outcome, budget.tokens)
 
         # Set duration if not already set by the agent
         if result.duration == 0.0:
@@ -243,15 +341,58 @@ class BaseAgent(ABC):
                 artifacts=result.artifacts,
                 metadata=result.metadata,
                 error=result.error,
-                duration=end_time - start_time,
+                duration=span.elapsed,
                 thinking_steps=result.thinking_steps
             )
 
         # Call after hook
-        await self.after_execution(task, result)
+        with metrics.span(self.name, "after"):
+            await self.after_execution(task, result)
 
         return result
 
+    def record_tokens(self, count: int, kind: str = "execution") -> None:
+        """
+        Record token spend for the current execution.
+
+        Agents call this as they consume tokens (for example after each
+        model call) so a runaway execution is stopped as soon as it crosses
+        max_execution_tokens rather than after it finishes. Spend is charged
+        to the execute_with_hooks call running in the current asyncio task;
+        outside one it is only counted in the metrics.
+
+        Args:
+            count: Tokens spent
+            kind: Spend category for metrics ("execution", "skill", ...)
+
+        Raises:
+            BudgetExceededError: If the execution's token budget is exceeded
+        """
+        self._metrics.record_tokens(self.name, kind, count)
+        budget = _current_budget.get()
+        if budget is None or budget.agent is not self:
+            return
+        budget.tokens += count
+        if kind == "execution":
+            budget.live_tokens += count
+        limit = self.config.max_execution_tokens
+        if limit is not None and budget.tokens > limit:
+            raise BudgetExceededError(
+                f"Execution exceeded token budget of {limit} ({budget.tokens} used)"
+            )
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """
+        Get this agent's aggregated timings and token spend.
+
+        Returns:
+            Span summaries (p50/p95/p99 per phase), token totals and
+            execution outcomes
+        """
+        return self._metrics.export(self.name).get(self.name, {
+            "spans": {}, "tokens": {}, "tokens_per_execution": {}, "executions": {}
+        })
+
     def get_capabilities(self) -> Dict[str, Any]:
         """
         Get agent capabilities and metadata.
@@ -296,15 +437,15 @@ class BaseAgent(ABC):
 
     def _get_skill_manager(self) -> 'SkillManager':
         """
-        Get or create the SkillManager instance.
+        Get the SkillManager instance (shared by all agents by default).
 
         Returns:
             SkillManager instance
         """
         if self._skill_manager is None:
             # Lazy import to avoid circular dependency
-            from agents.framework.skill_manager import SkillManager
-            self._skill_manager = SkillManager()
+            from agents.framework.skill_manager import get_skill_manager
+            self._skill_manager = get_skill_manager()
         return self._skill_manager
 
     async def load_skill(
@@ -322,8 +463,10 @@ class BaseAgent(ABC):
         Returns:
             True if skill loaded successfully, False otherwise
         """
-        # Check if already loaded
-        if skill_name in self._loaded_skills:
+        # Check if already loaded (a summary is upgraded when full content is requested)
+        if skill_name in self._loaded_skills and (
+            not force_full or skill_name in self._full_skills
+        ):
             logger.debug(f"Skill '{skill_name}' already loaded in agent {self.name}")
             return True
 
@@ -331,14 +474,14 @@ class BaseAgent(ABC):
         skill_manager = self._get_skill_manager()
 
         # Load skills if not already loaded
-        if not skill_manager._tier2_skills:
-            await skill_manager.load_all()
+        await skill_manager.ensure_loaded()
 
         # Get skill content (with progressive disclosure by default)
-        content = skill_manager.get_skill_content(
-            skill_name,
-            use_progressive=not force_full
-        )
+        with self._metrics.span(self.name, "skill_load"):
+            content = skill_manager.get_skill_content(
+                skill_name,
+                use_progressive=not force_full
+            )
 
         if content is None:
             logger.warning(f"Skill '{skill_name}' not found for agent {self.name}")
@@ -346,6 +489,11 @@ class BaseAgent(ABC):
 
         # Cache the content
         self._loaded_skills[skill_name] = content
+        self.record_tokens(_estimate_tokens(content), kind="skill")
+        if force_full:
+            self._full_skills.add(skill_name)
+        else:
+            self._full_skills.discard(skill_name)
         logger.info(f"Loaded skill '{skill_name}' in agent {self.name} (progressive={not force_full})")
 
         return True
@@ -430,6 +578,7 @@ class BaseAgent(ABC):
         """
         if skill_name in self._loaded_skills:
             del self._loaded_skills[skill_name]
+            self._full_skills.discard(skill_name)
             logger.info(f"Unloaded skill '{skill_name}' from agent {self.name}")
             return True
         return False
@@ -443,6 +592,7 @@ class BaseAgent(ABC):
         """
         count = len(self._loaded_skills)
         self._loaded_skills.clear()
+        self._full_skills.clear()
         logger.info(f"Unloaded all {count} skills from agent {self.name}")
         return count
 
@@ -454,8 +604,7 @@ class BaseAgent(ABC):
             Dict with token usage metrics
         """
         total_chars = sum(len(content) for content in self._loaded_skills.values())
-        # Rough estimate: 1 token ≈ 4 characters
-        total_tokens = total_chars // 4
+        total_tokens = total_chars // CHARS_PER_TOKEN
 
         return {
             "loaded_skills_count": len(self._loaded_skills),
@@ -473,8 +622,7 @@ class BaseAgent(ABC):
         skill_manager = self._get_skill_manager()
 
         # Ensure skills are loaded
-        if not skill_manager._tier2_skills:
-            await skill_manager.load_all()
+        await skill_manager.ensure_loaded()
 
         return skill_manager.list_all_skills()
 
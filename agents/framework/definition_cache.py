@@ -0,0 +1,195 @@
+"""
+Definition Cache for Blackbox 5
+
+Parses agent and skill definition files (YAML, JSON, SKILL.md) in a thread
+pool and keeps the parsed results in one compiled snapshot per source set.
+
+Each snapshot entry is keyed by file path and fingerprinted by mtime and
+size, so a warm start only stats the files and reads one JSON file; only
+new or changed files are parsed again.
+"""
+
+import hashlib
+import json
+import logging
+import os
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Bump when the snapshot layout changes so old snapshots are discarded
+SNAPSHOT_VERSION = 2
+
+# Default directory for compiled snapshots
+DEFAULT_CACHE_DIR = Path.home() / ".blackbox5" / ".cache"
+
+# Upper bound on parser threads
+MAX_PARSE_WORKERS = 8
+
+
+def parse_yaml_file(path: Path) -> Any:
+    """Parse a YAML file, using the libyaml loader when available."""
+    import yaml
+    loader = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+    with open(path, 'r') as f:
+        return yaml.load(f, Loader=loader)
+
+
+def parse_json_file(path: Path) -> Any:
+    """Parse a JSON file."""
+    with open(path, 'r') as f:
+        return json.load(f)
+
+
+def snapshot_path(kind: str, source: Path, cache_dir: Optional[Path] = None) -> Path:
+    """
+    Get the snapshot file for a kind of definition under a source directory.
+
+    Args:
+        kind: Short label such as "agent_yaml" or "skills_json"
+        source: Directory the definitions are read from
+        cache_dir: Snapshot directory (defaults to ~/.blackbox5/.cache)
+    """
+    key = hashlib.blake2b(str(Path(source).resolve()).encode('utf-8'), digest_size=8).hexdigest()
+    return (cache_dir or DEFAULT_CACHE_DIR) / f"{kind}_{key}.json"
+
+
+class DefinitionCache:
+    """
+    Compiled cache of parsed definition files.
+
+    Results of `parser` are stored per file together with the file's
+    (mtime_ns, size) fingerprint. Parse errors are cached too, so a broken
+    file is reported without being re-parsed until it changes.
+
+    Snapshots are plain JSON, like the agent manifest. Parsers that return
+    objects pass `encode`/`decode` to convert them; results that still do
+    not serialize are left out of the snapshot and parsed again next time.
+
+    Example:
+        ```python
+        cache = DefinitionCache(snapshot_path("agent_yaml", root), parse_yaml_file)
+        for path, data, error in cache.load(sorted(root.rglob("*.yaml"))):
+            ...
+        ```
+    """
+
+    def __init__(
+        self,
+        cache_file: Path,
+        parser: Callable[[Path], Any],
+        max_workers: int = MAX_PARSE_WORKERS,
+        encode: Optional[Callable[[Any], Any]] = None,
+        decode: Optional[Callable[[Any], Any]] = None
+    ):
+        self.cache_file = cache_file
+        self.parser = parser
+        self.max_workers = max_workers
+        self.encode = encode
+        self.decode = decode
+        self._entries: Dict[str, Tuple[Tuple[int, int], Any, Optional[str]]] = {}
+        self.parsed = 0
+        self.reused = 0
+        self._read_snapshot()
+
+    def _read_snapshot(self):
+        try:
+            with open(self.cache_file, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            if data.get('version') != SNAPSHOT_VERSION:
+                return
+            entries = {}
+            for key, (mtime_ns, size, parsed, error) in data['entries'].items():
+                if error is None and self.decode is not None:
+                    parsed = self.decode(parsed)
+                entries[key] = ((mtime_ns, size), parsed, error)
+            self._entries = entries
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            logger.debug(f"Discarding definition snapshot {self.cache_file}: {e}")
+            self._entries = {}
+
+    def _encode_entry(self, entry: Tuple[Tuple[int, int], Any, Optional[str]]) -> Optional[str]:
+        (mtime_ns, size), parsed, error = entry
+        try:
+            if error is None and self.encode is not None:
+                parsed = self.encode(parsed)
+            return json.dumps([mtime_ns, size, parsed, error])
+        except (TypeError, ValueError):
+            return None
+
+    def _write_snapshot(self):
+        encoded = []
+        for key, entry in self._entries.items():
+            value = self._encode_entry(entry)
+            if value is None:
+                logger.debug(f"Not snapshotting {key}: parsed result is not JSON serializable")
+                continue
+            encoded.append(f"{json.dumps(key)}: {value}")
+        try:
+            self.cache_file.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.cache_file.with_suffix(f".{os.getpid()}.tmp")
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                f.write(f'{{"version": {SNAPSHOT_VERSION}, "entries": {{')
+                f.write(", ".join(encoded))
+                f.write("}}")
+            tmp_path.replace(self.cache_file)
+        except Exception as e:
+            logger.debug(f"Could not write definition snapshot {self.cache_file}: {e}")
+
+    def _parse(self, path: Path) -> Tuple[Any, Optional[str]]:
+        try:
+            return self.parser(path), None
+        except Exception as e:
+            return None, f"{type(e).__name__}: {e}"
+
+    def load(self, files: List[Path]) -> List[Tuple[Path, Any, Optional[str]]]:
+        """
+        Get parsed results for files, parsing only new or changed ones.
+
+        Args:
+            files: Definition files, in the order results should be returned
+
+        Returns:
+            (path, parsed, error) per file; parsed is None when error is set
+        """
+        fingerprints: Dict[str, Tuple[int, int]] = {}
+        stale: List[Path] = []
+        for path in files:
+            key = str(path)
+            try:
+                st = path.stat()
+            except OSError:
+                continue
+            fingerprint = (st.st_mtime_ns, st.st_size)
+            fingerprints[key] = fingerprint
+            entry = self._entries.get(key)
+            if entry is None or entry[0] != fingerprint:
+                stale.append(path)
+
+        changed = bool(stale) or set(self._entries) - set(fingerprints)
+        if stale:
+            workers = max(1, min(self.max_workers, len(stale)))
+            if workers == 1:
+                results = [self._parse(path) for path in stale]
+            else:
+                with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="definition-parse") as pool:
+                    results = list(pool.map(self._parse, stale))
+            for path, (parsed, error) in zip(stale, results):
+                key = str(path)
+                self._entries[key] = (fingerprints[key], parsed, error)
+
+        self.parsed = len(stale)
+        self.reused = len(fingerprints) - len(stale)
+
+        if changed:
+            self._entries = {key: self._entries[key] for key in fingerprints}
+            self._write_snapshot()
+
+        return [
+            (path, self._entries[str(path)][1], self._entries[str(path)][2])
+            for path in files if str(path) in fingerprints
+        ]
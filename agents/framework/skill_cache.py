@@ -0,0 +1,390 @@
+"""
+Skill Cache for Blackbox 5
+
+Two-tier cache for skill content:
+- Memory: LRU of decompressed content, so a body is decompressed once per
+  process
+- Disk: content-addressed, zlib-compressed blobs with a size cap; entries
+  are evicted least recently used first
+
+Keys map to a content digest plus metadata, so identical bodies stored
+under several keys share one blob on disk.
+
+Several processes can share a cache directory: index writes merge with the
+index on disk under a file lock, and a blob is only deleted once no key in
+the merged index references it.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+import zlib
+from collections import OrderedDict
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Set
+
+try:
+    import fcntl
+except ImportError:  # Windows: index merges are not serialized across processes
+    fcntl = None
+
+logger = logging.getLogger(__name__)
+
+# Default location for the on-disk skill cache
+DEFAULT_SKILL_CACHE_DIR = Path.home() / ".claude" / "skills" / ".cache"
+
+
+class SkillCache:
+    """
+    Memory LRU in front of a compressed, content-addressed disk store.
+
+    Each entry may carry a `fingerprint` (for example the source file's
+    mtime and size); a lookup with a different fingerprint is a miss, so
+    edited skills are never served stale.
+
+    Example:
+        ```python
+        cache = SkillCache()
+        cache.put("skill:git-commit", body, tags=["git"], fingerprint=[mtime, size])
+        body = cache.get("skill:git-commit", fingerprint=[mtime, size])
+        ```
+    """
+
+    def __init__(
+        self,
+        cache_dir: Optional[Path] = None,
+        max_disk_bytes: int = 50 * 1024 * 1024,
+        max_memory_items: int = 256
+    ):
+        self.cache_dir = Path(cache_dir or DEFAULT_SKILL_CACHE_DIR)
+        self.max_disk_bytes = max_disk_bytes
+        self.max_memory_items = max_memory_items
+        self._lock = threading.RLock()
+
+        # key -> decompressed content
+        self._memory: "OrderedDict[str, str]" = OrderedDict()
+        # key -> {digest, size, stored, fingerprint, tags, metadata, cached_at}, LRU order
+        self._index: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        # digest -> number of keys referencing it, and its compressed size
+        self._refs: Dict[str, int] = {}
+        self._blob_sizes: Dict[str, int] = {}
+        self._disk_bytes = 0
+        self._index_dirty = False
+        # Changes since the last index write, replayed onto the on-disk index
+        self._changed: Set[str] = set()
+        self._removed: Dict[str, str] = {}   # key -> digest this process dropped
+        self._orphans: Set[str] = set()      # digests that may be unreferenced
+
+        self.hits = 0
+        self.memory_hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+        self._load_index()
+
+    # ========== Persistence ==========
+
+    @property
+    def _index_file(self) -> Path:
+        return self.cache_dir / "index.json"
+
+    def _blob_path(self, digest: str) -> Path:
+        return self.cache_dir / "objects" / digest[:2] / digest[2:]
+
+    @contextmanager
+    def _disk_lock(self) -> Iterator[None]:
+        """Serialize index and blob changes with other processes."""
+        if fcntl is None:
+            yield
+            return
+        with open(self.cache_dir / ".lock", 'a') as lock_file:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+    def _read_disk_index(self) -> "OrderedDict[str, Dict[str, Any]]":
+        try:
+            with open(self._index_file, 'r') as f:
+                return OrderedDict((key, entry) for key, entry in json.load(f).get('entries', []))
+        except (OSError, ValueError):
+            return OrderedDict()
+
+    def _load_index(self) -> None:
+        self._set_index(OrderedDict(
+            (key, entry) for key, entry in self._read_disk_index().items()
+            if self._blob_path(entry['digest']).exists()
+        ))
+
+    def _set_index(self, index: "OrderedDict[str, Dict[str, Any]]") -> None:
+        """Replace the key index and recount blob references."""
+        for key in list(self._memory):
+            old, new = self._index.get(key), index.get(key)
+            if old is None or new is None or old['digest'] != new['digest']:
+                del self._memory[key]
+
+        self._index = index
+        self._refs = {}
+        self._blob_sizes = {}
+        self._disk_bytes = 0
+        for entry in index.values():
+            digest = entry['digest']
+            if digest not in self._refs:
+                self._refs[digest] = 0
+                self._blob_sizes[digest] = entry['stored']
+                self._disk_bytes += entry['stored']
+            self._refs[digest] += 1
+
+    def _merge_disk_index(self) -> None:
+        """
+        Apply this process's changes on top of the current on-disk index.
+
+        Keys this process stored win; keys it dropped are removed only if
+        the disk still holds the version it dropped; everything else comes
+        from disk, so other processes' entries are kept.
+        """
+        merged = OrderedDict()
+        for key, entry in self._read_disk_index().items():
+            if key in self._changed:
+                continue
+            if self._removed.get(key) == entry['digest']:
+                continue
+            merged[key] = entry
+        for key in self._index:
+            if key in self._changed:
+                merged[key] = self._index[key]
+        self._set_index(merged)
+
+    def flush(self) -> None:
+        """Merge this process's index changes into the index on disk."""
+        with self._lock:
+            if not self._index_dirty:
+                return
+            try:
+                self.cache_dir.mkdir(parents=True, exist_ok=True)
+                with self._disk_lock():
+                    self._write_index()
+            except OSError as e:
+                logger.debug(f"Could not write skill cache index: {e}")
+
+    def _write_index(self) -> None:
+        """Merge, evict and write the index, then delete unreferenced blobs (disk lock held)."""
+        self._merge_disk_index()
+        self._evict()
+
+        tmp_path = self._index_file.with_suffix(f".{os.getpid()}.tmp")
+        with open(tmp_path, 'w') as f:
+            json.dump({'entries': list(self._index.items())}, f)
+        tmp_path.replace(self._index_file)
+
+        for digest in self._orphans:
+            if digest not in self._refs:
+                try:
+                    self._blob_path(digest).unlink()
+                except OSError:
+                    pass
+        self._orphans.clear()
+        self._changed.clear()
+        self._removed.clear()
+        self._index_dirty = False
+
+    # ========== Cache Operations ==========
+
+    def put(
+        self,
+        key: str,
+        content: str,
+        tags: Optional[List[str]] = None,
+        metadata: Optional[Dict[str, Any]] = None,
+        fingerprint: Optional[Any] = None
+    ) -> str:
+        """
+        Store content under a key.
+
+        Returns:
+            Content digest (the blob's address)
+        """
+        data = content.encode('utf-8')
+        digest = hashlib.sha256(data).hexdigest()
+
+        with self._lock:
+            try:
+                self.cache_dir.mkdir(parents=True, exist_ok=True)
+                with self._disk_lock():
+                    stored = self._write_blob(digest, data)
+                    self._store_entry(key, digest, len(data), stored, content, tags, metadata, fingerprint)
+                    self._write_index()
+            except OSError as e:
+                logger.debug(f"Could not write skill cache entry: {e}")
+                if key not in self._index:
+                    self._store_entry(key, digest, len(data), 0, content, tags, metadata, fingerprint)
+        return digest
+
+    def _write_blob(self, digest: str, data: bytes) -> int:
+        """Write a blob unless it is already on disk; returns its stored size."""
+        blob_path = self._blob_path(digest)
+        try:
+            return blob_path.stat().st_size
+        except OSError:
+            pass
+        compressed = zlib.compress(data, 6)
+        blob_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = blob_path.with_name(f"{blob_path.name}.{os.getpid()}.tmp")
+        with open(tmp_path, 'wb') as f:
+            f.write(compressed)
+        tmp_path.replace(blob_path)
+        return len(compressed)
+
+    def _store_entry(
+        self,
+        key: str,
+        digest: str,
+        size: int,
+        stored: int,
+        content: str,
+        tags: Optional[List[str]],
+        metadata: Optional[Dict[str, Any]],
+        fingerprint: Optional[Any]
+    ) -> None:
+        self._drop_key(key)
+        if digest not in self._refs:
+            self._refs[digest] = 0
+            self._blob_sizes[digest] = stored
+            self._disk_bytes += stored
+        self._refs[digest] += 1
+        self._orphans.discard(digest)
+        self._index[key] = {
+            'digest': digest,
+            'size': size,
+            'stored': self._blob_sizes[digest],
+            'fingerprint': _plain(fingerprint),
+            'tags': list(tags or []),
+            'metadata': metadata or {},
+            'cached_at': time.time(),
+        }
+        self._changed.add(key)
+        self._removed.pop(key, None)
+        self._index_dirty = True
+        self._remember(key, content)
+
+    def get(self, key: str, fingerprint: Optional[Any] = None) -> Optional[str]:
+        """
+        Get content by key.
+
+        Args:
+            key: Cache key
+            fingerprint: If given, must match the stored fingerprint
+
+        Returns:
+            Content, or None on a miss
+        """
+        with self._lock:
+            entry = self._index.get(key)
+            if entry is None or (fingerprint is not None and entry['fingerprint'] != _plain(fingerprint)):
+                self.misses += 1
+                return None
+
+            self._index.move_to_end(key)
+            content = self._memory.get(key)
+            if content is not None:
+                self._memory.move_to_end(key)
+                self.hits += 1
+                self.memory_hits += 1
+                return content
+
+            try:
+                with open(self._blob_path(entry['digest']), 'rb') as f:
+                    content = zlib.decompress(f.read()).decode('utf-8')
+            except (OSError, zlib.error) as e:
+                logger.debug(f"Dropping unreadable skill cache entry {key}: {e}")
+                self._drop_key(key)
+                self._index_dirty = True
+                self.misses += 1
+                return None
+
+            self.hits += 1
+            self._remember(key, content)
+            return content
+
+    def invalidate(self, key: str) -> bool:
+        """Remove a key from both tiers."""
+        with self._lock:
+            removed = self._drop_key(key)
+            if removed:
+                self._index_dirty = True
+        if removed:
+            self.flush()
+        return removed
+
+    def search_by_tag(self, tag: str) -> List[str]:
+        """Get keys whose entries carry a tag."""
+        with self._lock:
+            return [key for key, entry in self._index.items() if tag in entry['tags']]
+
+    def clear(self) -> None:
+        """Remove all cached content."""
+        with self._lock:
+            for key in list(self._index):
+                self._drop_key(key)
+            self._memory.clear()
+            self._index_dirty = True
+        self.flush()
+
+    def stats(self) -> Dict[str, Any]:
+        """Get cache statistics."""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "total_items": len(self._index),
+                "memory_items": len(self._memory),
+                "total_size_bytes": self._disk_bytes,
+                "total_size_mb": round(self._disk_bytes / (1024 * 1024), 3),
+                "utilization_percent": round(100.0 * self._disk_bytes / self.max_disk_bytes, 2)
+                if self.max_disk_bytes else 0.0,
+                "hits": self.hits,
+                "memory_hits": self.memory_hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+                "evictions": self.evictions,
+            }
+
+    # ========== Internals ==========
+
+    def _remember(self, key: str, content: str) -> None:
+        self._memory[key] = content
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_memory_items:
+            self._memory.popitem(last=False)
+
+    def _drop_key(self, key: str) -> bool:
+        """Forget a key; its blob is deleted at the next index write if unreferenced."""
+        self._memory.pop(key, None)
+        entry = self._index.pop(key, None)
+        if entry is None:
+            return False
+
+        digest = entry['digest']
+        self._changed.discard(key)
+        self._removed[key] = digest
+        self._refs[digest] -= 1
+        if self._refs[digest] <= 0:
+            del self._refs[digest]
+            self._disk_bytes -= self._blob_sizes.pop(digest, 0)
+            self._orphans.add(digest)
+        return True
+
+    def _evict(self) -> None:
+        while self._disk_bytes > self.max_disk_bytes and len(self._index) > 1:
+            oldest = next(iter(self._index))
+            self._drop_key(oldest)
+            self.evictions += 1
+
+
+def _plain(value: Any) -> Any:
+    """Normalize a fingerprint to its JSON round-trip form."""
+    return json.loads(json.dumps(value))
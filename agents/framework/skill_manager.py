@@ -12,7 +12,6 @@ Extended with Tier 2 Agent Skills Standard support:
 import asyncio
 import importlib
 import importlib.util
-import json
 import logging
 from dataclasses import dataclass, field
 from datetime import datetime
@@ -20,6 +19,10 @@ from pathlib import Path
 from typing import Dict, List, Optional, Set, Any, Union
 from enum import Enum
 
+from .definition_cache import DefinitionCache, parse_json_file, snapshot_path
+from .skill_cache import SkillCache
+from .skill_search import BM25Index
+
 logger = logging.getLogger(__name__)
 
 
@@ -90,6 +93,14 @@ class AgentSkill:
             "file_path": str(self.file_path) if self.file_path else None,
         }
 
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'AgentSkill':
+        """Create a skill from the output of to_dict()."""
+        fields = {k: v for k, v in data.items() if k != "tier"}
+        if fields.get("file_path"):
+            fields["file_path"] = Path(fields["file_path"])
+        return cls(**fields)
+
     @classmethod
     def from_markdown(cls, path: Path) -> 'AgentSkill':
         """
@@ -183,6 +194,15 @@ class AgentSkill:
 Use `load_skill_full` for complete content."""
 
 
+def _file_fingerprint(path: Path) -> Optional[List[Any]]:
+    """Identify a file version by path, mtime and size (None if missing)."""
+    try:
+        st = path.stat()
+    except OSError:
+        return None
+    return [str(path), st.st_mtime_ns, st.st_size]
+
+
 class SkillManager:
     """
     Skill discovery and management system with two-tier support.
@@ -210,16 +230,29 @@ class SkillManager:
 
         # Tier 1: Python-based skills (existing)
         self._skills: Dict[str, Skill] = {}
-        self._skills_by_category: Dict[str, List[str]] = {}
-        self._agent_skill_map: Dict[str, List[str]] = {}  # agent_name -> [skill_names]
+        # Indexes use dicts as insertion-ordered sets for O(1) removal
+        self._skills_by_category: Dict[str, Dict[str, None]] = {}
+        self._agent_skill_map: Dict[str, Dict[str, None]] = {}  # agent_name -> skill_names
 
         # Tier 2: Agent Skills Standard (NEW)
         self._tier2_skills_path = Path.home() / ".claude" / "skills"
         self._tier2_skills: Dict[str, AgentSkill] = {}
-        self._tier2_tags_index: Dict[str, List[str]] = {}  # tag -> [skill_names]
+        self._tier2_tags_index: Dict[str, Dict[str, None]] = {}  # tag -> skill_names
 
-        # Advanced caching with ContextManager (NEW)
-        self._cache_manager: Optional['ContextManager'] = None
+        # Full-text index over both tiers, keyed "tier:name"
+        self._search_index = BM25Index()
+
+        # Resolved per-agent skill lists, valid while _generation is unchanged
+        self._generation = 0
+        self._agent_skills_cache: Dict[str, tuple] = {}
+        self._enabled_skills_cache: Optional[tuple] = None
+        self._loaded = False
+
+        # Compiled snapshots of parsed definition files
+        self._definition_caches: Dict[tuple, DefinitionCache] = {}
+
+        # Tiered skill content cache (memory LRU + compressed disk store)
+        self._cache_manager: Optional[SkillCache] = None
         self._cache_enabled = True
 
         logger.info(f"SkillManager initialized with Tier 1 path: {self.skills_path}")
@@ -235,6 +268,11 @@ class SkillManager:
         self._tier2_skills_path = path
         logger.debug(f"Tier 2 skills path set to: {path}")
 
+    async def ensure_loaded(self) -> None:
+        """Load all skills once; later calls return immediately."""
+        if not self._loaded:
+            await self.load_all()
+
     async def load_all(self) -> List[Union[Skill, AgentSkill]]:
         """
         Load all available skills from both Tier 1 and Tier 2 sources.
@@ -255,20 +293,35 @@ class SkillManager:
         # Load Tier 2 skills (NEW - Agent Skills Standard)
         await self._load_tier2_skills()
 
+        self._loaded = True
         tier1_count = len(self._skills)
         tier2_count = len(self._tier2_skills)
         logger.info(f"Loaded {tier1_count} Tier 1 skills and {tier2_count} Tier 2 skills")
 
         return list(self._skills.values()) + list(self._tier2_skills.values())
 
+    def _definition_cache(
+        self, kind: str, source: Path, parser, encode=None, decode=None
+    ) -> DefinitionCache:
+        """Get the compiled definition cache for a source directory."""
+        key = (kind, source)
+        cache = self._definition_caches.get(key)
+        if cache is None:
+            cache = DefinitionCache(
+                snapshot_path(kind, source), parser, encode=encode, decode=decode
+            )
+            self._definition_caches[key] = cache
+        return cache
+
     async def _load_json_skills(self) -> None:
         """Load skills from JSON definition files."""
         json_files = list(self.skills_path.rglob("*.json"))
+        cache = self._definition_cache("skills_json", self.skills_path, parse_json_file)
 
-        for json_file in json_files:
+        for json_file, data, error in cache.load(json_files):
             try:
-                with open(json_file, 'r') as f:
-                    data = json.load(f)
+                if error:
+                    raise ValueError(error)
 
                 if 'name' not in data or 'description' not in data:
                     logger.debug(f"Skipping invalid skill file: {json_file}")
@@ -286,7 +339,7 @@ class SkillManager:
                     enabled=data.get('enabled', True)
                 )
 
-                self._skills[skill.name] = skill
+                self._index_skill(skill)
                 logger.debug(f"Loaded JSON skill: {skill.name}")
 
             except Exception as e:
@@ -350,7 +403,7 @@ class SkillManager:
                         capabilities=skill_info.get('capabilities', []),
                         metadata=skill_info,
                     )
-                    self._skills[skill.name] = skill
+                    self._index_skill(skill)
                     logger.debug(f"Loaded Python skill: {skill.name}")
                 except Exception as e:
                     logger.debug(f"Failed to create skill from {name}: {e}")
@@ -368,27 +421,24 @@ class SkillManager:
 
         logger.info(f"Loading Tier 2 skills from: {self._tier2_skills_path}")
 
-        # Find all SKILL.md files
+        # Find all SKILL.md files; changed ones are parsed concurrently
         skill_files = list(self._tier2_skills_path.rglob("SKILL.md"))
+        cache = self._definition_cache(
+            "skills_tier2", self._tier2_skills_path, AgentSkill.from_markdown,
+            encode=AgentSkill.to_dict, decode=AgentSkill.from_dict
+        )
 
-        for skill_file in skill_files:
+        for skill_file, skill, error in cache.load(skill_files):
             try:
-                skill = AgentSkill.from_markdown(skill_file)
+                if error:
+                    raise ValueError(error)
 
                 # Check if skill is enabled
                 if not skill.enabled:
                     logger.debug(f"Skipping disabled skill: {skill.name}")
                     continue
 
-                self._tier2_skills[skill.name] = skill
-
-                # Index by tags
-                for tag in skill.tags:
-                    if tag not in self._tier2_tags_index:
-                        self._tier2_tags_index[tag] = []
-                    if skill.name not in self._tier2_tags_index[tag]:
-                        self._tier2_tags_index[tag].append(skill.name)
-
+                self._index_tier2_skill(skill)
                 logger.debug(f"Loaded Tier 2 skill: {skill.name} from {skill_file}")
 
             except Exception as e:
@@ -397,13 +447,87 @@ class SkillManager:
         logger.info(f"Loaded {len(self._tier2_skills)} Tier 2 skills")
 
     def _organize_skills(self) -> None:
-        """Organize skills by category."""
+        """Rebuild the category index from the Tier 1 skills."""
         self._skills_by_category.clear()
 
         for skill_name, skill in self._skills.items():
-            if skill.category not in self._skills_by_category:
-                self._skills_by_category[skill.category] = []
-            self._skills_by_category[skill.category].append(skill_name)
+            self._skills_by_category.setdefault(skill.category, {})[skill_name] = None
+        self._invalidate()
+
+    # ========== Indexes ==========
+
+    def _invalidate(self) -> None:
+        """Drop resolved skill lists after any change to skills or mappings."""
+        self._generation += 1
+        self._agent_skills_cache.clear()
+        self._enabled_skills_cache = None
+
+    def _index_skill(self, skill: Skill) -> None:
+        """Add or replace a Tier 1 skill in all indexes."""
+        if skill.name in self._skills:
+            self._unindex_skill(skill.name)
+
+        self._skills[skill.name] = skill
+        self._skills_by_category.setdefault(skill.category, {})[skill.name] = None
+        self._search_index.add(
+            f"1:{skill.name}",
+            f"{skill.name} {skill.name} {skill.description} {' '.join(skill.capabilities)}"
+        )
+        self._invalidate()
+
+    def _unindex_skill(self, name: str) -> Optional[Skill]:
+        """Remove a Tier 1 skill from all indexes."""
+        skill = self._skills.pop(name, None)
+        if skill is None:
+            return None
+
+        names = self._skills_by_category.get(skill.category)
+        if names is not None:
+            names.pop(name, None)
+            if not names:
+                del self._skills_by_category[skill.category]
+        self._search_index.remove(f"1:{name}")
+        self._invalidate()
+        return skill
+
+    def _index_tier2_skill(self, skill: AgentSkill) -> None:
+        """Add or replace a Tier 2 skill in all indexes."""
+        previous = self._tier2_skills.get(skill.name)
+        if previous is not None:
+            for tag in previous.tags:
+                names = self._tier2_tags_index.get(tag)
+                if names is not None:
+                    names.pop(skill.name, None)
+                    if not names:
+                        del self._tier2_tags_index[tag]
+
+        self._tier2_skills[skill.name] = skill
+        for tag in skill.tags:
+            self._tier2_tags_index.setdefault(tag, {})[skill.name] = None
+        self._search_index.add(
+            f"2:{skill.name}",
+            f"{skill.name} {skill.name} {skill.description} {' '.join(skill.tags)}"
+        )
+        self._invalidate()
+
+    def search_skills(self, query: str, limit: int = 10) -> List[Union[Skill, AgentSkill]]:
+        """
+        Fuzzy full-text search over skill names, descriptions and tags.
+
+        Args:
+            query: Free-text query; partial words match by prefix
+            limit: Maximum number of results
+
+        Returns:
+            Matching skills from both tiers, best match first
+        """
+        results = []
+        for doc_id, _ in self._search_index.search(query, limit):
+            tier, name = doc_id.split(":", 1)
+            skill = self._tier2_skills.get(name) if tier == "2" else self._skills.get(name)
+            if skill is not None:
+                results.append(skill)
+        return results
 
     def get_skill(self, name: str) -> Optional[Union[Skill, AgentSkill]]:
         """
@@ -449,7 +573,7 @@ class SkillManager:
                 return skill.get_summary()
             else:
                 # Return full content
-                return skill.content
+                return self.get_skill_body(name)
         else:
             # Tier 1 skill
             return skill.description
@@ -464,8 +588,8 @@ class SkillManager:
         Returns:
             List of skills with this tag
         """
-        skill_names = self._tier2_tags_index.get(tag, [])
-        return [self._tier2_skills[name] for name in skill_names if name in self._tier2_skills]
+        skill_names = self._tier2_tags_index.get(tag, ())
+        return [self._tier2_skills[name] for name in skill_names]
 
     def list_tier2_skills(self) -> List[str]:
         """
@@ -507,8 +631,8 @@ class SkillManager:
         Returns:
             List of skills in the category
         """
-        skill_names = self._skills_by_category.get(category, [])
-        return [self._skills[name] for name in skill_names if name in self._skills]
+        skill_names = self._skills_by_category.get(category, ())
+        return [self._skills[name] for name in skill_names]
 
     def list_categories(self) -> List[str]:
         """
@@ -531,21 +655,24 @@ class SkillManager:
         """
         # Check if agent has specific skills mapped
         if agent_name in self._agent_skill_map:
-            skill_names = self._agent_skill_map[agent_name]
-            skills = []
-            for name in skill_names:
-                # Check Tier 2 first
-                if name in self._tier2_skills:
-                    skills.append(self._tier2_skills[name])
-                # Fall back to Tier 1
-                elif name in self._skills:
-                    skills.append(self._skills[name])
-            return skills
+            skills = self._agent_skills_cache.get(agent_name)
+            if skills is None:
+                resolved = []
+                for name in self._agent_skill_map[agent_name]:
+                    # Check Tier 2 first, fall back to Tier 1
+                    skill = self._tier2_skills.get(name) or self._skills.get(name)
+                    if skill is not None:
+                        resolved.append(skill)
+                skills = self._agent_skills_cache[agent_name] = tuple(resolved)
+            return list(skills)
 
         # Return all enabled skills from both tiers by default
-        tier1_skills = [s for s in self._skills.values() if s.enabled]
-        tier2_skills = [s for s in self._tier2_skills.values() if s.enabled]
-        return tier1_skills + tier2_skills
+        if self._enabled_skills_cache is None:
+            self._enabled_skills_cache = tuple(
+                [s for s in self._skills.values() if s.enabled] +
+                [s for s in self._tier2_skills.values() if s.enabled]
+            )
+        return list(self._enabled_skills_cache)
 
     def map_skill_to_agent(self, skill_name: str, agent_name: str) -> bool:
         """
@@ -562,11 +689,10 @@ class SkillManager:
             logger.warning(f"Skill not found: {skill_name}")
             return False
 
-        if agent_name not in self._agent_skill_map:
-            self._agent_skill_map[agent_name] = []
-
-        if skill_name not in self._agent_skill_map[agent_name]:
-            self._agent_skill_map[agent_name].append(skill_name)
+        mapped = self._agent_skill_map.setdefault(agent_name, {})
+        if skill_name not in mapped:
+            mapped[skill_name] = None
+            self._agent_skills_cache.pop(agent_name, None)
             logger.info(f"Mapped skill '{skill_name}' to agent '{agent_name}'")
 
         return True
@@ -578,14 +704,7 @@ class SkillManager:
         Args:
             skill: Skill to register
         """
-        self._skills[skill.name] = skill
-
-        if skill.category not in self._skills_by_category:
-            self._skills_by_category[skill.category] = []
-
-        if skill.name not in self._skills_by_category[skill.category]:
-            self._skills_by_category[skill.category].append(skill.name)
-
+        self._index_skill(skill)
         logger.info(f"Registered skill: {skill.name}")
 
     def unregister_skill(self, name: str) -> bool:
@@ -598,55 +717,83 @@ class SkillManager:
         Returns:
             True if unregistered, False if not found
         """
-        if name in self._skills:
-            skill = self._skills[name]
-            category = skill.category
+        if self._unindex_skill(name) is None:
+            return False
 
-            del self._skills[name]
+        # Remove from agent mappings
+        for mapped in self._agent_skill_map.values():
+            mapped.pop(name, None)
 
-            if category in self._skills_by_category:
-                self._skills_by_category[category].remove(name)
+        logger.info(f"Unregistered skill: {name}")
+        return True
 
-            # Remove from agent mappings
-            for agent_name in self._agent_skill_map:
-                if name in self._agent_skill_map[agent_name]:
-                    self._agent_skill_map[agent_name].remove(name)
+    # ========== Skill Content Cache ==========
 
-            logger.info(f"Unregistered skill: {name}")
-            return True
+    def _get_cache_manager(self) -> Optional[SkillCache]:
+        """
+        Get or create the tiered skill cache.
 
-        return False
+        Returns:
+            SkillCache instance, or None if caching is disabled
+        """
+        if self._cache_manager is None and self._cache_enabled:
+            self._cache_manager = SkillCache(
+                cache_dir=Path.home() / ".claude" / "skills" / ".cache",
+                max_disk_bytes=50 * 1024 * 1024  # 50MB skill cache
+            )
+            logger.info(f"Skill cache initialized at {self._cache_manager.cache_dir}")
 
-    # ========== Advanced Caching with ContextManager (NEW) ==========
+        return self._cache_manager
 
-    def _get_cache_manager(self) -> Optional['ContextManager']:
+    def get_skill_body(self, name: str) -> Optional[str]:
         """
-        Get or create the ContextManager for skill caching.
+        Get the full content of a skill through the skill cache.
+
+        Tier 2 bodies are cached per process (memory) and across processes
+        (compressed on disk), validated against the SKILL.md file's mtime
+        and size, so repeated loads do not go back to the markdown.
+
+        Args:
+            name: Skill name
 
         Returns:
-            ContextManager instance or None if not available
+            Full skill content, or None if not found
         """
-        if self._cache_manager is None:
-            try:
-                # Try to import ContextManager from runtime
-                from runtime.context.manager import ContextManager
+        skill = self.get_skill(name)
+        if skill is None:
+            return None
+        if not isinstance(skill, AgentSkill):
+            return skill.description
 
-                cache_root = Path.home() / ".claude" / "skills" / ".cache"
-                cache_root.mkdir(parents=True, exist_ok=True)
+        cache = self._get_cache_manager()
+        if cache is None or skill.file_path is None:
+            return skill.content
 
-                self._cache_manager = ContextManager(
-                    context_root=cache_root,
-                    max_size_mb=50.0,  # 50MB skill cache
-                    enable_compression=True,
-                    enable_semantic_index=False
-                )
-                logger.info(f"ContextManager initialized for skill caching at {cache_root}")
-            except ImportError:
-                # ContextManager not available, disable caching
-                logger.debug("ContextManager not available, caching disabled")
-                self._cache_enabled = False
+        fingerprint = _file_fingerprint(skill.file_path)
+        if fingerprint is None:
+            return skill.content
 
-        return self._cache_manager
+        key = f"skill:{name}"
+        content = cache.get(key, fingerprint=fingerprint)
+        if content is not None:
+            return content
+
+        # The loaded skill may predate an edit, so re-read the file and only
+        # cache it under the fingerprint it was read at
+        try:
+            content = AgentSkill.from_markdown(skill.file_path).content
+        except (OSError, ValueError) as e:
+            logger.debug(f"Could not re-read skill {name}: {e}")
+            return skill.content
+
+        if _file_fingerprint(skill.file_path) == fingerprint:
+            cache.put(
+                key, content,
+                tags=list(skill.tags) + ["skill", "cached"],
+                metadata={"type": "skill", "skill_name": name, "tier": 2},
+                fingerprint=fingerprint
+            )
+        return content
 
     async def cache_skill_content(
         self,
@@ -656,7 +803,7 @@ class SkillManager:
         metadata: Optional[Dict[str, Any]] = None
     ) -> bool:
         """
-        Cache skill content using ContextManager.
+        Cache skill content in the tiered skill cache.
 
         Args:
             skill_name: Name of the skill
@@ -667,24 +814,21 @@ class SkillManager:
         Returns:
             True if cached successfully, False otherwise
         """
-        if not self._cache_enabled:
-            return False
-
-        cache_mgr = self._get_cache_manager()
-        if cache_mgr is None:
+        cache = self._get_cache_manager()
+        if cache is None:
             return False
 
         try:
-            await cache_mgr.add_context(
-                key=f"skill:{skill_name}",
-                value=content,
+            cache.put(
+                f"skill:{skill_name}",
+                content,
+                tags=tags + ["skill", "cached"],  # Add standard tags
                 metadata={
                     "type": "skill",
                     "skill_name": skill_name,
                     "cached_at": datetime.utcnow().isoformat(),
                     **(metadata or {})
-                },
-                tags=tags + ["skill", "cached"]  # Add standard tags
+                }
             )
             logger.debug(f"Cached skill content: {skill_name}")
             return True
@@ -702,15 +846,11 @@ class SkillManager:
         Returns:
             Cached content or None if not in cache
         """
-        if not self._cache_enabled:
-            return None
-
-        cache_mgr = self._get_cache_manager()
-        if cache_mgr is None:
+        cache = self._get_cache_manager()
+        if cache is None:
             return None
 
-        content = await cache_mgr.get_context(f"skill:{skill_name}")
-        return content
+        return cache.get(f"skill:{skill_name}")
 
     async def search_cached_skills_by_tag(self, tag: str) -> List[str]:
         """
@@ -722,16 +862,13 @@ class SkillManager:
         Returns:
             List of skill names with this tag
         """
-        if not self._cache_enabled:
-            return []
-
-        cache_mgr = self._get_cache_manager()
-        if cache_mgr is None:
+        cache = self._get_cache_manager()
+        if cache is None:
             return []
 
-        skill_keys = await cache_mgr.search_by_tag(tag)
+        skill_keys = cache.search_by_tag(tag)
         # Remove "skill:" prefix
-        return [k.replace("skill:", "") for k in skill_keys if k.startswith("skill:")]
+        return [k.replace("skill:", "", 1) for k in skill_keys if k.startswith("skill:")]
 
     def get_cache_stats(self) -> Dict[str, Any]:
         """
@@ -740,20 +877,20 @@ class SkillManager:
         Returns:
             Dictionary with cache statistics
         """
-        if not self._cache_enabled:
-            return {"enabled": False}
-
-        cache_mgr = self._get_cache_manager()
-        if cache_mgr is None:
+        cache = self._get_cache_manager()
+        if cache is None:
             return {"enabled": False}
 
-        summary = cache_mgr.get_context_summary()
+        summary = cache.stats()
         return {
             "enabled": True,
-            "total_cached_items": summary.get("total_items", 0),
-            "total_size_bytes": summary.get("total_size_bytes", 0),
-            "total_size_mb": summary.get("total_size_mb", 0.0),
-            "utilization_percent": summary.get("utilization_percent", 0.0),
+            "total_cached_items": summary["total_items"],
+            "memory_cached_items": summary["memory_items"],
+            "total_size_bytes": summary["total_size_bytes"],
+            "total_size_mb": summary["total_size_mb"],
+            "utilization_percent": summary["utilization_percent"],
+            "hit_rate": summary["hit_rate"],
+            "evictions": summary["evictions"],
         }
 
     def clear_skill_cache(self) -> bool:
@@ -763,17 +900,33 @@ class SkillManager:
         Returns:
             True if cleared successfully, False otherwise
         """
-        if not self._cache_enabled:
+        cache = self._get_cache_manager()
+        if cache is None:
             return False
 
-        cache_mgr = self._get_cache_manager()
-        if cache_mgr is None:
-            return False
-
-        cache_mgr.clear_context(confirm=True)
+        cache.clear()
         logger.info("Cleared all skill cache")
         return True
 
+# Global singleton
+_skill_manager: Optional[SkillManager] = None
+
+
+def get_skill_manager() -> SkillManager:
+    """
+    Get the shared skill manager.
+
+    Agents share one manager so skills and their indexes are loaded once
+    per process instead of once per agent.
+
+    Returns:
+        The global SkillManager instance
+    """
+    global _skill_manager
+    if _skill_manager is None:
+        _skill_manager = SkillManager()
+    return _skill_manager
+
 
 # Import inspect for Python skill loading
 import inspect
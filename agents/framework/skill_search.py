@@ -0,0 +1,125 @@
+"""
+Skill Search for Blackbox 5
+
+A small incremental BM25 index used by SkillManager for fuzzy skill lookup
+over names, descriptions and tags.
+"""
+
+import math
+import re
+from bisect import bisect_left, insort
+from typing import Dict, List, Tuple
+
+_TOKEN_RE = re.compile(r"[a-z0-9]+")
+
+
+def tokenize(text: str) -> List[str]:
+    """Split text into lowercase alphanumeric terms."""
+    return _TOKEN_RE.findall(text.lower())
+
+
+class BM25Index:
+    """
+    Incremental Okapi BM25 index.
+
+    Documents can be added and removed at any time; postings, document
+    lengths and the average length are maintained so no rebuild is needed.
+    Query terms that are not in the vocabulary are expanded to vocabulary
+    terms they prefix, which gives simple fuzzy matching for partial words.
+
+    Example:
+        ```python
+        index = BM25Index()
+        index.add("git-commit", "git commit Write conventional commit messages")
+        index.search("commit msg")  # [("git-commit", <score>)]
+        ```
+    """
+
+    def __init__(self, k1: float = 1.2, b: float = 0.75, max_expansions: int = 5):
+        self.k1 = k1
+        self.b = b
+        self.max_expansions = max_expansions
+        self._postings: Dict[str, Dict[str, int]] = {}
+        self._doc_terms: Dict[str, Dict[str, int]] = {}
+        self._doc_len: Dict[str, int] = {}
+        self._total_len = 0
+        self._vocabulary: List[str] = []
+
+    def __len__(self) -> int:
+        return len(self._doc_len)
+
+    def __contains__(self, doc_id: str) -> bool:
+        return doc_id in self._doc_len
+
+    def add(self, doc_id: str, text: str) -> None:
+        """Index a document, replacing any previous version."""
+        if doc_id in self._doc_len:
+            self.remove(doc_id)
+
+        counts: Dict[str, int] = {}
+        for term in tokenize(text):
+            counts[term] = counts.get(term, 0) + 1
+
+        for term, tf in counts.items():
+            postings = self._postings.get(term)
+            if postings is None:
+                postings = self._postings[term] = {}
+                insort(self._vocabulary, term)
+            postings[doc_id] = tf
+
+        length = sum(counts.values())
+        self._doc_terms[doc_id] = counts
+        self._doc_len[doc_id] = length
+        self._total_len += length
+
+    def remove(self, doc_id: str) -> bool:
+        """Remove a document; returns False if it was not indexed."""
+        counts = self._doc_terms.pop(doc_id, None)
+        if counts is None:
+            return False
+
+        for term in counts:
+            postings = self._postings[term]
+            del postings[doc_id]
+            if not postings:
+                del self._postings[term]
+                del self._vocabulary[bisect_left(self._vocabulary, term)]
+
+        self._total_len -= self._doc_len.pop(doc_id)
+        return True
+
+    def _expand(self, term: str) -> List[str]:
+        if term in self._postings:
+            return [term]
+        expansions = []
+        i = bisect_left(self._vocabulary, term)
+        while (i < len(self._vocabulary) and len(expansions) < self.max_expansions
+               and self._vocabulary[i].startswith(term)):
+            expansions.append(self._vocabulary[i])
+            i += 1
+        return expansions
+
+    def search(self, query: str, limit: int = 10) -> List[Tuple[str, float]]:
+        """
+        Rank documents for a free-text query.
+
+        Returns:
+            (doc_id, score) pairs, best first
+        """
+        n_docs = len(self._doc_len)
+        if not n_docs:
+            return []
+        avg_len = self._total_len / n_docs or 1.0
+
+        scores: Dict[str, float] = {}
+        for query_term in set(tokenize(query)):
+            for term in self._expand(query_term):
+                postings = self._postings[term]
+                df = len(postings)
+                idf = math.log(1 + (n_docs - df + 0.5) / (df + 0.5))
+                for doc_id, tf in postings.items():
+                    norm = self.k1 * (1 - self.b + self.b * self._doc_len[doc_id] / avg_len)
+                    scores[doc_id] = scores.get(doc_id, 0.0) + idf * tf * (self.k1 + 1) / (tf + norm)
+
+        ranked = sorted(scores.items(), key=lambda item: (-item[1], item[0]))
+        return ranked[:limit]
@@ -0,0 +1,14 @@
+"""
+Task storage backends for TaskRegistry.
+
+- JSONTaskStore: one JSON file per task
+- SQLiteTaskStore: single database with indexed state/priority/capability columns
+"""
+
+from .json_store import JSONTaskStore
+from .sqlite_store import SQLiteTaskStore
+
+__all__ = [
+    "JSONTaskStore",
+    "SQLiteTaskStore",
+]
@@ -0,0 +1,69 @@
+"""
+JSON task store.
+
+Stores each task as its own JSON file so saving one task never rewrites
+the others. Writes go through a temporary file and an atomic rename.
+"""
+
+import json
+import logging
+import os
+from pathlib import Path
+from typing import List, Optional
+
+from ..task_schema import Task
+
+logger = logging.getLogger(__name__)
+
+
+class JSONTaskStore:
+    """File-per-task JSON storage backend."""
+
+    def __init__(self, tasks_dir: Optional[Path] = None):
+        """
+        Initialize the store.
+
+        Args:
+            tasks_dir: Directory for task files (defaults to ./.tasks)
+        """
+        self.tasks_dir = Path(tasks_dir) if tasks_dir else Path.cwd() / ".tasks"
+        self.tasks_dir.mkdir(parents=True, exist_ok=True)
+
+    def _path(self, task_id: str) -> Path:
+        # Task IDs are used as file names; keep them inside tasks_dir
+        safe_id = task_id.replace(os.sep, "_").replace("/", "_")
+        return self.tasks_dir / f"{safe_id}.json"
+
+    def save(self, task: Task) -> None:
+        """Write a task, replacing any previous version."""
+        path = self._path(task.id)
+        tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+        with open(tmp_path, 'w') as f:
+            json.dump(task.to_dict(), f, indent=2)
+        tmp_path.replace(path)
+
+    def load(self, task_id: str) -> Optional[Task]:
+        """Read a task, or None if it does not exist."""
+        try:
+            with open(self._path(task_id), 'r') as f:
+                return Task.from_dict(json.load(f))
+        except FileNotFoundError:
+            return None
+
+    def load_all(self) -> List[Task]:
+        """Read every stored task."""
+        tasks = []
+        for path in sorted(self.tasks_dir.glob("*.json")):
+            try:
+                with open(path, 'r') as f:
+                    tasks.append(Task.from_dict(json.load(f)))
+            except (OSError, ValueError, KeyError) as e:
+                logger.warning(f"Skipping unreadable task file {path}: {e}")
+        return tasks
+
+    def delete(self, task_id: str) -> None:
+        """Remove a task if it exists."""
+        try:
+            self._path(task_id).unlink()
+        except FileNotFoundError:
+            pass
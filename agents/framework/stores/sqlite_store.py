@@ -0,0 +1,120 @@
+"""
+SQLite task store.
+
+Keeps the full task as JSON plus the columns agents filter on (state,
+priority and the capability a task requires) in indexed columns, so
+"next pending task for these capabilities" is an index range scan.
+"""
+
+import json
+import sqlite3
+import threading
+from pathlib import Path
+from typing import List, Optional
+
+from ..task_schema import Task, TaskState
+
+
+class SQLiteTaskStore:
+    """SQLite storage backend with indexed lookup columns."""
+
+    def __init__(self, db_path: Optional[Path] = None):
+        """
+        Initialize the store.
+
+        Args:
+            db_path: Database file (defaults to ./.tasks/tasks.db)
+        """
+        self.db_path = Path(db_path) if db_path else Path.cwd() / ".tasks" / "tasks.db"
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.db_path), check_same_thread=False, timeout=30)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._init_schema()
+
+    def _init_schema(self) -> None:
+        with self._lock, self._conn:
+            self._conn.execute("""
+                CREATE TABLE IF NOT EXISTS tasks (
+                    id TEXT PRIMARY KEY,
+                    state TEXT NOT NULL,
+                    priority INTEGER NOT NULL,
+                    capability TEXT NOT NULL,
+                    assignee TEXT,
+                    created_at TEXT,
+                    data TEXT NOT NULL
+                )
+            """)
+            self._conn.execute("""
+                CREATE INDEX IF NOT EXISTS idx_tasks_available
+                ON tasks (state, capability, priority DESC, created_at)
+            """)
+            self._conn.execute("""
+                CREATE INDEX IF NOT EXISTS idx_tasks_assignee
+                ON tasks (assignee) WHERE assignee IS NOT NULL
+            """)
+
+    def save(self, task: Task) -> None:
+        """Insert or replace a task."""
+        data = task.to_dict()
+        with self._lock, self._conn:
+            self._conn.execute(
+                """
+                INSERT OR REPLACE INTO tasks
+                    (id, state, priority, capability, assignee, created_at, data)
+                VALUES (?, ?, ?, ?, ?, ?, ?)
+                """,
+                (
+                    task.id, task.state.value, task.priority, task.type,
+                    task.assignee, data["created_at"], json.dumps(data),
+                )
+            )
+
+    def load(self, task_id: str) -> Optional[Task]:
+        """Read a task, or None if it does not exist."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT data FROM tasks WHERE id = ?", (task_id,)
+            ).fetchone()
+        return Task.from_dict(json.loads(row[0])) if row else None
+
+    def load_all(self) -> List[Task]:
+        """Read every stored task, oldest first."""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT data FROM tasks ORDER BY created_at, rowid"
+            ).fetchall()
+        return [Task.from_dict(json.loads(row[0])) for row in rows]
+
+    def load_available(self, capabilities: List[str], limit: Optional[int] = None) -> List[Task]:
+        """
+        Read pending tasks whose required capability is in `capabilities`.
+
+        Returns:
+            Tasks ordered by priority (highest first), then age
+        """
+        if not capabilities:
+            return []
+        placeholders = ",".join("?" for _ in capabilities)
+        sql = (
+            f"SELECT data FROM tasks WHERE state = ? AND capability IN ({placeholders}) "
+            "ORDER BY priority DESC, created_at"
+        )
+        params: list = [TaskState.PENDING.value, *capabilities]
+        if limit is not None:
+            sql += " LIMIT ?"
+            params.append(limit)
+        with self._lock:
+            rows = self._conn.execute(sql, params).fetchall()
+        return [Task.from_dict(json.loads(row[0])) for row in rows]
+
+    def delete(self, task_id: str) -> None:
+        """Remove a task if it exists."""
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM tasks WHERE id = ?", (task_id,))
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._conn.close()
@@ -5,10 +5,13 @@ Based on research from LangGraph, CrewAI, Temporal, and Plandex.
 Production-ready task tracking with state management, dependencies, and metrics.
 """
 
+import heapq
+import threading
+import weakref
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
-from typing import Dict, List, Optional, Any
+from typing import Dict, Iterator, List, Optional, Any, Set, Tuple
 from uuid import uuid4
 
 
@@ -73,6 +76,11 @@ class TaskMetrics:
         self.agent_id = task.assignee
 
 
+# Task fields the registry indexes on
+_INDEXED_FIELDS = frozenset({"state", "priority", "type"})
+_UNSET = object()
+
+
 @dataclass
 class Task:
     """Production-ready task tracking
@@ -130,6 +138,22 @@ class Task:
     # Schema version (for evolution)
     schema_version: str = "2.0"
 
+    def __setattr__(self, name: str, value: Any) -> None:
+        previous = self.__dict__.get(name, _UNSET)
+        super().__setattr__(name, value)
+        # Let the owning registry reindex direct edits of indexed fields
+        if name in _INDEXED_FIELDS and previous is not _UNSET and previous != value:
+            registry_ref = self.__dict__.get("_registry_ref")
+            registry = registry_ref() if registry_ref is not None else None
+            if registry is not None:
+                registry._on_task_changed(self)
+
+    def __getstate__(self) -> Dict[str, Any]:
+        # The registry link is process-local (and a weakref cannot be pickled)
+        state = dict(self.__dict__)
+        state.pop("_registry_ref", None)
+        return state
+
     def can_transition_to(self, new_state: TaskState) -> bool:
         """Check if state transition is valid"""
         valid_transitions = {
@@ -254,7 +278,20 @@ class Task:
 # ============ TASK REGISTRY ============
 
 class TaskRegistry:
-    """Central task registry with multiple backend support"""
+    """Central task registry with multiple backend support
+
+    Keeps in-memory indexes so the agent polling path never scans every task:
+    - state -> task IDs
+    - per capability (task type), a max-heap of pending tasks by priority
+
+    Heap entries are invalidated lazily: each carries the task's index
+    version, and entries whose version or state no longer match are dropped
+    when they surface.
+
+    Tasks held by the registry notify it when their state, priority or type
+    is assigned, so direct edits are reindexed at once; update() is only
+    needed to persist a change.
+    """
 
     def __init__(self, backend: str = "json"):
         """
@@ -265,6 +302,18 @@ class TaskRegistry:
         """
         self.backend = backend
         self._tasks: Dict[str, Task] = {}
+        self._loaded = False
+        self._lock = threading.RLock()
+        self._ref = weakref.ref(self)
+
+        # Indexes
+        self._by_state: Dict[TaskState, Set[str]] = {state: set() for state in TaskState}
+        self._indexed_state: Dict[str, TaskState] = {}
+        self._pending_heaps: Dict[str, List[Tuple[int, int, int, str]]] = {}
+        self._versions: Dict[str, int] = {}
+        self._order: Dict[str, int] = {}
+        self._next_order = 0
+        self._stale_entries = 0
 
         if backend == "json":
             from .stores.json_store import JSONTaskStore
@@ -275,49 +324,198 @@ class TaskRegistry:
         else:
             raise ValueError(f"Unknown backend: {backend}")
 
+    # ========== Indexing ==========
+
+    def _ensure_loaded(self):
+        """Load every stored task into memory once."""
+        if self._loaded:
+            return
+        with self._lock:
+            if self._loaded:
+                return
+            for task in self.store.load_all():
+                if task.id not in self._tasks:
+                    self._tasks[task.id] = task
+                    self._index(task)
+            self._loaded = True
+
+    def _index(self, task: Task):
+        """(Re)index a task after it was added or changed."""
+        object.__setattr__(task, "_registry_ref", self._ref)
+        previous = self._indexed_state.get(task.id)
+        if previous is not None:
+            self._by_state[previous].discard(task.id)
+            if previous == TaskState.PENDING:
+                self._stale_entries += 1
+        self._by_state[task.state].add(task.id)
+        self._indexed_state[task.id] = task.state
+
+        version = self._versions.get(task.id, 0) + 1
+        self._versions[task.id] = version
+        if task.id not in self._order:
+            self._order[task.id] = self._next_order
+            self._next_order += 1
+
+        if task.state == TaskState.PENDING:
+            heap = self._pending_heaps.setdefault(task.type, [])
+            heapq.heappush(heap, (-task.priority, self._order[task.id], version, task.id))
+
+        self._maybe_compact()
+
+    def _on_task_changed(self, task: Task):
+        """Reindex a registered task whose state, priority or type was assigned."""
+        with self._lock:
+            if self._tasks.get(task.id) is task:
+                self._index(task)
+
+    def _unindex(self, task_id: str):
+        """Remove a task from all indexes."""
+        state = self._indexed_state.pop(task_id, None)
+        if state is not None:
+            self._by_state[state].discard(task_id)
+            if state == TaskState.PENDING:
+                self._stale_entries += 1
+        self._versions.pop(task_id, None)
+        self._order.pop(task_id, None)
+        self._maybe_compact()
+
+    def _is_live(self, entry: Tuple[int, int, int, str], capability: str) -> bool:
+        """Check whether a heap entry still describes a pending task."""
+        _, _, version, task_id = entry
+        task = self._tasks.get(task_id)
+        return (
+            task is not None
+            and self._versions.get(task_id) == version
+            and task.type == capability
+            and -entry[0] == task.priority
+            and task.state == TaskState.PENDING
+        )
+
+    def _maybe_compact(self):
+        """Rebuild the heaps once stale entries outnumber live ones."""
+        live = len(self._by_state[TaskState.PENDING])
+        if self._stale_entries <= max(64, live):
+            return
+        for capability, heap in list(self._pending_heaps.items()):
+            heap[:] = [entry for entry in heap if self._is_live(entry, capability)]
+            if heap:
+                heapq.heapify(heap)
+            else:
+                del self._pending_heaps[capability]
+        self._stale_entries = 0
+
+    def _iter_pending(self, capabilities: List[str]) -> Iterator[Task]:
+        """
+        Yield pending tasks for the given capabilities, best first.
+
+        Walks the capability heaps without popping them: a frontier heap
+        holds the next candidate position of each heap, so producing the
+        first k tasks costs O(k log k) instead of a scan of every task.
+        """
+        frontier: List[Tuple[Tuple[int, int, int, str], str, int]] = []
+        for capability in set(capabilities):
+            heap = self._pending_heaps.get(capability)
+            if heap:
+                frontier.append((heap[0], capability, 0))
+        heapq.heapify(frontier)
+
+        while frontier:
+            entry, capability, position = heapq.heappop(frontier)
+            heap = self._pending_heaps[capability]
+            for child in (2 * position + 1, 2 * position + 2):
+                if child < len(heap):
+                    heapq.heappush(frontier, (heap[child], capability, child))
+            if self._is_live(entry, capability):
+                yield self._tasks[entry[3]]
+
+    # ========== Operations ==========
+
     def create(self, **kwargs) -> Task:
         """Create new task"""
+        self._ensure_loaded()
         task = Task(**kwargs)
-        self._tasks[task.id] = task
+        with self._lock:
+            self._tasks[task.id] = task
+            self._index(task)
         self.store.save(task)
         return task
 
     def get(self, task_id: str) -> Optional[Task]:
         """Get task by ID"""
-        if task_id not in self._tasks:
-            # Try loading from store
-            task = self.store.load(task_id)
-            if task:
-                self._tasks[task_id] = task
-                return task
-        return self._tasks.get(task_id)
+        with self._lock:
+            if task_id not in self._tasks:
+                # Try loading from store
+                task = self.store.load(task_id)
+                if task:
+                    self._tasks[task_id] = task
+                    self._index(task)
+                    return task
+            return self._tasks.get(task_id)
 
     def update(self, task: Task):
         """Update task"""
-        self._tasks[task.id] = task
+        with self._lock:
+            self._tasks[task.id] = task
+            self._index(task)
         self.store.save(task)
 
     def get_all(self) -> List[Task]:
         """Get all tasks"""
-        # Load from store if cache is empty
-        if not self._tasks:
-            self._tasks = {t.id: t for t in self.store.load_all()}
+        self._ensure_loaded()
         return list(self._tasks.values())
 
-    def get_available(self, agent_id: str, capabilities: List[str]) -> List[Task]:
-        """Get tasks available for this agent"""
-        available = []
+    def get_by_state(self, state: TaskState) -> List[Task]:
+        """Get tasks currently in a state"""
+        self._ensure_loaded()
+        with self._lock:
+            return [self._tasks[task_id] for task_id in self._by_state[state]]
+
+    def get_available(
+        self,
+        agent_id: str,
+        capabilities: List[str],
+        limit: Optional[int] = None
+    ) -> List[Task]:
+        """
+        Get tasks available for this agent, highest priority first.
 
-        for task in self.get_all():
-            if task.is_available_for(agent_id, capabilities):
+        Args:
+            agent_id: Polling agent
+            capabilities: Task types the agent can handle
+            limit: Maximum number of tasks to return (all if None)
+        """
+        self._ensure_loaded()
+        with self._lock:
+            available = []
+            for task in self._iter_pending(capabilities):
+                if not task.is_available_for(agent_id, capabilities):
+                    continue
                 available.append(task)
+                if limit is not None and len(available) >= limit:
+                    break
+            return available
+
+    def claim_next(self, agent_id: str, capabilities: List[str]) -> Optional[Task]:
+        """
+        Assign the best available task to an agent.
 
-        # Sort by priority
-        available.sort(key=lambda t: t.priority, reverse=True)
-        return available
+        Returns:
+            The claimed task (now ASSIGNED), or None if nothing is available
+        """
+        with self._lock:
+            claimed = self.get_available(agent_id, capabilities, limit=1)
+            if not claimed:
+                return None
+            task = claimed[0]
+            task.transition_to(TaskState.ASSIGNED)
+            task.assignee = agent_id
+            self.update(task)
+            return task
 
     def delete(self, task_id: str):
         """Delete task"""
-        if task_id in self._tasks:
-            del self._tasks[task_id]
+        with self._lock:
+            if task_id in self._tasks:
+                del self._tasks[task_id]
+            self._unindex(task_id)
         self.store.delete(task_id)
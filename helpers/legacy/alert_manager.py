@@ -13,14 +13,19 @@ from pathlib import Path
 script_dir = Path(__file__).parent
 sys.path.insert(0, str(script_dir))
 from paths import PathResolver, get_path_resolver
+from metrics_store import get_metrics_store, parse_timestamp, MAX_ALERTS_TO_STORE
 
 resolver = get_path_resolver()
 PROJECT_DIR = resolver.get_project_path()
 
 import yaml
+import fcntl
 import json
-from datetime import datetime, timezone
-from typing import Dict, List, Any, Optional
+import threading
+import time
+from collections import deque
+from datetime import datetime, timezone, timedelta
+from typing import Callable, Dict, List, Any, Optional, Tuple
 import logging
 
 # Configure logging
@@ -33,8 +38,10 @@ logger = logging.getLogger(__name__)
 # ============================================================================
 # Configuration
 # ============================================================================
-ALERT_LOG_FILE = PROJECT_DIR / ".autonomous" / "data" / "alerts" / "alert_history.yaml"
+METRICS_DIR = PROJECT_DIR / ".autonomous" / "data" / "metrics"
+ALERT_LOG_FILE = PROJECT_DIR / ".autonomous" / "data" / "alerts" / "alert_history.yaml"   # legacy
 ALERT_CONFIG_FILE = PROJECT_DIR / "2-engine" / ".autonomous" / "config" / "alert-config.yaml"
+DASHBOARD_EVENTS_FILE = PROJECT_DIR / ".autonomous" / "communications" / "events.yaml"
 
 # Ensure alert directory exists
 ALERT_LOG_FILE.parent.mkdir(parents=True, exist_ok=True)
@@ -65,17 +72,45 @@ CHANNELS = {
     'webhook': False,  # Optional webhook (future)
 }
 
+# Pipeline settings (dedup window can be overridden by config)
+DEFAULT_DEDUP_WINDOW_SECONDS = 300   # Suppress repeats of the same alert for 5 minutes
+# Metadata fields that identify the event behind an alert; alerts differing
+# in any of these are never duplicates (elapsed times and thresholds are not
+# identity, so a continuing heartbeat outage is still one alert)
+DEDUP_KEY_FIELDS = ('agent_type', 'run_number', 'window', 'value', 'last_seen')
+COUNTER_BUCKET_SECONDS = 60          # Summary counter resolution
+COUNTER_RETENTION_HOURS = 168        # Summaries for longer windows read the history store
+
 # ============================================================================
 # Alert History Management
 # ============================================================================
 
-def load_alert_history() -> List[Dict[str, Any]]:
-    """Load alert history from storage."""
+_legacy_history_checked = False
+
+
+def _alert_store():
+    """Get the metrics store, importing legacy alert_history.yaml once."""
+    global _legacy_history_checked
+    store = get_metrics_store(METRICS_DIR)
+    if not _legacy_history_checked:
+        _legacy_history_checked = True
+        if store.count_alerts() == 0:
+            store.import_alert_yaml(ALERT_LOG_FILE)
+    return store
+
+
+def load_alert_history(since: Optional[datetime] = None) -> List[Dict[str, Any]]:
+    """
+    Load alert history from storage.
+
+    Args:
+        since: Only alerts after this time
+
+    Returns:
+        Alerts, newest first
+    """
     try:
-        if ALERT_LOG_FILE.exists():
-            with open(ALERT_LOG_FILE, 'r') as f:
-                data = yaml.safe_load(f)
-                return data.get('alerts', []) if data else []
+        return _alert_store().query_alerts(since=since)
     except Exception as e:
         logger.error(f"Error loading alert history: {e}")
 
@@ -93,29 +128,12 @@ def save_alert_to_history(alert: Dict[str, Any]) -> bool:
         True if save successful
     """
     try:
-        history = load_alert_history()
-
         # Add timestamp if not present
         if 'timestamp' not in alert:
             alert['timestamp'] = datetime.now(timezone.utc).isoformat()
 
-        # Prepend to history (newest first)
-        history.insert(0, alert)
-
-        # Keep last 1000 alerts
-        history = history[:1000]
-
-        # Save
-        data = {
-            'metadata': {
-                'last_updated': datetime.now(timezone.utc).isoformat(),
-                'total_alerts': len(history),
-            },
-            'alerts': history,
-        }
-
-        with open(ALERT_LOG_FILE, 'w') as f:
-            yaml.safe_dump(data, f, default_flow_style=False, sort_keys=False)
+        # Append; the store keeps the last MAX_ALERTS_TO_STORE alerts
+        _alert_store().append_alert(alert, keep=MAX_ALERTS_TO_STORE)
 
         return True
 
@@ -211,10 +229,44 @@ def send_to_log(alert: Dict[str, Any]) -> bool:
         return False
 
 
+# Dashboard event files already checked to hold a block YAML list in this
+# process (anything else cannot be appended to)
+_dashboard_files_checked = set()
+
+
+def _append_dashboard_event(events_file: Path, event: Dict[str, Any]) -> None:
+    """
+    Append one event to the dashboard events file as a YAML list item.
+
+    The file is read once per process to make sure it is a block list;
+    an empty list ("[]") or content that is not a list is replaced, as
+    the previous load-and-rewrite did.
+    """
+    events_file.parent.mkdir(parents=True, exist_ok=True)
+    item = yaml.safe_dump([event], default_flow_style=False)
+    with open(events_file, 'a+') as f:
+        fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+        try:
+            key = str(events_file)
+            if key not in _dashboard_files_checked:
+                f.seek(0)
+                content = f.read()
+                data = yaml.safe_load(content) if content.strip() else None
+                if not isinstance(data, list) or not data:
+                    f.truncate(0)
+                elif not content.endswith('\n'):
+                    f.write('\n')
+                _dashboard_files_checked.add(key)
+            f.write(item)
+        finally:
+            fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+
+
 def send_to_dashboard(alert: Dict[str, Any]) -> bool:
     """
     Send alert to dashboard (F-008 integration).
-    For now, this writes to the events.yaml file which the dashboard reads.
+    For now, this appends to the events.yaml file which the dashboard
+    reads (oldest first).
 
     Args:
         alert: Alert record
@@ -223,8 +275,6 @@ def send_to_dashboard(alert: Dict[str, Any]) -> bool:
         True if successful
     """
     try:
-        events_file = PROJECT_DIR / ".autonomous" / "communications" / "events.yaml"
-
         # Create event entry
         event = {
             'timestamp': alert['timestamp'],
@@ -235,19 +285,7 @@ def send_to_dashboard(alert: Dict[str, Any]) -> bool:
             'metadata': alert.get('metadata', {}),
         }
 
-        # Load existing events
-        events = []
-        if events_file.exists():
-            with open(events_file, 'r') as f:
-                data = yaml.safe_load(f)
-                events = data if isinstance(data, list) else []
-
-        # Prepend new event
-        events.insert(0, event)
-
-        # Save
-        with open(events_file, 'w') as f:
-            yaml.safe_dump(events, f, default_flow_style=False)
+        _append_dashboard_event(DASHBOARD_EVENTS_FILE, event)
 
         logger.info(f"Alert sent to dashboard: {alert['id']}")
         return True
@@ -266,6 +304,9 @@ def trigger_alert(
     """
     Trigger an alert across all configured channels.
 
+    Explicit triggers are never deduplicated; use get_alert_pipeline().emit
+    for suppression.
+
     Args:
         alert_type: Type of alert
         severity: Severity level
@@ -275,40 +316,400 @@ def trigger_alert(
     Returns:
         Alert record with delivery status
     """
-    # Create alert
-    alert = create_alert(alert_type, severity, message, metadata)
+    return get_alert_pipeline().deliver(create_alert(alert_type, severity, message, metadata))
 
-    # Load configuration
-    config = load_alert_config()
-    channels = config.get('channels', CHANNELS)
 
-    # Send to channels
-    delivery_status = {}
+# ============================================================================
+# Alert Rules
+# ============================================================================
 
-    if channels.get('log', True):
-        delivery_status['log'] = send_to_log(alert)
+# A rule check takes a metric event and returns (severity, message, metadata)
+# when it fires, or None
+RuleCheck = Callable[[Dict[str, Any]], Optional[Tuple[str, str, Dict[str, Any]]]]
 
-    if channels.get('dashboard', True):
-        delivery_status['dashboard'] = send_to_dashboard(alert)
 
-    if channels.get('webhook', False):
-        # Future: webhook support
-        delivery_status['webhook'] = False
+class AlertRule:
+    """Threshold rule for one metric, compiled once from the alert config."""
 
-    # Save to history
-    save_alert_to_history(alert)
+    __slots__ = ('metric', 'alert_type', 'check')
 
-    # Add delivery status to alert
-    alert['delivery_status'] = delivery_status
+    def __init__(self, metric: str, alert_type: str, check: RuleCheck):
+        self.metric = metric
+        self.alert_type = alert_type
+        self.check = check
 
-    logger.info(f"Alert triggered: {alert['id']} ({severity})")
-    return alert
+    def evaluate(self, event: Dict[str, Any]) -> Optional[Tuple[str, str, Dict[str, Any]]]:
+        """Evaluate the rule against one metric event."""
+        return self.check(event)
+
+
+def _compile_duration_rule(thresholds: Dict[str, Any]) -> RuleCheck:
+    critical_threshold = thresholds.get('critical_seconds', 600)
+    warning_threshold = thresholds.get('warning_seconds', 300)
+
+    def check(event):
+        current_duration = event['value']
+        baseline_duration = event.get('baseline', 0)
+        run_number = event.get('run_number')
+
+        # Check absolute thresholds
+        if current_duration > critical_threshold:
+            return ('critical',
+                    f'Duration {current_duration}s exceeds critical threshold ({critical_threshold}s)',
+                    {'run_number': run_number, 'value': current_duration, 'threshold': critical_threshold})
+        elif current_duration > warning_threshold:
+            return ('warning',
+                    f'Duration {current_duration}s exceeds warning threshold ({warning_threshold}s)',
+                    {'run_number': run_number, 'value': current_duration, 'threshold': warning_threshold})
+
+        # Check relative to baseline
+        if baseline_duration > 0:
+            ratio = current_duration / baseline_duration
+            message = f'Duration {current_duration}s is {ratio:.1f}x baseline average ({baseline_duration:.1f}s)'
+            metadata = {'run_number': run_number, 'value': current_duration, 'baseline': baseline_duration}
+            if ratio >= 2.0:
+                return ('critical', message, metadata)
+            elif ratio >= 1.5:
+                return ('warning', message, metadata)
+
+        return None
+
+    return check
+
+
+def _compile_success_rate_rule(thresholds: Dict[str, Any]) -> RuleCheck:
+    critical_threshold = thresholds.get('critical_percent', 50)
+    warning_threshold = thresholds.get('warning_percent', 80)
+
+    def check(event):
+        success_rate = event['value']
+        window = event.get('window')
+
+        if success_rate < critical_threshold:
+            return ('critical',
+                    f'Success rate {success_rate:.1f}% below critical threshold ({critical_threshold}%)',
+                    {'value': success_rate, 'threshold': critical_threshold, 'window': window})
+        elif success_rate < warning_threshold:
+            return ('warning',
+                    f'Success rate {success_rate:.1f}% below warning threshold ({warning_threshold}%)',
+                    {'value': success_rate, 'threshold': warning_threshold, 'window': window})
+        return None
+
+    return check
+
+
+def _compile_queue_depth_rule(thresholds: Dict[str, Any]) -> RuleCheck:
+    critical_threshold = thresholds.get('critical', 0)
+    warning_threshold = thresholds.get('warning', 2)
+
+    def check(event):
+        queue_depth = event['value']
+
+        if queue_depth <= critical_threshold:
+            return ('critical',
+                    f'Queue depth {queue_depth} at or below critical threshold ({critical_threshold})',
+                    {'value': queue_depth, 'threshold': critical_threshold})
+        elif queue_depth <= warning_threshold:
+            return ('warning',
+                    f'Queue depth {queue_depth} at or below warning threshold ({warning_threshold})',
+                    {'value': queue_depth, 'threshold': warning_threshold})
+        return None
+
+    return check
+
+
+def _compile_agent_timeout_rule(thresholds: Dict[str, Any]) -> RuleCheck:
+    timeout_threshold = thresholds.get('seconds', 120)
+
+    def check(event):
+        agent_type = event.get('agent_type')
+        last_seen = event['last_seen']
+
+        last_seen_dt = datetime.fromisoformat(last_seen.replace('Z', '+00:00'))
+        elapsed_seconds = (datetime.now(timezone.utc) - last_seen_dt).total_seconds()
+
+        if elapsed_seconds > timeout_threshold:
+            return ('critical',
+                    f'{agent_type} timeout: No heartbeat for {elapsed_seconds:.0f}s (threshold: {timeout_threshold}s)',
+                    {'agent_type': agent_type, 'last_seen': last_seen, 'elapsed_seconds': elapsed_seconds})
+        return None
+
+    return check
+
+
+# metric -> (alert type, threshold config key, rule compiler)
+RULE_COMPILERS = {
+    'duration': ('duration', 'duration', _compile_duration_rule),
+    'success_rate': ('success_rate', 'success_rate', _compile_success_rate_rule),
+    'queue_depth': ('queue_depth', 'queue_depth', _compile_queue_depth_rule),
+    'agent_timeout': ('agent_timeout', 'agent_timeout', _compile_agent_timeout_rule),
+}
+
+
+def compile_rules(thresholds: Dict[str, Any]) -> Dict[str, List[AlertRule]]:
+    """
+    Compile threshold config into rules, grouped by metric.
+
+    Args:
+        thresholds: Threshold config (see DEFAULT_THRESHOLDS)
+
+    Returns:
+        {metric: [AlertRule, ...]}
+    """
+    rules: Dict[str, List[AlertRule]] = {}
+    for metric, (alert_type, config_key, compiler) in RULE_COMPILERS.items():
+        check = compiler(thresholds.get(config_key, DEFAULT_THRESHOLDS.get(config_key, {})))
+        rules.setdefault(metric, []).append(AlertRule(metric, alert_type, check))
+    return rules
+
+
+# ============================================================================
+# Alert Counters
+# ============================================================================
+
+class AlertCounters:
+    """
+    Time-bucketed alert counts for summaries.
+
+    Counts are kept per (severity, type) in fixed-width buckets, so a
+    summary sums at most hours * 3600 / bucket_seconds small dicts instead
+    of re-reading the alert history.
+    """
+
+    def __init__(
+        self,
+        bucket_seconds: int = COUNTER_BUCKET_SECONDS,
+        retention_hours: int = COUNTER_RETENTION_HOURS,
+        recent: int = 10
+    ):
+        self.bucket_seconds = bucket_seconds
+        self.retention_hours = retention_hours
+        self._buckets: Dict[int, Dict[Tuple[str, str], int]] = {}
+        self._recent: deque = deque(maxlen=recent)
+        self._oldest_bucket: Optional[int] = None
+
+    def record(self, alert: Dict[str, Any]):
+        """Count one alert (alerts should arrive oldest first)."""
+        ts = parse_timestamp(alert.get('timestamp')) or time.time()
+        bucket = int(ts // self.bucket_seconds)
+        if bucket not in self._buckets:
+            self._buckets[bucket] = {}
+            self._prune(ts)
+        counts = self._buckets[bucket]
+        key = (alert.get('severity', 'info'), alert.get('type', 'unknown'))
+        counts[key] = counts.get(key, 0) + 1
+        self._recent.appendleft((ts, alert))
+
+    def _prune(self, now: float):
+        cutoff = int((now - self.retention_hours * 3600) // self.bucket_seconds)
+        if self._oldest_bucket is not None and self._oldest_bucket >= cutoff:
+            return
+        for bucket in [b for b in self._buckets if b < cutoff]:
+            del self._buckets[bucket]
+        self._oldest_bucket = min(self._buckets) if self._buckets else None
+
+    def covers(self, hours: float) -> bool:
+        """Whether summaries over `hours` can be served from the counters."""
+        return hours <= self.retention_hours
+
+    def summary(self, hours: float, now: Optional[float] = None) -> Dict[str, Any]:
+        """
+        Summarize alerts over the last `hours` (to bucket resolution).
+
+        Returns:
+            total_alerts, by_severity, by_type and recent_alerts (newest first)
+        """
+        now = now if now is not None else time.time()
+        cutoff = now - hours * 3600
+        first_bucket = int(cutoff // self.bucket_seconds)
+
+        severity_counts = {'critical': 0, 'warning': 0, 'info': 0}
+        type_counts: Dict[str, int] = {}
+        total = 0
+        for bucket, counts in self._buckets.items():
+            if bucket < first_bucket:
+                continue
+            for (severity, alert_type), count in counts.items():
+                severity_counts[severity] = severity_counts.get(severity, 0) + count
+                type_counts[alert_type] = type_counts.get(alert_type, 0) + count
+                total += count
+
+        return {
+            'total_alerts': total,
+            'by_severity': severity_counts,
+            'by_type': type_counts,
+            'recent_alerts': [alert for ts, alert in self._recent if ts > cutoff],
+        }
+
+
+# ============================================================================
+# Alert Pipeline
+# ============================================================================
+
+class AlertPipeline:
+    """
+    In-process alert pipeline.
+
+    Metric events are evaluated against rules compiled once from the alert
+    config; repeats of the same alert (type, severity and the event fields
+    in DEDUP_KEY_FIELDS) within the dedup window are suppressed; fired alerts are delivered to channels,
+    appended to the history store and counted for summaries.
+
+    Example:
+        pipeline = get_alert_pipeline()
+        pipeline.process({'metric': 'duration', 'value': 720, 'baseline': 300, 'run_number': 58})
+        pipeline.process({'metric': 'queue_depth', 'value': 1})
+        pipeline.summary(hours=24)
+    """
+
+    def __init__(self, config: Optional[Dict[str, Any]] = None, seed_history: bool = True):
+        """
+        Initialize the pipeline.
+
+        Args:
+            config: Alert config (loaded from ALERT_CONFIG_FILE if None)
+            seed_history: Seed summary counters from the stored alert history
+        """
+        self._lock = threading.Lock()
+        self._last_emitted: Dict[Tuple[Any, ...], float] = {}
+        self._last_pruned = time.monotonic()
+        self.suppressed = 0
+        self.counters = AlertCounters()
+        self.reload(config)
+
+        if seed_history:
+            since = datetime.now(timezone.utc) - timedelta(hours=self.counters.retention_hours)
+            for alert in reversed(load_alert_history(since=since)):
+                self.counters.record(alert)
+
+    def reload(self, config: Optional[Dict[str, Any]] = None):
+        """Recompile rules from config (e.g. after editing alert-config.yaml)."""
+        config = config if config is not None else load_alert_config()
+        self.thresholds = config.get('thresholds', DEFAULT_THRESHOLDS)
+        self.channels = config.get('channels', CHANNELS)
+        self.dedup_window = config.get('dedup_window_seconds', DEFAULT_DEDUP_WINDOW_SECONDS)
+        self.rules = compile_rules(self.thresholds)
+
+    def process(self, event: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """
+        Evaluate one metric event.
+
+        Args:
+            event: {'metric': name, ...metric fields}
+
+        Returns:
+            Alerts fired (suppressed duplicates are not included)
+        """
+        alerts = []
+        for rule in self.rules.get(event.get('metric'), []):
+            try:
+                fired = rule.evaluate(event)
+            except Exception as e:
+                logger.error(f"Error evaluating {rule.metric} rule: {e}")
+                continue
+            if fired:
+                severity, message, metadata = fired
+                alert = self.emit(rule.alert_type, severity, message, metadata)
+                if alert is not None:
+                    alerts.append(alert)
+        return alerts
+
+    def emit(
+        self,
+        alert_type: str,
+        severity: str,
+        message: str,
+        metadata: Optional[Dict[str, Any]] = None
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Fire an alert unless the same one fired within the dedup window.
+
+        The same one means equal type, severity and DEDUP_KEY_FIELDS values
+        in metadata.
+
+        Returns:
+            Alert record, or None if suppressed
+        """
+        identity = metadata or {}
+        key = (alert_type, severity) + tuple(identity.get(field) for field in DEDUP_KEY_FIELDS)
+        now = time.monotonic()
+        with self._lock:
+            last = self._last_emitted.get(key)
+            if last is not None and now - last < self.dedup_window:
+                self.suppressed += 1
+                logger.debug(f"Suppressed duplicate {severity} {alert_type} alert")
+                return None
+            self._last_emitted[key] = now
+            self._prune_emitted(now)
+
+        return self.deliver(create_alert(alert_type, severity, message, metadata))
+
+    def _prune_emitted(self, now: float) -> None:
+        """Forget keys outside the dedup window (at most once per window). Caller holds lock."""
+        if now - self._last_pruned < self.dedup_window:
+            return
+        self._last_pruned = now
+        self._last_emitted = {
+            key: last for key, last in self._last_emitted.items()
+            if now - last < self.dedup_window
+        }
+
+    def deliver(self, alert: Dict[str, Any]) -> Dict[str, Any]:
+        """Send an alert to channels, append it to history and count it."""
+        delivery_status = {}
+
+        if self.channels.get('log', True):
+            delivery_status['log'] = send_to_log(alert)
+
+        if self.channels.get('dashboard', True):
+            delivery_status['dashboard'] = send_to_dashboard(alert)
+
+        if self.channels.get('webhook', False):
+            # Future: webhook support
+            delivery_status['webhook'] = False
+
+        # Save to history (append-only)
+        save_alert_to_history(alert)
+        with self._lock:
+            self.counters.record(alert)
+
+        # Add delivery status to alert
+        alert['delivery_status'] = delivery_status
+
+        logger.info(f"Alert triggered: {alert['id']} ({alert['severity']})")
+        return alert
+
+    def summary(self, hours: int = 24) -> Dict[str, Any]:
+        """Summarize alerts from the time-bucketed counters."""
+        with self._lock:
+            summary = self.counters.summary(hours)
+        return dict(summary, time_window_hours=hours)
+
+
+_pipeline: Optional[AlertPipeline] = None
+_pipeline_lock = threading.Lock()
+
+
+def get_alert_pipeline() -> AlertPipeline:
+    """Get the process-wide alert pipeline."""
+    global _pipeline
+    if _pipeline is None:
+        with _pipeline_lock:
+            if _pipeline is None:
+                _pipeline = AlertPipeline()
+    return _pipeline
 
 
 # ============================================================================
 # Alert Evaluation Functions
 # ============================================================================
 
+def _evaluate(event: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """Run one event through the pipeline and return the first alert fired."""
+    alerts = get_alert_pipeline().process(event)
+    return alerts[0] if alerts else None
+
+
 def evaluate_duration_anomaly(
     current_duration: float,
     baseline_duration: float,
@@ -323,50 +724,14 @@ def evaluate_duration_anomaly(
         run_number: Run number
 
     Returns:
-        Alert if triggered, None otherwise
+        Alert if triggered (and not a suppressed duplicate), None otherwise
     """
-    thresholds = get_thresholds()
-    duration_thresholds = thresholds.get('duration', {})
-
-    critical_threshold = duration_thresholds.get('critical_seconds', 600)
-    warning_threshold = duration_thresholds.get('warning_seconds', 300)
-
-    # Check absolute thresholds
-    if current_duration > critical_threshold:
-        return trigger_alert(
-            'duration',
-            'critical',
-            f'Duration {current_duration}s exceeds critical threshold ({critical_threshold}s)',
-            {'run_number': run_number, 'value': current_duration, 'threshold': critical_threshold}
-        )
-    elif current_duration > warning_threshold:
-        return trigger_alert(
-            'duration',
-            'warning',
-            f'Duration {current_duration}s exceeds warning threshold ({warning_threshold}s)',
-            {'run_number': run_number, 'value': current_duration, 'threshold': warning_threshold}
-        )
-
-    # Check relative to baseline
-    if baseline_duration > 0:
-        ratio = current_duration / baseline_duration
-
-        if ratio >= 2.0:
-            return trigger_alert(
-                'duration',
-                'critical',
-                f'Duration {current_duration}s is {ratio:.1f}x baseline average ({baseline_duration:.1f}s)',
-                {'run_number': run_number, 'value': current_duration, 'baseline': baseline_duration}
-            )
-        elif ratio >= 1.5:
-            return trigger_alert(
-                'duration',
-                'warning',
-                f'Duration {current_duration}s is {ratio:.1f}x baseline average ({baseline_duration:.1f}s)',
-                {'run_number': run_number, 'value': current_duration, 'baseline': baseline_duration}
-            )
-
-    return None
+    return _evaluate({
+        'metric': 'duration',
+        'value': current_duration,
+        'baseline': baseline_duration,
+        'run_number': run_number,
+    })
 
 
 def evaluate_success_rate(
@@ -381,30 +746,9 @@ def evaluate_success_rate(
         window: Window size used for calculation
 
     Returns:
-        Alert if triggered, None otherwise
+        Alert if triggered (and not a suppressed duplicate), None otherwise
     """
-    thresholds = get_thresholds()
-    sr_thresholds = thresholds.get('success_rate', {})
-
-    critical_threshold = sr_thresholds.get('critical_percent', 50)
-    warning_threshold = sr_thresholds.get('warning_percent', 80)
-
-    if success_rate < critical_threshold:
-        return trigger_alert(
-            'success_rate',
-            'critical',
-            f'Success rate {success_rate:.1f}% below critical threshold ({critical_threshold}%)',
-            {'value': success_rate, 'threshold': critical_threshold, 'window': window}
-        )
-    elif success_rate < warning_threshold:
-        return trigger_alert(
-            'success_rate',
-            'warning',
-            f'Success rate {success_rate:.1f}% below warning threshold ({warning_threshold}%)',
-            {'value': success_rate, 'threshold': warning_threshold, 'window': window}
-        )
-
-    return None
+    return _evaluate({'metric': 'success_rate', 'value': success_rate, 'window': window})
 
 
 def evaluate_queue_depth(queue_depth: int) -> Optional[Dict[str, Any]]:
@@ -415,30 +759,9 @@ def evaluate_queue_depth(queue_depth: int) -> Optional[Dict[str, Any]]:
         queue_depth: Current queue depth
 
     Returns:
-        Alert if triggered, None otherwise
+        Alert if triggered (and not a suppressed duplicate), None otherwise
     """
-    thresholds = get_thresholds()
-    queue_thresholds = thresholds.get('queue_depth', {})
-
-    critical_threshold = queue_thresholds.get('critical', 0)
-    warning_threshold = queue_thresholds.get('warning', 2)
-
-    if queue_depth <= critical_threshold:
-        return trigger_alert(
-            'queue_depth',
-            'critical',
-            f'Queue depth {queue_depth} at or below critical threshold ({critical_threshold})',
-            {'value': queue_depth, 'threshold': critical_threshold}
-        )
-    elif queue_depth <= warning_threshold:
-        return trigger_alert(
-            'queue_depth',
-            'warning',
-            f'Queue depth {queue_depth} at or below warning threshold ({warning_threshold})',
-            {'value': queue_depth, 'threshold': warning_threshold}
-        )
-
-    return None
+    return _evaluate({'metric': 'queue_depth', 'value': queue_depth})
 
 
 def evaluate_agent_timeout(
@@ -453,28 +776,9 @@ def evaluate_agent_timeout(
         last_seen: Last seen timestamp
 
     Returns:
-        Alert if triggered, None otherwise
+        Alert if triggered (and not a suppressed duplicate), None otherwise
     """
-    thresholds = get_thresholds()
-    timeout_threshold = thresholds.get('agent_timeout', {}).get('seconds', 120)
-
-    try:
-        last_seen_dt = datetime.fromisoformat(last_seen.replace('Z', '+00:00'))
-        now = datetime.now(timezone.utc)
-        elapsed_seconds = (now - last_seen_dt).total_seconds()
-
-        if elapsed_seconds > timeout_threshold:
-            return trigger_alert(
-                'agent_timeout',
-                'critical',
-                f'{agent_type} timeout: No heartbeat for {elapsed_seconds:.0f}s (threshold: {timeout_threshold}s)',
-                {'agent_type': agent_type, 'last_seen': last_seen, 'elapsed_seconds': elapsed_seconds}
-            )
-
-    except Exception as e:
-        logger.error(f"Error evaluating agent timeout: {e}")
-
-    return None
+    return _evaluate({'metric': 'agent_timeout', 'agent_type': agent_type, 'last_seen': last_seen})
 
 
 # ============================================================================
@@ -491,14 +795,13 @@ def get_alert_summary(hours: int = 24) -> Dict[str, Any]:
     Returns:
         Alert summary
     """
-    history = load_alert_history()
-
-    # Filter by time window
-    cutoff_time = datetime.now(timezone.utc).timestamp() - (hours * 3600)
-    recent_alerts = [
-        alert for alert in history
-        if datetime.fromisoformat(alert['timestamp'].replace('Z', '+00:00')).timestamp() > cutoff_time
-    ]
+    pipeline = get_alert_pipeline()
+    if pipeline.counters.covers(hours):
+        return pipeline.summary(hours)
+
+    # Longer than the counters keep: read the history store
+    cutoff_time = datetime.now(timezone.utc) - timedelta(hours=hours)
+    recent_alerts = load_alert_history(since=cutoff_time)
 
     # Count by severity
     severity_counts = {'critical': 0, 'warning': 0, 'info': 0}
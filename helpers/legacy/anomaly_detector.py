@@ -13,15 +13,15 @@ from pathlib import Path
 script_dir = Path(__file__).parent
 sys.path.insert(0, str(script_dir))
 from paths import PathResolver, get_path_resolver
+from metrics_store import get_metrics_store
+from rolling_stats import MetricBaseline, summarize, window_rates, z_scores
 
 resolver = get_path_resolver()
 PROJECT_DIR = resolver.get_project_path()
 
-import yaml
 from datetime import datetime, timezone
 from typing import Dict, List, Any, Optional, Tuple
 import logging
-import statistics
 
 # Configure logging
 logging.basicConfig(
@@ -33,7 +33,11 @@ logger = logging.getLogger(__name__)
 # ============================================================================
 # Configuration
 # ============================================================================
-METRICS_FILE = PROJECT_DIR / ".autonomous" / "data" / "metrics" / "metrics.yaml"
+METRICS_DIR = PROJECT_DIR / ".autonomous" / "data" / "metrics"
+METRICS_FILE = METRICS_DIR / "metrics.yaml"   # legacy; imported into the store once
+
+# Fields read by the detectors
+DETECTION_COLUMNS = ['timestamp', 'run_number', 'duration_seconds', 'result', 'blockers']
 
 # Anomaly detection thresholds
 Z_SCORE_CRITICAL = 3.0  # 3 standard deviations
@@ -50,27 +54,26 @@ ERROR_RATE_WARNING = 0.2  # 20% error rate
 # Data Loading Functions
 # ============================================================================
 
-def load_metrics(agent_type: str = 'executor') -> List[Dict[str, Any]]:
+def load_metrics(
+    agent_type: str = 'executor',
+    window: Optional[int] = None,
+    columns: Optional[List[str]] = DETECTION_COLUMNS
+) -> List[Dict[str, Any]]:
     """
     Load metrics from storage.
 
     Args:
         agent_type: Filter by agent type
+        window: Only the N most recent runs
+        columns: Metric fields to read (all if None)
 
     Returns:
-        List of metric records
+        List of metric records (newest first)
     """
     try:
-        if METRICS_FILE.exists():
-            with open(METRICS_FILE, 'r') as f:
-                data = yaml.safe_load(f)
-                all_metrics = data.get('metrics', []) if data else []
-
-                # Filter by agent type
-                if agent_type:
-                    all_metrics = [m for m in all_metrics if m.get('agent_type') == agent_type]
-
-                return all_metrics
+        return get_metrics_store(METRICS_DIR).query_runs(
+            agent_type=agent_type or None, window=window, columns=columns
+        )
     except Exception as e:
         logger.error(f"Error loading metrics: {e}")
 
@@ -129,18 +132,20 @@ def detect_duration_anomalies(
     if not baseline_durations:
         return []
 
-    mean_duration = statistics.mean(baseline_durations)
-    std_duration = statistics.stdev(baseline_durations) if len(baseline_durations) > 1 else 0
+    baseline = summarize(baseline_durations)
+    mean_duration = baseline['mean']
 
     anomalies = []
 
-    # Check current metrics for anomalies
-    for metric in current_metrics:
-        duration = metric.get('duration_seconds')
-        if duration is None:
-            continue
+    # Score all current runs against the baseline at once
+    current_metrics = [m for m in current_metrics if m.get('duration_seconds') is not None]
+    scores = z_scores(
+        [m['duration_seconds'] for m in current_metrics], mean_duration, baseline['stdev']
+    )
 
-        z_score = calculate_z_score(duration, mean_duration, std_duration)
+    # Check current metrics for anomalies
+    for metric, z_score in zip(current_metrics, scores):
+        duration = metric['duration_seconds']
 
         if z_score >= Z_SCORE_CRITICAL:
             anomalies.append({
@@ -188,12 +193,10 @@ def detect_success_rate_anomalies(
     anomalies = []
 
     # Calculate success rate for each window
-    for i in range(0, len(metrics) - window, window):
+    rates = window_rates([m.get('result') == 'success' for m in metrics], window)
+    for i, success_rate in zip(range(0, len(metrics) - window, window), rates):
         window_metrics = metrics[i:i + window]
 
-        successes = len([m for m in window_metrics if m.get('result') == 'success'])
-        success_rate = successes / len(window_metrics)
-
         if success_rate < ERROR_RATE_CRITICAL:
             anomalies.append({
                 'type': 'success_rate',
@@ -299,7 +302,7 @@ def detect_rule_based_anomalies(
     if not baseline_durations:
         return []
 
-    baseline_avg = statistics.mean(baseline_durations)
+    baseline_avg = summarize(baseline_durations)['mean']
 
     # Check recent runs
     recent_metrics = metrics[:baseline_window]
@@ -415,9 +418,33 @@ def _count_by_type(anomalies: List[Dict[str, Any]]) -> Dict[str, int]:
     return type_counts
 
 
+_duration_baselines: Dict[str, MetricBaseline] = {}
+
+
+def get_duration_baseline(agent_type: str = 'executor') -> MetricBaseline:
+    """
+    Get the maintained duration baseline for an agent type.
+
+    The first call per process seeds it from stored history (duration
+    column only); later runs are folded in by check_single_run.
+    """
+    baseline = _duration_baselines.get(agent_type)
+    if baseline is None:
+        durations = [
+            m['duration_seconds']
+            for m in load_metrics(agent_type, columns=['duration_seconds'])
+            if m.get('duration_seconds')
+        ]
+        baseline = MetricBaseline()
+        baseline.extend(durations[::-1])   # oldest first
+        _duration_baselines[agent_type] = baseline
+    return baseline
+
+
 def check_single_run(
     run_metrics: Dict[str, Any],
-    agent_type: str = 'executor'
+    agent_type: str = 'executor',
+    update_baseline: bool = True
 ) -> List[Dict[str, Any]]:
     """
     Check a single run for anomalies.
@@ -425,35 +452,27 @@ def check_single_run(
     Args:
         run_metrics: Metrics for a single run
         agent_type: Type of agent
+        update_baseline: Fold the run into the maintained baseline after scoring
 
     Returns:
         List of anomalies detected for this run
     """
-    # Load historical data for baseline
-    historical = load_metrics(agent_type)
-
-    if not historical:
-        return []
-
-    # Extract baseline durations
-    baseline_durations = [
-        m.get('duration_seconds', 0)
-        for m in historical
-        if m.get('duration_seconds')
-    ]
+    # Score against the maintained baseline (seeded from history once)
+    baseline = get_duration_baseline(agent_type)
+    duration = run_metrics.get('duration_seconds')
 
-    if not baseline_durations:
+    if not baseline.count:
+        if duration and update_baseline:
+            baseline.push(duration)
         return []
 
-    baseline_mean = statistics.mean(baseline_durations)
-    baseline_std = statistics.stdev(baseline_durations) if len(baseline_durations) > 1 else 0
+    baseline_mean = baseline.stats.mean
 
     anomalies = []
 
     # Check duration
-    duration = run_metrics.get('duration_seconds')
     if duration:
-        z_score = calculate_z_score(duration, baseline_mean, baseline_std)
+        z_score = baseline.score(duration)['z_score']
 
         if z_score >= Z_SCORE_CRITICAL or duration > baseline_mean * DURATION_CRITICAL_MULTIPLIER:
             anomalies.append({
@@ -472,6 +491,9 @@ def check_single_run(
                 'z_score': round(z_score, 2),
             })
 
+    if duration and update_baseline:
+        baseline.push(duration)
+
     # Check result
     if run_metrics.get('result') != 'success':
         anomalies.append({
@@ -5,6 +5,13 @@ Event Logger - Unified Agent Communication Module
 Provides event logging to events.yaml for Python agents.
 Matches the format used by bash agents for unified communication.
 
+events.yaml is append-only: each event is appended to the end of the file
+as one YAML list item under a single exclusive lock, so concurrent agents
+never lose events and logging costs O(1) in the size of the log. Events
+can optionally be batched in-process (configure_batching). Readers stream
+events with iter_events(); compact_events() rewrites the file in canonical
+form and can drop old events.
+
 Usage:
     from event_logger import log_event, log_start, log_complete, log_error
 
@@ -16,13 +23,19 @@ Usage:
     )
 """
 
+import atexit
+import io
 import os
+import re
 import sys
+import textwrap
+import threading
+import time
 import yaml
 import fcntl
-from datetime import datetime
+from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Iterator, List, Optional
 
 # Add unified_config to path for path resolution
 sys.path.insert(0, str(Path(__file__).parent))
@@ -96,7 +109,7 @@ version: "1.0"
 # EVENT LOG (append only)
 # =============================================================================
 
-events: []
+events:
 """
         with open(events_file, 'w') as f:
             f.write(header)
@@ -120,6 +133,206 @@ def _unlock_file(f) -> None:
         pass
 
 
+# Fields written by _format_event; other entries are kept as plain YAML
+EVENT_FIELDS = {'timestamp', 'agent', 'type', 'message', 'run_dir', 'task_id', 'data'}
+
+# Event files already checked for an inline "events: []" (which cannot be
+# appended to) in this process
+_prepared_files = set()
+_prepare_lock = threading.Lock()
+
+
+def _prepare_events_file(events_file: Path) -> None:
+    """
+    Create events.yaml if needed and make sure items can be appended.
+
+    Older files end with an inline "events: []"; that line is rewritten to
+    a block "events:" once, under the file lock.
+    """
+    key = str(events_file)
+    if key in _prepared_files:
+        return
+    with _prepare_lock:
+        if key in _prepared_files:
+            return
+        _ensure_events_file_exists(events_file)
+        with open(events_file, 'r+') as f:
+            _lock_file(f)
+            try:
+                content = f.read()
+                lines = content.splitlines(keepends=True)
+                for index, line in enumerate(lines):
+                    if line.rstrip() == "events: []":
+                        lines[index] = "events:\n"
+                        f.seek(0)
+                        f.write("".join(lines))
+                        f.truncate()
+                        break
+            finally:
+                _unlock_file(f)
+        _prepared_files.add(key)
+
+
+def _quote(value: Any) -> str:
+    """
+    Render a value as a double-quoted YAML scalar on a single line.
+
+    Backslashes, quotes and line breaks are escaped so a multi-line
+    message (e.g. a traceback) never spills onto an unindented line.
+    """
+    text = str(value)
+    for char, escaped in (('\\', '\\\\'), ('"', '\\"'), ('\n', '\\n'), ('\r', '\\r'), ('\t', '\\t')):
+        text = text.replace(char, escaped)
+    return f'"{text}"'
+
+
+def _format_event(evt: Dict[str, Any]) -> str:
+    """Render one event as a YAML list item under "events:"."""
+    f = io.StringIO()
+    f.write("\n")
+    f.write(f"  - timestamp: \"{evt['timestamp']}\"\n")
+    f.write(f"    agent: {evt['agent']}\n")
+    f.write(f"    type: {evt['type']}\n")
+
+    if 'message' in evt:
+        f.write(f"    message: {_quote(evt['message'])}\n")
+
+    if 'run_dir' in evt:
+        f.write(f"    run_dir: {evt['run_dir']}\n")
+
+    if 'task_id' in evt:
+        f.write(f"    task_id: {evt['task_id']}\n")
+
+    if 'data' in evt and evt['data']:
+        f.write("    data:\n")
+        _write_yaml_data(f, evt['data'], indent_level=3)
+
+    return f.getvalue()
+
+
+def _append_to_events_file(events_file: Path, text: str) -> None:
+    """
+    Append text to events.yaml while holding its exclusive lock.
+
+    If the file was replaced (compacted) while waiting for the lock, the
+    new file is reopened so the write is not lost.
+    """
+    while True:
+        with open(events_file, 'a') as f:
+            _lock_file(f)
+            try:
+                try:
+                    current = os.stat(events_file)
+                except FileNotFoundError:
+                    current = None
+                if current is None or current.st_ino != os.fstat(f.fileno()).st_ino:
+                    continue
+                f.write(text)
+                f.flush()
+                return
+            finally:
+                _unlock_file(f)
+
+
+class EventWriter:
+    """
+    Appends events to events.yaml, optionally in batches.
+
+    With max_batch=1 (the default) every event is written immediately.
+    Larger batches are flushed when full, when the oldest buffered event is
+    older than max_delay seconds (checked on each write), on flush(), and
+    at interpreter exit.
+    """
+
+    def __init__(
+        self,
+        events_file: Optional[Path] = None,
+        max_batch: int = 1,
+        max_delay: float = 1.0
+    ):
+        self._events_file = Path(events_file) if events_file else None
+        self.max_batch = max(1, max_batch)
+        self.max_delay = max_delay
+        self._lock = threading.Lock()
+        self._buffer: List[str] = []
+        self._first_buffered = 0.0
+
+    @property
+    def events_file(self) -> Path:
+        if self._events_file is None:
+            self._events_file = _get_events_file_path()
+        return self._events_file
+
+    def write(self, event: Dict[str, Any]) -> bool:
+        """Buffer one event, flushing if the batch is due."""
+        text = _format_event(event)
+        with self._lock:
+            if not self._buffer:
+                self._first_buffered = time.monotonic()
+            self._buffer.append(text)
+            due = (len(self._buffer) >= self.max_batch
+                   or time.monotonic() - self._first_buffered >= self.max_delay)
+            if not due:
+                return True
+            return self._flush_locked()
+
+    def flush(self) -> bool:
+        """Write all buffered events."""
+        with self._lock:
+            return self._flush_locked()
+
+    def _flush_locked(self) -> bool:
+        if not self._buffer:
+            return True
+        events_file = self.events_file
+        _prepare_events_file(events_file)
+        _append_to_events_file(events_file, "".join(self._buffer))
+        self._buffer = []
+        return True
+
+
+_writer: Optional[EventWriter] = None
+_writer_lock = threading.Lock()
+
+
+def get_event_writer() -> EventWriter:
+    """Get the process-wide event writer used by log_event."""
+    global _writer
+    if _writer is None:
+        with _writer_lock:
+            if _writer is None:
+                _writer = EventWriter()
+    return _writer
+
+
+def configure_batching(max_batch: int = 50, max_delay: float = 1.0) -> None:
+    """
+    Batch events written by log_event in this process.
+
+    Args:
+        max_batch: Flush after this many events (1 disables batching)
+        max_delay: Flush once the oldest buffered event is this many seconds old
+    """
+    writer = get_event_writer()
+    writer.flush()
+    writer.max_batch = max(1, max_batch)
+    writer.max_delay = max_delay
+
+
+def flush_events() -> bool:
+    """Write any batched events now."""
+    if _writer is None:
+        return True
+    try:
+        return _writer.flush()
+    except Exception as e:
+        print(f"Warning: Failed to flush events: {e}", file=sys.stderr)
+        return False
+
+
+atexit.register(flush_events)
+
+
 def log_event(
     agent: str,
     event_type: str,
@@ -140,13 +353,9 @@ def log_event(
         data: Additional structured data (optional)
 
     Returns:
-        True if event was logged successfully, False otherwise
+        True if event was logged (or buffered) successfully, False otherwise
     """
     try:
-        # Get events file path
-        events_file = _get_events_file_path()
-        _ensure_events_file_exists(events_file)
-
         # Build event data
         event = {
             "timestamp": datetime.now().isoformat(),
@@ -166,70 +375,201 @@ def log_event(
         if data:
             event["data"] = data
 
-        # Read existing events
-        with open(events_file, 'r') as f:
-            _lock_file(f)
-            content = f.read()
-            _unlock_file(f)
+        return get_event_writer().write(event)
 
-        # Parse YAML to find events list
-        events = []
-        try:
-            yaml_content = yaml.safe_load(content) or {}
-            if isinstance(yaml_content, dict):
-                raw_events = yaml_content.get('events', [])
-                if isinstance(raw_events, list):
-                    events = raw_events
-                elif raw_events is None:
-                    events = []
-        except yaml.YAMLError:
-            events = []
+    except Exception as e:
+        print(f"Warning: Failed to log event: {e}", file=sys.stderr)
+        return False
 
-        # Append new event
-        events.append(event)
 
-        # Write back with proper YAML structure
-        # We need to preserve the header comments, so we reconstruct carefully
-        with open(events_file, 'w') as f:
-            _lock_file(f)
+# =============================================================================
+# Reading and Compaction
+# =============================================================================
 
-            # Write header (everything before "events:")
-            header_end = content.find("events:")
-            if header_end >= 0:
-                f.write(content[:header_end])
-                f.write("events:\n")
-            else:
-                f.write("events:\n")
+# A top-level mapping key ("version:", "events:") at column 0
+_TOP_LEVEL_KEY = re.compile(r'[A-Za-z_][\w.-]*:(\s|$)')
 
-            # Write all events
-            for evt in events:
-                f.write("\n")
-                f.write(f"  - timestamp: \"{evt['timestamp']}\"\n")
-                f.write(f"    agent: {evt['agent']}\n")
-                f.write(f"    type: {evt['type']}\n")
+# Start of a double-quoted value: `key: "`, `- key: "` or `- "`
+_QUOTED_VALUE = re.compile(r'\s*(?:-\s+)?(?:[\w.-]+:\s+)?"')
 
-                if 'message' in evt:
-                    # Escape quotes in message
-                    msg = evt['message'].replace('"', '\\"')
-                    f.write(f"    message: \"{msg}\"\n")
 
-                if 'run_dir' in evt:
-                    f.write(f"    run_dir: {evt['run_dir']}\n")
+def _ends_in_open_quote(line: str, in_quote: bool) -> bool:
+    """
+    Track whether a double-quoted scalar is still open after this line.
 
-                if 'task_id' in evt:
-                    f.write(f"    task_id: {evt['task_id']}\n")
+    Files written before messages were escaped can contain quoted values
+    that run over several lines, some of them unindented.
+    """
+    if not in_quote:
+        match = _QUOTED_VALUE.match(line)
+        if not match:
+            return False
+        position = match.end()
+    else:
+        position = 0
+    while position < len(line):
+        char = line[position]
+        if char == '\\':
+            position += 2
+            continue
+        if char == '"':
+            return False
+        position += 1
+    return True
+
+
+def _split_events_file(lines) -> Iterator[Any]:
+    """
+    Yield ("header", text) once, then ("item", yaml_text) per event.
 
-                if 'data' in evt and evt['data']:
-                    f.write("    data:\n")
-                    _write_yaml_data(f, evt['data'], indent_level=3)
+    Works line by line so arbitrarily large logs are never loaded whole.
+    The events list ends only at a top-level key outside a quoted value.
+    """
+    lines = iter(lines)
+    header = []
+    for line in lines:
+        header.append(line)
+        stripped = line.strip()
+        if stripped.startswith("events:") and not line[0].isspace():
+            break
+    yield "header", "".join(header)
+
+    item: List[str] = []
+    item_indent = None
+    in_quote = False
+    for line in lines:
+        if in_quote:
+            item.append(line)
+            in_quote = _ends_in_open_quote(line, True)
+            continue
+        stripped = line.strip()
+        if not stripped or stripped.startswith("#"):
+            if item:
+                item.append(line)
+            continue
+        indent = len(line) - len(line.lstrip())
+        if indent == 0 and _TOP_LEVEL_KEY.match(line):
+            # Next top-level key; the events list has ended
+            break
+        if stripped.startswith("-") and (item_indent is None or indent <= item_indent):
+            if item:
+                yield "item", textwrap.dedent("".join(item))
+            item = [line]
+            item_indent = indent if item_indent is None else item_indent
+        elif item:
+            item.append(line)
+        in_quote = _ends_in_open_quote(line, False)
+    if item:
+        yield "item", textwrap.dedent("".join(item))
+
+
+def iter_events(events_file: Optional[Path] = None) -> Iterator[Dict[str, Any]]:
+    """
+    Stream events from events.yaml, oldest first.
 
-            _unlock_file(f)
+    Args:
+        events_file: Events file (default: the resolved events.yaml)
 
-        return True
+    Yields:
+        Event dicts; unparseable entries are skipped
+    """
+    events_file = Path(events_file) if events_file else _get_events_file_path()
+    if not events_file.exists():
+        return
+    with open(events_file, 'r') as f:
+        for kind, text in _split_events_file(f):
+            if kind != "item":
+                continue
+            try:
+                parsed = yaml.safe_load(text)
+            except yaml.YAMLError:
+                continue
+            if isinstance(parsed, list):
+                for event in parsed:
+                    if isinstance(event, dict):
+                        yield event
+
+
+def compact_events(
+    events_file: Optional[Path] = None,
+    keep: Optional[int] = None,
+    max_age_days: Optional[float] = None
+) -> Dict[str, int]:
+    """
+    Rewrite events.yaml in canonical form, optionally dropping old events.
 
-    except Exception as e:
-        print(f"Warning: Failed to log event: {e}", file=sys.stderr)
-        return False
+    Holds the file lock for the whole rewrite; the new file replaces the
+    old one atomically and concurrent writers reopen it. The file is left
+    untouched if any entry cannot be parsed.
+
+    Args:
+        events_file: Events file (default: the resolved events.yaml)
+        keep: Keep only the newest N events
+        max_age_days: Drop events older than this
+
+    Returns:
+        {'before': n, 'after': n}
+
+    Raises:
+        ValueError: If an entry in the file cannot be parsed
+    """
+    flush_events()
+    events_file = Path(events_file) if events_file else _get_events_file_path()
+    if not events_file.exists():
+        return {'before': 0, 'after': 0}
+
+    cutoff = (datetime.now() - timedelta(days=max_age_days)).isoformat() if max_age_days else None
+
+    with open(events_file, 'r') as f:
+        _lock_file(f)
+        try:
+            header = ""
+            events = []
+            unparsed = 0
+            for kind, text in _split_events_file(f):
+                if kind == "header":
+                    header = text
+                    continue
+                try:
+                    parsed = yaml.safe_load(text)
+                except yaml.YAMLError:
+                    parsed = None
+                if not isinstance(parsed, list):
+                    unparsed += 1
+                    continue
+                for event in parsed:
+                    if isinstance(event, dict):
+                        events.append(event)
+            if unparsed:
+                # Rewriting would silently drop these entries
+                raise ValueError(
+                    f"{events_file}: {unparsed} event entries could not be parsed; "
+                    f"not compacting"
+                )
+
+            before = len(events)
+            if cutoff:
+                events = [e for e in events if str(e.get('timestamp', '')) >= cutoff]
+            if keep is not None:
+                events = events[-keep:] if keep > 0 else []
+
+            head = header.rsplit("events:", 1)[0] if "events:" in header else header
+            tmp_file = events_file.with_suffix(f".{os.getpid()}.tmp")
+            with open(tmp_file, 'w') as out:
+                out.write(head)
+                out.write("events:\n")
+                for event in events:
+                    if set(event) <= EVENT_FIELDS and {'timestamp', 'agent', 'type'} <= set(event):
+                        out.write(_format_event(event))
+                    else:
+                        # Foreign entry (e.g. appended by a bash hook); keep as YAML
+                        item = yaml.safe_dump([event], default_flow_style=False, sort_keys=False)
+                        out.write("\n" + textwrap.indent(item, "  "))
+            os.replace(tmp_file, events_file)
+        finally:
+            _unlock_file(f)
+
+    return {'before': before, 'after': len(events)}
 
 
 def _write_yaml_data(f, data: Any, indent_level: int = 0) -> None:
@@ -247,13 +587,13 @@ def _write_yaml_data(f, data: Any, indent_level: int = 0) -> None:
                     if isinstance(item, dict):
                         f.write(f"{indent}-\n")
                         _write_yaml_data(f, item, indent_level + 1)
+                    elif isinstance(item, str):
+                        f.write(f"{indent}- {_quote(item)}\n")
                     else:
                         f.write(f"{indent}- {item}\n")
             else:
-                # Escape quotes in string values
                 if isinstance(value, str):
-                    value = value.replace('"', '\\"')
-                    f.write(f"{indent}{key}: \"{value}\"\n")
+                    f.write(f"{indent}{key}: {_quote(value)}\n")
                 else:
                     f.write(f"{indent}{key}: {value}\n")
     elif isinstance(data, list):
@@ -261,6 +601,8 @@ def _write_yaml_data(f, data: Any, indent_level: int = 0) -> None:
             if isinstance(item, dict):
                 f.write(f"{indent}-\n")
                 _write_yaml_data(f, item, indent_level + 1)
+            elif isinstance(item, str):
+                f.write(f"{indent}- {_quote(item)}\n")
             else:
                 f.write(f"{indent}- {item}\n")
 
@@ -307,17 +649,34 @@ def log_in_progress(agent: str, message: str = "Agent in progress", run_dir: Opt
 
 
 if __name__ == "__main__":
-    # Test the module
-    print("Testing event_logger module...")
-
-    # Test basic logging
-    success = log_start("test-agent", "Test start event")
-    print(f"Start event logged: {success}")
-
-    success = log_complete("test-agent", "Test complete event", data={"test": True})
-    print(f"Complete event logged: {success}")
-
-    success = log_error("test-agent", "Test error event", error_details="Something went wrong")
-    print(f"Error event logged: {success}")
-
-    print("Test complete. Check events.yaml for logged events.")
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Event Logger')
+    parser.add_argument('--compact', action='store_true', help='Rewrite events.yaml in canonical form')
+    parser.add_argument('--keep', type=int, help='With --compact: keep only the newest N events')
+    parser.add_argument('--max-age-days', type=float, help='With --compact: drop events older than this')
+    parser.add_argument('--tail', type=int, help='Print the newest N events')
+    args = parser.parse_args()
+
+    if args.compact:
+        result = compact_events(keep=args.keep, max_age_days=args.max_age_days)
+        print(f"Compacted events.yaml: {result['before']} -> {result['after']} events")
+    elif args.tail:
+        from collections import deque
+        for event in deque(iter_events(), maxlen=args.tail):
+            print(f"[{event.get('timestamp')}] {event.get('agent')} {event.get('type')}: {event.get('message', '')}")
+    else:
+        # Test the module
+        print("Testing event_logger module...")
+
+        # Test basic logging
+        success = log_start("test-agent", "Test start event")
+        print(f"Start event logged: {success}")
+
+        success = log_complete("test-agent", "Test complete event", data={"test": True})
+        print(f"Complete event logged: {success}")
+
+        success = log_error("test-agent", "Test error event", error_details="Something went wrong")
+        print(f"Error event logged: {success}")
+
+        print("Test complete. Check events.yaml for logged events.")
@@ -13,11 +13,12 @@ from pathlib import Path
 script_dir = Path(__file__).parent
 sys.path.insert(0, str(script_dir))
 from paths import PathResolver, get_path_resolver
+from metrics_store import get_metrics_store
+from rolling_stats import summarize
 
 resolver = get_path_resolver()
 PROJECT_DIR = resolver.get_project_path()
 
-import yaml
 from datetime import datetime, timezone, timedelta
 from typing import Dict, List, Any, Optional, Tuple
 import logging
@@ -33,24 +34,36 @@ logger = logging.getLogger(__name__)
 # ============================================================================
 # Configuration
 # ============================================================================
-METRICS_FILE = PROJECT_DIR / ".autonomous" / "data" / "metrics" / "metrics.yaml"
+METRICS_DIR = PROJECT_DIR / ".autonomous" / "data" / "metrics"
+METRICS_FILE = METRICS_DIR / "metrics.yaml"   # legacy; imported into the store once
+
+# Fields read by the trend calculations
+ANALYSIS_COLUMNS = ['timestamp', 'run_number', 'agent_type', 'duration_seconds', 'result', 'files_modified']
 
 # ============================================================================
 # Data Loading Functions
 # ============================================================================
 
-def load_metrics() -> List[Dict[str, Any]]:
+def load_metrics(
+    agent_type: Optional[str] = None,
+    window: Optional[int] = None,
+    columns: Optional[List[str]] = None
+) -> List[Dict[str, Any]]:
     """
     Load metrics from storage.
 
+    Args:
+        agent_type: Only this agent type (both if None)
+        window: Only the N most recent runs
+        columns: Metric fields to read (all if None)
+
     Returns:
-        List of metric records
+        List of metric records (newest first)
     """
     try:
-        if METRICS_FILE.exists():
-            with open(METRICS_FILE, 'r') as f:
-                data = yaml.safe_load(f)
-                return data.get('metrics', []) if data else []
+        return get_metrics_store(METRICS_DIR).query_runs(
+            agent_type=agent_type, window=window, columns=columns
+        )
     except Exception as e:
         logger.error(f"Error loading metrics: {e}")
 
@@ -109,7 +122,7 @@ def calculate_velocity_trend(metrics: List[Dict[str, Any]]) -> Dict[str, Any]:
         return {'average': 0, 'trend': 'unknown', 'recent': 0, 'baseline': 0}
 
     # Calculate average duration (in minutes)
-    avg_duration_seconds = statistics.mean(durations)
+    avg_duration_seconds = summarize(durations)['mean']
     avg_duration_minutes = avg_duration_seconds / 60
 
     # Velocity = runs per hour = 60 / avg_duration_minutes
@@ -130,11 +143,11 @@ def calculate_velocity_trend(metrics: List[Dict[str, Any]]) -> Dict[str, Any]:
     baseline_velocity = 0
 
     if recent_durations:
-        recent_avg_min = statistics.mean(recent_durations) / 60
+        recent_avg_min = summarize(recent_durations)['mean'] / 60
         recent_velocity = 60 / recent_avg_min if recent_avg_min > 0 else 0
 
     if baseline_durations:
-        baseline_avg_min = statistics.mean(baseline_durations) / 60
+        baseline_avg_min = summarize(baseline_durations)['mean'] / 60
         baseline_velocity = 60 / baseline_avg_min if baseline_avg_min > 0 else 0
 
     # Determine trend
@@ -222,7 +235,8 @@ def calculate_duration_trend(metrics: List[Dict[str, Any]]) -> Dict[str, Any]:
     if not durations:
         return {'average': 0, 'trend': 'unknown', 'recent': 0, 'baseline': 0}
 
-    avg_duration = statistics.mean(durations)
+    overall = summarize(durations)
+    avg_duration = overall['mean']
 
     # Calculate recent vs baseline
     recent_count = len(metrics) // 3
@@ -232,8 +246,8 @@ def calculate_duration_trend(metrics: List[Dict[str, Any]]) -> Dict[str, Any]:
     recent_durations = [m.get('duration_seconds', 0) for m in recent_metrics if m.get('duration_seconds')]
     baseline_durations = [m.get('duration_seconds', 0) for m in baseline_metrics if m.get('duration_seconds')]
 
-    recent_avg = statistics.mean(recent_durations) if recent_durations else 0
-    baseline_avg = statistics.mean(baseline_durations) if baseline_durations else 0
+    recent_avg = summarize(recent_durations)['mean']
+    baseline_avg = summarize(baseline_durations)['mean']
 
     # Determine trend
     if recent_avg < baseline_avg * 0.9:
@@ -248,9 +262,9 @@ def calculate_duration_trend(metrics: List[Dict[str, Any]]) -> Dict[str, Any]:
         'recent': round(recent_avg, 1),
         'baseline': round(baseline_avg, 1),
         'trend': trend,
-        'min': round(min(durations), 1),
-        'max': round(max(durations), 1),
-        'median': round(statistics.median(durations), 1),
+        'min': round(overall['min'], 1),
+        'max': round(overall['max'], 1),
+        'median': round(overall['median'], 1),
         'sample_size': len(durations),
     }
 
@@ -291,13 +305,7 @@ def analyze_trends(window: int = 100, agent_type: str = 'executor') -> Dict[str,
     Returns:
         Comprehensive trend analysis
     """
-    metrics = load_metrics()
-
-    if not metrics:
-        logger.warning("No metrics available for analysis")
-        return {}
-
-    filtered = filter_metrics_by_window(metrics, window, agent_type)
+    filtered = load_metrics(agent_type=agent_type, window=window, columns=ANALYSIS_COLUMNS)
 
     if not filtered:
         logger.warning(f"No metrics found for agent_type={agent_type} in window={window}")
@@ -335,8 +343,7 @@ def compare_vs_baseline(
     Returns:
         Comparison results
     """
-    metrics = load_metrics()
-    baseline = filter_metrics_by_window(metrics, baseline_window, 'executor')
+    baseline = load_metrics(agent_type='executor', window=baseline_window, columns=ANALYSIS_COLUMNS)
 
     if not baseline:
         return {'status': 'no_baseline'}
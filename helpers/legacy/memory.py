@@ -4,6 +4,9 @@ Memory System
 
 Persists learnings, decisions, and insights across runs.
 Simple file-based memory (no external dependencies).
+
+Memories are indexed as they are written (see memory_index), so listing
+and searching them does not read every file.
 """
 
 from pathlib import Path
@@ -16,6 +19,7 @@ import sys
 # Add lib to path for importing paths module
 sys.path.insert(0, str(Path(__file__).parent))
 from paths import get_path_resolver
+from memory_index import MemoryIndex
 
 
 class MemorySystem:
@@ -51,6 +55,57 @@ class MemorySystem:
         self.insights_path.mkdir(parents=True, exist_ok=True)
         self.context_path.mkdir(parents=True, exist_ok=True)
 
+        # Full-text index, updated on write and synced lazily before reads
+        self.index = MemoryIndex(self.base_path / "index.db", {
+            "decisions": (self.decisions_path, "*.md"),
+            "insights": (self.insights_path, "*.md"),
+            "context": (self.context_path, "*.yaml"),
+        })
+
+    @staticmethod
+    def _parse_memory(kind: str, file_path: Path, content: str) -> Dict[str, Any]:
+        """Extract the stored index fields from a memory file."""
+        fields: Dict[str, Any] = {}
+
+        if kind == "decisions":
+            if "# Decision:" in content:
+                fields["title"] = content.split("# Decision:")[1].split("\n")[0].strip()
+            if "**Date:**" in content:
+                fields["date"] = content.split("**Date:**")[1].split("\n")[0].strip()
+
+        elif kind == "insights":
+            if "**Category:**" in content:
+                fields["category"] = content.split("**Category:**")[1].split("\n")[0].strip()
+            if "**Date:**" in content:
+                fields["date"] = content.split("**Date:**")[1].split("\n")[0].strip()
+            if "## Content" in content:
+                fields["content"] = content.split("## Content")[1].split("---")[0].strip()
+
+        elif kind == "context":
+            try:
+                data = yaml.safe_load(content) or {}
+            except yaml.YAMLError:
+                data = {}
+            if isinstance(data, dict):
+                for field, key in (("title", "name"), ("date", "date"), ("content", "summary")):
+                    if data.get(key) is not None:
+                        fields[field] = str(data[key])
+
+        return fields
+
+    def _index_written(self, kind: str, file_path: Path, content: str):
+        """Add a memory this instance just wrote to the index."""
+        self.index.record(kind, file_path, content, self._parse_memory(kind, file_path, content))
+
+    def reindex(self) -> int:
+        """
+        Re-read any memory file whose size or mtime changed.
+
+        Returns:
+            Number of files (re)indexed or removed
+        """
+        return self.index.sync(self._parse_memory, force=True)
+
     def record_decision(
         self,
         title: str,
@@ -122,6 +177,7 @@ class MemorySystem:
 """
 
         file_path.write_text(content)
+        self._index_written("decisions", file_path, content)
         return file_path
 
     def record_insight(
@@ -186,6 +242,7 @@ class MemorySystem:
 """
 
         file_path.write_text(md_content)
+        self._index_written("insights", file_path, md_content)
         return file_path
 
     def save_context_summary(
@@ -218,70 +275,73 @@ class MemorySystem:
         }
 
         file_path = self.context_path / f"{name}.yaml"
-        file_path.write_text(yaml.dump(context_data, default_flow_style=False))
+        content = yaml.dump(context_data, default_flow_style=False)
+        file_path.write_text(content)
+        self._index_written("context", file_path, content)
 
         return file_path
 
     def get_recent_decisions(self, limit: int = 10) -> List[Dict[str, Any]]:
         """Get recent decisions."""
-        decisions = []
-
-        for file_path in sorted(self.decisions_path.glob("DEC-*.md"), reverse=True)[:limit]:
-            # Parse markdown to extract key info
-            content = file_path.read_text()
-
-            decision = {
-                "id": file_path.stem,
-                "file": str(file_path),
-                "title": "",
-                "date": ""
+        self.index.sync(self._parse_memory)
+
+        return [
+            {
+                "id": doc["path"].stem,
+                "file": str(doc["path"]),
+                "title": doc["title"] or "",
+                "date": doc["date"] or "",
             }
-
-            # Extract title
-            if "# Decision:" in content:
-                decision["title"] = content.split("# Decision:")[1].split("\n")[0].strip()
-
-            # Extract date
-            if "**Date:**" in content:
-                decision["date"] = content.split("**Date:**")[1].split("  ")[0].strip()
-
-            decisions.append(decision)
-
-        return decisions
+            for doc in self.index.list_documents("decisions", limit=limit)
+        ]
 
     def get_insights_by_category(self, category: str) -> List[Dict[str, Any]]:
         """Get insights filtered by category."""
-        insights = []
-
-        for file_path in self.insights_path.glob("INSIGHT-*.md"):
-            content = file_path.read_text()
+        self.index.sync(self._parse_memory)
+
+        return [
+            {
+                "id": doc["path"].stem,
+                "file": str(doc["path"]),
+                "category": category,
+                "content": doc["content"] or "",
+            }
+            for doc in self.index.list_documents("insights", category=category, newest_first=False)
+        ]
 
-            # Check category
-            if f"**Category:** {category}" in content:
-                insight = {
-                    "id": file_path.stem,
-                    "file": str(file_path),
-                    "category": category,
-                    "content": ""
-                }
+    def search(
+        self,
+        query: str,
+        limit: Optional[int] = 10,
+        kinds: Optional[List[str]] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Ranked search across memories (BM25).
 
-                # Extract content
-                if "## Content" in content:
-                    insight["content"] = content.split("## Content")[1].split("---")[0].strip()
+        Every query term must appear in a result; terms are whole words,
+        case-insensitive.
 
-                insights.append(insight)
+        Args:
+            query: Search terms
+            limit: Maximum results
+            kinds: Only these memory types ("decisions", "insights", "context")
 
-        return insights
+        Returns:
+            List of {"path", "kind", "name", "score"}, best match first
+        """
+        self.index.sync(self._parse_memory)
+        return self.index.search(query, kinds=kinds, limit=limit)
 
-    def search_memories(self, query: str) -> Dict[str, List[Path]]:
+    def search_memories(self, query: str, limit: Optional[int] = None) -> Dict[str, List[Path]]:
         """
-        Simple search across all memories.
+        Search across all memories.
 
         Args:
-            query: Search term
+            query: Search terms
+            limit: Maximum matches overall (all if None)
 
         Returns:
-            Dictionary of memory type -> matching files
+            Dictionary of memory type -> matching files, best match first
         """
         results = {
             "decisions": [],
@@ -289,22 +349,8 @@ class MemorySystem:
             "context": []
         }
 
-        query_lower = query.lower()
-
-        # Search decisions
-        for file_path in self.decisions_path.glob("*.md"):
-            if query_lower in file_path.read_text().lower():
-                results["decisions"].append(file_path)
-
-        # Search insights
-        for file_path in self.insights_path.glob("*.md"):
-            if query_lower in file_path.read_text().lower():
-                results["insights"].append(file_path)
-
-        # Search context
-        for file_path in self.context_path.glob("*.yaml"):
-            if query_lower in file_path.read_text().lower():
-                results["context"].append(file_path)
+        for hit in self.search(query, limit=limit):
+            results[hit["kind"]].append(hit["path"])
 
         return results
 
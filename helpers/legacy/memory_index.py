@@ -0,0 +1,350 @@
+#!/usr/bin/env python3
+"""
+Memory Index
+
+Inverted index with BM25 ranking over the memory system's decision,
+insight and context files.
+
+The index lives next to the memories (index.db, SQLite from the standard
+library) and is updated when MemorySystem writes a memory, so queries only
+touch the postings of the query terms instead of reading every file.
+Files added or removed by other processes are picked up when a memory
+directory's mtime changes; reindex() re-reads anything whose size or
+mtime differs.
+"""
+
+import math
+import os
+import re
+import sqlite3
+import threading
+from collections import Counter
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+# BM25 parameters
+BM25_K1 = 1.5
+BM25_B = 0.75
+
+TOKEN_PATTERN = re.compile(r"[a-z0-9]+")
+
+
+def tokenize(text: str) -> List[str]:
+    """Split text into lowercase alphanumeric terms."""
+    return TOKEN_PATTERN.findall(text.lower())
+
+
+class MemoryIndex:
+    """
+    Incrementally maintained full-text index of memory files.
+
+    Each indexed file is a document of a kind ("decisions", "insights",
+    "context") with a few stored fields (title, date, category, content)
+    so listings can be served without reading files.
+    """
+
+    def __init__(self, db_path: Path, sources: Dict[str, Tuple[Path, str]]):
+        """
+        Initialize the index.
+
+        Args:
+            db_path: SQLite file for the index
+            sources: {kind: (directory, glob pattern)} of files to index
+        """
+        self.db_path = Path(db_path)
+        self.sources = sources
+        self._lock = threading.RLock()
+        self._dir_mtimes: Dict[str, int] = {}
+
+        self._conn = sqlite3.connect(str(self.db_path), check_same_thread=False, timeout=30)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        with self._conn:
+            self._conn.execute("""
+                CREATE TABLE IF NOT EXISTS docs (
+                    id INTEGER PRIMARY KEY,
+                    path TEXT UNIQUE,
+                    kind TEXT,
+                    name TEXT,
+                    length INTEGER,
+                    mtime_ns INTEGER,
+                    size INTEGER,
+                    title TEXT,
+                    date TEXT,
+                    category TEXT,
+                    content TEXT
+                )
+            """)
+            self._conn.execute("CREATE INDEX IF NOT EXISTS idx_docs_kind_name ON docs (kind, name)")
+            self._conn.execute("CREATE INDEX IF NOT EXISTS idx_docs_kind_category ON docs (kind, category)")
+            self._conn.execute("""
+                CREATE TABLE IF NOT EXISTS postings (
+                    term TEXT,
+                    doc_id INTEGER,
+                    tf INTEGER,
+                    PRIMARY KEY (term, doc_id)
+                ) WITHOUT ROWID
+            """)
+            self._conn.execute("CREATE INDEX IF NOT EXISTS idx_postings_doc ON postings (doc_id)")
+            self._conn.execute("""
+                CREATE TABLE IF NOT EXISTS stats (
+                    id INTEGER PRIMARY KEY CHECK (id = 0),
+                    doc_count INTEGER,
+                    total_length INTEGER
+                )
+            """)
+            self._conn.execute("INSERT OR IGNORE INTO stats VALUES (0, 0, 0)")
+
+    # ========== Writes ==========
+
+    def add(self, kind: str, path: Path, text: str, fields: Optional[Dict[str, Any]] = None):
+        """
+        Index (or re-index) one file.
+
+        Args:
+            kind: Memory kind
+            path: File path
+            text: File content
+            fields: Stored fields (title, date, category, content)
+        """
+        path = Path(path)
+        try:
+            stat = path.stat()
+            mtime_ns, size = stat.st_mtime_ns, stat.st_size
+        except OSError:
+            mtime_ns, size = None, None
+        fields = fields or {}
+        terms = Counter(tokenize(text))
+        length = sum(terms.values())
+
+        with self._lock, self._conn:
+            self._remove_locked(str(path))
+            cursor = self._conn.execute(
+                "INSERT INTO docs (path, kind, name, length, mtime_ns, size, title, date, category, content) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (str(path), kind, path.name, length, mtime_ns, size,
+                 fields.get("title"), fields.get("date"), fields.get("category"), fields.get("content"))
+            )
+            doc_id = cursor.lastrowid
+            self._conn.executemany(
+                "INSERT INTO postings (term, doc_id, tf) VALUES (?, ?, ?)",
+                [(term, doc_id, tf) for term, tf in terms.items()]
+            )
+            self._conn.execute(
+                "UPDATE stats SET doc_count = doc_count + 1, total_length = total_length + ? WHERE id = 0",
+                (length,)
+            )
+
+    def record(self, kind: str, path: Path, text: str, fields: Optional[Dict[str, Any]] = None):
+        """
+        Index a file this process just wrote.
+
+        Also refreshes the remembered directory mtime (if the kind was
+        synced) so the write does not trigger a directory rescan.
+        """
+        self.add(kind, path, text, fields)
+        with self._lock:
+            if kind in self._dir_mtimes:
+                try:
+                    self._dir_mtimes[kind] = os.stat(self.sources[kind][0]).st_mtime_ns
+                except OSError:
+                    self._dir_mtimes.pop(kind, None)
+
+    def remove(self, path: Path):
+        """Drop one file from the index."""
+        with self._lock, self._conn:
+            self._remove_locked(str(path))
+
+    def _remove_locked(self, path: str):
+        row = self._conn.execute("SELECT id, length FROM docs WHERE path = ?", (path,)).fetchone()
+        if row is None:
+            return
+        doc_id, length = row
+        self._conn.execute("DELETE FROM postings WHERE doc_id = ?", (doc_id,))
+        self._conn.execute("DELETE FROM docs WHERE id = ?", (doc_id,))
+        self._conn.execute(
+            "UPDATE stats SET doc_count = doc_count - 1, total_length = total_length - ? WHERE id = 0",
+            (length,)
+        )
+
+    # ========== Synchronization ==========
+
+    def sync(self, parse, force: bool = False) -> int:
+        """
+        Bring the index up to date with the memory directories.
+
+        Cheap when nothing changed: only the directories are stat'ed unless
+        one of their mtimes moved (a file was added or removed) or force.
+
+        Args:
+            parse: Callable(kind, path, text) -> stored fields
+            force: Compare every file's size and mtime (picks up in-place edits)
+
+        Returns:
+            Number of files (re)indexed or removed
+        """
+        changed = 0
+        with self._lock:
+            for kind, (directory, pattern) in self.sources.items():
+                try:
+                    dir_mtime = os.stat(directory).st_mtime_ns
+                except OSError:
+                    continue
+                if not force and self._dir_mtimes.get(kind) == dir_mtime:
+                    continue
+
+                known = {
+                    path: (mtime_ns, size)
+                    for path, mtime_ns, size in self._conn.execute(
+                        "SELECT path, mtime_ns, size FROM docs WHERE kind = ?", (kind,)
+                    )
+                }
+                seen = set()
+                for path in directory.glob(pattern):
+                    key = str(path)
+                    seen.add(key)
+                    try:
+                        stat = path.stat()
+                    except OSError:
+                        continue
+                    if known.get(key) == (stat.st_mtime_ns, stat.st_size):
+                        continue
+                    try:
+                        text = path.read_text()
+                    except (OSError, UnicodeDecodeError):
+                        continue
+                    self.add(kind, path, text, parse(kind, path, text))
+                    changed += 1
+
+                for key in set(known) - seen:
+                    self.remove(Path(key))
+                    changed += 1
+
+                self._dir_mtimes[kind] = dir_mtime
+        return changed
+
+    # ========== Queries ==========
+
+    def search(
+        self,
+        query: str,
+        kinds: Optional[Iterable[str]] = None,
+        limit: Optional[int] = None,
+        match_all: bool = True
+    ) -> List[Dict[str, Any]]:
+        """
+        Rank documents against a query with BM25.
+
+        Args:
+            query: Free-text query
+            kinds: Only these memory kinds (all if None)
+            limit: Maximum number of results
+            match_all: Require every query term (False ranks any match)
+
+        Returns:
+            [{"path", "kind", "name", "score"}], best first
+        """
+        terms = list(dict.fromkeys(tokenize(query)))
+        if not terms:
+            return []
+
+        with self._lock:
+            doc_count, total_length = self._conn.execute(
+                "SELECT doc_count, total_length FROM stats WHERE id = 0"
+            ).fetchone()
+            if not doc_count:
+                return []
+            avg_length = total_length / doc_count
+
+            postings: List[Dict[int, int]] = []
+            for term in terms:
+                rows = self._conn.execute(
+                    "SELECT doc_id, tf FROM postings WHERE term = ?", (term,)
+                ).fetchall()
+                if not rows:
+                    if match_all:
+                        return []
+                    continue
+                postings.append(dict(rows))
+
+            if not postings:
+                return []
+            if match_all:
+                # Intersect starting from the rarest term
+                postings.sort(key=len)
+                candidates = set(postings[0])
+                for term_postings in postings[1:]:
+                    candidates.intersection_update(term_postings)
+            else:
+                candidates = set().union(*postings)
+            if not candidates:
+                return []
+            candidates = list(candidates)
+
+            # Fetch lengths and metadata for candidate documents only
+            docs = {}
+            wanted = set(kinds) if kinds is not None else None
+            for start in range(0, len(candidates), 500):
+                chunk = candidates[start:start + 500]
+                placeholders = ", ".join("?" for _ in chunk)
+                for doc_id, path, kind, name, length in self._conn.execute(
+                    f"SELECT id, path, kind, name, length FROM docs WHERE id IN ({placeholders})", chunk
+                ):
+                    if wanted is None or kind in wanted:
+                        docs[doc_id] = (path, kind, name, length)
+
+            # Full BM25 with per-term saturation and length normalization
+            idfs = [
+                math.log(1 + (doc_count - len(p) + 0.5) / (len(p) + 0.5)) for p in postings
+            ]
+            results = []
+            for doc_id, (path, kind, name, length) in docs.items():
+                norm = BM25_K1 * (1 - BM25_B + BM25_B * length / avg_length)
+                score = 0.0
+                for term_postings, idf in zip(postings, idfs):
+                    tf = term_postings.get(doc_id)
+                    if tf:
+                        score += idf * tf * (BM25_K1 + 1) / (tf + norm)
+                results.append({"path": Path(path), "kind": kind, "name": name, "score": score})
+
+        results.sort(key=lambda r: (-r["score"], r["name"]))
+        return results[:limit] if limit is not None else results
+
+    def list_documents(
+        self,
+        kind: str,
+        category: Optional[str] = None,
+        limit: Optional[int] = None,
+        newest_first: bool = True
+    ) -> List[Dict[str, Any]]:
+        """
+        List stored documents of a kind, ordered by file name.
+
+        Returns:
+            [{"path", "name", "title", "date", "category", "content"}]
+        """
+        sql = "SELECT path, name, title, date, category, content FROM docs WHERE kind = ?"
+        params: List[Any] = [kind]
+        if category is not None:
+            sql += " AND category = ?"
+            params.append(category)
+        sql += f" ORDER BY name {'DESC' if newest_first else 'ASC'}"
+        if limit is not None:
+            sql += " LIMIT ?"
+            params.append(limit)
+        with self._lock:
+            rows = self._conn.execute(sql, params).fetchall()
+        return [
+            {"path": Path(path), "name": name, "title": title, "date": date,
+             "category": category, "content": content}
+            for path, name, title, date, category, content in rows
+        ]
+
+    def count(self) -> int:
+        """Number of indexed documents."""
+        with self._lock:
+            return self._conn.execute("SELECT doc_count FROM stats WHERE id = 0").fetchone()[0]
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
@@ -13,14 +13,17 @@ from pathlib import Path
 script_dir = Path(__file__).parent
 sys.path.insert(0, str(script_dir))
 from paths import PathResolver, get_path_resolver
+from metrics_store import get_metrics_store
 
 resolver = get_path_resolver()
 PROJECT_DIR = resolver.get_project_path()
 
 import yaml
 import json
+import os
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
-from typing import Dict, List, Any, Optional
+from typing import Dict, Iterator, List, Any, Optional, Tuple
 import logging
 
 # Configure logging
@@ -40,9 +43,14 @@ PLANNER_RUNS_DIR = PROJECT_DIR / "runs" / "planner"
 EXECUTOR_RUNS_DIR = PROJECT_DIR / "runs" / "executor"
 
 # Storage settings
-METRICS_FILE = METRICS_DIR / "metrics.yaml"
+METRICS_FILE = METRICS_DIR / "metrics.yaml"   # legacy; imported into the store once
+METRICS_DB = METRICS_DIR / "metrics.db"
 MAX_RUNS_TO_STORE = 1000
 
+# Ingestion settings
+MAX_INGEST_WORKERS = 8
+YAML_LOADER = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+
 # Ensure metrics directory exists
 METRICS_DIR.mkdir(parents=True, exist_ok=True)
 
@@ -69,7 +77,7 @@ def extract_metrics_from_run(run_dir: Path, agent_type: str) -> Optional[Dict[st
             return None
 
         with open(metadata_file, 'r') as f:
-            metadata = yaml.safe_load(f)
+            metadata = yaml.load(f, Loader=YAML_LOADER)
 
         if not metadata:
             logger.warning(f"Empty metadata in {run_dir}")
@@ -122,6 +130,81 @@ def extract_metrics_from_run(run_dir: Path, agent_type: str) -> Optional[Dict[st
         return None
 
 
+def iter_run_directories() -> Iterator[Tuple[Path, str]]:
+    """
+    Yield every run directory and its agent type.
+
+    Yields:
+        (run_dir, agent_type) for executor runs, then planner runs
+    """
+    for runs_dir, agent_type in ((EXECUTOR_RUNS_DIR, 'executor'), (PLANNER_RUNS_DIR, 'planner')):
+        if not runs_dir.exists():
+            continue
+        with os.scandir(runs_dir) as entries:
+            names = sorted(e.name for e in entries if e.name.startswith('run-') and e.is_dir())
+        for name in names:
+            yield runs_dir / name, agent_type
+
+
+def get_run_fingerprint(run_dir: Path) -> Optional[Tuple[int, int]]:
+    """
+    Get the fingerprint of a run: mtime and size of its metadata.yaml.
+
+    Returns:
+        (mtime_ns, size), or None if the run has no metadata.yaml
+    """
+    try:
+        stat = os.stat(run_dir / "metadata.yaml")
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+def collect_new_metrics(
+    fingerprints: Dict[str, Tuple[int, int]],
+    max_workers: int = MAX_INGEST_WORKERS
+) -> Tuple[List[Dict[str, Any]], Dict[str, Tuple[int, int]], List[str]]:
+    """
+    Collect metrics only from runs that are new or changed.
+
+    Args:
+        fingerprints: {run_directory: (mtime_ns, size)} already ingested
+        max_workers: Threads used to parse metadata.yaml files
+
+    Returns:
+        (new or changed metric records, their fingerprints,
+         previously ingested run directories that no longer exist)
+    """
+    pending = []
+    seen = set()
+    for run_dir, agent_type in iter_run_directories():
+        fingerprint = get_run_fingerprint(run_dir)
+        if fingerprint is None:
+            continue
+        key = str(run_dir)
+        seen.add(key)
+        if fingerprints.get(key) != fingerprint:
+            pending.append((run_dir, agent_type, fingerprint))
+
+    removed = [key for key in fingerprints if key not in seen]
+
+    if len(pending) > 1 and max_workers > 1:
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(pending))) as pool:
+            results = list(pool.map(lambda p: extract_metrics_from_run(p[0], p[1]), pending))
+    else:
+        results = [extract_metrics_from_run(run_dir, agent_type) for run_dir, agent_type, _ in pending]
+
+    records = []
+    new_fingerprints = {}
+    for (run_dir, _, fingerprint), metrics in zip(pending, results):
+        # Fingerprint unreadable runs too; they are re-read once they change
+        new_fingerprints[str(run_dir)] = fingerprint
+        if metrics:
+            records.append(metrics)
+
+    return records, new_fingerprints, removed
+
+
 def collect_all_metrics() -> List[Dict[str, Any]]:
     """
     Collect metrics from all planner and executor runs.
@@ -129,23 +212,7 @@ def collect_all_metrics() -> List[Dict[str, Any]]:
     Returns:
         List of metric records, sorted by timestamp (newest first)
     """
-    all_metrics = []
-
-    # Collect from executor runs
-    if EXECUTOR_RUNS_DIR.exists():
-        for run_dir in sorted(EXECUTOR_RUNS_DIR.iterdir()):
-            if run_dir.is_dir() and run_dir.name.startswith('run-'):
-                metrics = extract_metrics_from_run(run_dir, 'executor')
-                if metrics:
-                    all_metrics.append(metrics)
-
-    # Collect from planner runs
-    if PLANNER_RUNS_DIR.exists():
-        for run_dir in sorted(PLANNER_RUNS_DIR.iterdir()):
-            if run_dir.is_dir() and run_dir.name.startswith('run-'):
-                metrics = extract_metrics_from_run(run_dir, 'planner')
-                if metrics:
-                    all_metrics.append(metrics)
+    all_metrics, _, _ = collect_new_metrics({})
 
     # Sort by timestamp (newest first)
     all_metrics.sort(key=lambda x: x.get('timestamp', ''), reverse=True)
@@ -154,18 +221,30 @@ def collect_all_metrics() -> List[Dict[str, Any]]:
     return all_metrics
 
 
-def load_existing_metrics() -> List[Dict[str, Any]]:
+def load_existing_metrics(
+    agent_type: Optional[str] = None,
+    window: Optional[int] = None,
+    since: Any = None,
+    until: Any = None,
+    columns: Optional[List[str]] = None
+) -> List[Dict[str, Any]]:
     """
     Load existing metrics from storage.
 
+    Args:
+        agent_type: Only this agent type
+        window: Only the N most recent runs
+        since: Earliest timestamp (ISO string or datetime)
+        until: Latest timestamp (ISO string or datetime)
+        columns: Metric fields to read (all if None)
+
     Returns:
-        List of existing metric records
+        List of existing metric records (newest first)
     """
     try:
-        if METRICS_FILE.exists():
-            with open(METRICS_FILE, 'r') as f:
-                data = yaml.safe_load(f)
-                return data.get('metrics', []) if data else []
+        return get_metrics_store(METRICS_DIR).query_runs(
+            agent_type=agent_type, window=window, since=since, until=until, columns=columns
+        )
     except Exception as e:
         logger.error(f"Error loading existing metrics: {e}")
 
@@ -188,21 +267,12 @@ def save_metrics(metrics: List[Dict[str, Any]]) -> bool:
             metrics = metrics[:MAX_RUNS_TO_STORE]
             logger.info(f"Applied retention policy: keeping {MAX_RUNS_TO_STORE} most recent runs")
 
-        # Create data structure
-        data = {
-            'metadata': {
-                'last_updated': datetime.now(timezone.utc).isoformat(),
-                'total_runs': len(metrics),
-                'retention_policy': MAX_RUNS_TO_STORE,
-            },
-            'metrics': metrics
-        }
+        store = get_metrics_store(METRICS_DIR)
+        store.replace_runs(metrics)
+        # Runs were replaced wholesale; re-read every run on next collection
+        store.clear_fingerprints()
 
-        # Write to file
-        with open(METRICS_FILE, 'w') as f:
-            yaml.safe_dump(data, f, default_flow_style=False, sort_keys=False)
-
-        logger.info(f"Saved {len(metrics)} metrics to {METRICS_FILE}")
+        logger.info(f"Saved {len(metrics)} metrics to {store.db_path}")
         return True
 
     except Exception as e:
@@ -210,36 +280,50 @@ def save_metrics(metrics: List[Dict[str, Any]]) -> bool:
         return False
 
 
-def collect_and_store_metrics() -> Dict[str, Any]:
+def collect_and_store_metrics(incremental: bool = True) -> Dict[str, Any]:
     """
-    Main function: collect all metrics and store them.
+    Main function: collect metrics and store them.
+
+    Args:
+        incremental: Only parse runs whose metadata.yaml is new or changed
+            since the last collection (False re-reads every run)
 
     Returns:
         Summary of collection results
     """
-    logger.info("Starting metrics collection...")
+    logger.info(f"Starting {'incremental' if incremental else 'full'} metrics collection...")
 
-    # Load existing metrics
-    existing_metrics = load_existing_metrics()
-    logger.info(f"Loaded {len(existing_metrics)} existing metrics")
+    try:
+        store = get_metrics_store(METRICS_DIR)
+        fingerprints = store.get_fingerprints() if incremental else {}
 
-    # Collect new metrics from runs
-    new_metrics = collect_all_metrics()
-    logger.info(f"Collected {len(new_metrics)} metrics from runs")
+        new_metrics, new_fingerprints, removed = collect_new_metrics(fingerprints)
+        logger.info(
+            f"Collected {len(new_metrics)} new or changed runs "
+            f"({len(fingerprints)} already ingested, {len(removed)} removed)"
+        )
 
-    # Merge: use new_metrics (fresh collection from all runs)
-    # In the future, we could do incremental updates, but for now re-collecting is safer
-    merged_metrics = new_metrics
+        store.ingest(new_metrics, new_fingerprints, removed, replace=not incremental)
 
-    # Save to storage
-    success = save_metrics(merged_metrics)
+        # Apply retention policy
+        pruned = store.prune_runs(MAX_RUNS_TO_STORE)
+        if pruned:
+            logger.info(f"Applied retention policy: keeping {MAX_RUNS_TO_STORE} most recent runs")
+        success = True
+    except Exception as e:
+        logger.error(f"Error storing metrics: {e}")
+        new_metrics, removed, success = [], [], False
+
+    stored = get_metrics_summary()
 
     # Build summary
     summary = {
         'success': success,
-        'total_metrics': len(merged_metrics),
-        'executor_runs': len([m for m in merged_metrics if m.get('agent_type') == 'executor']),
-        'planner_runs': len([m for m in merged_metrics if m.get('agent_type') == 'planner']),
+        'total_metrics': stored['total_runs'],
+        'executor_runs': stored['executor_runs'],
+        'planner_runs': stored['planner_runs'],
+        'ingested_runs': len(new_metrics),
+        'removed_runs': len(removed),
         'last_updated': datetime.now(timezone.utc).isoformat(),
     }
 
@@ -254,9 +338,9 @@ def get_metrics_summary() -> Dict[str, Any]:
     Returns:
         Summary statistics
     """
-    metrics = load_existing_metrics()
+    summary = get_metrics_store(METRICS_DIR).summary()
 
-    if not metrics:
+    if not summary['total_runs']:
         return {
             'total_runs': 0,
             'executor_runs': 0,
@@ -264,21 +348,14 @@ def get_metrics_summary() -> Dict[str, Any]:
             'date_range': None,
         }
 
-    executor_runs = [m for m in metrics if m.get('agent_type') == 'executor']
-    planner_runs = [m for m in metrics if m.get('agent_type') == 'planner']
-
-    # Calculate date range
-    timestamps = [m.get('timestamp') for m in metrics if m.get('timestamp')]
-    date_range = {
-        'earliest': min(timestamps) if timestamps else None,
-        'latest': max(timestamps) if timestamps else None,
-    }
-
     return {
-        'total_runs': len(metrics),
-        'executor_runs': len(executor_runs),
-        'planner_runs': len(planner_runs),
-        'date_range': date_range,
+        'total_runs': summary['total_runs'],
+        'executor_runs': summary['by_agent_type'].get('executor', 0),
+        'planner_runs': summary['by_agent_type'].get('planner', 0),
+        'date_range': {
+            'earliest': summary['earliest'],
+            'latest': summary['latest'],
+        },
     }
 
 
@@ -293,6 +370,7 @@ def main():
     parser = argparse.ArgumentParser(description='RALF Metrics Collector')
     parser.add_argument('--summary', action='store_true', help='Show metrics summary')
     parser.add_argument('--collect', action='store_true', help='Collect and store metrics')
+    parser.add_argument('--full', action='store_true', help='Re-read every run instead of only new or changed ones')
     parser.add_argument('--verbose', action='store_true', help='Enable verbose logging')
 
     args = parser.parse_args()
@@ -304,11 +382,11 @@ def main():
         summary = get_metrics_summary()
         print(json.dumps(summary, indent=2))
     elif args.collect:
-        result = collect_and_store_metrics()
+        result = collect_and_store_metrics(incremental=not args.full)
         print(json.dumps(result, indent=2))
     else:
         # Default: collect and store
-        result = collect_and_store_metrics()
+        result = collect_and_store_metrics(incremental=not args.full)
         print(json.dumps(result, indent=2))
 
 
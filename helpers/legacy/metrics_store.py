@@ -0,0 +1,495 @@
+#!/usr/bin/env python3
+"""
+Metrics Store for RALF Performance Monitoring
+Typed, indexed storage for run metrics and alert history
+
+Replaces the single metrics.yaml / alert_history.yaml files that every
+analyzer re-parsed in full. Runs live in a SQLite table with one typed
+column per metric, indexed by agent type and timestamp, so each tool
+reads only the rows (window, agent type, time range) and columns it needs.
+
+Version: 1.0.0
+Author: RALF System
+Created: 2026-02-01
+"""
+
+import json
+import logging
+import sqlite3
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+import yaml
+
+logger = logging.getLogger(__name__)
+
+# ============================================================================
+# Schema
+# ============================================================================
+
+# Run metric columns and their SQLite types (order matches collector records)
+RUN_COLUMNS = {
+    'timestamp': 'TEXT',
+    'run_number': 'INTEGER',
+    'run_directory': 'TEXT',
+    'agent_type': 'TEXT',
+    'agent': 'TEXT',
+    'duration_seconds': 'INTEGER',
+    'task_id': 'TEXT',
+    'task_status': 'TEXT',
+    'result': 'TEXT',
+    'files_modified': 'INTEGER',
+    'commit_hash': 'TEXT',
+    'actions_taken': 'INTEGER',
+    'blockers': 'INTEGER',
+    'discoveries': 'INTEGER',
+    'questions_asked': 'INTEGER',
+}
+
+# Alert history columns; anything else is kept in the JSON 'data' column
+ALERT_COLUMNS = ('timestamp', 'type', 'severity', 'message')
+
+MAX_ALERTS_TO_STORE = 1000
+
+_RUN_FIELDS = ['run_directory', 'ts'] + [n for n in RUN_COLUMNS if n != 'run_directory'] + ['extra']
+_RUN_INSERT = (
+    f"INSERT OR REPLACE INTO runs ({', '.join(_RUN_FIELDS)}) "
+    f"VALUES ({', '.join('?' for _ in _RUN_FIELDS)})"
+)
+
+
+def parse_timestamp(value: Optional[str]) -> Optional[float]:
+    """Convert an ISO timestamp (with 'Z' or offset) to epoch seconds."""
+    if not value:
+        return None
+    try:
+        return datetime.fromisoformat(str(value).replace('Z', '+00:00')).timestamp()
+    except ValueError:
+        return None
+
+
+def _epoch(value: Any) -> Optional[float]:
+    if value is None:
+        return None
+    if isinstance(value, datetime):
+        return value.timestamp()
+    if isinstance(value, (int, float)):
+        return float(value)
+    return parse_timestamp(value)
+
+
+# ============================================================================
+# Store
+# ============================================================================
+
+class MetricsStore:
+    """
+    SQLite-backed store for run metrics and alerts.
+
+    Example:
+        store = MetricsStore(metrics_dir / "metrics.db")
+        store.replace_runs(records)
+        recent = store.query_runs(agent_type='executor', window=100,
+                                  columns=('timestamp', 'duration_seconds'))
+    """
+
+    def __init__(self, db_path: Path, legacy_yaml: Optional[Path] = None):
+        """
+        Open (and create) the store.
+
+        Args:
+            db_path: SQLite database file
+            legacy_yaml: metrics.yaml to import once if the store is empty
+        """
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.db_path), check_same_thread=False, timeout=30)
+        self._conn.row_factory = sqlite3.Row
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._init_schema()
+
+        if legacy_yaml is not None and self.count_runs() == 0:
+            self.import_yaml(legacy_yaml)
+
+    def _init_schema(self):
+        columns = ", ".join(f"{name} {kind}" for name, kind in RUN_COLUMNS.items()
+                            if name != 'run_directory')
+        with self._lock, self._conn:
+            self._conn.execute(f"""
+                CREATE TABLE IF NOT EXISTS runs (
+                    run_directory TEXT PRIMARY KEY,
+                    ts REAL,
+                    {columns},
+                    extra TEXT
+                )
+            """)
+            self._conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_runs_agent_ts ON runs (agent_type, ts DESC)"
+            )
+            self._conn.execute("CREATE INDEX IF NOT EXISTS idx_runs_ts ON runs (ts DESC)")
+            self._conn.execute("""
+                CREATE TABLE IF NOT EXISTS alerts (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    ts REAL,
+                    timestamp TEXT,
+                    type TEXT,
+                    severity TEXT,
+                    message TEXT,
+                    data TEXT
+                )
+            """)
+            self._conn.execute("CREATE INDEX IF NOT EXISTS idx_alerts_ts ON alerts (ts DESC)")
+            # Fingerprint (metadata.yaml mtime and size) of every ingested run
+            # directory, including runs since pruned by retention
+            self._conn.execute("""
+                CREATE TABLE IF NOT EXISTS sources (
+                    run_directory TEXT PRIMARY KEY,
+                    mtime_ns INTEGER,
+                    size INTEGER
+                )
+            """)
+
+    # ------------------------------------------------------------------
+    # Runs: writes
+    # ------------------------------------------------------------------
+
+    def _run_row(self, record: Dict[str, Any]) -> tuple:
+        extra = {k: v for k, v in record.items() if k not in RUN_COLUMNS}
+        key = record.get('run_directory') or f"{record.get('agent_type')}:{record.get('run_number')}"
+        return (
+            key,
+            parse_timestamp(record.get('timestamp')),
+            *(record.get(name) for name in RUN_COLUMNS if name != 'run_directory'),
+            json.dumps(extra, default=str) if extra else None,
+        )
+
+    def upsert_runs(self, records: Iterable[Dict[str, Any]]) -> int:
+        """
+        Insert or replace run records (keyed by run_directory).
+
+        Returns:
+            Number of records written
+        """
+        rows = [self._run_row(r) for r in records]
+        if not rows:
+            return 0
+        with self._lock, self._conn:
+            self._conn.executemany(
+                _RUN_INSERT,
+                rows
+            )
+        return len(rows)
+
+    def replace_runs(self, records: Iterable[Dict[str, Any]]) -> int:
+        """Replace all stored runs with records."""
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM runs")
+        return self.upsert_runs(records)
+
+    def delete_runs(self, run_directories: Iterable[str]) -> int:
+        """Delete runs by directory."""
+        keys = [(str(d),) for d in run_directories]
+        with self._lock, self._conn:
+            self._conn.executemany("DELETE FROM runs WHERE run_directory = ?", keys)
+        return len(keys)
+
+    def prune_runs(self, keep: int) -> int:
+        """
+        Keep only the newest runs.
+
+        Returns:
+            Number of runs deleted
+        """
+        with self._lock, self._conn:
+            cursor = self._conn.execute("""
+                DELETE FROM runs WHERE run_directory NOT IN (
+                    SELECT run_directory FROM runs ORDER BY ts DESC LIMIT ?
+                )
+            """, (keep,))
+            return cursor.rowcount
+
+    # ------------------------------------------------------------------
+    # Runs: incremental ingestion
+    # ------------------------------------------------------------------
+
+    def get_fingerprints(self) -> Dict[str, Tuple[int, int]]:
+        """Get {run_directory: (mtime_ns, size)} for every ingested run."""
+        with self._lock:
+            rows = self._conn.execute("SELECT run_directory, mtime_ns, size FROM sources").fetchall()
+        return {row[0]: (row[1], row[2]) for row in rows}
+
+    def ingest(
+        self,
+        records: Sequence[Dict[str, Any]],
+        fingerprints: Dict[str, Tuple[int, int]],
+        removed: Iterable[str] = (),
+        replace: bool = False
+    ) -> int:
+        """
+        Apply one incremental collection in a single transaction.
+
+        Args:
+            records: New or changed run records
+            fingerprints: {run_directory: (mtime_ns, size)} of the sources read
+            removed: Run directories that no longer exist
+            replace: Drop all stored runs and fingerprints first (full rebuild)
+
+        Returns:
+            Number of records written
+        """
+        removed = [(str(d),) for d in removed]
+        with self._lock, self._conn:
+            if replace:
+                self._conn.execute("DELETE FROM runs")
+                self._conn.execute("DELETE FROM sources")
+            self._conn.executemany(
+                _RUN_INSERT,
+                [self._run_row(r) for r in records]
+            )
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO sources (run_directory, mtime_ns, size) VALUES (?, ?, ?)",
+                [(key, mtime, size) for key, (mtime, size) in fingerprints.items()]
+            )
+            self._conn.executemany("DELETE FROM runs WHERE run_directory = ?", removed)
+            self._conn.executemany("DELETE FROM sources WHERE run_directory = ?", removed)
+        return len(records)
+
+    def clear_fingerprints(self):
+        """Forget all fingerprints so the next ingestion re-reads every run."""
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM sources")
+
+    def import_yaml(self, yaml_file: Path) -> int:
+        """
+        Import runs from a legacy metrics.yaml file.
+
+        Returns:
+            Number of runs imported
+        """
+        try:
+            if not Path(yaml_file).exists():
+                return 0
+            loader = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+            with open(yaml_file, 'r') as f:
+                data = yaml.load(f, Loader=loader)
+            imported = self.upsert_runs((data or {}).get('metrics', []) or [])
+            if imported:
+                logger.info(f"Imported {imported} runs from {yaml_file}")
+            return imported
+        except Exception as e:
+            logger.error(f"Error importing metrics from {yaml_file}: {e}")
+            return 0
+
+    # ------------------------------------------------------------------
+    # Runs: queries
+    # ------------------------------------------------------------------
+
+    def _where(
+        self,
+        agent_type: Optional[str],
+        since: Any,
+        until: Any,
+        result: Optional[str]
+    ) -> Tuple[str, list]:
+        clauses, params = [], []
+        if agent_type:
+            clauses.append("agent_type = ?")
+            params.append(agent_type)
+        if since is not None:
+            clauses.append("ts >= ?")
+            params.append(_epoch(since))
+        if until is not None:
+            clauses.append("ts <= ?")
+            params.append(_epoch(until))
+        if result:
+            clauses.append("result = ?")
+            params.append(result)
+        return (" WHERE " + " AND ".join(clauses)) if clauses else "", params
+
+    def query_runs(
+        self,
+        agent_type: Optional[str] = None,
+        window: Optional[int] = None,
+        since: Any = None,
+        until: Any = None,
+        result: Optional[str] = None,
+        columns: Optional[Sequence[str]] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Get run records, newest first.
+
+        Args:
+            agent_type: Only this agent type ('executor', 'planner')
+            window: Only the N most recent matching runs
+            since: Earliest timestamp (ISO string, datetime or epoch), inclusive
+            until: Latest timestamp, inclusive
+            result: Only runs with this result
+            columns: Metric columns to read (all, plus extras, if None)
+
+        Returns:
+            List of metric dicts
+        """
+        if columns is None:
+            selected = list(RUN_COLUMNS) + ['extra']
+        else:
+            unknown = [c for c in columns if c not in RUN_COLUMNS]
+            if unknown:
+                raise ValueError(f"Unknown metric columns: {unknown}")
+            selected = list(columns)
+
+        where, params = self._where(agent_type, since, until, result)
+        sql = f"SELECT {', '.join(selected)} FROM runs{where} ORDER BY ts DESC"
+        if window is not None:
+            sql += " LIMIT ?"
+            params.append(window)
+
+        with self._lock:
+            rows = self._conn.execute(sql, params).fetchall()
+
+        records = []
+        for row in rows:
+            record = dict(row)
+            extra = record.pop('extra', None)
+            if extra:
+                record.update(json.loads(extra))
+            records.append(record)
+        return records
+
+    def column(
+        self,
+        name: str,
+        agent_type: Optional[str] = None,
+        window: Optional[int] = None,
+        since: Any = None,
+        until: Any = None
+    ) -> List[Any]:
+        """Get one metric column as a list, newest first."""
+        return [r[name] for r in self.query_runs(
+            agent_type=agent_type, window=window, since=since, until=until, columns=(name,)
+        )]
+
+    def count_runs(self, agent_type: Optional[str] = None) -> int:
+        """Count stored runs."""
+        where, params = self._where(agent_type, None, None, None)
+        with self._lock:
+            return self._conn.execute(f"SELECT COUNT(*) FROM runs{where}", params).fetchone()[0]
+
+    def summary(self) -> Dict[str, Any]:
+        """Get run counts per agent type and the stored date range."""
+        with self._lock:
+            by_type = dict(self._conn.execute(
+                "SELECT agent_type, COUNT(*) FROM runs GROUP BY agent_type"
+            ).fetchall())
+            row = self._conn.execute(
+                "SELECT COUNT(*), MIN(timestamp), MAX(timestamp) FROM runs"
+            ).fetchone()
+        return {
+            'total_runs': row[0],
+            'by_agent_type': by_type,
+            'earliest': row[1],
+            'latest': row[2],
+        }
+
+    # ------------------------------------------------------------------
+    # Alerts
+    # ------------------------------------------------------------------
+
+    def append_alert(self, alert: Dict[str, Any], keep: int = MAX_ALERTS_TO_STORE):
+        """Append an alert and trim history to the newest `keep` alerts."""
+        data = {k: v for k, v in alert.items() if k not in ALERT_COLUMNS}
+        with self._lock, self._conn:
+            cursor = self._conn.execute(
+                "INSERT INTO alerts (ts, timestamp, type, severity, message, data) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (
+                    parse_timestamp(alert.get('timestamp')),
+                    alert.get('timestamp'), alert.get('type'),
+                    alert.get('severity'), alert.get('message'),
+                    json.dumps(data, default=str) if data else None,
+                )
+            )
+            # Amortized trim: only when the table is 10% over the cap
+            if keep and cursor.lastrowid % max(1, keep // 10) == 0:
+                self._conn.execute(
+                    "DELETE FROM alerts WHERE id <= ?",
+                    (cursor.lastrowid - keep,)
+                )
+
+    def query_alerts(
+        self,
+        since: Any = None,
+        limit: Optional[int] = MAX_ALERTS_TO_STORE
+    ) -> List[Dict[str, Any]]:
+        """Get alerts, newest first."""
+        sql = "SELECT timestamp, type, severity, message, data FROM alerts"
+        params: list = []
+        if since is not None:
+            sql += " WHERE ts > ?"
+            params.append(_epoch(since))
+        sql += " ORDER BY id DESC"
+        if limit is not None:
+            sql += " LIMIT ?"
+            params.append(limit)
+        with self._lock:
+            rows = self._conn.execute(sql, params).fetchall()
+
+        alerts = []
+        for row in rows:
+            alert = {k: row[k] for k in ALERT_COLUMNS if row[k] is not None}
+            if row['data']:
+                alert.update(json.loads(row['data']))
+            alerts.append(alert)
+        return alerts
+
+    def import_alert_yaml(self, yaml_file: Path) -> int:
+        """Import alerts from a legacy alert_history.yaml (newest first)."""
+        try:
+            if not Path(yaml_file).exists():
+                return 0
+            with open(yaml_file, 'r') as f:
+                data = yaml.safe_load(f)
+            alerts = (data or {}).get('alerts', []) or []
+            for alert in reversed(alerts):
+                self.append_alert(alert, keep=0)
+            return len(alerts)
+        except Exception as e:
+            logger.error(f"Error importing alerts from {yaml_file}: {e}")
+            return 0
+
+    def count_alerts(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM alerts").fetchone()[0]
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+
+# ============================================================================
+# Shared instance
+# ============================================================================
+
+_stores: Dict[str, MetricsStore] = {}
+_stores_lock = threading.Lock()
+
+
+def get_metrics_store(metrics_dir: Path) -> MetricsStore:
+    """
+    Get the store for a metrics directory (one instance per process).
+
+    The first open imports an existing metrics.yaml in that directory.
+    """
+    metrics_dir = Path(metrics_dir)
+    key = str(metrics_dir.resolve())
+    with _stores_lock:
+        store = _stores.get(key)
+        if store is None:
+            store = _stores[key] = MetricsStore(
+                metrics_dir / "metrics.db",
+                legacy_yaml=metrics_dir / "metrics.yaml"
+            )
+        return store
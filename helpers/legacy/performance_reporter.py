@@ -13,11 +13,11 @@ from pathlib import Path
 script_dir = Path(__file__).parent
 sys.path.insert(0, str(script_dir))
 from paths import PathResolver, get_path_resolver
+from metrics_store import get_metrics_store
 
 resolver = get_path_resolver()
 PROJECT_DIR = resolver.get_project_path()
 
-import yaml
 from datetime import datetime, timezone, timedelta
 from typing import Dict, List, Any, Optional
 import logging
@@ -33,7 +33,8 @@ logger = logging.getLogger(__name__)
 # ============================================================================
 # Configuration
 # ============================================================================
-METRICS_FILE = PROJECT_DIR / ".autonomous" / "data" / "metrics" / "metrics.yaml"
+METRICS_DIR = PROJECT_DIR / ".autonomous" / "data" / "metrics"
+METRICS_FILE = METRICS_DIR / "metrics.yaml"   # legacy; imported into the store once
 REPORTS_DIR = PROJECT_DIR / ".autonomous" / "data" / "reports"
 
 # Ensure reports directory exists
@@ -43,13 +44,22 @@ REPORTS_DIR.mkdir(parents=True, exist_ok=True)
 # Data Loading
 # ============================================================================
 
-def load_metrics() -> List[Dict[str, Any]]:
-    """Load metrics from storage."""
+def load_metrics(
+    start_date: Optional[datetime] = None,
+    end_date: Optional[datetime] = None
+) -> List[Dict[str, Any]]:
+    """
+    Load metrics from storage.
+
+    Args:
+        start_date: Start of date range (inclusive)
+        end_date: End of date range (inclusive)
+
+    Returns:
+        List of metric records (newest first)
+    """
     try:
-        if METRICS_FILE.exists():
-            with open(METRICS_FILE, 'r') as f:
-                data = yaml.safe_load(f)
-                return data.get('metrics', []) if data else []
+        return get_metrics_store(METRICS_DIR).query_runs(since=start_date, until=end_date)
     except Exception as e:
         logger.error(f"Error loading metrics: {e}")
 
@@ -299,8 +309,7 @@ def generate_daily_report() -> Dict[str, str]:
     now = datetime.now(timezone.utc)
     start_date = now - timedelta(hours=24)
 
-    metrics = load_metrics()
-    filtered = filter_metrics_by_date_range(metrics, start_date, now)
+    filtered = load_metrics(start_date, now)
     stats = calculate_report_statistics(filtered)
 
     # Generate reports
@@ -339,8 +348,7 @@ def generate_weekly_report() -> Dict[str, str]:
     now = datetime.now(timezone.utc)
     start_date = now - timedelta(days=7)
 
-    metrics = load_metrics()
-    filtered = filter_metrics_by_date_range(metrics, start_date, now)
+    filtered = load_metrics(start_date, now)
     stats = calculate_report_statistics(filtered)
 
     # Generate reports
@@ -386,8 +394,7 @@ def generate_custom_report(
     now = datetime.now(timezone.utc)
     start_date = now - timedelta(hours=hours_back)
 
-    metrics = load_metrics()
-    filtered = filter_metrics_by_date_range(metrics, start_date, now)
+    filtered = load_metrics(start_date, now)
     stats = calculate_report_statistics(filtered)
 
     # Generate report
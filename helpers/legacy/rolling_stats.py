@@ -0,0 +1,354 @@
+#!/usr/bin/env python3
+"""
+Rolling Statistics for RALF Performance Monitoring
+Shared batch and online statistics for the anomaly and trend analyzers
+
+Batch helpers (summarize, z_scores, window_rates) are vectorized with
+NumPy when it is installed and fall back to single-pass Python otherwise.
+Online updaters keep O(1) state per observation so a new run can be scored
+without reloading history:
+
+- RunningStats: Welford mean/variance (plus min/max), mergeable
+- EWMA: exponentially weighted mean and variance
+- RollingQuantile: quantiles over the last N observations
+
+Version: 1.0.0
+Author: RALF System
+Created: 2026-02-01
+"""
+
+import bisect
+import math
+from collections import deque
+from typing import Any, Dict, Iterable, List, Optional, Sequence
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    np = None
+    NUMPY_AVAILABLE = False
+
+
+# ============================================================================
+# Batch Statistics
+# ============================================================================
+
+def summarize(values: Sequence[float]) -> Dict[str, float]:
+    """
+    Summarize a batch of values.
+
+    Args:
+        values: Observations
+
+    Returns:
+        count, mean, stdev (sample), min, max and median (zeros if empty)
+    """
+    count = len(values)
+    if count == 0:
+        return {'count': 0, 'mean': 0.0, 'stdev': 0.0, 'min': 0.0, 'max': 0.0, 'median': 0.0}
+
+    if NUMPY_AVAILABLE:
+        array = np.asarray(values, dtype=float)
+        return {
+            'count': count,
+            'mean': float(array.mean()),
+            'stdev': float(array.std(ddof=1)) if count > 1 else 0.0,
+            'min': float(array.min()),
+            'max': float(array.max()),
+            'median': float(np.median(array)),
+        }
+
+    stats = RunningStats()
+    stats.extend(values)
+    ordered = sorted(values)
+    middle = count // 2
+    median = ordered[middle] if count % 2 else (ordered[middle - 1] + ordered[middle]) / 2
+    return {
+        'count': count,
+        'mean': stats.mean,
+        'stdev': stats.stdev,
+        'min': stats.min,
+        'max': stats.max,
+        'median': float(median),
+    }
+
+
+def z_scores(values: Sequence[float], mean: float, stdev: float) -> List[float]:
+    """
+    Absolute z-scores of values against a baseline.
+
+    Returns:
+        One score per value (all zeros if stdev is 0)
+    """
+    if stdev == 0:
+        return [0.0] * len(values)
+    if NUMPY_AVAILABLE:
+        return np.abs((np.asarray(values, dtype=float) - mean) / stdev).tolist()
+    return [abs((value - mean) / stdev) for value in values]
+
+
+def window_rates(flags: Sequence[bool], window: int) -> List[float]:
+    """
+    Fraction of true flags in consecutive, non-overlapping windows.
+
+    Only full windows that leave at least one observation after them are
+    included, matching the original per-window loop.
+
+    Args:
+        flags: One boolean per observation (newest first)
+        window: Window size
+
+    Returns:
+        Rate per window, in order
+    """
+    starts = range(0, len(flags) - window, window)
+    if NUMPY_AVAILABLE:
+        cumulative = np.concatenate(([0], np.cumsum(np.asarray(flags, dtype=int))))
+        begin = np.asarray(starts, dtype=int)
+        return ((cumulative[begin + window] - cumulative[begin]) / window).tolist()
+
+    cumulative = [0]
+    for flag in flags:
+        cumulative.append(cumulative[-1] + (1 if flag else 0))
+    return [(cumulative[i + window] - cumulative[i]) / window for i in starts]
+
+
+# ============================================================================
+# Online Statistics
+# ============================================================================
+
+class RunningStats:
+    """
+    Welford's online mean and variance.
+
+    Example:
+        stats = RunningStats()
+        stats.extend([120, 95, 140])
+        stats.push(300)
+        stats.z_score(300)
+    """
+
+    __slots__ = ('count', 'mean', '_m2', 'min', 'max')
+
+    def __init__(self):
+        self.count = 0
+        self.mean = 0.0
+        self._m2 = 0.0
+        self.min = math.inf
+        self.max = -math.inf
+
+    def push(self, value: float):
+        """Add one observation; O(1)."""
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self._m2 += delta * (value - self.mean)
+        if value < self.min:
+            self.min = value
+        if value > self.max:
+            self.max = value
+
+    def extend(self, values: Iterable[float]):
+        """Add many observations (vectorized when NumPy is available)."""
+        if NUMPY_AVAILABLE:
+            array = np.asarray(list(values), dtype=float)
+            if array.size:
+                batch = RunningStats()
+                batch.count = int(array.size)
+                batch.mean = float(array.mean())
+                batch._m2 = float(((array - batch.mean) ** 2).sum())
+                batch.min = float(array.min())
+                batch.max = float(array.max())
+                self.merge(batch)
+            return
+        for value in values:
+            self.push(value)
+
+    def merge(self, other: 'RunningStats'):
+        """Combine another accumulator into this one (Chan et al.)."""
+        if other.count == 0:
+            return
+        if self.count == 0:
+            self.count, self.mean, self._m2 = other.count, other.mean, other._m2
+            self.min, self.max = other.min, other.max
+            return
+        total = self.count + other.count
+        delta = other.mean - self.mean
+        self._m2 += other._m2 + delta * delta * self.count * other.count / total
+        self.mean += delta * other.count / total
+        self.count = total
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+
+    @property
+    def variance(self) -> float:
+        """Sample variance (0 with fewer than two observations)."""
+        return self._m2 / (self.count - 1) if self.count > 1 else 0.0
+
+    @property
+    def stdev(self) -> float:
+        """Sample standard deviation."""
+        return math.sqrt(self.variance)
+
+    def z_score(self, value: float) -> float:
+        """Absolute z-score of value against the observations so far."""
+        stdev = self.stdev
+        return abs((value - self.mean) / stdev) if stdev else 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'count': self.count,
+            'mean': self.mean,
+            'm2': self._m2,
+            'min': self.min if self.count else None,
+            'max': self.max if self.count else None,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'RunningStats':
+        stats = cls()
+        stats.count = data.get('count', 0)
+        stats.mean = data.get('mean', 0.0)
+        stats._m2 = data.get('m2', 0.0)
+        if stats.count:
+            stats.min = data.get('min', math.inf)
+            stats.max = data.get('max', -math.inf)
+        return stats
+
+
+class EWMA:
+    """
+    Exponentially weighted moving mean and variance.
+
+    Recent observations weigh more, so the baseline follows gradual drift
+    while still flagging sudden jumps.
+    """
+
+    __slots__ = ('alpha', 'count', 'mean', 'variance')
+
+    def __init__(self, alpha: float = 0.1):
+        if not 0 < alpha <= 1:
+            raise ValueError(f"alpha must be in (0, 1], got {alpha}")
+        self.alpha = alpha
+        self.count = 0
+        self.mean = 0.0
+        self.variance = 0.0
+
+    def push(self, value: float):
+        """Add one observation; O(1)."""
+        self.count += 1
+        if self.count == 1:
+            self.mean = float(value)
+            return
+        delta = value - self.mean
+        increment = self.alpha * delta
+        self.mean += increment
+        self.variance = (1 - self.alpha) * (self.variance + delta * increment)
+
+    def extend(self, values: Iterable[float]):
+        for value in values:
+            self.push(value)
+
+    @property
+    def stdev(self) -> float:
+        return math.sqrt(self.variance)
+
+    def z_score(self, value: float) -> float:
+        """Absolute z-score of value against the weighted baseline."""
+        stdev = self.stdev
+        return abs((value - self.mean) / stdev) if stdev else 0.0
+
+
+class RollingQuantile:
+    """
+    Quantiles over the last `window` observations.
+
+    Keeps the window in arrival order and in sorted order; each push is a
+    binary search plus one insertion and one removal.
+    """
+
+    def __init__(self, window: int = 100):
+        if window < 1:
+            raise ValueError(f"window must be positive, got {window}")
+        self.window = window
+        self._values: deque = deque()
+        self._sorted: List[float] = []
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    def push(self, value: float):
+        """Add one observation, evicting the oldest when the window is full."""
+        if len(self._values) == self.window:
+            oldest = self._values.popleft()
+            del self._sorted[bisect.bisect_left(self._sorted, oldest)]
+        self._values.append(value)
+        bisect.insort(self._sorted, value)
+
+    def extend(self, values: Iterable[float]):
+        for value in values:
+            self.push(value)
+
+    def quantile(self, q: float) -> Optional[float]:
+        """
+        Get the q-th quantile (0-1) by linear interpolation.
+
+        Returns:
+            Quantile, or None if no observations
+        """
+        if not self._sorted:
+            return None
+        position = q * (len(self._sorted) - 1)
+        lower = int(math.floor(position))
+        upper = min(lower + 1, len(self._sorted) - 1)
+        fraction = position - lower
+        return self._sorted[lower] + (self._sorted[upper] - self._sorted[lower]) * fraction
+
+    @property
+    def median(self) -> Optional[float]:
+        return self.quantile(0.5)
+
+
+class MetricBaseline:
+    """
+    Maintained baseline for one metric: full-history Welford stats, an
+    EWMA and rolling quantiles, all updated in O(1) per run.
+
+    Example:
+        baseline = MetricBaseline()
+        baseline.extend(historical_durations)
+        score = baseline.score(new_duration)
+        baseline.push(new_duration)
+    """
+
+    def __init__(self, alpha: float = 0.1, quantile_window: int = 100):
+        self.stats = RunningStats()
+        self.ewma = EWMA(alpha)
+        self.quantiles = RollingQuantile(quantile_window)
+
+    @property
+    def count(self) -> int:
+        return self.stats.count
+
+    def push(self, value: float):
+        self.stats.push(value)
+        self.ewma.push(value)
+        self.quantiles.push(value)
+
+    def extend(self, values: Sequence[float]):
+        """Fold in historical values, oldest first."""
+        self.stats.extend(values)
+        self.ewma.extend(values)
+        self.quantiles.extend(values[-self.quantiles.window:])
+
+    def score(self, value: float) -> Dict[str, Any]:
+        """Score a value against the baseline without adding it."""
+        return {
+            'mean': self.stats.mean,
+            'stdev': self.stats.stdev,
+            'z_score': self.stats.z_score(value),
+            'ewma': self.ewma.mean,
+            'ewma_z_score': self.ewma.z_score(value),
+            'p95': self.quantiles.quantile(0.95),
+        }
@@ -7,6 +7,7 @@ Part of Agent-2.3 automatic skill routing feature.
 Updated for folder-based skill structure (Anthropic Standard).
 """
 
+import os
 import re
 import yaml
 from pathlib import Path
@@ -77,6 +78,16 @@ class SkillMetadata:
             self.commands = []
 
 
+@dataclass
+class _SkillFile:
+    """A SKILL.md read from disk, valid while its (mtime_ns, size) is unchanged."""
+    path: Path
+    stamp: Tuple[int, int]
+    content: str
+    metadata: Optional[SkillMetadata] = None
+    parsed: bool = False
+
+
 # Skill routing configuration - maps roles to skill folders
 # Keywords are used for matching; skills are loaded from SKILL.md files
 SKILL_MAP: Dict[SkillRole, Dict] = {
@@ -336,6 +347,144 @@ SKILL_MAP: Dict[SkillRole, Dict] = {
 }
 
 
+def _is_word_char(char: str) -> bool:
+    """Same character class as the regex \\w."""
+    return char.isalnum() or char == "_"
+
+
+def _is_word_boundary(text: str, pos: int) -> bool:
+    """Same test as the regex \\b at text[pos]."""
+    before = pos > 0 and _is_word_char(text[pos - 1])
+    after = pos < len(text) and _is_word_char(text[pos])
+    return before != after
+
+
+class KeywordMatcher:
+    """
+    Aho-Corasick automaton over the keywords of every role in a skill map.
+
+    A single pass over the task text finds every keyword occurrence, so
+    scoring all roles costs O(len(text) + matches) instead of one regex
+    search per keyword. Scores are identical to SkillRouter._calculate_score:
+    2 x weight for a whole-word match, 1 x weight for a substring-only match.
+    """
+
+    def __init__(self, skill_map: Dict[SkillRole, Dict]):
+        """
+        Compile the keywords of a skill map.
+
+        Args:
+            skill_map: Role -> config with "keywords" and optional "weight"
+        """
+        self.skill_map = skill_map
+        self.roles = list(skill_map)
+        self._keywords = [skill_map[role]["keywords"] for role in self.roles]
+        self._weights = [skill_map[role].get("weight", 1.0) for role in self.roles]
+
+        # Trie: goto[state] = {char: state}; out[state] = pattern ids ending here
+        self._goto: List[Dict[str, int]] = [{}]
+        self._out: List[List[int]] = [[]]
+        self._fail: List[int] = [0]
+        self._lengths: List[int] = []
+        self._owners: List[List[Tuple[int, int]]] = []  # pattern id -> [(role index, keyword index)]
+
+        pattern_ids: Dict[str, int] = {}
+        for role_index, keywords in enumerate(self._keywords):
+            for keyword_index, keyword in enumerate(keywords):
+                text = keyword.lower()
+                if not text:
+                    continue
+                pattern_id = pattern_ids.get(text)
+                if pattern_id is None:
+                    pattern_id = pattern_ids[text] = len(self._lengths)
+                    self._lengths.append(len(text))
+                    self._owners.append([])
+                    self._insert(text, pattern_id)
+                self._owners[pattern_id].append((role_index, keyword_index))
+
+        self._build_failure_links()
+
+    def _insert(self, text: str, pattern_id: int):
+        state = 0
+        for char in text:
+            next_state = self._goto[state].get(char)
+            if next_state is None:
+                next_state = len(self._goto)
+                self._goto[state][char] = next_state
+                self._goto.append({})
+                self._out.append([])
+                self._fail.append(0)
+            state = next_state
+        self._out[state].append(pattern_id)
+
+    def _build_failure_links(self):
+        queue = list(self._goto[0].values())
+        for state in queue:
+            for char, next_state in self._goto[state].items():
+                queue.append(next_state)
+                fallback = self._fail[state]
+                while fallback and char not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                target = self._goto[fallback].get(char, 0)
+                self._fail[next_state] = target if target != next_state else 0
+                self._out[next_state] = self._out[next_state] + self._out[self._fail[next_state]]
+
+    def find(self, text: str) -> Dict[int, bool]:
+        """
+        Find which keywords occur in text.
+
+        Args:
+            text: Lowercase text to scan
+
+        Returns:
+            Dict of pattern id -> whether any occurrence is a whole word
+        """
+        goto, fail, out, lengths = self._goto, self._fail, self._out, self._lengths
+        found: Dict[int, bool] = {}
+        state = 0
+
+        for end, char in enumerate(text, 1):
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            for pattern_id in out[state]:
+                if found.get(pattern_id):
+                    continue
+                start = end - lengths[pattern_id]
+                found[pattern_id] = _is_word_boundary(text, start) and _is_word_boundary(text, end)
+
+        return found
+
+    def score(self, text: str) -> Dict[SkillRole, Tuple[float, List[str]]]:
+        """
+        Score every role against text in one pass.
+
+        Args:
+            text: Lowercase task description
+
+        Returns:
+            Role -> (score, matched_keywords) for roles with a match, in
+            skill map order, keywords in config order
+        """
+        hits: Dict[int, List[Tuple[int, bool]]] = {}
+        for pattern_id, whole_word in self.find(text).items():
+            for role_index, keyword_index in self._owners[pattern_id]:
+                hits.setdefault(role_index, []).append((keyword_index, whole_word))
+
+        scores: Dict[SkillRole, Tuple[float, List[str]]] = {}
+        for role_index in sorted(hits):
+            keywords = self._keywords[role_index]
+            weight = self._weights[role_index]
+            score = 0.0
+            matches = []
+            for keyword_index, whole_word in sorted(hits[role_index]):
+                score += (2.0 if whole_word else 1.0) * weight
+                matches.append(keywords[keyword_index])
+            scores[self.roles[role_index]] = (score, matches)
+
+        return scores
+
+
 class SkillRouter:
     """
     Routes tasks to appropriate BMAD skills based on content analysis.
@@ -351,7 +500,58 @@ class SkillRouter:
         """
         self.skills_path = skills_path or Path(__file__).parent.parent / "skills"
         self.skill_map = SKILL_MAP
-        self._skill_metadata_cache: Dict[str, SkillMetadata] = {}
+        self._matcher: Optional[KeywordMatcher] = None
+        self._skill_file_cache: Dict[str, _SkillFile] = {}
+
+    def _get_matcher(self) -> KeywordMatcher:
+        """Compiled keyword matcher, rebuilt if skill_map was replaced."""
+        if self._matcher is None or self._matcher.skill_map is not self.skill_map:
+            self._matcher = KeywordMatcher(self.skill_map)
+        return self._matcher
+
+    def _load_skill_file(self, skill_file: Path) -> Optional[_SkillFile]:
+        """
+        Return a SKILL.md, re-reading it only when its mtime or size changed.
+
+        Args:
+            skill_file: Path to SKILL.md
+
+        Returns:
+            Cached file or None if it does not exist
+        """
+        key = str(skill_file)
+        try:
+            stat = os.stat(key)
+        except OSError:
+            self._skill_file_cache.pop(key, None)
+            return None
+
+        stamp = (stat.st_mtime_ns, stat.st_size)
+        cached = self._skill_file_cache.get(key)
+        if cached is None or cached.stamp != stamp:
+            cached = _SkillFile(path=Path(skill_file), stamp=stamp, content=Path(skill_file).read_text())
+            self._skill_file_cache[key] = cached
+        return cached
+
+    @staticmethod
+    def _parse_frontmatter(skill_folder: str, content: str) -> Optional[SkillMetadata]:
+        """Build SkillMetadata from SKILL.md YAML frontmatter."""
+        if content.startswith('---'):
+            parts = content.split('---', 2)
+            if len(parts) >= 3:
+                frontmatter = yaml.safe_load(parts[1])
+                return SkillMetadata(
+                    name=frontmatter.get('name', skill_folder),
+                    description=frontmatter.get('description', ''),
+                    category=frontmatter.get('category', 'unknown'),
+                    agent=frontmatter.get('agent'),
+                    role=frontmatter.get('role'),
+                    trigger=frontmatter.get('trigger'),
+                    keywords=frontmatter.get('keywords', []),
+                    commands=frontmatter.get('commands', []),
+                    weight=frontmatter.get('weight', 1.0)
+                )
+        return None
 
     def _parse_skill_md(self, skill_folder: str) -> Optional[SkillMetadata]:
         """
@@ -363,35 +563,18 @@ class SkillRouter:
         Returns:
             SkillMetadata or None if parsing fails
         """
-        if skill_folder in self._skill_metadata_cache:
-            return self._skill_metadata_cache[skill_folder]
-
         skill_file = self.skills_path / skill_folder / "SKILL.md"
-        if not skill_file.exists():
-            logger.warning(f"SKILL.md not found: {skill_file}")
-            return None
 
         try:
-            content = skill_file.read_text()
-
-            # Parse YAML frontmatter
-            if content.startswith('---'):
-                parts = content.split('---', 2)
-                if len(parts) >= 3:
-                    frontmatter = yaml.safe_load(parts[1])
-                    metadata = SkillMetadata(
-                        name=frontmatter.get('name', skill_folder),
-                        description=frontmatter.get('description', ''),
-                        category=frontmatter.get('category', 'unknown'),
-                        agent=frontmatter.get('agent'),
-                        role=frontmatter.get('role'),
-                        trigger=frontmatter.get('trigger'),
-                        keywords=frontmatter.get('keywords', []),
-                        commands=frontmatter.get('commands', []),
-                        weight=frontmatter.get('weight', 1.0)
-                    )
-                    self._skill_metadata_cache[skill_folder] = metadata
-                    return metadata
+            skill = self._load_skill_file(skill_file)
+            if skill is None:
+                logger.warning(f"SKILL.md not found: {skill_file}")
+                return None
+
+            if not skill.parsed:
+                skill.metadata = self._parse_frontmatter(skill_folder, skill.content)
+                skill.parsed = True
+            return skill.metadata
 
         except Exception as e:
             logger.error(f"Failed to parse SKILL.md for {skill_folder}: {e}")
@@ -417,8 +600,11 @@ class SkillRouter:
             return None
 
         skill_path = self.skills_path / folder / "SKILL.md"
-        if skill_path.exists():
-            return skill_path
+        try:
+            if self._load_skill_file(skill_path):
+                return skill_path
+        except Exception as e:
+            logger.error(f"Failed to read SKILL.md for {folder}: {e}")
 
         return None
 
@@ -435,14 +621,8 @@ class SkillRouter:
         if not task_description:
             return None
 
-        task_lower = task_description.lower()
-        scores: Dict[SkillRole, Tuple[float, List[str]]] = {}
-
-        # Calculate scores for each skill
-        for role, config in self.skill_map.items():
-            score, matches = self._calculate_score(task_lower, config)
-            if score > 0:
-                scores[role] = (score, matches)
+        # Score every skill in one pass over the task
+        scores = self._get_matcher().score(task_description.lower())
 
         if not scores:
             return None
@@ -476,7 +656,10 @@ class SkillRouter:
 
     def _calculate_score(self, task_lower: str, config: Dict) -> Tuple[float, List[str]]:
         """
-        Calculate match score for a skill configuration.
+        Calculate match score for a single skill configuration.
+
+        route() and get_all_routes() score all roles at once with
+        KeywordMatcher, which gives the same result.
 
         Args:
             task_lower: Lowercase task description
@@ -514,11 +697,10 @@ class SkillRouter:
         if not task_description:
             return []
 
-        task_lower = task_description.lower()
         routes = []
 
-        for role, config in self.skill_map.items():
-            score, matches = self._calculate_score(task_lower, config)
+        for role, (score, matches) in self._get_matcher().score(task_description.lower()).items():
+            config = self.skill_map[role]
             if score > 0:
                 max_possible = len(config["keywords"]) * config.get("weight", 1.0)
                 confidence = min(score / max_possible * 2, 1.0)
@@ -601,8 +783,9 @@ class SkillRouter:
             Skill file content or None if not found
         """
         try:
-            if route.skill_path.exists():
-                return route.skill_path.read_text()
+            skill = self._load_skill_file(route.skill_path)
+            if skill is not None:
+                return skill.content
             else:
                 logger.warning(f"Skill file not found: {route.skill_path}")
                 return None
@@ -4,12 +4,24 @@ Task State Machine
 
 Validates task state transitions and dependency resolution.
 Adapted from Blackbox5 Task Registry.
+
+Readiness is tracked incrementally by a DependencyEngine: completing a task
+updates only its dependents, and available tasks are read from the ready set.
 """
 
 from enum import Enum
 from typing import Optional, List, Dict, Any, Tuple
 from dataclasses import dataclass
 from datetime import datetime
+from pathlib import Path
+import sys
+
+# The dependency engine lives with the managerial agents; append (not insert)
+# so that directory never shadows modules next to this one
+ENGINE_DIR = Path(__file__).resolve().parents[2] / "agents" / "definitions" / "managerial"
+if str(ENGINE_DIR) not in sys.path:
+    sys.path.append(str(ENGINE_DIR))
+from dependency_engine import DependencyEngine
 
 
 class TaskState(Enum):
@@ -25,6 +37,37 @@ class StateTransitionError(Exception):
     pass
 
 
+class _DependencyList(list):
+    """Dependency list that tells its task when it is edited in place."""
+
+    __slots__ = ("_task",)
+
+    def __init__(self, task: "Task", items=()):
+        super().__init__(items)
+        self._task = task
+
+    def __reduce_ex__(self, protocol):
+        # Copies and pickles are plain lists; the owner re-wraps on assignment
+        return list, (list(self),)
+
+
+def _notifying(name: str):
+    method = getattr(list, name)
+
+    def wrapper(self, *args):
+        result = method(self, *args)
+        self._task._notify("dependencies", None)
+        return result
+
+    wrapper.__name__ = name
+    return wrapper
+
+
+for _name in ("append", "extend", "insert", "remove", "pop", "clear",
+              "__setitem__", "__delitem__", "__iadd__", "__imul__"):
+    setattr(_DependencyList, _name, _notifying(_name))
+
+
 @dataclass
 class Task:
     """Simple task representation."""
@@ -36,6 +79,75 @@ class Task:
     started_at: Optional[str] = None
     completed_at: Optional[str] = None
 
+    def __setattr__(self, name: str, value: Any) -> None:
+        if name == "dependencies" and not (
+            isinstance(value, _DependencyList) and value._task is self
+        ):
+            value = _DependencyList(self, value)
+        previous = self.__dict__.get(name)
+        super().__setattr__(name, value)
+        # Let the owning state machine see direct state and dependency edits
+        if name == "dependencies" or (name == "state" and previous is not None and previous != value):
+            self._notify(name, previous)
+
+    def _notify(self, name: str, previous: Any) -> None:
+        listener = self.__dict__.get("_listener")
+        if listener is not None:
+            listener(self, name, previous)
+
+    def __getstate__(self):
+        # The state machine link is process-local
+        state = self.__dict__.copy()
+        state.pop("_listener", None)
+        return state
+
+
+class _TaskTable(dict):
+    """task_id -> Task dict that reports adds, replacements and removals."""
+
+    def __init__(self, machine: "TaskStateMachine", tasks: Dict[str, Task]):
+        super().__init__(tasks)
+        self._machine = machine
+
+    def __setitem__(self, task_id: str, task: Task) -> None:
+        previous = self.get(task_id)
+        super().__setitem__(task_id, task)
+        if previous is not task:
+            self._machine._replaced(previous, task)
+
+    def __delitem__(self, task_id: str) -> None:
+        previous = self[task_id]
+        super().__delitem__(task_id)
+        self._machine._replaced(previous, None)
+
+    def pop(self, task_id: str, *default):
+        if task_id not in self:
+            return super().pop(task_id, *default)
+        task = self[task_id]
+        del self[task_id]
+        return task
+
+    def popitem(self):
+        task_id, task = super().popitem()
+        self._machine._replaced(task, None)
+        return task_id, task
+
+    def setdefault(self, task_id: str, task: Optional[Task] = None):
+        if task_id not in self:
+            self[task_id] = task
+        return self[task_id]
+
+    def update(self, *args, **kwargs) -> None:
+        for task_id, task in dict(*args, **kwargs).items():
+            self[task_id] = task
+
+    def clear(self) -> None:
+        super().clear()
+        self._machine._rebuild()
+
+    def __reduce_ex__(self, protocol):
+        return dict, (dict(self),)
+
 
 class TaskStateMachine:
     """
@@ -61,11 +173,89 @@ class TaskStateMachine:
         """
         Initialize state machine.
 
+        The machine keeps its own task table; later edits go through
+        self.tasks (or add_task/remove_task), not the dict passed in.
+
         Args:
             tasks: Dictionary of task_id -> Task
         """
         self.tasks = tasks or {}
 
+    @property
+    def tasks(self) -> Dict[str, Task]:
+        """task_id -> Task; adding, replacing or deleting entries is tracked."""
+        return self._tasks
+
+    @tasks.setter
+    def tasks(self, tasks: Dict[str, Task]) -> None:
+        self._tasks = _TaskTable(self, tasks)
+        self._rebuild()
+
+    # =========================================================================
+    # Dependency tracking
+    # =========================================================================
+    #
+    # The engine is updated when tasks change, never by rescanning on reads:
+    # the task table reports added, replaced and removed tasks, and each
+    # task reports state changes and dependency edits (assignment or in
+    # place). Queries are then answered from the engine's ready set.
+
+    def add_task(self, task: Task) -> None:
+        """Add a task, replacing any task with the same id."""
+        self._tasks[task.id] = task
+
+    def remove_task(self, task_id: str) -> Optional[Task]:
+        """Remove a task; dependents then count it as missing."""
+        return self._tasks.pop(task_id, None)
+
+    def _rebuild(self) -> None:
+        """Rebuild the dependency engine from the task table."""
+        self._engine = DependencyEngine()
+        for task in self._tasks.values():
+            self._track(task)
+
+    def _track(self, task: Task) -> None:
+        """Register a task with the engine and watch it for edits."""
+        if not isinstance(task.dependencies, _DependencyList):
+            task.dependencies = task.dependencies
+        object.__setattr__(task, "_listener", self._on_task_change)
+        self._engine.add_task(
+            task.id,
+            depends_on=task.dependencies,
+            resolved=task.state == TaskState.COMPLETED
+        )
+
+    def _untrack(self, task: Task) -> None:
+        if task.__dict__.get("_listener") == self._on_task_change:
+            object.__setattr__(task, "_listener", None)
+        self._engine.remove_task(task.id)
+
+    def _replaced(self, previous: Optional[Task], task: Optional[Task]) -> None:
+        """Called by the task table when an entry changes."""
+        if previous is not None:
+            self._untrack(previous)
+        if task is not None:
+            self._track(task)
+
+    def _on_task_change(self, task: Task, name: str, previous: Any) -> None:
+        if self._tasks.get(task.id) is not task:
+            return
+        if name == "state":
+            if task.state == TaskState.COMPLETED:
+                self._engine.resolve(task.id)
+            elif previous == TaskState.COMPLETED:
+                self._engine.unresolve(task.id)
+            return
+
+        # Dependencies were reassigned or edited in place; O(deps)
+        current = set(self._engine.get_dependencies(task.id))
+        wanted = set(task.dependencies)
+        for dep in current - wanted:
+            self._engine.remove_dependency(task.id, dep)
+        for dep in task.dependencies:
+            if dep not in current:
+                self._engine.add_dependency(task.id, dep, check_cycles=False)
+
     def can_transition(
         self,
         task_id: str,
@@ -144,6 +334,11 @@ class TaskStateMachine:
 
     def _check_dependencies(self, task: Task) -> Tuple[bool, Optional[str]]:
         """Check if all dependencies are completed."""
+        if task.id in self._engine and self.tasks.get(task.id) is task:
+            if self._engine.unresolved_count(task.id) == 0:
+                return True, None
+
+        # Slow path only to explain what is blocking
         for dep_id in task.dependencies:
             dep_task = self.tasks.get(dep_id)
             if not dep_task:
@@ -154,22 +349,21 @@ class TaskStateMachine:
 
     def _notify_dependents(self, completed_task_id: str) -> None:
         """Notify tasks that depend on the completed task."""
-        for task in self.tasks.values():
-            if completed_task_id in task.dependencies:
-                if task.state == TaskState.BLOCKED:
-                    # Check if now unblocked
-                    can_start, _ = self._check_dependencies(task)
-                    if can_start:
-                        task.state = TaskState.PENDING
+        self._engine.resolve(completed_task_id)
+        for dependent_id in self._engine.get_dependents(completed_task_id):
+            task = self.tasks.get(dependent_id)
+            if task and task.state == TaskState.BLOCKED:
+                # Check if now unblocked
+                if self._engine.unresolved_count(dependent_id) == 0:
+                    task.state = TaskState.PENDING
 
     def get_available_tasks(self) -> List[Task]:
         """Get tasks that can be started (pending, deps met)."""
         available = []
-        for task in self.tasks.values():
-            if task.state == TaskState.PENDING:
-                deps_met, _ = self._check_dependencies(task)
-                if deps_met:
-                    available.append(task)
+        for task_id in self._engine.ready_tasks():
+            task = self.tasks.get(task_id)
+            if task and task.state == TaskState.PENDING:
+                available.append(task)
         return available
 
     def get_blocked_tasks(self) -> List[Tuple[Task, str]]:
@@ -191,7 +385,7 @@ class TaskStateMachine:
                 dependencies=task_data.get("dependencies", {}).get("requires", []),
                 created_at=task_data.get("created_at")
             )
-            self.tasks[task.id] = task
+            self.add_task(task)
 
 
 # Convenience functions for single-task operations
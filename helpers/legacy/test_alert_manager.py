@@ -0,0 +1,200 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the alert pipeline
+
+Run with: python3 -m unittest test_alert_manager -v
+"""
+
+import shutil
+import tempfile
+import unittest
+from datetime import datetime, timedelta, timezone
+from unittest.mock import patch
+
+import yaml
+
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent))
+
+import alert_manager
+from alert_manager import AlertCounters, AlertPipeline, DEFAULT_THRESHOLDS, compile_rules
+
+CONFIG = {
+    'thresholds': DEFAULT_THRESHOLDS,
+    'channels': {'log': False, 'dashboard': False},
+    'dedup_window_seconds': 300,
+}
+
+
+class TestCompileRules(unittest.TestCase):
+    """Test rules compiled from the threshold config."""
+
+    def setUp(self):
+        self.rules = compile_rules(DEFAULT_THRESHOLDS)
+
+    def evaluate(self, event):
+        return [rule.evaluate(event) for rule in self.rules[event['metric']]]
+
+    def test_rules_per_metric(self):
+        self.assertEqual(set(self.rules), {'duration', 'success_rate', 'queue_depth', 'agent_timeout'})
+
+    def test_duration_thresholds(self):
+        self.assertEqual(self.evaluate({'metric': 'duration', 'value': 700, 'baseline': 0})[0][0], 'critical')
+        self.assertEqual(self.evaluate({'metric': 'duration', 'value': 400, 'baseline': 0})[0][0], 'warning')
+        self.assertEqual(self.evaluate({'metric': 'duration', 'value': 200, 'baseline': 120})[0][0], 'warning')
+        self.assertEqual(self.evaluate({'metric': 'duration', 'value': 100, 'baseline': 100}), [None])
+
+    def test_custom_thresholds(self):
+        rules = compile_rules({'queue_depth': {'critical': 1, 'warning': 5}})
+        severity, _, _ = rules['queue_depth'][0].evaluate({'metric': 'queue_depth', 'value': 4})
+        self.assertEqual(severity, 'warning')
+        # Missing sections fall back to the defaults
+        self.assertIsNotNone(rules['success_rate'][0].evaluate({'value': 10}))
+
+    def test_agent_timeout(self):
+        last_seen = (datetime.now(timezone.utc) - timedelta(minutes=10)).isoformat()
+        fired = self.evaluate({'metric': 'agent_timeout', 'agent_type': 'planner', 'last_seen': last_seen})[0]
+        self.assertEqual(fired[0], 'critical')
+        self.assertEqual(fired[2]['agent_type'], 'planner')
+
+
+class TestAlertPipeline(unittest.TestCase):
+    """Test deduplication and delivery."""
+
+    def setUp(self):
+        patcher = patch.object(alert_manager, 'save_alert_to_history')
+        self.saved = patcher.start()
+        self.addCleanup(patcher.stop)
+        self.pipeline = AlertPipeline(config=CONFIG, seed_history=False)
+
+    def test_repeat_of_same_event_is_suppressed(self):
+        event = {'metric': 'duration', 'value': 700, 'baseline': 300, 'run_number': 1}
+        self.assertEqual(len(self.pipeline.process(event)), 1)
+        self.assertEqual(self.pipeline.process(dict(event)), [])
+        self.assertEqual(self.pipeline.suppressed, 1)
+        self.assertEqual(self.saved.call_count, 1)
+
+    def test_different_events_are_not_duplicates(self):
+        with patch.object(alert_manager, 'get_alert_pipeline', return_value=self.pipeline):
+            first = alert_manager.evaluate_duration_anomaly(700, 300, 1)
+            second = alert_manager.evaluate_duration_anomaly(900, 300, 2)
+        self.assertIsNotNone(first)
+        self.assertIsNotNone(second)
+        self.assertEqual(self.saved.call_count, 2)
+
+    def test_continuing_timeout_is_one_alert(self):
+        last_seen = (datetime.now(timezone.utc) - timedelta(minutes=10)).isoformat()
+        event = {'metric': 'agent_timeout', 'agent_type': 'executor', 'last_seen': last_seen}
+        self.assertEqual(len(self.pipeline.process(event)), 1)
+        self.assertEqual(self.pipeline.process(event), [])
+
+    def test_repeat_after_window_fires(self):
+        event = {'metric': 'queue_depth', 'value': 0}
+        with patch.object(alert_manager.time, 'monotonic', return_value=1000.0):
+            self.assertEqual(len(self.pipeline.process(event)), 1)
+        with patch.object(alert_manager.time, 'monotonic', return_value=1301.0):
+            self.assertEqual(len(self.pipeline.process(event)), 1)
+
+    def test_expired_dedup_keys_are_pruned(self):
+        with patch.object(alert_manager.time, 'monotonic', return_value=1000.0):
+            pipeline = AlertPipeline(config=CONFIG, seed_history=False)
+            for run in range(50):
+                pipeline.process({'metric': 'duration', 'value': 700, 'baseline': 0, 'run_number': run})
+        self.assertEqual(len(pipeline._last_emitted), 50)
+
+        with patch.object(alert_manager.time, 'monotonic', return_value=1200.0):
+            pipeline.process({'metric': 'queue_depth', 'value': 0})
+        self.assertEqual(len(pipeline._last_emitted), 51)
+
+        with patch.object(alert_manager.time, 'monotonic', return_value=1301.0):
+            pipeline.process({'metric': 'queue_depth', 'value': 1})
+        # Only keys still inside the window are kept
+        self.assertEqual(len(pipeline._last_emitted), 2)
+        with patch.object(alert_manager.time, 'monotonic', return_value=1302.0):
+            self.assertEqual(pipeline.process({'metric': 'queue_depth', 'value': 0}), [])
+
+    def test_summary_counts_fired_alerts(self):
+        self.pipeline.process({'metric': 'queue_depth', 'value': 0})
+        self.pipeline.process({'metric': 'success_rate', 'value': 70, 'window': 10})
+        summary = self.pipeline.summary(hours=1)
+        self.assertEqual(summary['total_alerts'], 2)
+        self.assertEqual(summary['by_severity']['critical'], 1)
+        self.assertEqual(summary['by_type'], {'queue_depth': 1, 'success_rate': 1})
+
+
+class TestSendToDashboard(unittest.TestCase):
+    """Test appending alerts to the dashboard events file."""
+
+    def setUp(self):
+        self.tmpdir = Path(tempfile.mkdtemp())
+        self.addCleanup(shutil.rmtree, self.tmpdir)
+        self.events_file = self.tmpdir / "communications" / "events.yaml"
+        patcher = patch.object(alert_manager, 'DASHBOARD_EVENTS_FILE', self.events_file)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        alert_manager._dashboard_files_checked.clear()
+        self.addCleanup(alert_manager._dashboard_files_checked.clear)
+
+    def send(self, n):
+        alert = alert_manager.create_alert('queue_depth', 'warning', f"Alert {n}", {'value': n})
+        self.assertTrue(alert_manager.send_to_dashboard(alert))
+
+    def messages(self):
+        return [event['message'] for event in yaml.safe_load(self.events_file.read_text())]
+
+    def test_alerts_are_appended_oldest_first(self):
+        with patch.object(alert_manager.yaml, 'safe_load', wraps=yaml.safe_load) as safe_load:
+            for n in range(3):
+                self.send(n)
+        self.assertEqual(self.messages(), ["Alert 0", "Alert 1", "Alert 2"])
+        # The file is only read the first time
+        self.assertLessEqual(safe_load.call_count, 1)
+
+    def test_existing_events_are_kept(self):
+        self.events_file.parent.mkdir(parents=True)
+        self.events_file.write_text("- message: Earlier\n  type: alert")
+        self.send(1)
+        self.assertEqual(self.messages(), ["Earlier", "Alert 1"])
+
+    def test_unappendable_content_is_replaced(self):
+        self.events_file.parent.mkdir(parents=True)
+        for content in ("[]\n", "events: {}\n"):
+            alert_manager._dashboard_files_checked.clear()
+            self.events_file.write_text(content)
+            self.send(1)
+            self.assertEqual(self.messages(), ["Alert 1"])
+
+
+class TestAlertCounters(unittest.TestCase):
+    """Test time-bucketed counts."""
+
+    def alert(self, ts, severity='warning', alert_type='duration'):
+        stamp = datetime.fromtimestamp(ts, timezone.utc).isoformat()
+        return {'timestamp': stamp, 'severity': severity, 'type': alert_type}
+
+    def test_summary_window(self):
+        counters = AlertCounters(bucket_seconds=60, retention_hours=48)
+        now = 1_800_000_000.0
+        counters.record(self.alert(now - 5 * 3600, 'critical'))
+        counters.record(self.alert(now - 600))
+        counters.record(self.alert(now - 60, alert_type='queue_depth'))
+
+        summary = counters.summary(hours=1, now=now)
+        self.assertEqual(summary['total_alerts'], 2)
+        self.assertEqual(summary['by_type'], {'duration': 1, 'queue_depth': 1})
+        self.assertEqual(len(summary['recent_alerts']), 2)
+        self.assertEqual(counters.summary(hours=24, now=now)['by_severity']['critical'], 1)
+
+    def test_old_buckets_are_pruned(self):
+        counters = AlertCounters(bucket_seconds=60, retention_hours=1)
+        now = 1_800_000_000.0
+        counters.record(self.alert(now - 3 * 3600))
+        counters.record(self.alert(now))
+        self.assertEqual(len(counters._buckets), 1)
+        self.assertTrue(counters.covers(1))
+        self.assertFalse(counters.covers(2))
+
+
+if __name__ == "__main__":
+    unittest.main()
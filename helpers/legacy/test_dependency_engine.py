@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the incremental dependency engine
+
+Run with: python3 -m unittest test_dependency_engine -v
+"""
+
+import unittest
+
+import sys
+from pathlib import Path
+sys.path.append(str(Path(__file__).resolve().parents[2] / "agents" / "definitions" / "managerial"))
+
+from dependency_engine import DependencyEngine, DependencyCycleError
+
+
+class TestDependencyEngine(unittest.TestCase):
+    """Test DependencyEngine readiness tracking."""
+
+    def setUp(self):
+        """Set up a small diamond: A -> B, A -> C, (B, C) -> D."""
+        self.engine = DependencyEngine()
+        self.engine.add_task("A")
+        self.engine.add_task("B", depends_on=["A"])
+        self.engine.add_task("C", depends_on=["A"])
+        self.engine.add_task("D", depends_on=["B", "C"])
+
+    def test_initial_ready_set(self):
+        """Only tasks without dependencies start ready."""
+        self.assertEqual(self.engine.ready_tasks(), ["A"])
+        self.assertEqual(self.engine.unresolved_count("D"), 2)
+
+    def test_resolve_propagates_to_dependents(self):
+        """Resolving a task readies dependents whose count reaches zero."""
+        self.assertEqual(self.engine.resolve("A"), ["B", "C"])
+        self.assertEqual(self.engine.resolve("B"), [])
+        self.assertFalse(self.engine.is_ready("D"))
+        self.assertEqual(self.engine.resolve("C"), ["D"])
+        self.assertEqual(self.engine.ready_tasks(), ["D"])
+
+    def test_unresolve_blocks_dependents_again(self):
+        """Reopening a task removes its dependents from the ready set."""
+        self.engine.resolve("A")
+        self.engine.unresolve("A")
+        self.assertEqual(self.engine.ready_tasks(), ["A"])
+        self.assertEqual(self.engine.get_blockers("B"), ["A"])
+
+    def test_missing_dependency_counts_as_unresolved(self):
+        """A dependency on an unknown task blocks until it is resolved."""
+        self.engine.add_task("E", depends_on=["MISSING"])
+        self.assertFalse(self.engine.is_ready("E"))
+        self.engine.resolve("MISSING")
+        self.assertTrue(self.engine.is_ready("E"))
+
+    def test_cycle_detection(self):
+        """Adding an edge that closes a cycle is rejected."""
+        with self.assertRaises(DependencyCycleError) as cm:
+            self.engine.add_dependency("A", "D")
+        self.assertEqual(cm.exception.cycle[0], "A")
+        self.assertEqual(cm.exception.cycle[-1], "A")
+        # Graph unchanged
+        self.assertEqual(self.engine.get_dependencies("A"), [])
+
+    def test_self_dependency_is_a_cycle(self):
+        """A task cannot depend on itself when cycles are checked."""
+        with self.assertRaises(DependencyCycleError):
+            self.engine.add_dependency("A", "A")
+
+    def test_remove_dependency_can_ready_task(self):
+        """Dropping the last unresolved edge makes a task ready."""
+        self.engine.remove_dependency("B", "A")
+        self.assertTrue(self.engine.is_ready("B"))
+
+
+if __name__ == "__main__":
+    unittest.main()
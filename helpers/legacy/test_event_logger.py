@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the append-only event logger
+
+Run with: python3 -m unittest test_event_logger -v
+"""
+
+import shutil
+import tempfile
+import threading
+import unittest
+
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent))
+
+import yaml
+
+from event_logger import EventWriter, compact_events, iter_events
+
+
+def make_event(n, agent="executor"):
+    return {"timestamp": f"2026-02-01T00:00:{n:02d}", "agent": agent, "type": "tick",
+            "message": f'event "{n}"', "data": {"n": n}}
+
+
+class TestEventLogger(unittest.TestCase):
+    """Test appending, streaming and compacting events.yaml."""
+
+    def setUp(self):
+        self.temp_dir = Path(tempfile.mkdtemp())
+        self.events_file = self.temp_dir / "events.yaml"
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir)
+
+    def test_append_to_legacy_inline_list(self):
+        """An existing "events: []" file is converted and stays valid YAML."""
+        self.events_file.write_text('version: "1.0"\n\nevents: []\n')
+        EventWriter(self.events_file).write(make_event(1))
+        data = yaml.safe_load(self.events_file.read_text())
+        self.assertEqual(data["version"], "1.0")
+        self.assertEqual(data["events"][0]["message"], 'event "1"')
+
+    def test_concurrent_writers_lose_nothing(self):
+        """Events from many threads are all appended."""
+        writer = EventWriter(self.events_file)
+
+        def work(agent):
+            for n in range(50):
+                writer.write(make_event(n, agent))
+
+        threads = [threading.Thread(target=work, args=(f"agent-{i}",)) for i in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(len(list(iter_events(self.events_file))), 200)
+
+    def test_batching_defers_until_flush(self):
+        """Batched events are written when the batch fills or on flush."""
+        writer = EventWriter(self.events_file, max_batch=10, max_delay=60)
+        for n in range(15):
+            writer.write(make_event(n))
+        self.assertEqual(len(list(iter_events(self.events_file))), 10)
+        writer.flush()
+        self.assertEqual(len(list(iter_events(self.events_file))), 15)
+
+    def test_iter_events_reads_shell_appended_items(self):
+        """Items appended by bash hooks are streamed too."""
+        EventWriter(self.events_file).write(make_event(1))
+        with open(self.events_file, "a") as f:
+            f.write('- timestamp: "2026-02-01T00:01:00"\n  type: "auto_push"\n  agent_type: "hook"\n')
+        events = list(iter_events(self.events_file))
+        self.assertEqual([e["type"] for e in events], ["tick", "auto_push"])
+
+    def test_compact_keeps_newest(self):
+        """Compaction drops old events and writes canonical YAML."""
+        writer = EventWriter(self.events_file)
+        for n in range(20):
+            writer.write(make_event(n))
+        self.assertEqual(compact_events(self.events_file, keep=5), {"before": 20, "after": 5})
+        events = yaml.safe_load(self.events_file.read_text())["events"]
+        self.assertEqual([e["data"]["n"] for e in events], [15, 16, 17, 18, 19])
+        writer.write(make_event(30))
+        self.assertEqual(len(list(iter_events(self.events_file))), 6)
+
+    def test_multiline_message_followed_by_more_events(self):
+        """A traceback in a message does not end the events list."""
+        writer = EventWriter(self.events_file)
+        message = 'Traceback (most recent call last):\nValueError: bad "input" in C:\\new\n- done'
+        for n in range(5):
+            event = make_event(n)
+            if n == 1:
+                event["message"] = message
+                event["data"].update(trace=message, lines=message.splitlines())
+            writer.write(event)
+
+        self.assertEqual(len(yaml.safe_load(self.events_file.read_text())["events"]), 5)
+        events = list(iter_events(self.events_file))
+        self.assertEqual([e["data"]["n"] for e in events], [0, 1, 2, 3, 4])
+        self.assertEqual(events[1]["message"], message)
+        self.assertEqual(events[1]["data"]["lines"], message.splitlines())
+
+        self.assertEqual(compact_events(self.events_file), {"before": 5, "after": 5})
+        self.assertEqual(list(iter_events(self.events_file))[1]["message"], message)
+
+    def test_reads_unescaped_multiline_message(self):
+        """Quoted messages written over several lines by older versions are kept."""
+        self.events_file.write_text(
+            'events:\n'
+            '  - timestamp: "2026-02-01T00:00:00"\n'
+            '    agent: executor\n'
+            '    type: error\n'
+            '    message: "Traceback (most recent call last):\n'
+            'ValueError: bad\n'
+            '- not an item"\n'
+            '  - timestamp: "2026-02-01T00:00:01"\n'
+            '    agent: executor\n'
+            '    type: tick\n'
+        )
+        events = list(iter_events(self.events_file))
+        self.assertEqual([e["type"] for e in events], ["error", "tick"])
+        self.assertEqual(compact_events(self.events_file), {"before": 2, "after": 2})
+        self.assertEqual(len(yaml.safe_load(self.events_file.read_text())["events"]), 2)
+
+    def test_compact_refuses_unparseable_entries(self):
+        """Compaction leaves the file alone rather than dropping entries."""
+        writer = EventWriter(self.events_file)
+        writer.write(make_event(1))
+        with open(self.events_file, "a") as f:
+            f.write("  - timestamp: [unclosed\n")
+        writer.write(make_event(2))
+        original = self.events_file.read_text()
+
+        with self.assertRaises(ValueError):
+            compact_events(self.events_file, keep=1)
+        self.assertEqual(self.events_file.read_text(), original)
+
+
+if __name__ == "__main__":
+    unittest.main()
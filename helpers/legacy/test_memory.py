@@ -183,6 +183,47 @@ class TestMemorySystem(unittest.TestCase):
         self.assertEqual(len(results["insights"]), 0)
         self.assertEqual(len(results["context"]), 0)
 
+    def test_search_ranks_by_relevance(self):
+        """Test that search results are ranked with BM25."""
+        self.memory.save_context_summary("ctx-a", "cache cache cache invalidation", ["a.py"])
+        self.memory.save_context_summary("ctx-b", "cache warmup for the planner queue", ["b.py"])
+        self.memory.save_context_summary("ctx-c", "unrelated summary", ["c.py"])
+
+        hits = self.memory.search("cache")
+        self.assertEqual([h["name"] for h in hits], ["ctx-a.yaml", "ctx-b.yaml"])
+        self.assertGreater(hits[0]["score"], hits[1]["score"])
+
+        # Every term must match
+        self.assertEqual([h["name"] for h in self.memory.search("cache planner")], ["ctx-b.yaml"])
+
+    def test_index_picks_up_external_files(self):
+        """Test that files written outside the memory system are indexed."""
+        self.memory.search("anything")
+        (self.memory.context_path / "external.yaml").write_text("name: external\nsummary: zebra\n")
+
+        results = self.memory.search_memories("zebra")
+        self.assertEqual([p.name for p in results["context"]], ["external.yaml"])
+
+        (self.memory.context_path / "external.yaml").unlink()
+        self.assertEqual(self.memory.search_memories("zebra")["context"], [])
+
+    def test_reindex_picks_up_edits(self):
+        """Test that reindex re-reads files edited in place."""
+        path = self.memory.save_context_summary("ctx", "original words", [])
+        self.memory.search("original")
+        path.write_text("name: ctx\nsummary: replaced text here\n")
+
+        self.memory.reindex()
+        self.assertEqual(self.memory.search("original"), [])
+        self.assertEqual(len(self.memory.search("replaced")), 1)
+
+    def test_index_persists_across_instances(self):
+        """Test that a new instance reuses the stored index."""
+        self.memory.record_insight("Persisted insight", category="gotcha")
+        memory = MemorySystem(self.memory_base)
+        self.assertEqual(len(memory.get_insights_by_category("gotcha")), 1)
+        self.assertEqual(memory.index.count(), 1)
+
     def test_decision_markdown_format(self):
         """Test that decision markdown has expected format."""
         file_path = self.memory.record_decision(
@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the metrics store
+
+Run with: python3 -m unittest test_metrics_store -v
+"""
+
+import shutil
+import tempfile
+import unittest
+
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent))
+
+import yaml
+
+from metrics_store import MetricsStore
+
+
+def make_run(n, agent_type='executor', result='success', duration=100):
+    return {
+        'timestamp': f"2026-02-01T{n:02d}:00:00+00:00",
+        'run_number': n,
+        'run_directory': f"runs/{agent_type}/run-{n:04d}",
+        'agent_type': agent_type,
+        'agent': agent_type,
+        'duration_seconds': duration,
+        'task_id': f"TASK-{n}",
+        'task_status': 'completed' if result == 'success' else result,
+        'result': result,
+        'files_modified': n % 3,
+        'commit_hash': None,
+        'actions_taken': 1,
+        'blockers': 0,
+        'discoveries': 0,
+        'questions_asked': 0,
+    }
+
+
+class TestMetricsStore(unittest.TestCase):
+    """Test MetricsStore run and alert storage."""
+
+    def setUp(self):
+        self.temp_dir = Path(tempfile.mkdtemp())
+        self.store = MetricsStore(self.temp_dir / "metrics.db")
+        runs = [make_run(n) for n in range(10)]
+        runs += [make_run(n, agent_type='planner') for n in range(10, 15)]
+        self.store.replace_runs(runs)
+
+    def tearDown(self):
+        self.store.close()
+        shutil.rmtree(self.temp_dir)
+
+    def test_query_window_and_agent_type(self):
+        """Window returns the newest runs of one agent type."""
+        runs = self.store.query_runs(agent_type='executor', window=3)
+        self.assertEqual([r['run_number'] for r in runs], [9, 8, 7])
+
+    def test_query_time_range(self):
+        """since/until bound the timestamp inclusively."""
+        runs = self.store.query_runs(since="2026-02-01T03:00:00Z", until="2026-02-01T05:00:00Z")
+        self.assertEqual([r['run_number'] for r in runs], [5, 4, 3])
+
+    def test_query_selected_columns(self):
+        """Only the requested columns are returned."""
+        runs = self.store.query_runs(window=1, columns=['duration_seconds'])
+        self.assertEqual(runs, [{'duration_seconds': 100}])
+        with self.assertRaises(ValueError):
+            self.store.query_runs(columns=['not_a_column'])
+
+    def test_extra_fields_round_trip(self):
+        """Fields outside the schema are kept."""
+        run = dict(make_run(20), custom='value')
+        self.store.upsert_runs([run])
+        self.assertEqual(self.store.query_runs(window=1)[0]['custom'], 'value')
+
+    def test_prune_keeps_newest(self):
+        """Pruning drops the oldest runs."""
+        self.assertEqual(self.store.prune_runs(5), 10)
+        self.assertEqual(self.store.count_runs(), 5)
+        self.assertEqual(self.store.count_runs('executor'), 0)
+
+    def test_summary(self):
+        """Summary counts runs per agent type."""
+        summary = self.store.summary()
+        self.assertEqual(summary['total_runs'], 15)
+        self.assertEqual(summary['by_agent_type'], {'executor': 10, 'planner': 5})
+
+    def test_legacy_yaml_import(self):
+        """An empty store imports an existing metrics.yaml."""
+        legacy = self.temp_dir / "metrics.yaml"
+        with open(legacy, 'w') as f:
+            yaml.safe_dump({'metrics': [make_run(1), make_run(2)]}, f)
+        store = MetricsStore(self.temp_dir / "imported.db", legacy_yaml=legacy)
+        self.assertEqual(store.count_runs(), 2)
+        store.close()
+
+    def test_ingest_tracks_fingerprints(self):
+        """Ingestion records fingerprints and drops removed runs."""
+        run = make_run(20)
+        self.store.ingest([run], {run['run_directory']: (123, 45)},
+                          removed=[make_run(0)['run_directory']])
+        self.assertEqual(self.store.get_fingerprints(), {run['run_directory']: (123, 45)})
+        self.assertEqual(self.store.count_runs('executor'), 10)
+        self.store.ingest([], {}, replace=True)
+        self.assertEqual(self.store.count_runs(), 0)
+        self.assertEqual(self.store.get_fingerprints(), {})
+
+    def test_alerts_newest_first_and_trimmed(self):
+        """Alerts come back newest first and history is bounded."""
+        for n in range(30):
+            self.store.append_alert({
+                'timestamp': f"2026-02-01T00:{n:02d}:00+00:00",
+                'type': 'duration', 'severity': 'warning', 'message': str(n),
+                'run_number': n,
+            }, keep=10)
+        alerts = self.store.query_alerts(limit=None)
+        self.assertLessEqual(len(alerts), 11)
+        self.assertEqual(alerts[0]['message'], '29')
+        self.assertEqual(alerts[0]['run_number'], 29)
+        recent = self.store.query_alerts(since="2026-02-01T00:27:00Z")
+        self.assertEqual([a['message'] for a in recent], ['29', '28'])
+
+
+if __name__ == "__main__":
+    unittest.main()
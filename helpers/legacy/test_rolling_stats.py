@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the rolling statistics engine
+
+Run with: python3 -m unittest test_rolling_stats -v
+"""
+
+import random
+import statistics
+import unittest
+
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from rolling_stats import (
+    EWMA, MetricBaseline, RollingQuantile, RunningStats,
+    summarize, window_rates, z_scores,
+)
+
+
+class TestBatchStatistics(unittest.TestCase):
+    """Test the batch helpers against the statistics module."""
+
+    def setUp(self):
+        rng = random.Random(7)
+        self.values = [rng.randint(30, 900) for _ in range(101)]
+
+    def test_summarize_matches_statistics(self):
+        summary = summarize(self.values)
+        self.assertAlmostEqual(summary['mean'], statistics.mean(self.values))
+        self.assertAlmostEqual(summary['stdev'], statistics.stdev(self.values))
+        self.assertEqual(summary['median'], statistics.median(self.values))
+        self.assertEqual(summary['min'], min(self.values))
+        self.assertEqual(summarize([])['count'], 0)
+
+    def test_z_scores(self):
+        self.assertEqual(z_scores([10, 30], 20, 5), [2.0, 2.0])
+        self.assertEqual(z_scores([10, 30], 20, 0), [0.0, 0.0])
+
+    def test_window_rates_match_loop(self):
+        flags = [v % 3 != 0 for v in self.values]
+        expected = [
+            sum(flags[i:i + 20]) / 20 for i in range(0, len(flags) - 20, 20)
+        ]
+        self.assertEqual(window_rates(flags, 20), expected)
+
+
+class TestOnlineStatistics(unittest.TestCase):
+    """Test the O(1) updaters."""
+
+    def test_welford_matches_batch(self):
+        values = [float(v) for v in range(1, 50, 3)]
+        stats = RunningStats()
+        for value in values:
+            stats.push(value)
+        self.assertAlmostEqual(stats.mean, statistics.mean(values))
+        self.assertAlmostEqual(stats.stdev, statistics.stdev(values))
+
+    def test_merge_and_round_trip(self):
+        left, right = RunningStats(), RunningStats()
+        left.extend([1, 2, 3])
+        right.extend([10, 20])
+        left.merge(right)
+        restored = RunningStats.from_dict(left.to_dict())
+        self.assertAlmostEqual(restored.mean, statistics.mean([1, 2, 3, 10, 20]))
+        self.assertAlmostEqual(restored.variance, statistics.variance([1, 2, 3, 10, 20]))
+        self.assertEqual((restored.min, restored.max), (1, 20))
+
+    def test_ewma_follows_recent_values(self):
+        ewma = EWMA(alpha=0.5)
+        ewma.extend([100] * 10 + [200] * 10)
+        self.assertGreater(ewma.mean, 199)
+        with self.assertRaises(ValueError):
+            EWMA(alpha=0)
+
+    def test_rolling_quantile_evicts_oldest(self):
+        quantiles = RollingQuantile(window=5)
+        quantiles.extend([100, 1, 2, 3, 4, 5])
+        self.assertEqual(len(quantiles), 5)
+        self.assertEqual(quantiles.median, 3)
+        self.assertEqual(quantiles.quantile(1.0), 5)
+
+    def test_baseline_scores_without_adding(self):
+        baseline = MetricBaseline()
+        baseline.extend([100, 110, 90, 105, 95])
+        score = baseline.score(400)
+        self.assertGreater(score['z_score'], 3)
+        self.assertEqual(baseline.count, 5)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the skill router
+
+Run with: python3 -m unittest test_skill_router -v
+"""
+
+import os
+import random
+import shutil
+import tempfile
+import unittest
+
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from skill_router import SKILL_MAP, KeywordMatcher, SkillRole, SkillRouter
+
+SKILL_MD = """---
+name: {name}
+description: Test skill
+category: test
+---
+
+# {name}
+"""
+
+
+class TestKeywordMatcher(unittest.TestCase):
+    """Test that the compiled matcher scores like the per-keyword scorer."""
+
+    def test_matches_per_keyword_scoring(self):
+        router = SkillRouter()
+        matcher = KeywordMatcher(SKILL_MAP)
+        vocab = sorted({k for config in SKILL_MAP.values() for k in config["keywords"]})
+        rng = random.Random(3)
+
+        for _ in range(500):
+            words = [rng.choice(vocab) if rng.random() < 0.5 else rng.choice(["the", "un", "s", "_"])
+                     for _ in range(rng.randint(1, 10))]
+            text = "".join(w + rng.choice(["", " ", "-", ", "]) for w in words).lower()
+            expected = {}
+            for role, config in SKILL_MAP.items():
+                score, matches = router._calculate_score(text, config)
+                if score > 0:
+                    expected[role] = (score, matches)
+            self.assertEqual(list(matcher.score(text).items()), list(expected.items()), text)
+
+    def test_whole_word_and_substring(self):
+        matcher = KeywordMatcher({SkillRole.DEV: {"keywords": ["test", "bug"], "weight": 1.0}})
+        self.assertEqual(matcher.score("testing a bug"), {SkillRole.DEV: (3.0, ["test", "bug"])})
+
+
+class TestSkillFileCache(unittest.TestCase):
+    """Test that SKILL.md files are cached until they change."""
+
+    def setUp(self):
+        self.skills_path = Path(tempfile.mkdtemp())
+        self.skill_file = self.skills_path / "bmad-dev" / "SKILL.md"
+        self.skill_file.parent.mkdir()
+        self.skill_file.write_text(SKILL_MD.format(name="dev"))
+        self.router = SkillRouter(self.skills_path)
+
+    def tearDown(self):
+        shutil.rmtree(self.skills_path)
+
+    def test_route_and_content(self):
+        route = self.router.route("implement the endpoint and refactor the module")
+        self.assertEqual(route.role, SkillRole.DEV)
+        self.assertEqual(route.skill_metadata["name"], "dev")
+        self.assertIn("# dev", self.router.load_skill_content(route))
+
+    def test_reparses_after_change(self):
+        self.assertEqual(self.router._parse_skill_md("bmad-dev").name, "dev")
+        self.skill_file.write_text(SKILL_MD.format(name="developer"))
+        stat = self.skill_file.stat()
+        os.utime(self.skill_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+        self.assertEqual(self.router._parse_skill_md("bmad-dev").name, "developer")
+
+    def test_missing_skill_is_not_routed(self):
+        self.skill_file.unlink()
+        self.assertIsNone(self.router.route("implement the endpoint"))
+        self.assertIsNone(self.router._parse_skill_md("bmad-dev"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -6,8 +6,10 @@ Tests the task state transition and dependency management system.
 Run with: python3 -m unittest test_state_machine -v
 """
 
+import pickle
 import unittest
 from datetime import datetime
+from unittest import mock
 
 import sys
 from pathlib import Path
@@ -210,6 +212,87 @@ class TestTaskStateMachine(unittest.TestCase):
         self.assertEqual(sm.tasks["TASK-002"].state, TaskState.PENDING)
         self.assertEqual(sm.tasks["TASK-002"].dependencies, ["TASK-001"])
 
+    def test_replacing_tasks_directly(self):
+        """Test that tasks removed and added through the dict are tracked."""
+        sm = TaskStateMachine({"A": Task("A", "A", TaskState.PENDING, [])})
+        sm.get_available_tasks()
+        del sm.tasks["A"]
+        sm.tasks["C"] = Task("C", "C", TaskState.PENDING, [])
+
+        self.assertEqual([t.id for t in sm.get_available_tasks()], ["C"])
+
+    def test_replacing_task_with_new_dependencies(self):
+        """Test that a task replaced under the same id uses its new deps."""
+        self.sm.get_available_tasks()
+        self.sm.tasks["TASK-001"] = Task("TASK-001", "First Task", TaskState.PENDING, ["TASK-002"])
+
+        self.assertEqual(self.sm.get_available_tasks(), [])
+        can, _ = self.sm.can_transition("TASK-001", TaskState.IN_PROGRESS)
+        self.assertFalse(can)
+
+    def test_dependency_appended_in_place(self):
+        """Test that a dependency appended to a task blocks it."""
+        self.assertTrue(self.sm.can_transition("TASK-001", TaskState.IN_PROGRESS)[0])
+        self.sm.tasks["TASK-001"].dependencies.append("TASK-002")
+
+        can, reason = self.sm.can_transition("TASK-001", TaskState.IN_PROGRESS)
+        self.assertFalse(can)
+        self.assertIn("TASK-002", reason)
+        self.assertEqual(self.sm.get_available_tasks(), [])
+
+    def test_dependency_edits_are_tracked(self):
+        """Test reassigning, extending and removing dependencies."""
+        task = self.sm.tasks["TASK-003"]
+        self.sm.tasks["TASK-001"].state = TaskState.COMPLETED
+        self.assertNotIn(task, self.sm.get_available_tasks())
+
+        task.dependencies.remove("TASK-002")
+        self.assertIn(task, self.sm.get_available_tasks())
+        task.dependencies += ["TASK-004"]
+        self.assertNotIn(task, self.sm.get_available_tasks())
+        task.dependencies = ["TASK-001"]
+        self.assertIn(task, self.sm.get_available_tasks())
+        del task.dependencies[:]
+        task.dependencies.extend(["TASK-002"])
+        self.assertNotIn(task, self.sm.get_available_tasks())
+
+    def test_add_and_remove_task_api(self):
+        """Test the explicit add/remove API."""
+        self.sm.add_task(Task("TASK-005", "Missing dep", TaskState.COMPLETED, []))
+        self.sm.tasks["TASK-004"].state = TaskState.PENDING
+        self.assertIn("TASK-004", [t.id for t in self.sm.get_available_tasks()])
+
+        removed = self.sm.remove_task("TASK-005")
+        self.assertEqual(removed.id, "TASK-005")
+        self.assertIsNone(self.sm.remove_task("TASK-005"))
+        self.assertNotIn("TASK-004", [t.id for t in self.sm.get_available_tasks()])
+
+        # A removed task is no longer watched
+        removed.dependencies.append("TASK-001")
+        removed.state = TaskState.PENDING
+        self.assertNotIn("TASK-005", self.sm.tasks)
+
+    def test_reads_do_not_walk_tasks(self):
+        """Test that availability checks never rescan the task table."""
+        for n in range(200):
+            self.sm.add_task(Task(f"BULK-{n}", "Bulk", TaskState.PENDING, ["TASK-001"]))
+        table = type(self.sm.tasks)
+        with mock.patch.object(table, "__iter__", side_effect=AssertionError("rescan")), \
+                mock.patch.object(table, "values", side_effect=AssertionError("rescan")), \
+                mock.patch.object(table, "items", side_effect=AssertionError("rescan")):
+            self.assertEqual([t.id for t in self.sm.get_available_tasks()], ["TASK-001"])
+            self.sm.transition("TASK-001", TaskState.IN_PROGRESS)
+            self.sm.transition("TASK-001", TaskState.COMPLETED)
+            self.assertEqual(len(self.sm.get_available_tasks()), 201)
+            self.assertTrue(self.sm.can_transition("BULK-7", TaskState.IN_PROGRESS)[0])
+
+    def test_task_pickles_without_state_machine(self):
+        """Test that a tracked task can be copied out of the machine."""
+        copy = pickle.loads(pickle.dumps(self.sm.tasks["TASK-003"]))
+        self.assertEqual(copy, self.sm.tasks["TASK-003"])
+        copy.dependencies.append("TASK-004")
+        self.assertEqual(self.sm.tasks["TASK-003"].dependencies, ["TASK-001", "TASK-002"])
+
     def test_completed_is_terminal(self):
         """Test that COMPLETED state has no outgoing transitions."""
         # This is implicit in VALID_TRANSITIONS
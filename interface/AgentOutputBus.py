@@ -17,14 +17,18 @@ Usage:
     bus.receive(agent_output)
 """
 
+import atexit
 import logging
 import json
+import queue
 import sqlite3
 import sys
 import threading
+import zlib
+from contextlib import contextmanager
 from datetime import datetime
 from pathlib import Path
-from typing import Callable, Dict, List, Optional, Any
+from typing import Callable, Dict, Iterator, List, Optional, Any
 from dataclasses import dataclass, field
 from enum import Enum
 
@@ -108,6 +112,231 @@ class OutputHandler:
         raise NotImplementedError(f"{self.name}.handle() not implemented")
 
 
+def _compress_text(text: Optional[str]) -> Optional[bytes]:
+    """Compress text for blob storage (None and empty strings stay None)."""
+    if not text:
+        return None
+    return zlib.compress(text.encode('utf-8'), 6)
+
+
+def _decompress_text(data: Optional[Any]) -> Optional[str]:
+    """Inverse of _compress_text; tolerates uncompressed legacy text."""
+    if data is None:
+        return None
+    if isinstance(data, str):
+        return data
+    return zlib.decompress(data).decode('utf-8')
+
+
+def _time_bucket(timestamp: datetime) -> str:
+    """Hourly rollup bucket key, e.g. '2026-02-01T12'."""
+    return timestamp.strftime('%Y-%m-%dT%H')
+
+
+class OutputLogWriter:
+    """
+    Persistent, batched SQLite writer with a small read-connection pool.
+
+    A single long-lived connection in WAL mode is owned by a background
+    thread that drains submitted items every ``flush_interval_ms`` (or as
+    soon as ``max_batch`` items are queued) and hands them to
+    ``apply_batch`` inside one transaction. Readers borrow connections from
+    a bounded pool so they never block the writer.
+
+    Pending items are flushed on ``close()`` and at interpreter exit.
+    """
+
+    def __init__(
+        self,
+        db_path: Path,
+        apply_batch: Callable[[sqlite3.Connection, List[Any]], None],
+        flush_interval_ms: int = 50,
+        max_batch: int = 100,
+        read_pool_size: int = 4
+    ):
+        """
+        Initialize the writer (no connections are opened until start()).
+
+        Args:
+            db_path: Path to SQLite database
+            apply_batch: Called with (connection, items) inside a transaction
+            flush_interval_ms: Maximum time an item waits before commit
+            max_batch: Queue length that triggers an immediate commit
+            read_pool_size: Maximum number of pooled read connections
+        """
+        self.db_path = db_path
+        self.apply_batch = apply_batch
+        self.flush_interval = flush_interval_ms / 1000.0
+        self.max_batch = max_batch
+        self.read_pool_size = read_pool_size
+
+        self._pending: List[Any] = []
+        self._cond = threading.Condition()
+        self._write_lock = threading.Lock()
+        self._submitted = 0
+        self._committed = 0
+        self._flush_requested = False
+        self._running = False
+        self._thread: Optional[threading.Thread] = None
+        self._conn: Optional[sqlite3.Connection] = None
+
+        self._readers: "queue.LifoQueue[sqlite3.Connection]" = queue.LifoQueue()
+        self._reader_count = 0
+        self._reader_lock = threading.Lock()
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.db_path, check_same_thread=False, timeout=30)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        return conn
+
+    def start(self) -> None:
+        """Open the writer connection and start the background thread."""
+        with self._cond:
+            if self._running:
+                return
+            self._conn = self._connect()
+            self._running = True
+            self._thread = threading.Thread(
+                target=self._run, name="OutputLogWriter", daemon=True
+            )
+            self._thread.start()
+        atexit.register(self.close)
+
+    def submit(self, item: Any) -> None:
+        """Queue an item for the next batch (written inline if not started)."""
+        with self._cond:
+            if not self._running:
+                running = False
+            else:
+                running = True
+                self._pending.append(item)
+                self._submitted += 1
+                if len(self._pending) >= self.max_batch:
+                    self._cond.notify_all()
+        if not running:
+            self._write_inline([item])
+
+    def _write_inline(self, items: List[Any]) -> None:
+        conn = self._connect()
+        try:
+            with conn:
+                self.apply_batch(conn, items)
+        finally:
+            conn.close()
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                # A flush requested before the thread got here must not
+                # wait out the interval
+                if (self._running and not self._flush_requested
+                        and len(self._pending) < self.max_batch):
+                    self._cond.wait(self.flush_interval)
+                self._flush_requested = False
+                batch, self._pending = self._pending, []
+                running = self._running
+            if batch:
+                self._commit(batch)
+            if not running:
+                return
+
+    def _commit(self, batch: List[Any]) -> None:
+        with self._write_lock:
+            try:
+                with self._conn:
+                    self.apply_batch(self._conn, batch)
+            except Exception as e:
+                logger.error(f"Batch write of {len(batch)} items failed: {e}")
+        with self._cond:
+            self._committed += len(batch)
+            self._cond.notify_all()
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """
+        Block until everything submitted so far is committed.
+
+        Returns:
+            True if the flush completed within the timeout
+        """
+        with self._cond:
+            if not self._running:
+                return True
+            target = self._submitted
+            self._flush_requested = True
+            self._cond.notify_all()
+            return self._cond.wait_for(
+                lambda: self._committed >= target or not self._running,
+                timeout
+            )
+
+    def execute_write(self, fn: Callable[[sqlite3.Connection], Any]) -> Any:
+        """Run fn(connection) in its own transaction after pending items commit."""
+        self.flush()
+        if not self._running:
+            conn = self._connect()
+            try:
+                with conn:
+                    return fn(conn)
+            finally:
+                conn.close()
+        with self._write_lock:
+            with self._conn:
+                return fn(self._conn)
+
+    @contextmanager
+    def reader(self) -> Iterator[sqlite3.Connection]:
+        """Borrow a pooled read connection."""
+        try:
+            conn = self._readers.get_nowait()
+        except queue.Empty:
+            with self._reader_lock:
+                create = self._reader_count < self.read_pool_size
+                if create:
+                    self._reader_count += 1
+            if create:
+                conn = self._connect()
+                conn.row_factory = sqlite3.Row
+            else:
+                conn = self._readers.get()
+        try:
+            yield conn
+        finally:
+            self._readers.put(conn)
+
+    def close(self) -> None:
+        """Flush pending items, stop the thread and close all connections."""
+        with self._cond:
+            if not self._running:
+                return
+            self._running = False
+            self._cond.notify_all()
+        self._thread.join()
+        try:
+            atexit.unregister(self.close)
+        except Exception:
+            pass
+        with self._write_lock:
+            self._conn.close()
+            self._conn = None
+        while True:
+            try:
+                self._readers.get_nowait().close()
+            except queue.Empty:
+                break
+        with self._reader_lock:
+            self._reader_count = 0
+
+    @property
+    def stats(self) -> Dict[str, int]:
+        with self._cond:
+            return {
+                "submitted": self._submitted,
+                "committed": self._committed,
+                "pending": len(self._pending),
+            }
+
+
 class AgentOutputBus:
     """
     Central bus for routing agent outputs to appropriate systems.
@@ -119,17 +348,33 @@ class AgentOutputBus:
     4. Aggregates results
     """
 
-    def __init__(self, db_path: Optional[Path] = None):
+    def __init__(
+        self,
+        db_path: Optional[Path] = None,
+        flush_interval_ms: int = 50,
+        batch_size: int = 100,
+        read_pool_size: int = 4
+    ):
         """
         Initialize the Agent Output Bus.
 
         Args:
             db_path: Path to SQLite database for logging (optional)
+            flush_interval_ms: Maximum delay before logged outputs are committed
+            batch_size: Number of queued outputs that forces an immediate commit
+            read_pool_size: Number of pooled read connections
         """
         self.db_path = db_path or Path.cwd() / "agent_outputs.db"
         self._handlers: List[OutputHandler] = []
         self._lock = threading.RLock()
         self._initialized = False
+        self._writer = OutputLogWriter(
+            self.db_path,
+            self._write_batch,
+            flush_interval_ms=flush_interval_ms,
+            max_batch=batch_size,
+            read_pool_size=read_pool_size
+        )
 
         logger.info(f"AgentOutputBus created (db: {self.db_path})")
 
@@ -140,14 +385,25 @@ class AgentOutputBus:
                 logger.warning("AgentOutputBus already initialized")
                 return
 
-            # Initialize database
+            # Initialize database and start the batched writer
             self._init_database()
+            self._writer.start()
 
             # Register handlers (will be added separately)
             logger.info(f"AgentOutputBus initialized with {len(self._handlers)} handlers")
 
             self._initialized = True
 
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """Block until all logged outputs are committed to the database."""
+        return self._writer.flush(timeout)
+
+    def close(self) -> None:
+        """Flush pending outputs and release database connections."""
+        with self._lock:
+            self._writer.close()
+            self._initialized = False
+
     def register_handler(self, handler: OutputHandler) -> None:
         """Register a handler to receive events."""
         with self._lock:
@@ -155,10 +411,22 @@ class AgentOutputBus:
             logger.info(f"Registered handler: {handler.name}")
 
     def _init_database(self) -> None:
-        """Initialize SQLite database for logging."""
+        """
+        Initialize SQLite database for logging.
+
+        Schema:
+        - agent_outputs: narrow per-output rows (no large text columns)
+        - agent_output_blobs: zlib-compressed human_content/raw_output
+        - agent_output_totals: per agent/status counts
+        - agent_output_buckets: per hour/agent/status counts
+
+        Databases created before the split have their inline blobs moved
+        and the rollups backfilled once.
+        """
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
 
         conn = sqlite3.connect(self.db_path)
+        conn.execute("PRAGMA journal_mode=WAL")
         conn.execute("""
             CREATE TABLE IF NOT EXISTS agent_outputs (
                 id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -169,9 +437,7 @@ class AgentOutputBus:
                 summary TEXT,
                 deliverables TEXT,
                 next_steps TEXT,
-                metadata TEXT,
-                human_content TEXT,
-                raw_output TEXT
+                metadata TEXT
             )
         """)
         conn.execute("""
@@ -186,11 +452,85 @@ class AgentOutputBus:
             CREATE INDEX IF NOT EXISTS idx_agent_outputs_status
             ON agent_outputs(status)
         """)
+        conn.execute("""
+            CREATE INDEX IF NOT EXISTS idx_agent_outputs_deliverables
+            ON agent_outputs(timestamp DESC)
+            WHERE deliverables IS NOT NULL AND deliverables != '[]'
+        """)
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS agent_output_blobs (
+                output_id INTEGER PRIMARY KEY,
+                human_content BLOB,
+                raw_output BLOB
+            )
+        """)
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS agent_output_totals (
+                agent_name TEXT NOT NULL,
+                status TEXT NOT NULL,
+                count INTEGER NOT NULL DEFAULT 0,
+                PRIMARY KEY (agent_name, status)
+            ) WITHOUT ROWID
+        """)
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS agent_output_buckets (
+                bucket TEXT NOT NULL,
+                agent_name TEXT NOT NULL,
+                status TEXT NOT NULL,
+                count INTEGER NOT NULL DEFAULT 0,
+                PRIMARY KEY (bucket, agent_name, status)
+            ) WITHOUT ROWID
+        """)
         conn.commit()
+
+        self._migrate_legacy_schema(conn)
         conn.close()
 
         logger.info(f"Database initialized at {self.db_path}")
 
+    def _migrate_legacy_schema(self, conn: sqlite3.Connection) -> None:
+        """Move inline blobs out of agent_outputs and backfill empty rollups."""
+        columns = {row[1] for row in conn.execute("PRAGMA table_info(agent_outputs)")}
+
+        with conn:
+            if 'raw_output' in columns:
+                cursor = conn.execute("""
+                    SELECT id, human_content, raw_output FROM agent_outputs
+                    WHERE human_content IS NOT NULL OR raw_output IS NOT NULL
+                """)
+                moved = 0
+                while True:
+                    rows = cursor.fetchmany(500)
+                    if not rows:
+                        break
+                    conn.executemany("""
+                        INSERT OR REPLACE INTO agent_output_blobs (output_id, human_content, raw_output)
+                        VALUES (?, ?, ?)
+                    """, [(r[0], _compress_text(r[1]), _compress_text(r[2])) for r in rows])
+                    moved += len(rows)
+                if moved:
+                    conn.execute("""
+                        UPDATE agent_outputs SET human_content = NULL, raw_output = NULL
+                        WHERE human_content IS NOT NULL OR raw_output IS NOT NULL
+                    """)
+                    logger.info(f"Moved {moved} inline output blobs to agent_output_blobs")
+
+            has_totals = conn.execute("SELECT 1 FROM agent_output_totals LIMIT 1").fetchone()
+            has_outputs = conn.execute("SELECT 1 FROM agent_outputs LIMIT 1").fetchone()
+            if has_outputs and not has_totals:
+                conn.execute("""
+                    INSERT INTO agent_output_totals (agent_name, status, count)
+                    SELECT agent_name, status, COUNT(*) FROM agent_outputs
+                    GROUP BY agent_name, status
+                """)
+                conn.execute("""
+                    INSERT OR REPLACE INTO agent_output_buckets (bucket, agent_name, status, count)
+                    SELECT replace(substr(timestamp, 1, 13), ' ', 'T'), agent_name, status, COUNT(*)
+                    FROM agent_outputs
+                    GROUP BY 1, agent_name, status
+                """)
+                logger.info("Backfilled agent output rollups")
+
     def receive(self, raw_output: str) -> Dict[str, Any]:
         """
         Receive and process an agent output.
@@ -278,26 +618,68 @@ class AgentOutputBus:
         }
 
     def _log_to_database(self, event: OutputEvent) -> None:
-        """Log event to database for analytics."""
-        conn = sqlite3.connect(self.db_path)
-        conn.execute("""
-            INSERT INTO agent_outputs
-            (timestamp, agent_name, task_id, status, summary, deliverables, next_steps, metadata, human_content, raw_output)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-        """, (
-            event.timestamp.isoformat(),
-            event.agent_name,
-            event.task_id,
-            event.status.value,
-            event.summary,
-            json.dumps(event.deliverables),
-            json.dumps(event.next_steps),
-            json.dumps(event.metadata),
-            event.human_content,
-            event.raw_output
-        ))
-        conn.commit()
-        conn.close()
+        """Queue event for batched logging to the database."""
+        self._writer.submit(event)
+
+    def _write_batch(self, conn: sqlite3.Connection, events: List[OutputEvent]) -> None:
+        """
+        Insert a batch of events (runs inside the writer's transaction).
+
+        Rollups are updated in the same transaction, so they always agree
+        with agent_outputs.
+        """
+        totals: Dict[tuple, int] = {}
+        buckets: Dict[tuple, int] = {}
+        blobs = []
+
+        for event in events:
+            cursor = conn.execute("""
+                INSERT INTO agent_outputs
+                (timestamp, agent_name, task_id, status, summary, deliverables, next_steps, metadata)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+            """, (
+                event.timestamp.isoformat(),
+                event.agent_name,
+                event.task_id,
+                event.status.value,
+                event.summary,
+                json.dumps(event.deliverables),
+                json.dumps(event.next_steps),
+                json.dumps(event.metadata)
+            ))
+            if event.human_content or event.raw_output:
+                blobs.append((
+                    cursor.lastrowid,
+                    _compress_text(event.human_content),
+                    _compress_text(event.raw_output)
+                ))
+
+            status = event.status.value
+            key = (event.agent_name, status)
+            totals[key] = totals.get(key, 0) + 1
+            bucket_key = (_time_bucket(event.timestamp), event.agent_name, status)
+            buckets[bucket_key] = buckets.get(bucket_key, 0) + 1
+
+        if blobs:
+            conn.executemany("""
+                INSERT INTO agent_output_blobs (output_id, human_content, raw_output)
+                VALUES (?, ?, ?)
+            """, blobs)
+        conn.executemany("""
+            INSERT INTO agent_output_totals (agent_name, status, count) VALUES (?, ?, ?)
+            ON CONFLICT(agent_name, status) DO UPDATE SET count = count + excluded.count
+        """, [(agent, status, n) for (agent, status), n in totals.items()])
+        conn.executemany("""
+            INSERT INTO agent_output_buckets (bucket, agent_name, status, count) VALUES (?, ?, ?, ?)
+            ON CONFLICT(bucket, agent_name, status) DO UPDATE SET count = count + excluded.count
+        """, [(bucket, agent, status, n) for (bucket, agent, status), n in buckets.items()])
+
+    @contextmanager
+    def _read_connection(self) -> Iterator[sqlite3.Connection]:
+        """Borrow a pooled read connection after flushing pending writes."""
+        self._writer.flush()
+        with self._writer.reader() as conn:
+            yield conn
 
     def get_recent_outputs(self, limit: int = 50) -> List[Dict[str, Any]]:
         """
@@ -309,19 +691,26 @@ class AgentOutputBus:
         Returns:
             List of recent outputs
         """
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row
-
-        cursor = conn.execute("""
-            SELECT * FROM agent_outputs
-            ORDER BY timestamp DESC
-            LIMIT ?
-        """, (limit,))
+        with self._read_connection() as conn:
+            cursor = conn.execute("""
+                SELECT o.id, o.timestamp, o.agent_name, o.task_id, o.status, o.summary,
+                       o.deliverables, o.next_steps, o.metadata,
+                       b.human_content, b.raw_output
+                FROM agent_outputs o
+                LEFT JOIN agent_output_blobs b ON b.output_id = o.id
+                ORDER BY o.timestamp DESC
+                LIMIT ?
+            """, (limit,))
 
-        rows = cursor.fetchall()
-        conn.close()
+            rows = cursor.fetchall()
 
-        return [dict(row) for row in rows]
+        results = []
+        for row in rows:
+            output = dict(row)
+            output['human_content'] = _decompress_text(output['human_content'])
+            output['raw_output'] = _decompress_text(output['raw_output'])
+            results.append(output)
+        return results
 
     def get_agent_stats(self, agent_name: Optional[str] = None) -> Dict[str, Any]:
         """
@@ -333,64 +722,90 @@ class AgentOutputBus:
         Returns:
             Statistics dictionary
         """
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row
-
-        if agent_name:
-            cursor = conn.execute("""
-                SELECT
-                    COUNT(*) as total,
-                    SUM(CASE WHEN status = 'success' THEN 1 ELSE 0 END) as success_count,
-                    SUM(CASE WHEN status = 'partial' THEN 1 ELSE 0 END) as partial_count,
-                    SUM(CASE WHEN status = 'failed' THEN 1 ELSE 0 END) as failed_count
-                FROM agent_outputs
-                WHERE agent_name = ?
-            """, (agent_name,))
-        else:
-            cursor = conn.execute("""
-                SELECT
-                    COUNT(*) as total,
-                    SUM(CASE WHEN status = 'success' THEN 1 ELSE 0 END) as success_count,
-                    SUM(CASE WHEN status = 'partial' THEN 1 ELSE 0 END) as partial_count,
-                    SUM(CASE WHEN status = 'failed' THEN 1 ELSE 0 END) as failed_count
-                FROM agent_outputs
-            """)
-
-        stats = cursor.fetchone()
-        conn.close()
-
-        if not stats or stats[0] == 0:
+        with self._read_connection() as conn:
+            if agent_name:
+                cursor = conn.execute("""
+                    SELECT status, count FROM agent_output_totals
+                    WHERE agent_name = ?
+                """, (agent_name,))
+            else:
+                cursor = conn.execute("""
+                    SELECT status, SUM(count) FROM agent_output_totals
+                    GROUP BY status
+                """)
+
+            counts = {row[0]: row[1] or 0 for row in cursor.fetchall()}
+
+        total = sum(counts.values())
+        if total == 0:
             return {"total": 0, "success_rate": 0}
 
+        success_count = counts.get('success', 0)
         return {
-            "total": stats[0],
-            "success_count": stats[1] or 0,
-            "partial_count": stats[2] or 0,
-            "failed_count": stats[3] or 0,
-            "success_rate": (stats[1] or 0) / stats[0] if stats[0] > 0 else 0
+            "total": total,
+            "success_count": success_count,
+            "partial_count": counts.get('partial', 0),
+            "failed_count": counts.get('failed', 0),
+            "success_rate": success_count / total
         }
 
+    def get_stats_by_bucket(
+        self,
+        agent_name: Optional[str] = None,
+        since: Optional[datetime] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Get hourly output counts by status from the rollup table.
+
+        Args:
+            agent_name: Filter by specific agent (optional)
+            since: Only include buckets at or after this time (optional)
+
+        Returns:
+            List of {"bucket", "success", "partial", "failed", "total"} dicts,
+            oldest first
+        """
+        query = "SELECT bucket, status, SUM(count) FROM agent_output_buckets WHERE 1=1"
+        params: List[Any] = []
+        if agent_name:
+            query += " AND agent_name = ?"
+            params.append(agent_name)
+        if since:
+            query += " AND bucket >= ?"
+            params.append(_time_bucket(since))
+        query += " GROUP BY bucket, status ORDER BY bucket"
+
+        with self._read_connection() as conn:
+            rows = conn.execute(query, params).fetchall()
+
+        timeline: Dict[str, Dict[str, Any]] = {}
+        for bucket, status, count in rows:
+            entry = timeline.setdefault(bucket, {
+                "bucket": bucket, "success": 0, "partial": 0, "failed": 0, "total": 0
+            })
+            entry[status] = entry.get(status, 0) + count
+            entry["total"] += count
+        return list(timeline.values())
+
     def get_recent_deliverables(self, limit: int = 20) -> List[str]:
         """Get list of recent deliverables."""
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row
-
-        cursor = conn.execute("""
-            SELECT deliverables FROM agent_outputs
-            WHERE deliverables IS NOT NULL AND deliverables != '[]'
-            ORDER BY timestamp DESC
-            LIMIT ?
-        """, (limit,))
+        with self._read_connection() as conn:
+            cursor = conn.execute("""
+                SELECT deliverables FROM agent_outputs
+                WHERE deliverables IS NOT NULL AND deliverables != '[]'
+                ORDER BY timestamp DESC
+                LIMIT ?
+            """, (limit,))
+            rows = cursor.fetchall()
 
         results = []
-        for row in cursor.fetchall():
+        for row in rows:
             try:
                 deliverables = json.loads(row[0])
                 results.extend(deliverables)
             except (json.JSONDecodeError, TypeError, KeyError):
                 continue
 
-        conn.close()
         return results[:limit]
 
     def clear_old_logs(self, days_to_keep: int = 30) -> int:
@@ -403,15 +818,31 @@ class AgentOutputBus:
         Returns:
             Number of rows deleted
         """
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.execute("""
-            DELETE FROM agent_outputs
-            WHERE timestamp < datetime('now', '-' || ? || ' days')
-        """, (days_to_keep,))
-
-        deleted = cursor.rowcount
-        conn.commit()
-        conn.close()
+        def delete_old(conn: sqlite3.Connection) -> int:
+            cutoff = "timestamp < datetime('now', '-' || ? || ' days')"
+            # Hourly buckets are kept as history; per-agent totals track
+            # the rows that remain, as before.
+            conn.executemany("""
+                UPDATE agent_output_totals SET count = count - ?
+                WHERE agent_name = ? AND status = ?
+            """, conn.execute(f"""
+                SELECT COUNT(*), agent_name, status FROM agent_outputs
+                WHERE {cutoff}
+                GROUP BY agent_name, status
+            """, (days_to_keep,)).fetchall())
+            conn.execute("DELETE FROM agent_output_totals WHERE count <= 0")
+            conn.execute(f"""
+                DELETE FROM agent_output_blobs WHERE output_id IN (
+                    SELECT id FROM agent_outputs WHERE {cutoff}
+                )
+            """, (days_to_keep,))
+            cursor = conn.execute(f"""
+                DELETE FROM agent_outputs
+                WHERE {cutoff}
+            """, (days_to_keep,))
+            return cursor.rowcount
+
+        deleted = self._writer.execute_write(delete_old)
 
         logger.info(f"Cleared {deleted} old log entries (kept {days_to_keep} days)")
         return deleted
@@ -124,9 +124,26 @@ async def add_security_headers(request, call_next):
 # Startup
 # ============================================================================
 
+_safety_gate = None
+
+
+def _get_safety_gate():
+    """Get the shared safety gate, importing the safety system once."""
+    global _safety_gate
+    if _safety_gate is None:
+        from safety.gate.safety_gate import get_safety_gate
+        _safety_gate = get_safety_gate()
+    return _safety_gate
+
+
 @app.on_event("startup")
 async def startup():
     """Initialize Blackbox 5 on startup"""
+    try:
+        _get_safety_gate()
+    except Exception as e:
+        # /chat retries the import and reports the failure per request
+        print(f"Safety gate unavailable at startup: {e}", file=sys.stderr)
     await get_blackbox5()
 
 
@@ -370,40 +387,27 @@ async def chat(request: ChatRequest):
     5. Validates output with constitutional classifier
     """
     try:
-        # Import safety checks
-        from safety.kill_switch import get_kill_switch
-        from safety.safe_mode import get_safe_mode
-        from safety.constitutional_classifier import get_classifier, ContentType
+        # 1-2. Kill switch and safe mode: one read of the current gate snapshot
+        gate = _get_safety_gate()
+        blocked = gate.snapshot.rejection("agent_execution")
+        if blocked:
+            status_code, detail = blocked
+            raise HTTPException(status_code=status_code, detail=detail)
 
-        # 1. Check kill switch
-        ks = get_kill_switch()
-        if not ks.is_operational():
-            raise HTTPException(
-                status_code=503,
-                detail={
-                    "error": "Kill switch has been triggered",
-                    "reason": ks.trigger_reason.value if ks.trigger_reason else "Unknown",
-                    "message": ks.trigger_message,
-                    "recovery_available": True
-                }
-            )
+        # 3. Validate input, overlapping classification with request setup
+        input_check_pending = gate.start_input_check(request.message)
 
-        # 2. Check safe mode
-        sm = get_safe_mode()
-        if sm.is_safe_mode() and not sm.is_operation_allowed("agent_execution"):
-            raise HTTPException(
-                status_code=503,
-                detail={
-                    "error": "Agent execution not allowed in current mode",
-                    "safe_mode_level": sm.current_level.value,
-                    "enter_reason": sm.enter_reason,
-                    "allowed_operations": sm.get_limits()['allowed_operations']
-                }
-            )
+        # Get Blackbox5 instance
+        bb5 = await get_blackbox5()
+
+        # Build context
+        context = request.context or {}
+        if request.agent:
+            context['forced_agent'] = request.agent
+        if request.strategy and request.strategy != 'auto':
+            context['strategy'] = request.strategy
 
-        # 3. Validate input
-        classifier = get_classifier()
-        input_check = classifier.check_input(request.message, ContentType.USER_INPUT)
+        input_check = await input_check_pending
         if not input_check.safe:
             raise HTTPException(
                 status_code=400,
@@ -415,16 +419,6 @@ async def chat(request: ChatRequest):
                 }
             )
 
-        # Get Blackbox5 instance
-        bb5 = await get_blackbox5()
-
-        # Build context
-        context = request.context or {}
-        if request.agent:
-            context['forced_agent'] = request.agent
-        if request.strategy and request.strategy != 'auto':
-            context['strategy'] = request.strategy
-
         # Process request
         result = await bb5.process_request(request.message, request.session_id, context)
 
@@ -432,7 +426,7 @@ async def chat(request: ChatRequest):
         if isinstance(result, dict) and 'result' in result:
             result_output = result['result'].get('output', '')
             if isinstance(result_output, str):
-                output_check = classifier.check_output(result_output, ContentType.AGENT_OUTPUT)
+                output_check = gate.check_output(result_output)
                 if not output_check.safe:
                     raise HTTPException(
                         status_code=500,
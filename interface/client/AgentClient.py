@@ -7,7 +7,7 @@ Adapted from Auto-Claude's client.py for BlackBox5 architecture.
 This module provides a generic agent client factory with:
 - Project capability detection
 - Tool permission management
-- Project caching with TTL
+- Project caching with file-change invalidation
 - MCP server configuration support
 
 Source: .docs/research/agents/auto-claude/apps/backend/core/client.py
@@ -20,14 +20,14 @@ Key differences from Auto-Claude:
 - Prepared for future MCP server integration
 """
 
-import copy
 import json
 import logging
 import os
 import threading
 import time
 from pathlib import Path
-from typing import Any, Optional
+from types import MappingProxyType
+from typing import Any, Mapping, Optional
 
 logger = logging.getLogger(__name__)
 
@@ -36,15 +36,115 @@ logger = logging.getLogger(__name__)
 # =============================================================================
 # Caches project index and capabilities to avoid reloading on every call.
 # This significantly reduces the time to create new agent sessions.
-
-_PROJECT_INDEX_CACHE: dict[str, tuple[dict[str, Any], dict[str, bool], float]] = {}
-_CACHE_TTL_SECONDS = 300  # 5 minute TTL
+#
+# Entries are invalidated by file changes rather than a TTL: when the
+# optional ``watchdog`` package is installed the project's blackbox5
+# directory is watched for events, otherwise each lookup compares a cheap
+# stat fingerprint of the index file. Cached data is frozen once at load
+# time, so hits return shared read-only views instead of deep copies.
+
+try:
+    from watchdog.events import FileSystemEventHandler
+    from watchdog.observers import Observer
+
+    WATCHDOG_AVAILABLE = True
+except ImportError:
+    WATCHDOG_AVAILABLE = False
+
+_PROJECT_INDEX_CACHE: dict[str, "_CachedProject"] = {}
 _CACHE_LOCK = threading.Lock()  # Protects _PROJECT_INDEX_CACHE access
+_OBSERVER = None  # Shared watchdog observer, started on first watch
+
+
+class _CachedProject:
+    """A cached, frozen project index with its invalidation state."""
+
+    __slots__ = ("index", "capabilities", "fingerprint", "watched", "stale")
+
+    def __init__(self, index, capabilities, fingerprint, watched=False):
+        self.index = index
+        self.capabilities = capabilities
+        self.fingerprint = fingerprint
+        self.watched = watched
+        self.stale = False
+
+
+def _index_file(project_dir: Path) -> Path:
+    return project_dir / "blackbox5" / "project_index.json"
+
+
+def _index_fingerprint(project_dir: Path) -> Optional[tuple]:
+    """Stat fingerprint of the project index file (None if missing)."""
+    try:
+        st = _index_file(project_dir).stat()
+    except OSError:
+        return None
+    return (st.st_mtime_ns, st.st_size, st.st_ino)
+
+
+def _freeze(value: Any) -> Any:
+    """Recursively convert dicts to read-only mappings and lists to tuples."""
+    if isinstance(value, dict):
+        return MappingProxyType({k: _freeze(v) for k, v in value.items()})
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(v) for v in value)
+    if isinstance(value, set):
+        return frozenset(_freeze(v) for v in value)
+    return value
+
+
+def _mark_stale(key: str) -> None:
+    """Mark a cached project stale (called from watcher threads)."""
+    with _CACHE_LOCK:
+        entry = _PROJECT_INDEX_CACHE.get(key)
+        if entry is not None:
+            entry.stale = True
+
+
+if WATCHDOG_AVAILABLE:
+
+    class _IndexChangeHandler(FileSystemEventHandler):
+        """Marks a cached project stale when its index directory changes."""
+
+        def __init__(self, key: str):
+            super().__init__()
+            self.key = key
+
+        def on_any_event(self, event):
+            _mark_stale(self.key)
+
+
+def _watch_project(key: str, project_dir: Path) -> bool:
+    """Start watching the project's blackbox5 directory. Caller holds lock."""
+    global _OBSERVER
+    if not WATCHDOG_AVAILABLE:
+        return False
+    watch_dir = _index_file(project_dir).parent
+    if not watch_dir.is_dir():
+        return False
+    try:
+        if _OBSERVER is None:
+            _OBSERVER = Observer()
+            _OBSERVER.daemon = True
+            _OBSERVER.start()
+        _OBSERVER.schedule(_IndexChangeHandler(key), str(watch_dir), recursive=False)
+        return True
+    except Exception as e:
+        logger.debug(f"Could not watch {watch_dir}, using mtime fingerprint: {e}")
+        return False
+
+
+def _is_fresh(entry: "_CachedProject", project_dir: Path) -> bool:
+    if entry.stale:
+        return False
+    if entry.watched:
+        return True
+    return entry.fingerprint == _index_fingerprint(project_dir)
 
 
 def _get_cached_project_data(
     project_dir: Path,
-) -> tuple[dict[str, Any], dict[str, bool]]:
+) -> tuple[Mapping[str, Any], Mapping[str, bool]]:
     """
     Get project index and capabilities with caching.
 
@@ -52,35 +152,33 @@ def _get_cached_project_data(
         project_dir: Path to the project directory
 
     Returns:
-        Tuple of (project_index, project_capabilities)
+        Tuple of (project_index, project_capabilities) as read-only views.
+        Nested dicts are read-only mappings and lists are tuples.
     """
     key = str(project_dir.resolve())
-    now = time.time()
     debug = os.environ.get("DEBUG", "").lower() in ("true", "1")
 
     # Check cache with lock
     with _CACHE_LOCK:
-        if key in _PROJECT_INDEX_CACHE:
-            cached_index, cached_capabilities, cached_time = _PROJECT_INDEX_CACHE[key]
-            cache_age = now - cached_time
-            if cache_age < _CACHE_TTL_SECONDS:
+        entry = _PROJECT_INDEX_CACHE.get(key)
+        if entry is not None:
+            if _is_fresh(entry, project_dir):
                 if debug:
-                    print(
-                        f"[AgentClientCache] Cache HIT for project index (age: {cache_age:.1f}s / TTL: {_CACHE_TTL_SECONDS}s)"
-                    )
+                    print("[AgentClientCache] Cache HIT for project index")
                 logger.debug(f"Using cached project index for {project_dir}")
-                # Return deep copies to prevent callers from corrupting the cache
-                return copy.deepcopy(cached_index), copy.deepcopy(cached_capabilities)
+                return entry.index, entry.capabilities
             elif debug:
-                print(
-                    f"[AgentClientCache] Cache EXPIRED for project index (age: {cache_age:.1f}s > TTL: {_CACHE_TTL_SECONDS}s)"
-                )
+                print("[AgentClientCache] Cache STALE for project index (index changed)")
 
-    # Cache miss or expired - load fresh data (outside lock to avoid blocking)
+    # Cache miss or stale - load fresh data (outside lock to avoid blocking).
+    # Fingerprint before reading so a concurrent edit is seen as a change.
     load_start = time.time()
     logger.debug(f"Loading project index for {project_dir}")
+    fingerprint = _index_fingerprint(project_dir)
     project_index = load_project_index(project_dir)
     project_capabilities = detect_project_capabilities(project_index)
+    frozen_index = _freeze(project_index)
+    frozen_capabilities = MappingProxyType(dict(project_capabilities))
 
     if debug:
         load_duration = (time.time() - load_start) * 1000
@@ -91,39 +189,43 @@ def _get_cached_project_data(
     # Store in cache with lock - use double-checked locking pattern
     # Re-check if another thread populated the cache while we were loading
     with _CACHE_LOCK:
-        if key in _PROJECT_INDEX_CACHE:
-            cached_index, cached_capabilities, cached_time = _PROJECT_INDEX_CACHE[key]
-            cache_age = now - cached_time
-            if cache_age < _CACHE_TTL_SECONDS:
-                # Another thread already cached valid data while we were loading
-                if debug:
-                    print(
-                        "[AgentClientCache] Cache was populated by another thread, using cached data"
-                    )
-                # Return deep copies to prevent callers from corrupting the cache
-                return copy.deepcopy(cached_index), copy.deepcopy(cached_capabilities)
-        # Either no cache entry or it's expired - store our fresh data
-        _PROJECT_INDEX_CACHE[key] = (project_index, project_capabilities, time.time())
+        entry = _PROJECT_INDEX_CACHE.get(key)
+        if entry is not None and entry.fingerprint == fingerprint and _is_fresh(entry, project_dir):
+            # Another thread already cached valid data while we were loading
+            if debug:
+                print(
+                    "[AgentClientCache] Cache was populated by another thread, using cached data"
+                )
+            return entry.index, entry.capabilities
 
-    # Return the freshly loaded data (no need to copy since it's not from cache)
-    return project_index, project_capabilities
+        watched = entry.watched if entry is not None else _watch_project(key, project_dir)
+        new_entry = _CachedProject(frozen_index, frozen_capabilities, fingerprint, watched)
+        # A watcher event may have fired while we were loading; re-check once
+        if watched and _index_fingerprint(project_dir) != fingerprint:
+            new_entry.stale = True
+        _PROJECT_INDEX_CACHE[key] = new_entry
+
+    return frozen_index, frozen_capabilities
 
 
 def invalidate_project_cache(project_dir: Optional[Path] = None) -> None:
     """
     Invalidate the project index cache.
 
+    Watches stay registered, so a later load reuses them.
+
     Args:
         project_dir: Specific project to invalidate, or None to clear all
     """
     with _CACHE_LOCK:
         if project_dir is None:
-            _PROJECT_INDEX_CACHE.clear()
-            logger.debug("Cleared all project index cache entries")
+            for entry in _PROJECT_INDEX_CACHE.values():
+                entry.stale = True
+            logger.debug("Invalidated all project index cache entries")
         else:
             key = str(project_dir.resolve())
             if key in _PROJECT_INDEX_CACHE:
-                del _PROJECT_INDEX_CACHE[key]
+                _PROJECT_INDEX_CACHE[key].stale = True
                 logger.debug(f"Invalidated project index cache for {project_dir}")
 
 
@@ -139,7 +241,7 @@ def load_project_index(project_dir: Path) -> dict:
     Returns:
         Parsed project index dict, or empty dict if not found
     """
-    index_file = project_dir / "blackbox5" / "project_index.json"
+    index_file = _index_file(project_dir)
     if not index_file.exists():
         logger.debug(f"No project index found at {index_file}")
         return {}
@@ -290,7 +392,7 @@ def detect_project_capabilities(project_index: dict) -> dict:
 
 def get_tools_for_agent(
     agent_type: str,
-    project_capabilities: Optional[dict] = None,
+    project_capabilities: Optional[Mapping[str, bool]] = None,
 ) -> list[str]:
     """
     Get the list of allowed tools for a specific agent type.
@@ -302,7 +404,7 @@ def get_tools_for_agent(
 
     Args:
         agent_type: Agent type identifier (e.g., 'coder', 'planner', 'qa_reviewer')
-        project_capabilities: Optional dict from detect_project_capabilities()
+        project_capabilities: Optional mapping from detect_project_capabilities()
                             containing flags like is_electron, is_web_frontend, etc.
 
     Returns:
@@ -479,7 +581,7 @@ def create_client(
     logger.info(f"Creating {agent_type} client for {project_dir}")
     logger.info(f"Model: {model}")
     logger.info(f"Max thinking tokens: {max_thinking_tokens or 'disabled'}")
-    logger.info(f"Project capabilities: {project_capabilities}")
+    logger.info(f"Project capabilities: {dict(project_capabilities)}")
     logger.info(f"Allowed tools: {len(allowed_tools)} tools")
 
     # Return configuration dict
@@ -487,7 +589,7 @@ def create_client(
         "model": model,
         "system_prompt": base_prompt,
         "allowed_tools": allowed_tools,
-        "project_capabilities": project_capabilities,
+        "project_capabilities": dict(project_capabilities),
         "max_thinking_tokens": max_thinking_tokens,
         "project_dir": str(project_dir.resolve()),
     }
@@ -18,6 +18,8 @@ Based on analysis of real production token usage patterns.
 import hashlib
 import logging
 import threading
+import time
+from collections import OrderedDict, deque
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from pathlib import Path
@@ -76,20 +78,122 @@ def estimate_messages_tokens(messages: List[Dict[str, str]]) -> int:
 # CACHED PROMPT MANAGER
 # =============================================================================
 
+try:
+    import xxhash
+    _HAS_XXHASH = True
+except ImportError:
+    _HAS_XXHASH = False
+
+
+def _fast_hash(content: str) -> str:
+    """
+    Fast, non-cryptographic content fingerprint.
+
+    Uses xxh3 when the optional ``xxhash`` package is installed and falls
+    back to an 8-byte BLAKE2b digest, which is still considerably cheaper
+    than SHA-256 for large prompt sections.
+    """
+    data = content.encode('utf-8', 'surrogatepass')
+    if _HAS_XXHASH:
+        return xxhash.xxh3_64_hexdigest(data)
+    return hashlib.blake2b(data, digest_size=8).hexdigest()
+
+
+def _split_blocks(content: str) -> List[str]:
+    """
+    Split content into paragraph blocks (each keeps its trailing blank line).
+
+    Skill and persona sections are built from shared markdown fragments, so
+    paragraph boundaries are where two sections usually start to diverge.
+    """
+    blocks = []
+    start = 0
+    while True:
+        end = content.find('\n\n', start)
+        if end == -1:
+            if start < len(content):
+                blocks.append(content[start:])
+            return blocks
+        blocks.append(content[start:end + 2])
+        start = end + 2
+
+
+class _PrefixNode:
+    """A node in the shared-prefix block trie."""
+
+    __slots__ = ('parent', 'block', 'children', 'refcount', 'nbytes')
+
+    def __init__(self, parent: Optional['_PrefixNode'], block: str):
+        self.parent = parent
+        self.block = block
+        self.children: Dict[str, '_PrefixNode'] = {}
+        self.refcount = 0
+        self.nbytes = len(block.encode('utf-8', 'surrogatepass')) if block else 0
+
+
+class _PrefixStore:
+    """
+    Block trie that stores each distinct prefix of cached sections once.
+
+    Sections that share leading blocks (a common system preamble, the same
+    persona with different skill appendices, ...) reference the same nodes,
+    so memory usage grows with the amount of *distinct* text only.
+    Not thread-safe; callers hold the manager lock.
+    """
+
+    def __init__(self):
+        self._root = _PrefixNode(None, '')
+        self.total_bytes = 0
+
+    def intern(self, content: str) -> Tuple[_PrefixNode, Tuple[str, ...]]:
+        """Store content and return its leaf node plus the shared block tuple."""
+        node = self._root
+        blocks = []
+        for block in _split_blocks(content):
+            child = node.children.get(block)
+            if child is None:
+                child = _PrefixNode(node, block)
+                node.children[block] = child
+                self.total_bytes += child.nbytes
+            child.refcount += 1
+            node = child
+            blocks.append(child.block)
+        return node, tuple(blocks)
+
+    def release(self, leaf: _PrefixNode) -> None:
+        """Drop one reference to the path ending at leaf, freeing unused blocks."""
+        node = leaf
+        while node is not self._root:
+            parent = node.parent
+            node.refcount -= 1
+            if node.refcount == 0:
+                del parent.children[node.block]
+                self.total_bytes -= node.nbytes
+            node = parent
+
+
 @dataclass
 class CachedSection:
     """A cached prompt section."""
     key: str
-    content: str
     hash: str
+    size_chars: int
     created_at: datetime
+    expires_at: float
+    blocks: Tuple[str, ...] = ()
+    node: Optional[_PrefixNode] = field(default=None, repr=False)
     access_count: int = 0
     last_accessed: Optional[datetime] = None
+    tokens: Optional[int] = None
+
+    @property
+    def content(self) -> str:
+        return ''.join(self.blocks)
 
     def to_dict(self) -> Dict[str, Any]:
         return {
             'key': self.key,
-            'content': content,
+            'content': self.content,
             'hash': self.hash,
             'created_at': self.created_at.isoformat(),
             'access_count': self.access_count,
@@ -107,6 +211,12 @@ class CachedPromptManager:
     2. Storing them with metadata
     3. Returning cache keys instead of full content
 
+    The cache is bounded: entries expire lazily after ``ttl_seconds``, and
+    the least recently used entries are evicted once ``max_entries`` or
+    ``max_bytes`` (distinct stored bytes, after prefix sharing) is exceeded.
+    The section being registered is never evicted by its own insertion, so
+    a section larger than ``max_bytes`` is kept (alone) until the next one.
+
     Usage:
         manager = CachedPromptManager()
 
@@ -121,24 +231,70 @@ class CachedPromptManager:
         ]
     """
 
-    def __init__(self, ttl_seconds: int = 3600):
+    def __init__(
+        self,
+        ttl_seconds: int = 3600,
+        max_entries: int = 512,
+        max_bytes: int = 32 * 1024 * 1024
+    ):
         """
         Initialize cached prompt manager.
 
         Args:
             ttl_seconds: Time-to-live for cache entries (default: 1 hour)
+            max_entries: Maximum number of cached sections
+            max_bytes: Maximum distinct bytes stored across all sections
         """
-        self._cache: Dict[str, CachedSection] = {}
+        self._cache: "OrderedDict[str, CachedSection]" = OrderedDict()
+        self._store = _PrefixStore()
         self._lock = threading.RLock()
         self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
 
         # Statistics
         self._cache_hits = 0
         self._cache_misses = 0
+        self._evictions = 0
+        self._expirations = 0
 
     def _compute_hash(self, content: str) -> str:
         """Compute content hash for caching."""
-        return hashlib.sha256(content.encode()).hexdigest()[:16]
+        return _fast_hash(content)
+
+    def _remove(self, key: str) -> None:
+        """Remove an entry and release its stored blocks. Caller holds lock."""
+        entry = self._cache.pop(key)
+        if entry.node is not None:
+            self._store.release(entry.node)
+
+    def _get_live(self, key: str) -> Optional[CachedSection]:
+        """Return a non-expired entry, expiring it lazily. Caller holds lock."""
+        entry = self._cache.get(key)
+        if entry is None:
+            return None
+        if time.monotonic() >= entry.expires_at:
+            self._remove(key)
+            self._expirations += 1
+            logger.debug(f"Cache EXPIRED: {key}")
+            return None
+        return entry
+
+    def _evict(self, keep: Optional[str] = None) -> None:
+        """
+        Evict least recently used entries until within bounds, never
+        evicting ``keep``. Caller holds lock.
+        """
+        while self._cache and (
+            len(self._cache) > self.max_entries
+            or self._store.total_bytes > self.max_bytes
+        ):
+            key = next(iter(self._cache))
+            if key == keep:
+                break
+            self._remove(key)
+            self._evictions += 1
+            logger.debug(f"Cache EVICT: {key}")
 
     def register(
         self,
@@ -157,30 +313,44 @@ class CachedPromptManager:
         Returns:
             Cache reference token
         """
-        content_hash = self._compute_hash(content)
         now = datetime.now()
 
         with self._lock:
-            # Check if already cached with same content
-            if not force and key in self._cache:
-                existing = self._cache[key]
+            existing = self._get_live(key)
+            content_hash = None
+
+            # Check if already cached with same content. A length mismatch
+            # is a guaranteed change, so only hash when lengths agree.
+            if not force and existing is not None and existing.size_chars == len(content):
+                content_hash = self._compute_hash(content)
                 if existing.hash == content_hash:
                     existing.access_count += 1
                     existing.last_accessed = now
+                    self._cache.move_to_end(key)
                     self._cache_hits += 1
                     logger.debug(f"Cache HIT: {key} (access #{existing.access_count})")
                     return f"[CACHE:{key}]"
 
+            if existing is not None:
+                self._remove(key)
+            if content_hash is None:
+                content_hash = self._compute_hash(content)
+
             # Add new cache entry
+            node, blocks = self._store.intern(content)
             self._cache[key] = CachedSection(
                 key=key,
-                content=content,
                 hash=content_hash,
+                size_chars=len(content),
                 created_at=now,
+                expires_at=time.monotonic() + self.ttl_seconds,
+                blocks=blocks,
+                node=node,
                 access_count=1,
                 last_accessed=now
             )
             self._cache_misses += 1
+            self._evict(keep=key)
             logger.debug(f"Cache MISS: {key} (registered {len(content)} chars)")
             return f"[CACHE:{key}]"
 
@@ -195,15 +365,16 @@ class CachedPromptManager:
             The cached content, or empty string if not found
         """
         with self._lock:
-            if key not in self._cache:
+            entry = self._get_live(key)
+            if entry is None:
                 logger.warning(f"Cache key not found: {key}")
                 return ""
 
-            entry = self._cache[key]
             entry.access_count += 1
             entry.last_accessed = datetime.now()
+            self._cache.move_to_end(key)
 
-            logger.debug(f"Retrieved cached: {key} ({len(entry.content)} chars)")
+            logger.debug(f"Retrieved cached: {key} ({entry.size_chars} chars)")
             return entry.content
 
     def get_reference(self, key: str) -> Optional[str]:
@@ -213,7 +384,7 @@ class CachedPromptManager:
         Returns "[CACHE:key]" if cached, None otherwise.
         """
         with self._lock:
-            if key in self._cache:
+            if self._get_live(key) is not None:
                 return f"[CACHE:{key}]"
             return None
 
@@ -247,23 +418,29 @@ class CachedPromptManager:
 
     def cleanup_expired(self) -> int:
         """Remove expired cache entries. Returns count removed."""
-        now = datetime.now()
-        expired = []
+        now = time.monotonic()
 
         with self._lock:
-            for key, entry in self._cache.items():
-                age = now - entry.created_at
-                if age.total_seconds() > self.ttl_seconds:
-                    expired.append(key)
+            expired = [
+                key for key, entry in self._cache.items()
+                if now >= entry.expires_at
+            ]
 
             for key in expired:
-                del self._cache[key]
+                self._remove(key)
+            self._expirations += len(expired)
 
             if expired:
                 logger.info(f"Cleaned up {len(expired)} expired cache entries")
 
         return len(expired)
 
+    def _entry_tokens(self, entry: CachedSection) -> int:
+        """Token estimate for an entry, computed once per entry."""
+        if entry.tokens is None:
+            entry.tokens = estimate_tokens(entry.content)
+        return entry.tokens
+
     def get_stats(self) -> Dict[str, Any]:
         """Get cache statistics."""
         with self._lock:
@@ -273,7 +450,11 @@ class CachedPromptManager:
 
             # Estimate tokens saved
             tokens_saved = sum(
-                estimate_tokens(entry.content) * (entry.access_count - 1)
+                self._entry_tokens(entry) * (entry.access_count - 1)
+                for entry in self._cache.values()
+            )
+            logical_bytes = sum(
+                sum(len(b.encode('utf-8', 'surrogatepass')) for b in entry.blocks)
                 for entry in self._cache.values()
             )
 
@@ -283,11 +464,16 @@ class CachedPromptManager:
                 'cache_misses': self._cache_misses,
                 'hit_rate': hit_rate,
                 'tokens_saved': tokens_saved,
+                'evictions': self._evictions,
+                'expirations': self._expirations,
+                'stored_bytes': self._store.total_bytes,
+                'logical_bytes': logical_bytes,
+                'max_bytes': self.max_bytes,
                 'entries': [
                     {
                         'key': e.key,
-                        'size_chars': len(e.content),
-                        'size_tokens': estimate_tokens(e.content),
+                        'size_chars': e.size_chars,
+                        'size_tokens': self._entry_tokens(e),
                         'access_count': e.access_count,
                         'age_seconds': (datetime.now() - e.created_at).total_seconds()
                     }
@@ -465,6 +651,161 @@ def estimate_task_type(task_description: str) -> str:
 # CONVERSATION TRIMMING
 # =============================================================================
 
+class MessageWindow:
+    """
+    Token-accounted view over a conversation history.
+
+    Each message's token count is estimated exactly once when it enters the
+    window, and running totals are kept so that trimming and consolidation
+    never re-estimate the whole history.
+
+    Layout (in output order):
+    1. System messages (pinned, never dropped by trimming)
+    2. An optional summary slot holding consolidated older messages
+    3. Conversation messages, oldest first
+
+    Usage:
+        window = MessageWindow(history)
+        window.trim_to(8000)
+        window.consolidate(keep_count=10)
+        messages = window.to_messages()
+    """
+
+    def __init__(
+        self,
+        messages: Optional[List[Dict[str, str]]] = None,
+        keep_system: bool = True
+    ):
+        """
+        Initialize message window.
+
+        Args:
+            messages: Initial messages (chronological)
+            keep_system: Keep system messages; if False they are discarded
+        """
+        self.keep_system = keep_system
+        self._system: List[Tuple[Dict[str, str], int]] = []
+        self._conversation: "deque[Tuple[Dict[str, str], int]]" = deque()
+        self._summary: Optional[Tuple[Dict[str, str], int]] = None
+        self._summary_parts: List[str] = []
+        self._summarized_count = 0
+        self._system_tokens = 0
+        self._conversation_tokens = 0
+
+        for msg in messages or []:
+            self.append(msg)
+
+    def __len__(self) -> int:
+        return len(self._system) + (1 if self._summary else 0) + len(self._conversation)
+
+    @property
+    def system_tokens(self) -> int:
+        return self._system_tokens
+
+    @property
+    def summary_tokens(self) -> int:
+        return self._summary[1] if self._summary else 0
+
+    @property
+    def conversation_tokens(self) -> int:
+        return self._conversation_tokens
+
+    @property
+    def total_tokens(self) -> int:
+        return self._system_tokens + self.summary_tokens + self._conversation_tokens
+
+    @property
+    def system_count(self) -> int:
+        return len(self._system)
+
+    @property
+    def conversation_count(self) -> int:
+        return len(self._conversation)
+
+    def append(self, message: Dict[str, str]) -> None:
+        """Add a message, estimating its tokens once."""
+        tokens = estimate_tokens(message.get('content', ''))
+        if message.get('role') == 'system':
+            if self.keep_system:
+                self._system.append((message, tokens))
+                self._system_tokens += tokens
+        else:
+            self._conversation.append((message, tokens))
+            self._conversation_tokens += tokens
+
+    def drop_oldest(self) -> Tuple[Dict[str, str], int]:
+        """Remove and return the oldest conversation message and its tokens."""
+        message, tokens = self._conversation.popleft()
+        self._conversation_tokens -= tokens
+        return message, tokens
+
+    def set_summary(self, message: Optional[Dict[str, str]]) -> None:
+        """Place a message in the summary slot (or clear it with None)."""
+        if message is None:
+            self._summary = None
+        else:
+            self._summary = (message, estimate_tokens(message.get('content', '')))
+
+    def trim_to(self, max_tokens: int) -> int:
+        """
+        Drop oldest conversation messages until the window fits max_tokens.
+
+        If system messages alone exceed the budget, only the first system
+        message is kept. Returns the number of messages dropped.
+        """
+        before = len(self)
+
+        if self._system_tokens >= max_tokens:
+            logger.warning(
+                f"System messages alone exceed budget: {self._system_tokens} > {max_tokens}"
+            )
+            self._system = self._system[:1]
+            self._system_tokens = sum(t for _, t in self._system)
+            self._summary = None
+            self._conversation.clear()
+            self._conversation_tokens = 0
+            return before - len(self)
+
+        while self._conversation and self.total_tokens > max_tokens:
+            self.drop_oldest()
+
+        if self.total_tokens > max_tokens:
+            self._summary = None
+
+        return before - len(self)
+
+    def consolidate(self, keep_count: int, excerpt_chars: int = 200) -> int:
+        """
+        Fold all but the most recent keep_count messages into the summary slot.
+
+        Returns the number of messages summarized.
+        """
+        folded = 0
+        while len(self._conversation) > keep_count:
+            message, _ = self.drop_oldest()
+            role = message.get('role', 'unknown')
+            content = message.get('content', '')[:excerpt_chars]
+            self._summary_parts.append(f"{role}: {content}...")
+            folded += 1
+
+        if folded:
+            self._summarized_count += folded
+            self.set_summary({
+                'role': 'system',
+                'content': f"[Summary of {self._summarized_count} previous messages]\n" +
+                          "\n".join(self._summary_parts)
+            })
+        return folded
+
+    def to_messages(self) -> List[Dict[str, str]]:
+        """Return the window contents as a message list."""
+        result = [m for m, _ in self._system]
+        if self._summary:
+            result.append(self._summary[0])
+        result.extend(m for m, _ in self._conversation)
+        return result
+
+
 def trim_messages_by_tokens(
     messages: List[Dict[str, str]],
     max_tokens: int,
@@ -489,36 +830,9 @@ def trim_messages_by_tokens(
     if not messages:
         return []
 
-    # Separate system and non-system messages
-    system_msgs = [m for m in messages if m.get('role') == 'system'] if keep_system else []
-    other_msgs = [m for m in messages if m.get('role') != 'system']
-
-    # Calculate system message tokens
-    system_tokens = sum(estimate_tokens(m.get('content', '')) for m in system_msgs)
-    remaining_budget = max_tokens - system_tokens
-
-    if remaining_budget <= 0:
-        logger.warning(f"System messages alone exceed budget: {system_tokens} > {max_tokens}")
-        return system_msgs[:1]  # Return just first system message
-
-    # Add non-system messages from most recent until budget exceeded
-    result_msgs = list(system_msgs)
-    current_tokens = system_tokens
-
-    for msg in reversed(other_msgs):
-        msg_tokens = estimate_tokens(msg.get('content', ''))
-
-        if current_tokens + msg_tokens <= remaining_budget:
-            result_msgs.insert(len(system_msgs), msg)
-            current_tokens += msg_tokens
-        else:
-            break
-
-    # Sort by original order (keep chronological sequence)
-    if len(result_msgs) > len(system_msgs):
-        # Non-system messages were added in reverse, need to fix order
-        non_system = result_msgs[len(system_msgs):]
-        result_msgs = system_msgs + non_system
+    window = MessageWindow(messages, keep_system=keep_system)
+    window.trim_to(max_tokens)
+    result_msgs = window.to_messages()
 
     dropped = len(messages) - len(result_msgs)
     if dropped > 0:
@@ -549,31 +863,11 @@ def consolidate_messages(
     if len(messages) <= target_count:
         return messages
 
-    # Separate messages
-    system_msgs = [m for m in messages if m.get('role') == 'system']
-    other_msgs = [m for m in messages if m.get('role') != 'system']
-
-    # Keep recent messages
-    keep_count = max(target_count - len(system_msgs) - 1, 5)
-    recent_msgs = other_msgs[-keep_count:]
-    old_msgs = other_msgs[:-keep_count]
-
-    # Consolidate old messages
-    if old_msgs:
-        # Create a summary of old messages
-        summary_parts = []
-        for msg in old_msgs:
-            role = msg.get('role', 'unknown')
-            content = msg.get('content', '')[:200]  # Truncate
-            summary_parts.append(f"{role}: {content}...")
-
-        summary_msg = {
-            'role': 'system',
-            'content': f"[Summary of {len(old_msgs)} previous messages]\n" +
-                      "\n".join(summary_parts)
-        }
+    window = MessageWindow(messages)
+    keep_count = max(target_count - window.system_count - 1, 5)
 
-        return system_msgs + [summary_msg] + recent_msgs
+    if window.consolidate(keep_count):
+        return window.to_messages()
 
     return messages
 
@@ -673,7 +967,8 @@ class TokenOptimizer:
         # Calculate original tokens
         original_system = estimate_tokens(system_prompt)
         original_persona = estimate_tokens(agent_persona)
-        original_conversation = estimate_messages_tokens(conversation_history)
+        window = MessageWindow(conversation_history)
+        original_conversation = window.total_tokens
         original_code = estimate_tokens(code_context)
         original_query = estimate_tokens(user_query)
         original_total = original_system + original_persona + original_conversation + original_code + original_query
@@ -696,35 +991,37 @@ class TokenOptimizer:
 
         # Step 2: Trim conversation to budget
         if self.enable_trimming:
-            conversation_history = trim_messages_by_tokens(
-                conversation_history,
-                max_tokens=budget.conversation,
-                keep_system=True
-            )
+            dropped = window.trim_to(budget.conversation)
+            if dropped:
+                logger.info(f"Dropped {dropped} messages to fit {budget.conversation} token budget")
 
         # Step 3: Consolidate if still too long
-        if self.enable_consolidation and len(conversation_history) > 20:
-            conversation_history = consolidate_messages(conversation_history, target_count=15)
+        if self.enable_consolidation and len(window) > 20:
+            window.consolidate(keep_count=max(15 - window.system_count - 1, 5))
+        conversation_history = window.to_messages()
 
         # Step 4: Trim code context to budget
         code_context = self._trim_text_to_tokens(code_context, budget.code_context)
 
         # Step 5: Build optimized messages
         messages = [
-            {'role': 'system', 'content': self.cache.get(system_key)},
-            {'role': 'system', 'content': self.cache.get(persona_key)},
+            {'role': 'system', 'content': system_prompt},
+            {'role': 'system', 'content': agent_persona},
             *conversation_history,
             {'role': 'user', 'content': f"Context:\n{code_context}\n\n{user_query}"}
         ]
 
-        # Calculate optimized tokens
-        optimized_conversation = estimate_messages_tokens(conversation_history)
+        # Calculate optimized tokens (per-message counts are already known)
+        optimized_conversation = window.total_tokens
         optimized_code = estimate_tokens(code_context)
 
         stats['optimized_tokens'] = {
             'conversation': optimized_conversation,
             'code_context': optimized_code,
-            'total': estimate_messages_tokens(messages),
+            'total': (
+                original_system + original_persona + optimized_conversation +
+                estimate_tokens(messages[-1]['content'])
+            ),
         }
 
         stats['cache_stats'] = self.cache.get_stats()
@@ -738,7 +1035,7 @@ class TokenOptimizer:
 
     def _compute_hash(self, content: str) -> str:
         """Compute hash for cache key."""
-        return hashlib.sha256(content.encode()).hexdigest()[:12]
+        return _fast_hash(content)[:12]
 
     def _trim_text_to_tokens(self, text: str, max_tokens: int) -> str:
         """Trim text to fit within token budget."""
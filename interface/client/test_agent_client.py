@@ -0,0 +1,220 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the AgentClient project cache
+
+Tests fingerprint and watcher invalidation of cached project indexes and
+the read-only views returned on cache hits.
+Run with: pytest test_agent_client.py -v
+"""
+
+import json
+import os
+import shutil
+import tempfile
+import unittest
+from unittest.mock import patch
+
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent))
+
+import AgentClient
+from AgentClient import _get_cached_project_data, create_client, invalidate_project_cache
+
+
+class CacheTestCase(unittest.TestCase):
+    """Creates a temporary project and clears the cache around each test."""
+
+    def setUp(self):
+        self.project_dir = Path(tempfile.mkdtemp())
+        (self.project_dir / "blackbox5").mkdir()
+        self.index_file = self.project_dir / "blackbox5" / "project_index.json"
+        AgentClient._PROJECT_INDEX_CACHE.clear()
+
+    def tearDown(self):
+        AgentClient._PROJECT_INDEX_CACHE.clear()
+        shutil.rmtree(self.project_dir)
+
+    def write_index(self, framework, **extra):
+        service = {"framework": framework, "dependencies": ["express"], **extra}
+        self.index_file.write_text(json.dumps({"services": {"web": service}}))
+
+
+class TestFingerprintInvalidation(CacheTestCase):
+    """Test cache invalidation by index file stat fingerprint."""
+
+    def setUp(self):
+        super().setUp()
+        patcher = patch.object(AgentClient, "_watch_project", return_value=False)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_unchanged_index_is_a_cache_hit(self):
+        """Test that repeated lookups return the same cached views."""
+        self.write_index("react")
+        first = _get_cached_project_data(self.project_dir)
+
+        with patch.object(AgentClient, "load_project_index") as load:
+            second = _get_cached_project_data(self.project_dir)
+
+        load.assert_not_called()
+        self.assertIs(first[0], second[0])
+        self.assertIs(first[1], second[1])
+
+    def test_edited_index_invalidates_cache(self):
+        """Test that rewriting the index is picked up on the next lookup."""
+        self.write_index("react")
+        _, capabilities = _get_cached_project_data(self.project_dir)
+        self.assertTrue(capabilities["is_web_frontend"])
+        self.assertFalse(capabilities["is_nextjs"])
+
+        self.write_index("nextjs")
+        index, capabilities = _get_cached_project_data(self.project_dir)
+
+        self.assertEqual(index["services"]["web"]["framework"], "nextjs")
+        self.assertTrue(capabilities["is_nextjs"])
+
+    def test_same_size_edit_detected_by_mtime(self):
+        """Test that an edit which keeps the file size is still detected."""
+        self.write_index("vue")
+        _get_cached_project_data(self.project_dir)
+
+        self.write_index("nuxt")
+        stat = self.index_file.stat()
+        os.utime(self.index_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+        _, capabilities = _get_cached_project_data(self.project_dir)
+
+        self.assertTrue(capabilities["is_nuxt"])
+
+    def test_created_and_deleted_index(self):
+        """Test that creating or deleting the index invalidates the cache."""
+        index, _ = _get_cached_project_data(self.project_dir)
+        self.assertEqual(dict(index), {})
+
+        self.write_index("react")
+        index, _ = _get_cached_project_data(self.project_dir)
+        self.assertIn("services", index)
+
+        self.index_file.unlink()
+        index, capabilities = _get_cached_project_data(self.project_dir)
+        self.assertEqual(dict(index), {})
+        self.assertFalse(capabilities["is_web_frontend"])
+
+    def test_invalidate_project_cache_forces_reload(self):
+        """Test explicit invalidation of one project and of all projects."""
+        self.write_index("react")
+        first, _ = _get_cached_project_data(self.project_dir)
+
+        invalidate_project_cache(self.project_dir)
+        second, _ = _get_cached_project_data(self.project_dir)
+        self.assertIsNot(first, second)
+
+        invalidate_project_cache()
+        third, _ = _get_cached_project_data(self.project_dir)
+        self.assertIsNot(second, third)
+
+
+class TestWatcherInvalidation(CacheTestCase):
+    """Test cache invalidation by file watcher events."""
+
+    def setUp(self):
+        super().setUp()
+        self.watched = []
+
+        def fake_watch(key, project_dir):
+            self.watched.append(key)
+            return True
+
+        patcher = patch.object(AgentClient, "_watch_project", side_effect=fake_watch)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_watched_entry_skips_stat_until_event(self):
+        """Test that a watched entry is fresh until a change event arrives."""
+        self.write_index("react")
+        first, _ = _get_cached_project_data(self.project_dir)
+
+        with patch.object(AgentClient, "_index_fingerprint") as fingerprint:
+            self.assertIs(_get_cached_project_data(self.project_dir)[0], first)
+        fingerprint.assert_not_called()
+
+        self.write_index("nextjs")
+        AgentClient._mark_stale(self.watched[0])
+        index, capabilities = _get_cached_project_data(self.project_dir)
+
+        self.assertTrue(capabilities["is_nextjs"])
+        self.assertIsNot(index, first)
+        # The existing watch is reused rather than registered again
+        self.assertEqual(len(self.watched), 1)
+
+    def test_event_during_load_marks_new_entry_stale(self):
+        """Test that an edit racing the load is not cached as fresh."""
+        self.write_index("react")
+        real_load = AgentClient.load_project_index
+
+        def load_then_edit(project_dir):
+            index = real_load(project_dir)
+            self.write_index("nextjs")
+            return index
+
+        with patch.object(AgentClient, "load_project_index", side_effect=load_then_edit):
+            _get_cached_project_data(self.project_dir)
+
+        _, capabilities = _get_cached_project_data(self.project_dir)
+        self.assertTrue(capabilities["is_nextjs"])
+
+    @unittest.skipUnless(AgentClient.WATCHDOG_AVAILABLE, "watchdog not installed")
+    def test_handler_marks_entry_stale(self):
+        """Test that the watchdog handler invalidates its project."""
+        self.write_index("react")
+        _get_cached_project_data(self.project_dir)
+
+        AgentClient._IndexChangeHandler(self.watched[0]).on_any_event(None)
+
+        self.assertTrue(AgentClient._PROJECT_INDEX_CACHE[self.watched[0]].stale)
+
+
+class TestFrozenViews(CacheTestCase):
+    """Test that cached results cannot be mutated by callers."""
+
+    def setUp(self):
+        super().setUp()
+        patcher = patch.object(AgentClient, "_watch_project", return_value=False)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.write_index("react", api={"routes": ["/a", "/b"]})
+
+    def test_index_rejects_mutation(self):
+        """Test that nested mappings are read-only and lists are tuples."""
+        index, _ = _get_cached_project_data(self.project_dir)
+        web = index["services"]["web"]
+
+        with self.assertRaises(TypeError):
+            index["services"] = {}
+        with self.assertRaises(TypeError):
+            web["framework"] = "vue"
+        with self.assertRaises(TypeError):
+            web["api"]["routes"][0] = "/c"
+        self.assertEqual(web["api"]["routes"], ("/a", "/b"))
+        self.assertEqual(web["dependencies"], ("express",))
+
+    def test_capabilities_reject_mutation(self):
+        """Test that cached capabilities cannot be changed through a hit."""
+        _, capabilities = _get_cached_project_data(self.project_dir)
+
+        with self.assertRaises(TypeError):
+            capabilities["is_electron"] = True
+        _, again = _get_cached_project_data(self.project_dir)
+        self.assertFalse(again["is_electron"])
+
+    def test_create_client_returns_mutable_copy(self):
+        """Test that create_client hands out its own capabilities dict."""
+        config = create_client(self.project_dir)
+        config["project_capabilities"]["is_electron"] = True
+
+        _, capabilities = _get_cached_project_data(self.project_dir)
+        self.assertFalse(capabilities["is_electron"])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,187 @@
+#!/usr/bin/env python3
+"""
+Unit tests for TokenOptimizer
+
+Tests the bounded prompt cache and conversation trimming helpers.
+Run with: pytest test_token_optimizer.py -v
+"""
+
+import unittest
+from unittest.mock import patch
+
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent))
+
+import TokenOptimizer
+from TokenOptimizer import (
+    CachedPromptManager,
+    MessageWindow,
+    TokenOptimizer as Optimizer,
+    consolidate_messages,
+    trim_messages_by_tokens,
+)
+
+
+class TestCachedPromptManager(unittest.TestCase):
+    """Test cases for CachedPromptManager."""
+
+    def test_register_hit_and_get(self):
+        """Test that re-registering identical content is a cache hit."""
+        manager = CachedPromptManager()
+        manager.register('system', 'You are a helpful agent.')
+        manager.register('system', 'You are a helpful agent.')
+
+        stats = manager.get_stats()
+        self.assertEqual(stats['cache_hits'], 1)
+        self.assertEqual(stats['cache_misses'], 1)
+        self.assertEqual(manager.get('system'), 'You are a helpful agent.')
+
+    def test_changed_content_replaces_entry(self):
+        """Test that changed content is detected and stored."""
+        manager = CachedPromptManager()
+        manager.register('persona', 'version one')
+        manager.register('persona', 'version two')
+
+        self.assertEqual(manager.get('persona'), 'version two')
+        self.assertEqual(manager.get_stats()['cache_misses'], 2)
+
+    def test_lru_eviction_by_entry_count(self):
+        """Test that least recently used entries are evicted first."""
+        manager = CachedPromptManager(max_entries=2)
+        manager.register('a', 'alpha')
+        manager.register('b', 'beta')
+        manager.get('a')
+        manager.register('c', 'gamma')
+
+        self.assertIsNotNone(manager.get_reference('a'))
+        self.assertIsNone(manager.get_reference('b'))
+        self.assertEqual(manager.get_stats()['evictions'], 1)
+
+    def test_eviction_by_byte_size(self):
+        """Test that the byte limit bounds stored content."""
+        manager = CachedPromptManager(max_bytes=100)
+        manager.register('a', 'x' * 60)
+        manager.register('b', 'y' * 60)
+
+        self.assertIsNone(manager.get_reference('a'))
+        self.assertLessEqual(manager.get_stats()['stored_bytes'], 100)
+
+    def test_oversized_entry_is_not_evicted_on_insert(self):
+        """Test that a section larger than max_bytes is still retrievable."""
+        manager = CachedPromptManager(max_bytes=100)
+        manager.register('a', 'x' * 60)
+        self.assertEqual(manager.register('big', 'y' * 500), '[CACHE:big]')
+
+        self.assertEqual(manager.get('big'), 'y' * 500)
+        self.assertIsNone(manager.get_reference('a'))
+
+        manager.register('c', 'z' * 10)
+        self.assertIsNone(manager.get_reference('big'))
+        self.assertEqual(manager.get('c'), 'z' * 10)
+
+    def test_optimize_keeps_prompts_with_small_cache(self):
+        """Test that optimize sends the prompts even if the cache drops them."""
+        optimizer = Optimizer(cache_manager=CachedPromptManager(max_bytes=10))
+        result = optimizer.optimize(
+            system_prompt='You are a careful reviewer.',
+            agent_persona='Persona: strict but kind.',
+            conversation_history=[],
+            code_context='',
+            user_query='Review this',
+            task_type='implement'
+        )
+
+        self.assertEqual(result.messages[0]['content'], 'You are a careful reviewer.')
+        self.assertEqual(result.messages[1]['content'], 'Persona: strict but kind.')
+
+    def test_lazy_ttl_expiry(self):
+        """Test that expired entries are dropped on access."""
+        manager = CachedPromptManager(ttl_seconds=10)
+        with patch.object(TokenOptimizer.time, 'monotonic', return_value=1000.0):
+            manager.register('a', 'alpha')
+        with patch.object(TokenOptimizer.time, 'monotonic', return_value=1011.0):
+            self.assertEqual(manager.get('a'), '')
+
+        self.assertEqual(manager.get_stats()['expirations'], 1)
+        self.assertEqual(manager.get_stats()['stored_bytes'], 0)
+
+    def test_shared_prefix_stored_once(self):
+        """Test that sections sharing leading blocks share storage."""
+        manager = CachedPromptManager()
+        preamble = 'Shared instructions paragraph.\n\n' * 20
+        manager.register('skill_a', preamble + 'Skill A body')
+        manager.register('skill_b', preamble + 'Skill B body')
+
+        stats = manager.get_stats()
+        self.assertLess(stats['stored_bytes'], stats['logical_bytes'])
+        self.assertEqual(manager.get('skill_a'), preamble + 'Skill A body')
+        self.assertEqual(manager.get('skill_b'), preamble + 'Skill B body')
+
+        with manager._lock:
+            manager._remove('skill_a')
+        self.assertEqual(manager.get('skill_b'), preamble + 'Skill B body')
+
+
+class TestMessageWindow(unittest.TestCase):
+    """Test cases for MessageWindow and the trimming helpers."""
+
+    def _history(self, count, size=40):
+        return [
+            {'role': 'user' if i % 2 == 0 else 'assistant', 'content': f"{i:03d}" + 'x' * size}
+            for i in range(count)
+        ]
+
+    def test_tokens_estimated_once(self):
+        """Test that trimming does not re-estimate the history."""
+        history = self._history(500)
+        with patch.object(TokenOptimizer, 'estimate_tokens', wraps=TokenOptimizer.estimate_tokens) as est:
+            trim_messages_by_tokens(history, max_tokens=200)
+        self.assertEqual(est.call_count, 500)
+
+    def test_trim_keeps_most_recent_within_budget(self):
+        """Test that the newest messages are kept in order."""
+        system = {'role': 'system', 'content': 's' * 40}
+        history = [system] + self._history(50)
+        trimmed = trim_messages_by_tokens(history, max_tokens=100)
+
+        self.assertEqual(trimmed[0], system)
+        self.assertEqual(trimmed[-1], history[-1])
+        self.assertLessEqual(TokenOptimizer.estimate_messages_tokens(trimmed), 100)
+        self.assertEqual(trimmed[1:], history[-len(trimmed) + 1:])
+
+    def test_trim_system_over_budget(self):
+        """Test that only the first system message survives an exhausted budget."""
+        history = [
+            {'role': 'system', 'content': 'a' * 400},
+            {'role': 'system', 'content': 'b' * 400},
+        ] + self._history(5)
+        self.assertEqual(trim_messages_by_tokens(history, max_tokens=50), history[:1])
+
+    def test_consolidate_uses_summary_slot(self):
+        """Test that older messages are folded into one summary message."""
+        history = [{'role': 'system', 'content': 'base'}] + self._history(30)
+        result = consolidate_messages(history, target_count=10)
+
+        self.assertEqual(result[0], history[0])
+        self.assertTrue(result[1]['content'].startswith('[Summary of 22 previous messages]'))
+        self.assertEqual(result[2:], history[-8:])
+
+    def test_window_running_totals(self):
+        """Test that running totals follow drops and summaries."""
+        window = MessageWindow(self._history(10))
+        total = window.total_tokens
+        _, dropped = window.drop_oldest()
+        self.assertEqual(window.total_tokens, total - dropped)
+
+        window.consolidate(keep_count=3)
+        self.assertEqual(window.conversation_count, 3)
+        self.assertEqual(len(window.to_messages()), 4)
+        self.assertEqual(
+            window.total_tokens,
+            TokenOptimizer.estimate_messages_tokens(window.to_messages())
+        )
+
+
+if __name__ == '__main__':
+    unittest.main()
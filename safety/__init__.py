@@ -5,11 +5,13 @@ Provides critical safety features for multi-agent operations:
 - Kill Switch: Emergency shutdown capability
 - Safe Mode: Degraded operation mode
 - Constitutional Classifiers: Input/output content filtering
+- Safety Gate: Cached safety decision for request hot paths
 """
 
-from .kill_switch import KillSwitch, get_kill_switch, activate_emergency_shutdown
-from .safe_mode import SafeMode, SafeModeLevel, get_safe_mode
-from .constitutional_classifier import ConstitutionalClassifier, get_classifier
+from .kill_switch.kill_switch import KillSwitch, get_kill_switch, activate_emergency_shutdown
+from .safe_mode.safe_mode import SafeMode, SafeModeLevel, get_safe_mode
+from .classifier.constitutional_classifier import ConstitutionalClassifier, get_classifier
+from .gate.safety_gate import SafetyGate, get_safety_gate
 
 __all__ = [
     'KillSwitch',
@@ -20,4 +22,6 @@ __all__ = [
     'get_safe_mode',
     'ConstitutionalClassifier',
     'get_classifier',
+    'SafetyGate',
+    'get_safety_gate',
 ]
@@ -11,8 +11,10 @@ Features:
 - Harmful content blocking
 - Rate limiting
 - Content validation
+- Streaming (chunked) input/output checks
 """
 
+import atexit
 import logging
 import re
 import threading
@@ -21,6 +23,11 @@ from typing import Optional, Dict, Any, List, Tuple
 from enum import Enum
 from pathlib import Path
 
+try:
+    from re import _parser as sre_parse
+except ImportError:  # Python < 3.11
+    import sre_parse
+
 # Configure logging
 logger = logging.getLogger(__name__)
 
@@ -88,6 +95,201 @@ class Violation:
         }
 
 
+# Characters of offending content kept per recorded violation
+VIOLATION_EXCERPT_CHARS = 200
+
+
+class ViolationRecord:
+    """Compact history entry for a violation (bounded content excerpt)"""
+
+    __slots__ = ('violation_type', 'severity', 'excerpt', 'reason', 'timestamp')
+
+    def __init__(self, violation: Violation):
+        self.violation_type = violation.violation_type
+        self.severity = violation.severity
+        content = violation.content
+        self.excerpt = (
+            content[:VIOLATION_EXCERPT_CHARS] + "..."
+            if len(content) > VIOLATION_EXCERPT_CHARS else content
+        )
+        self.reason = violation.reason
+        self.timestamp = violation.timestamp
+
+    @property
+    def content(self) -> str:
+        return self.excerpt
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary"""
+        return {
+            "type": self.violation_type.value,
+            "severity": self.severity.value,
+            "content": self.excerpt,
+            "reason": self.reason,
+            "timestamp": self.timestamp.isoformat(),
+        }
+
+
+class ViolationHistory:
+    """
+    Fixed-size ring buffer of violation records with running counters.
+
+    Counters by type and severity always describe the records currently in
+    the buffer, so statistics never need a rescan. Not thread-safe; the
+    classifier lock guards access.
+    """
+
+    def __init__(self, capacity: int = 1000):
+        if capacity < 1:
+            raise ValueError(f"ViolationHistory capacity must be at least 1, got {capacity}")
+        self.capacity = capacity
+        self._slots: List[Optional[ViolationRecord]] = [None] * capacity
+        self._next = 0
+        self._size = 0
+        self.total_recorded = 0
+        self.by_type: Dict[str, int] = {}
+        self.by_severity: Dict[str, int] = {}
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __iter__(self):
+        """Iterate records oldest first"""
+        start = (self._next - self._size) % self.capacity
+        for i in range(self._size):
+            yield self._slots[(start + i) % self.capacity]
+
+    def append(self, record: ViolationRecord) -> None:
+        evicted = self._slots[self._next]
+        if evicted is not None:
+            self._count(evicted, -1)
+        else:
+            self._size += 1
+        self._slots[self._next] = record
+        self._next = (self._next + 1) % self.capacity
+        self._count(record, 1)
+        self.total_recorded += 1
+
+    def _count(self, record: ViolationRecord, delta: int) -> None:
+        type_key = record.violation_type.value
+        severity_key = record.severity.value
+        self.by_type[type_key] = self.by_type.get(type_key, 0) + delta
+        self.by_severity[severity_key] = self.by_severity.get(severity_key, 0) + delta
+        if not self.by_type[type_key]:
+            del self.by_type[type_key]
+        if not self.by_severity[severity_key]:
+            del self.by_severity[severity_key]
+
+    def clear(self) -> None:
+        self._slots = [None] * self.capacity
+        self._next = 0
+        self._size = 0
+        self.by_type.clear()
+        self.by_severity.clear()
+
+
+# Pattern categories, in priority order
+HARMFUL = "harmful"
+JAILBREAK = "jailbreak"
+SUSPICIOUS = "suspicious"
+INPUT_CATEGORIES = (HARMFUL, JAILBREAK, SUSPICIOUS)
+OUTPUT_CATEGORIES = (HARMFUL, JAILBREAK)
+
+# Cap for the streaming overlap when a pattern has an unbounded repeat
+MAX_STREAM_OVERLAP = 256
+
+# Streaming checks scan their buffer in windows of this many characters
+SCAN_WINDOW = 65536
+
+
+def _lower_pattern(pattern: str) -> str:
+    """Lowercase a regex pattern, leaving escape sequences (e.g. \\S) intact."""
+    out = []
+    i = 0
+    while i < len(pattern):
+        if pattern[i] == '\\' and i + 1 < len(pattern):
+            out.append(pattern[i:i + 2])
+            i += 2
+        else:
+            out.append(pattern[i].lower())
+            i += 1
+    return ''.join(out)
+
+
+def _first_chars(items: List[Tuple[Any, Any]]) -> Optional[set]:
+    """Literal characters a parsed pattern can start with (None if unknown)."""
+    if not items:
+        return None
+    op, av = items[0]
+    if op is sre_parse.LITERAL:
+        return {chr(av)}
+    if op is sre_parse.SUBPATTERN:
+        return _first_chars(list(av[-1]))
+    if op in (sre_parse.MAX_REPEAT, sre_parse.MIN_REPEAT) and av[0] >= 1:
+        return _first_chars(list(av[2]))
+    if op is sre_parse.BRANCH:
+        chars = set()
+        for alternative in av[1]:
+            first = _first_chars(list(alternative))
+            if first is None:
+                return None
+            chars |= first
+        return chars
+    if op is sre_parse.IN:
+        chars = set()
+        for in_op, in_av in av:
+            if in_op is not sre_parse.LITERAL:
+                return None
+            chars.add(chr(in_av))
+        return chars
+    return None
+
+
+def _compile_combined(
+    categories: Tuple[Tuple[str, List[str]], ...],
+    ignore_case: bool = False
+) -> 're.Pattern':
+    """
+    Compile all category patterns into one zero-width scanner.
+
+    By default the scanner is lowercase and case-sensitive (for lowercased
+    text). When every pattern starts with a known literal, a first-character
+    class is checked before the alternation so most positions are rejected
+    cheaply.
+    """
+    if ignore_case:
+        return re.compile(
+            '(?=' + '|'.join(
+                f"(?P<{name}>{'|'.join(patterns)})" for name, patterns in categories
+            ) + ')',
+            re.IGNORECASE | re.MULTILINE
+        )
+
+    first: Optional[set] = set()
+    groups = []
+    for name, patterns in categories:
+        lowered = [_lower_pattern(p) for p in patterns]
+        groups.append(f"(?P<{name}>{'|'.join(lowered)})")
+        for pattern in lowered:
+            chars = _first_chars(list(sre_parse.parse(pattern))) if first is not None else None
+            first = first | chars if chars is not None and first is not None else None
+
+    guard = f"(?=[{re.escape(''.join(sorted(first)))}])" if first else ''
+    return re.compile(guard + '(?=' + '|'.join(groups) + ')', re.MULTILINE)
+
+
+def _max_match_width(patterns: List[str]) -> int:
+    """Longest possible match over patterns, capped at MAX_STREAM_OVERLAP."""
+    width = 0
+    for pattern in patterns:
+        try:
+            _, max_width = sre_parse.parse(pattern, re.IGNORECASE).getwidth()
+        except Exception:
+            max_width = MAX_STREAM_OVERLAP
+        width = max(width, min(max_width, MAX_STREAM_OVERLAP))
+    return width
+
+
 class ConstitutionalClassifier:
     """
     Constitutional AI classifier for BlackBox 5.
@@ -115,7 +317,7 @@ class ConstitutionalClassifier:
     Attributes:
         enabled: Whether classifier is enabled
         strict_mode: Whether to use strict checking
-        violation_history: History of violations
+        violation_history: Recent violations (compact records, oldest first)
     """
 
     # Harmful content patterns
@@ -147,12 +349,24 @@ class ConstitutionalClassifier:
         r'\.{2,}',                             # Path traversal
     ]
 
-    def __init__(self, enabled: bool = True, strict_mode: bool = True):
+    def __init__(
+        self,
+        enabled: bool = True,
+        strict_mode: bool = True,
+        history_size: int = 1000,
+        persist_interval: float = 30.0
+    ):
         self.enabled = enabled
         self.strict_mode = strict_mode
-        self.violation_history: List[Violation] = []
+        self._history = ViolationHistory(history_size)
         self._lock = threading.Lock()
 
+        # State is persisted by a background timer when dirty
+        self.persist_interval = persist_interval
+        self._state_dirty = False
+        self._persist_thread: Optional[threading.Thread] = None
+        self._persist_stop = threading.Event()
+
         # Compile patterns for performance
         self._harmful_regex = re.compile(
             '|'.join(self.HARMFUL_PATTERNS),
@@ -167,6 +381,23 @@ class ConstitutionalClassifier:
             re.IGNORECASE | re.MULTILINE
         )
 
+        # Combined single-pass scanner. Each category is a named group inside
+        # a zero-width lookahead, so every start position is examined once
+        # and, at a given position, categories are tried in priority order.
+        # ASCII content is lowercased so the combined pattern can run
+        # case-sensitively, which is several times faster than IGNORECASE;
+        # other content uses the IGNORECASE variant (see _finditer).
+        categories = (
+            (HARMFUL, self.HARMFUL_PATTERNS),
+            (JAILBREAK, self.JAILBREAK_PATTERNS),
+            (SUSPICIOUS, self.SUSPICIOUS_PATTERNS),
+        )
+        self._combined_regex = _compile_combined(categories)
+        self._combined_regex_ci = _compile_combined(categories, ignore_case=True)
+        self.stream_overlap = _max_match_width(
+            self.HARMFUL_PATTERNS + self.JAILBREAK_PATTERNS + self.SUSPICIOUS_PATTERNS
+        )
+
         # State file
         self._state_file = Path(
             "blackbox5/2-engine/01-core/safety/.classifier_state.json"
@@ -207,59 +438,19 @@ class ConstitutionalClassifier:
         if not self.enabled:
             return CheckResult(safe=True, content=content)
 
-        # Check for harmful content
-        harmful_match = self._harmful_regex.search(content)
-        if harmful_match:
-            violation = Violation(
-                violation_type=ViolationType.HARMFUL_CONTENT,
-                severity=Severity.HIGH,
-                content=content,
-                reason=f"Harmful content detected: {harmful_match.group()}",
-                context={"match": harmful_match.group(), "type": content_type.value}
-            )
-            self._record_violation(violation)
-            return CheckResult(safe=False, violation=violation, content=content)
+        matches = self._scan(content, INPUT_CATEGORIES)
 
-        # Check for jailbreak attempts
-        jailbreak_match = self._jailbreak_regex.search(content)
-        if jailbreak_match:
-            violation = Violation(
-                violation_type=ViolationType.JAILBREAK_ATTEMPT,
-                severity=Severity.CRITICAL,
-                content=content,
-                reason=f"Jailbreak attempt detected: {jailbreak_match.group()}",
-                context={"match": jailbreak_match.group(), "type": content_type.value}
-            )
-            self._record_violation(violation)
-
-            # Trigger kill switch for jailbreak attempts
-            if self.strict_mode:
-                from .kill_switch import get_kill_switch
-                ks = get_kill_switch()
-                ks.trigger(
-                    KillSwitchReason.MALICE_DETECTED,
-                    f"Jailbreak attempt: {jailbreak_match.group()}",
-                    source="constitutional_classifier"
-                )
-
-            return CheckResult(safe=False, violation=violation, content=content)
-
-        # Check for suspicious patterns
-        suspicious_match = self._suspicious_regex.search(content)
-        if suspicious_match:
-            # Lower severity for suspicious patterns (could be legitimate)
-            severity = Severity.MEDIUM if self.strict_mode else Severity.LOW
-            violation = Violation(
-                violation_type=ViolationType.MALICIOUS_CODE,
-                severity=severity,
-                content=content,
-                reason=f"Suspicious pattern detected: {suspicious_match.group()}",
-                context={"match": suspicious_match.group(), "type": content_type.value}
-            )
+        # Harmful content, then jailbreak attempts, then suspicious patterns
+        for category in INPUT_CATEGORIES:
+            if category not in matches:
+                continue
+            match = matches[category][0]
+            violation = self._input_violation(category, match, content, content_type)
             self._record_violation(violation)
-
-            # Only block in strict mode
-            if self.strict_mode:
+            if category == JAILBREAK:
+                self._on_input_jailbreak(match)
+            # Suspicious patterns are only blocked in strict mode
+            if category != SUSPICIOUS or self.strict_mode:
                 return CheckResult(safe=False, violation=violation, content=content)
 
         # Additional checks based on content type
@@ -289,43 +480,196 @@ class ConstitutionalClassifier:
         if not self.enabled:
             return CheckResult(safe=True, content=content)
 
-        # Check for harmful content in output (more strict)
-        harmful_match = self._harmful_regex.search(content)
-        if harmful_match:
-            violation = Violation(
+        matches = self._scan(content, OUTPUT_CATEGORIES)
+
+        # Harmful content in output (more strict), then bypass instructions
+        for category in OUTPUT_CATEGORIES:
+            if category in matches:
+                match = matches[category][0]
+                violation = self._output_violation(category, match, content, content_type)
+                self._record_violation(violation)
+                if category == HARMFUL:
+                    self._on_output_harmful(match)
+                return CheckResult(safe=False, violation=violation, content=content)
+
+        return CheckResult(safe=True, content=content)
+
+    def stream_input(
+        self,
+        content_type: ContentType = ContentType.USER_INPUT
+    ) -> 'StreamingCheck':
+        """
+        Start a streaming input check.
+
+        Example:
+            ```python
+            check = classifier.stream_input()
+            for chunk in chunks:
+                result = check.feed(chunk)
+                if result is not None and not result.safe:
+                    break
+            result = check.finish()
+            ```
+        """
+        return StreamingCheck(self, INPUT_CATEGORIES, content_type, is_output=False)
+
+    def stream_output(
+        self,
+        content_type: ContentType = ContentType.AGENT_OUTPUT
+    ) -> 'StreamingCheck':
+        """Start a streaming output check (see stream_input)."""
+        return StreamingCheck(self, OUTPUT_CATEGORIES, content_type, is_output=True)
+
+    def _finditer(self, text: str):
+        """
+        Iterate combined-scanner matches over text, ignoring case.
+
+        For ASCII text lowercasing is exact case folding, so the lowercase
+        scanner (several times faster than IGNORECASE) finds the same
+        matches at the same positions. Any other text is scanned with
+        IGNORECASE so case-fold equivalents (e.g. U+017F for "s") match.
+        """
+        if text.isascii():
+            return self._combined_regex.finditer(text.lower())
+        return self._combined_regex_ci.finditer(text)
+
+    def _scan(
+        self,
+        text: str,
+        categories: Tuple[str, ...]
+    ) -> Dict[str, Tuple[str, int]]:
+        """
+        Single pass over the whole text, returning (match text, start) per category.
+
+        Only the first match of each category is kept. Scanning stops once
+        the highest-priority category is found.
+        """
+        found: Dict[str, Tuple[str, int]] = {}
+        for match in self._finditer(text):
+            category = match.lastgroup
+            if category not in categories or category in found:
+                continue
+            start, match_end = match.span(category)
+            found[category] = (text[start:match_end], start)
+            if category == categories[0] or len(found) == len(categories):
+                break
+        return found
+
+    def _scan_stream(
+        self,
+        text: str,
+        categories: Tuple[str, ...],
+        pos: int = 0,
+        limit: Optional[int] = None
+    ) -> Optional[Tuple[str, str, int]]:
+        """
+        Find the first match of any category in a streaming buffer.
+
+        The buffer is scanned in windows of SCAN_WINDOW characters plus
+        stream_overlap of look-ahead. Start positions at or beyond limit
+        are not examined (but may be used as look-ahead).
+
+        Returns:
+            (category, match text, start), or None
+        """
+        end = len(text) if limit is None else min(limit, len(text))
+        window_start = pos
+
+        while window_start < end:
+            window_end = min(window_start + SCAN_WINDOW, end)
+            window = text[window_start:window_end + self.stream_overlap]
+            stop = window_end - window_start
+
+            for match in self._finditer(window):
+                if match.start() >= stop:
+                    break
+                category = match.lastgroup
+                if category not in categories:
+                    continue
+                start, match_end = match.span(category)
+                return category, window[start:match_end], window_start + start
+
+            window_start = window_end
+
+        return None
+
+    def _input_violation(
+        self,
+        category: str,
+        match: str,
+        content: str,
+        content_type: ContentType
+    ) -> Violation:
+        context = {"match": match, "type": content_type.value}
+        if category == HARMFUL:
+            return Violation(
+                violation_type=ViolationType.HARMFUL_CONTENT,
+                severity=Severity.HIGH,
+                content=content,
+                reason=f"Harmful content detected: {match}",
+                context=context
+            )
+        if category == JAILBREAK:
+            return Violation(
+                violation_type=ViolationType.JAILBREAK_ATTEMPT,
+                severity=Severity.CRITICAL,
+                content=content,
+                reason=f"Jailbreak attempt detected: {match}",
+                context=context
+            )
+        # Lower severity for suspicious patterns (could be legitimate)
+        return Violation(
+            violation_type=ViolationType.MALICIOUS_CODE,
+            severity=Severity.MEDIUM if self.strict_mode else Severity.LOW,
+            content=content,
+            reason=f"Suspicious pattern detected: {match}",
+            context=context
+        )
+
+    def _output_violation(
+        self,
+        category: str,
+        match: str,
+        content: str,
+        content_type: ContentType
+    ) -> Violation:
+        context = {"match": match, "type": content_type.value}
+        if category == HARMFUL:
+            return Violation(
                 violation_type=ViolationType.HARMFUL_CONTENT,
                 severity=Severity.CRITICAL,
                 content=content,
-                reason=f"Agent produced harmful content: {harmful_match.group()}",
-                context={"match": harmful_match.group(), "type": content_type.value}
+                reason=f"Agent produced harmful content: {match}",
+                context=context
             )
-            self._record_violation(violation)
+        return Violation(
+            violation_type=ViolationType.BYPASS_ATTEMPT,
+            severity=Severity.HIGH,
+            content=content,
+            reason=f"Agent output contains bypass instructions: {match}",
+            context=context
+        )
 
-            # Trigger kill switch for harmful output
-            from .kill_switch import get_kill_switch
+    def _on_input_jailbreak(self, match: str):
+        """Trigger kill switch for jailbreak attempts (strict mode)"""
+        if self.strict_mode:
+            from ..kill_switch.kill_switch import get_kill_switch
             ks = get_kill_switch()
             ks.trigger(
-                KillSwitchReason.SAFETY_VIOLATION,
-                f"Agent produced harmful content: {harmful_match.group()}",
+                KillSwitchReason.MALICE_DETECTED,
+                f"Jailbreak attempt: {match}",
                 source="constitutional_classifier"
             )
 
-            return CheckResult(safe=False, violation=violation, content=content)
-
-        # Check if output contains instructions to bypass safety
-        bypass_match = self._jailbreak_regex.search(content)
-        if bypass_match:
-            violation = Violation(
-                violation_type=ViolationType.BYPASS_ATTEMPT,
-                severity=Severity.HIGH,
-                content=content,
-                reason=f"Agent output contains bypass instructions: {bypass_match.group()}",
-                context={"match": bypass_match.group(), "type": content_type.value}
-            )
-            self._record_violation(violation)
-            return CheckResult(safe=False, violation=violation, content=content)
-
-        return CheckResult(safe=True, content=content)
+    def _on_output_harmful(self, match: str):
+        """Trigger kill switch for harmful output"""
+        from ..kill_switch.kill_switch import get_kill_switch
+        ks = get_kill_switch()
+        ks.trigger(
+            KillSwitchReason.SAFETY_VIOLATION,
+            f"Agent produced harmful content: {match}",
+            source="constitutional_classifier"
+        )
 
     def _check_file_operation(self, content: str) -> Optional[Violation]:
         """Check if file operation is safe"""
@@ -349,18 +693,20 @@ class ConstitutionalClassifier:
 
         return None
 
+    @property
+    def violation_history(self) -> List[ViolationRecord]:
+        """Snapshot of recent violations, oldest first"""
+        with self._lock:
+            return list(self._history)
+
     def _record_violation(self, violation: Violation):
         """Record a violation in history"""
+        record = ViolationRecord(violation)
         with self._lock:
-            self.violation_history.append(violation)
-
-            # Keep only last 1000 violations
-            if len(self.violation_history) > 1000:
-                self.violation_history = self.violation_history[-1000:]
-
-            # Save state periodically
-            if len(self.violation_history) % 100 == 0:
-                self._save_state()
+            self._history.append(record)
+            self._state_dirty = True
+            if self._persist_thread is None:
+                self._start_persistence()
 
         # Log based on severity
         if violation.severity in [Severity.HIGH, Severity.CRITICAL]:
@@ -382,32 +728,62 @@ class ConstitutionalClassifier:
     def get_stats(self) -> Dict[str, Any]:
         """Get classifier statistics"""
         with self._lock:
-            # Count by type
-            by_type = {}
-            by_severity = {}
-            for v in self.violation_history:
-                by_type[v.violation_type.value] = by_type.get(v.violation_type.value, 0) + 1
-                by_severity[v.severity.value] = by_severity.get(v.severity.value, 0) + 1
-
             return {
                 "enabled": self.enabled,
                 "strict_mode": self.strict_mode,
-                "total_violations": len(self.violation_history),
-                "violations_by_type": by_type,
-                "violations_by_severity": by_severity,
+                "total_violations": len(self._history),
+                "lifetime_violations": self._history.total_recorded,
+                "violations_by_type": dict(self._history.by_type),
+                "violations_by_severity": dict(self._history.by_severity),
             }
 
-    def _save_state(self):
-        """Save classifier state to file"""
-        try:
-            self._state_file.parent.mkdir(parents=True, exist_ok=True)
-            import json
+    def _start_persistence(self):
+        """Start the background state writer (caller holds the lock)"""
+        self._persist_thread = threading.Thread(
+            target=self._persist_loop,
+            name="ClassifierStatePersister",
+            daemon=True
+        )
+        self._persist_thread.start()
+        # Violations recorded since the last tick would be lost at exit
+        atexit.register(self.stop_persistence)
+
+    def _persist_loop(self):
+        while not self._persist_stop.wait(self.persist_interval):
+            self.flush_state()
+
+    def flush_state(self):
+        """Persist state now if it changed since the last save"""
+        with self._lock:
+            if not self._state_dirty:
+                return
+            self._state_dirty = False
             state_data = {
                 "enabled": self.enabled,
                 "strict_mode": self.strict_mode,
-                "violation_count": len(self.violation_history),
+                "violation_count": len(self._history),
+                "lifetime_violations": self._history.total_recorded,
+                "violations_by_type": dict(self._history.by_type),
                 "last_updated": datetime.now().isoformat(),
             }
+        self._save_state(state_data)
+
+    def stop_persistence(self):
+        """Stop the background writer after a final flush"""
+        self._persist_stop.set()
+        if self._persist_thread is not None:
+            self._persist_thread.join()
+            try:
+                atexit.unregister(self.stop_persistence)
+            except Exception:
+                pass
+        self.flush_state()
+
+    def _save_state(self, state_data: Dict[str, Any]):
+        """Save classifier state to file"""
+        try:
+            self._state_file.parent.mkdir(parents=True, exist_ok=True)
+            import json
             with open(self._state_file, 'w') as f:
                 json.dump(state_data, f, indent=2)
         except Exception as e:
@@ -416,7 +792,8 @@ class ConstitutionalClassifier:
     def clear_history(self):
         """Clear violation history"""
         with self._lock:
-            self.violation_history.clear()
+            self._history.clear()
+            self._state_dirty = True
             logger.info("Cleared violation history")
 
 
@@ -466,6 +843,114 @@ class CheckResult:
         }
 
 
+class StreamingCheck:
+    """
+    Incremental safety check over content that arrives in chunks.
+
+    Only a tail of ``classifier.stream_overlap`` characters (the longest
+    possible pattern match) is retained between chunks, so arbitrarily
+    large content is checked without being buffered. Start positions are
+    only examined once enough look-ahead is available; ``finish()`` checks
+    the remainder.
+
+    Unlike ``check_input``/``check_output``, which report the highest
+    priority violation found anywhere, a stream stops at the first
+    violation in stream order.
+    """
+
+    def __init__(
+        self,
+        classifier: ConstitutionalClassifier,
+        categories: Tuple[str, ...],
+        content_type: ContentType,
+        is_output: bool
+    ):
+        self.classifier = classifier
+        self.categories = categories
+        self.content_type = content_type
+        self.is_output = is_output
+        self.result: Optional[CheckResult] = None
+        self.chars_seen = 0
+        self._buffer = ""
+        self._scanned = 0  # Positions in _buffer below this were examined
+
+    @property
+    def done(self) -> bool:
+        return self.result is not None
+
+    def feed(self, chunk: str) -> Optional[CheckResult]:
+        """
+        Feed the next chunk.
+
+        Returns:
+            A blocking CheckResult on the first violation (later calls return
+            the same result), otherwise None
+        """
+        if self.result is not None:
+            return self.result
+        if not self.classifier.enabled:
+            self.chars_seen += len(chunk)
+            return None
+
+        self.chars_seen += len(chunk)
+        self._buffer += chunk
+        limit = len(self._buffer) - self.classifier.stream_overlap
+        if limit > self._scanned:
+            self._check(limit)
+            if self.result is not None and not self.result.safe:
+                return self.result
+            # Keep only the tail that still needs scanning or look-ahead
+            self._buffer = self._buffer[limit:]
+            self._scanned = 0
+        return None
+
+    def finish(self) -> CheckResult:
+        """Check the remaining buffered content and return the final result."""
+        if self.result is None:
+            if self.classifier.enabled:
+                self._check(None)
+            if self.result is None:
+                self.result = CheckResult(safe=True, content=self._buffer)
+        return self.result
+
+    def _check(self, limit: Optional[int]) -> None:
+        classifier = self.classifier
+        while True:
+            found = classifier._scan_stream(
+                self._buffer, self.categories, pos=self._scanned, limit=limit
+            )
+            if found is None:
+                self._scanned = limit if limit is not None else len(self._buffer)
+                return
+
+            category, match, start = found
+            excerpt = self._buffer
+            if self.is_output:
+                violation = classifier._output_violation(
+                    category, match, excerpt, self.content_type
+                )
+            else:
+                violation = classifier._input_violation(
+                    category, match, excerpt, self.content_type
+                )
+            classifier._record_violation(violation)
+
+            if self.is_output:
+                if category == HARMFUL:
+                    classifier._on_output_harmful(match)
+            elif category == JAILBREAK:
+                classifier._on_input_jailbreak(match)
+
+            if category == SUSPICIOUS and not classifier.strict_mode:
+                # Recorded once but not blocking; keep scanning for the rest
+                self.categories = tuple(c for c in self.categories if c != SUSPICIOUS)
+                self._scanned = start + 1
+                continue
+
+            self.result = CheckResult(safe=False, violation=violation, content=excerpt)
+            return
+
+
 # Global singleton
 _classifier: Optional[ConstitutionalClassifier] = None
 _classifier_lock = threading.Lock()
@@ -551,4 +1036,4 @@ def check_agent_output(func):
 
 
 # Import for type annotations
-from .kill_switch import KillSwitchReason
+from ..kill_switch.kill_switch import KillSwitchReason
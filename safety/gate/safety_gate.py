@@ -0,0 +1,220 @@
+"""
+Safety Gate for BlackBox 5
+
+Caches the combined kill switch / safe mode decision for request hot paths.
+
+The gate keeps an immutable, versioned snapshot of the safety state. The
+snapshot is rebuilt only when the kill switch or safe mode changes state
+(through their on_trigger/on_recover/on_enter/on_exit callbacks), so
+checking whether a request may proceed is a single attribute read.
+
+Features:
+- Versioned, immutable safety snapshots
+- Precomputed rejection details per operation
+- Cached classifier access with off-loop classification for large inputs
+"""
+
+import asyncio
+import logging
+import threading
+from datetime import datetime
+from typing import Optional, Dict, Any, Tuple
+
+from ..kill_switch.kill_switch import KillSwitch, get_kill_switch
+from ..safe_mode.safe_mode import SafeMode, SafeModeConfig, get_safe_mode
+from ..classifier.constitutional_classifier import (
+    ConstitutionalClassifier,
+    CheckResult,
+    ContentType,
+    get_classifier,
+)
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+# Inputs longer than this are classified in a worker thread so the
+# event loop can continue request setup in the meantime
+OFFLOAD_THRESHOLD_CHARS = 4096
+
+
+class GateSnapshot:
+    """
+    Immutable view of the safety state at one version.
+
+    Attributes:
+        version: Monotonic snapshot version
+        operational: Whether the kill switch allows operations
+        safe_mode_level: Current safe mode level value
+        limits: Operation limits for the current mode
+        created_at: When the snapshot was built
+    """
+
+    __slots__ = (
+        'version', 'operational', 'safe_mode_level', 'limits',
+        'created_at', '_kill_switch_detail', '_allowed', '_safe_mode_detail',
+    )
+
+    def __init__(self, version: int, kill_switch: KillSwitch, safe_mode: SafeMode):
+        self.version = version
+        self.operational = kill_switch.is_operational()
+        level = safe_mode.current_level
+        self.safe_mode_level = level.value
+        self.limits = SafeModeConfig.MODE_LIMITS[level].copy()
+        self.created_at = datetime.now()
+
+        self._kill_switch_detail: Optional[Dict[str, Any]] = None
+        if not self.operational:
+            reason = kill_switch.trigger_reason
+            self._kill_switch_detail = {
+                "error": "Kill switch has been triggered",
+                "reason": reason.value if reason else "Unknown",
+                "message": kill_switch.trigger_message,
+                "recovery_available": True
+            }
+
+        allowed = self.limits["allowed_operations"]
+        self._allowed = frozenset(allowed)
+        self._safe_mode_detail = {
+            "safe_mode_level": self.safe_mode_level,
+            "enter_reason": safe_mode.enter_reason,
+            "allowed_operations": list(allowed)
+        }
+
+    def is_operation_allowed(self, operation: str) -> bool:
+        """Check if an operation is allowed in the snapshot's mode"""
+        return "all" in self._allowed or operation in self._allowed
+
+    def rejection(self, operation: str) -> Optional[Tuple[int, Dict[str, Any]]]:
+        """
+        Get the rejection for an operation, if any.
+
+        Args:
+            operation: Operation type (agent_execution, read, write, etc.)
+
+        Returns:
+            (status_code, detail) if the operation is blocked, else None
+        """
+        if self._kill_switch_detail is not None:
+            return 503, dict(self._kill_switch_detail)
+        if not self.is_operation_allowed(operation):
+            detail = {"error": f"Operation '{operation}' not allowed in current mode"}
+            if operation == "agent_execution":
+                detail["error"] = "Agent execution not allowed in current mode"
+            detail.update(self._safe_mode_detail)
+            return 503, detail
+        return None
+
+
+class SafetyGate:
+    """
+    Versioned safety decision cache.
+
+    Subscribes to kill switch and safe mode transitions and publishes a new
+    GateSnapshot on each one. Readers never take a lock: they read
+    `snapshot` once and use it for the whole request.
+
+    Example:
+        ```python
+        gate = get_safety_gate()
+        blocked = gate.snapshot.rejection("agent_execution")
+        if blocked:
+            status_code, detail = blocked
+        ```
+    """
+
+    def __init__(
+        self,
+        kill_switch: Optional[KillSwitch] = None,
+        safe_mode: Optional[SafeMode] = None,
+        classifier: Optional[ConstitutionalClassifier] = None
+    ):
+        self._kill_switch = kill_switch or get_kill_switch()
+        self._safe_mode = safe_mode or get_safe_mode()
+        self._classifier = classifier or get_classifier()
+        self._lock = threading.Lock()
+        self._version = 0
+        self.snapshot = GateSnapshot(0, self._kill_switch, self._safe_mode)
+
+        self._kill_switch.on_trigger(self._on_kill_switch_change)
+        self._kill_switch.on_recover(self._on_kill_switch_change)
+        self._safe_mode.on_enter(self._on_safe_mode_change)
+        self._safe_mode.on_exit(self._on_safe_mode_change)
+
+    @property
+    def version(self) -> int:
+        """Version of the current snapshot"""
+        return self.snapshot.version
+
+    @property
+    def classifier(self) -> ConstitutionalClassifier:
+        """Classifier used for content checks"""
+        return self._classifier
+
+    def refresh(self) -> GateSnapshot:
+        """
+        Rebuild the snapshot from the current safety state.
+
+        Called automatically on state transitions; call directly after
+        changing state without going through those transitions.
+        """
+        with self._lock:
+            self._version += 1
+            snapshot = GateSnapshot(self._version, self._kill_switch, self._safe_mode)
+            self.snapshot = snapshot
+        logger.debug(f"Safety gate snapshot v{snapshot.version}")
+        return snapshot
+
+    def _on_kill_switch_change(self, *args):
+        self.refresh()
+
+    def _on_safe_mode_change(self, *args):
+        self.refresh()
+
+    def check_input(self, content: str) -> CheckResult:
+        """Classify user input"""
+        return self._classifier.check_input(content, ContentType.USER_INPUT)
+
+    def check_output(self, content: str) -> CheckResult:
+        """Classify agent output"""
+        return self._classifier.check_output(content, ContentType.AGENT_OUTPUT)
+
+    def start_input_check(self, content: str) -> "asyncio.Future[CheckResult]":
+        """
+        Start classifying user input for the running event loop.
+
+        Large inputs are classified in the default executor so the caller
+        can overlap request setup with classification; small inputs are
+        checked inline, where a thread hop would cost more than the check.
+
+        Returns:
+            Awaitable resolving to the CheckResult
+        """
+        loop = asyncio.get_running_loop()
+        if len(content) > OFFLOAD_THRESHOLD_CHARS:
+            return loop.run_in_executor(None, self.check_input, content)
+        future = loop.create_future()
+        try:
+            future.set_result(self.check_input(content))
+        except Exception as e:
+            future.set_exception(e)
+        return future
+
+
+# Global singleton
+_safety_gate: Optional[SafetyGate] = None
+_safety_gate_lock = threading.Lock()
+
+
+def get_safety_gate() -> SafetyGate:
+    """
+    Get the global safety gate instance.
+
+    Returns:
+        The global SafetyGate singleton
+    """
+    global _safety_gate
+    if _safety_gate is None:
+        with _safety_gate_lock:
+            if _safety_gate is None:
+                _safety_gate = SafetyGate()
+    return _safety_gate
@@ -24,6 +24,7 @@ import signal
 import os
 import asyncio
 import json
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from typing import Optional, Callable, Dict, Any, Set, List
 from enum import Enum
@@ -32,6 +33,9 @@ from pathlib import Path
 # Configure logging
 logger = logging.getLogger(__name__)
 
+# Upper bound on threads used to call blocking agent stop methods at once
+MAX_STOP_WORKERS = 64
+
 
 class KillSwitchState(Enum):
     """Kill switch states"""
@@ -54,6 +58,97 @@ class KillSwitchReason(Enum):
     USER_REQUEST = "user_request"       # User requested shutdown
 
 
+class StopBroadcaster:
+    """
+    Fan-out of stop signals with an event-driven acknowledgment barrier.
+
+    One broadcast covers a set of expected agents. Acknowledgments remove
+    agents from the pending set in O(1) and record per-agent stop latency;
+    the waiter wakes as soon as the set empties instead of polling.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._pending: Set[str] = set()
+        self._started: Optional[float] = None
+        self._latencies: Dict[str, float] = {}
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._done: Optional[asyncio.Event] = None
+        self.quiesce_time: Optional[float] = None
+
+    def begin(self, expected: Set[str], acknowledged: Set[str]):
+        """Start a broadcast round for the expected agents"""
+        with self._lock:
+            self._pending = set(expected) - set(acknowledged)
+            self._started = time.monotonic()
+            self._latencies = {agent_id: 0.0 for agent_id in expected & acknowledged}
+            self.quiesce_time = None
+            self._loop = None
+            self._done = None
+
+    def acknowledge(self, agent_id: str):
+        """Record an acknowledgment, waking the waiter on the last one"""
+        with self._lock:
+            if self._started is None or agent_id not in self._pending:
+                return
+            self._pending.discard(agent_id)
+            now = time.monotonic()
+            self._latencies[agent_id] = now - self._started
+            if not self._pending:
+                self.quiesce_time = now - self._started
+                if self._done is not None:
+                    self._loop.call_soon_threadsafe(self._done.set)
+
+    async def wait(self, timeout: float) -> Set[str]:
+        """
+        Wait until every expected agent acknowledged or the deadline passes.
+
+        Returns:
+            Agents that did not acknowledge in time
+        """
+        with self._lock:
+            if not self._pending:
+                return set()
+            self._loop = asyncio.get_running_loop()
+            self._done = asyncio.Event()
+            done = self._done
+
+        try:
+            await asyncio.wait_for(done.wait(), timeout)
+        except asyncio.TimeoutError:
+            pass
+
+        with self._lock:
+            self._done = None
+            return set(self._pending)
+
+    @property
+    def pending(self) -> Set[str]:
+        """Agents still expected to acknowledge"""
+        with self._lock:
+            return set(self._pending)
+
+    @property
+    def latencies(self) -> Dict[str, float]:
+        """Seconds from broadcast to acknowledgment, per agent"""
+        with self._lock:
+            return dict(self._latencies)
+
+    def latency_summary(self) -> Dict[str, Any]:
+        """Summary of stop latencies for status reporting"""
+        with self._lock:
+            values = sorted(self._latencies.values())
+            quiesce = self.quiesce_time
+        if not values:
+            return {"count": 0, "p50_ms": None, "max_ms": None, "quiesce_ms": None}
+        return {
+            "count": len(values),
+            "p50_ms": round(values[len(values) // 2] * 1000, 2),
+            "max_ms": round(values[-1] * 1000, 2),
+            "quiesce_ms": round(quiesce * 1000, 2) if quiesce is not None else None,
+        }
+
+
 class KillSwitch:
     """
     Emergency shutdown system for BlackBox 5.
@@ -114,6 +209,7 @@ class KillSwitch:
         self._acknowledgments: Dict[str, Dict[str, Any]] = {}
         self._expected_agents: Set[str] = set()
         self._ack_timeout = 5.0  # seconds
+        self._stop_broadcaster = StopBroadcaster()
 
         # Compliance verification
         self._compliance_verified = False
@@ -360,6 +456,7 @@ class KillSwitch:
             'timestamp': datetime.now().isoformat(),
             'stopped': stopped
         }
+        self._stop_broadcaster.acknowledge(agent_id)
         logger.debug(f"Acknowledgment from {agent_id}: stopped={stopped}")
 
     def get_acknowledgments(self) -> Dict[str, Dict[str, Any]]:
@@ -370,31 +467,53 @@ class KillSwitch:
         """Get agents that haven't acknowledged"""
         return self._expected_agents - set(self._acknowledgments.keys())
 
+    def get_stop_latencies(self) -> Dict[str, float]:
+        """Get seconds from stop broadcast to acknowledgment, per agent"""
+        return self._stop_broadcaster.latencies
+
     # ========== Compliance Verification ==========
 
     async def _verify_trigger_completion(self):
         """Verify all agents acknowledged and stopped (async)"""
         try:
-            # Wait for acknowledgments
-            await self._wait_for_acknowledgments()
+            registry = self._get_agent_registry()
+            agents = self._resolve_agents(registry, self._expected_agents)
+
+            # Signal every agent at once and wait on the acknowledgment barrier
+            self._stop_broadcaster.begin(
+                self._expected_agents, set(self._acknowledgments.keys())
+            )
+            broadcast = asyncio.ensure_future(self._broadcast_stop(agents))
+            missing = await self._wait_for_acknowledgments()
+            if not broadcast.done():
+                broadcast.cancel()
+
+            # Escalate only the stragglers
+            stragglers = set(missing)
+            stragglers |= {
+                agent_id for agent_id, ack in self._acknowledgments.items()
+                if agent_id in self._expected_agents and not ack.get('stopped', True)
+            }
+            stragglers |= self._find_running_agents(registry)
+            if stragglers:
+                await self._force_kill_agents(stragglers)
 
-            # Check for missing agents
-            missing = self.get_missing_acknowledgments()
             if missing:
                 logger.critical(f"Kill switch: Agents did not acknowledge: {missing}")
                 self._save_verification_result(False, "missing_acknowledgments", list(missing))
                 return False
 
-            # Verify agents actually stopped
-            if not await self._verify_agents_stopped():
-                logger.critical("Kill switch: Agents acknowledged but still running!")
-                await self._force_kill_agents()
-                self._save_verification_result(False, "agents_still_running", [])
+            if stragglers:
+                logger.critical(f"Kill switch: Agents acknowledged but still running: {stragglers}")
+                self._save_verification_result(False, "agents_still_running", list(stragglers))
                 return False
 
             self._compliance_verified = True
             self._save_verification_result(True, "all_stopped", list(self._expected_agents))
-            logger.info("Kill switch: All agents verified stopped")
+            logger.info(
+                "Kill switch: All agents verified stopped "
+                f"({self._stop_broadcaster.latency_summary()})"
+            )
             return True
 
         except Exception as e:
@@ -402,66 +521,132 @@ class KillSwitch:
             self._save_verification_result(False, f"verification_error: {e}", [])
             return False
 
-    async def _wait_for_acknowledgments(self, timeout: Optional[float] = None):
-        """Wait for all agents to acknowledge kill signal (async)"""
+    async def _broadcast_stop(self, agents: Dict[str, Any]):
+        """Send stop to all agents concurrently; a clean return counts as delivery"""
+        async def on_stopped(agent_id: str, agent: Any, delivered: bool):
+            if delivered and agent_id not in self._acknowledgments:
+                self.register_acknowledgment(
+                    agent_id, not getattr(agent, 'is_running', False)
+                )
+
+        await self._fan_out(agents, 'stop', on_stopped)
+
+    async def _wait_for_acknowledgments(self, timeout: Optional[float] = None) -> Set[str]:
+        """
+        Wait for all agents to acknowledge kill signal (async).
+
+        Returns:
+            Agents that did not acknowledge before the deadline
+        """
         timeout = timeout or self._ack_timeout
-        started = datetime.now()
-
-        while (datetime.now() - started).total_seconds() < timeout:
-            acked = set(self._acknowledgments.keys())
-            if acked == self._expected_agents:
-                logger.debug(f"All {len(acked)} agents acknowledged")
-                break
-            await asyncio.sleep(0.1)
-
-        # Log final status
-        acked = set(self._acknowledgments.keys())
-        if acked != self._expected_agents:
-            missing = self._expected_agents - acked
+        if self._stop_broadcaster.pending != self.get_missing_acknowledgments():
+            self._stop_broadcaster.begin(
+                self._expected_agents, set(self._acknowledgments.keys())
+            )
+
+        missing = await self._stop_broadcaster.wait(timeout)
+        if missing:
             logger.warning(f"Timeout: {len(missing)} agents didn't acknowledge: {missing}")
+        else:
+            logger.debug(f"All {len(self._expected_agents)} agents acknowledged")
+        return missing
 
     async def _verify_agents_stopped(self) -> bool:
         """Verify all agents actually stopped"""
-        try:
-            # Try to import agent registry
-            from ..agents.base_agent import get_agent_registry
-            registry = get_agent_registry()
-
-            for agent_id in self._expected_agents:
-                try:
-                    agent = registry.get(agent_id)
-                    if agent and hasattr(agent, 'is_running') and agent.is_running:
-                        logger.critical(f"Agent {agent_id} still running after kill!")
-                        return False
-                except Exception as e:
-                    logger.debug(f"Could not check agent {agent_id}: {e}")
-
-            return True
-
-        except ImportError:
+        registry = self._get_agent_registry()
+        if registry is None:
             logger.debug("Agent registry not available, skipping verification")
             return True  # Assume stopped if can't verify
 
-    async def _force_kill_agents(self):
-        """Force kill agents that didn't stop gracefully"""
+        running = self._find_running_agents(registry)
+        for agent_id in running:
+            logger.critical(f"Agent {agent_id} still running after kill!")
+        return not running
+
+    async def _force_kill_agents(self, agent_ids: Optional[Set[str]] = None):
+        """Force kill agents that didn't stop gracefully (all expected by default)"""
         logger.critical("Forcing kill of non-compliant agents")
         self._force_kill_used = True
 
-        try:
-            from ..agents.base_agent import get_agent_registry
-            registry = get_agent_registry()
+        registry = self._get_agent_registry()
+        if registry is None:
+            logger.error("Could not import agent registry for force kill")
+            return
 
-            for agent_id in self._expected_agents:
-                try:
-                    agent = registry.get(agent_id)
-                    if agent and hasattr(agent, 'force_stop'):
-                        agent.force_stop()
-                        logger.warning(f"Force stopped agent {agent_id}")
-                except Exception as e:
-                    logger.error(f"Error force stopping {agent_id}: {e}")
+        targets = self._expected_agents if agent_ids is None else agent_ids
+        agents = self._resolve_agents(registry, targets)
+
+        async def on_forced(agent_id: str, agent: Any, stopped: bool):
+            if stopped:
+                logger.warning(f"Force stopped agent {agent_id}")
 
+        await self._fan_out(agents, 'force_stop', on_forced)
+
+    async def _fan_out(self, agents: Dict[str, Any], method: str, on_done: Callable):
+        """
+        Call a sync or async method on all agents concurrently.
+
+        Blocking methods run on a pool sized to the fan-out so one slow
+        agent does not delay signalling the rest. on_done(agent_id, agent,
+        success) is awaited as each call completes.
+        """
+        if not agents:
+            return
+        loop = asyncio.get_running_loop()
+        executor = ThreadPoolExecutor(
+            max_workers=min(len(agents), MAX_STOP_WORKERS),
+            thread_name_prefix="kill-switch-stop"
+        )
+
+        async def call(agent_id: str, agent: Any):
+            fn = getattr(agent, method, None)
+            if fn is None:
+                return
+            try:
+                if asyncio.iscoroutinefunction(fn):
+                    await fn()
+                else:
+                    await loop.run_in_executor(executor, fn)
+                success = True
+            except Exception as e:
+                logger.error(f"Error calling {method} on {agent_id}: {e}")
+                success = False
+            await on_done(agent_id, agent, success)
+
+        try:
+            await asyncio.gather(*(call(agent_id, agent) for agent_id, agent in agents.items()))
+        finally:
+            executor.shutdown(wait=False)
+
+    def _get_agent_registry(self):
+        """Get the agent registry, or None if it is not available"""
+        try:
+            from ..agents.base_agent import get_agent_registry
+            return get_agent_registry()
         except ImportError:
-            logger.error("Could not import agent registry for force kill")
+            return None
+
+    def _resolve_agents(self, registry, agent_ids: Set[str]) -> Dict[str, Any]:
+        """Look up agent objects by ID, skipping unknown agents"""
+        agents = {}
+        if registry is None:
+            return agents
+        for agent_id in agent_ids:
+            try:
+                agent = registry.get(agent_id)
+                if agent is not None:
+                    agents[agent_id] = agent
+            except Exception as e:
+                logger.debug(f"Could not check agent {agent_id}: {e}")
+        return agents
+
+    def _find_running_agents(self, registry) -> Set[str]:
+        """Get expected agents that still report is_running"""
+        return {
+            agent_id
+            for agent_id, agent in self._resolve_agents(registry, self._expected_agents).items()
+            if getattr(agent, 'is_running', False)
+        }
 
     def _save_verification_result(self, success: bool, reason: str, details: List[str]):
         """Save verification result to state"""
@@ -758,6 +943,14 @@ class KillSwitch:
             self._trigger_reason = None
             self._trigger_message = None
             self._save_state()
+
+            # Execute callbacks
+            for callback in self._on_recover_callbacks:
+                try:
+                    callback(self, "Force reset")
+                except Exception as e:
+                    logger.error(f"Error in recover callback: {e}")
+
             return True
 
     def get_status(self) -> Dict[str, Any]:
@@ -787,6 +980,7 @@ class KillSwitch:
             # Compliance
             "compliance_verified": self._compliance_verified,
             "force_kill_used": self._force_kill_used,
+            "stop_latency": self._stop_broadcaster.latency_summary(),
             # Testing
             "test_count": len(self._test_results),
             "last_test_result": self._test_results[-1] if self._test_results else None,
@@ -485,5 +485,30 @@ def test_kill_switch_performance(kill_switch):
     assert ack_time < 1.0
 
 
+
+@pytest.mark.asyncio
+async def test_ack_barrier_wakes_on_last_acknowledgment(kill_switch):
+    """Test that the acknowledgment barrier returns as soon as all agents ack"""
+    num_agents = 300
+    kill_switch.trigger(KillSwitchReason.MANUAL, "Barrier test")
+
+    # Set expected agents after trigger (trigger calls _get_running_agents)
+    kill_switch._expected_agents = {f"agent-{i}" for i in range(num_agents)}
+    kill_switch._stop_broadcaster.begin(kill_switch._expected_agents, set())
+
+    async def acknowledge_all():
+        await asyncio.sleep(0.05)
+        for i in range(num_agents):
+            kill_switch.register_acknowledgment(f"agent-{i}", True)
+
+    start = time.time()
+    asyncio.ensure_future(acknowledge_all())
+    missing = await kill_switch._wait_for_acknowledgments(timeout=5.0)
+
+    assert missing == set()
+    assert time.time() - start < 1.0
+    assert len(kill_switch.get_stop_latencies()) == num_agents
+    assert kill_switch.get_status()['stop_latency']['count'] == num_agents
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
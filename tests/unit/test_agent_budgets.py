@@ -0,0 +1,186 @@
+#!/usr/bin/env python3
+"""
+Tests for agent execution budgets and metrics
+
+Covers the time and token budgets enforced by BaseAgent.execute_with_hooks,
+isolation of budgets between concurrent executions, and the percentiles
+exported by AgentMetrics.
+"""
+
+import asyncio
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from agents.framework.agent_metrics import AgentMetrics, Histogram
+from agents.framework.base_agent import AgentConfig, AgentResult, AgentTask, SimpleAgent
+
+
+class SpendingAgent(SimpleAgent):
+    """Spends tokens in steps, sleeping between them."""
+
+    async def execute(self, task: AgentTask) -> AgentResult:
+        for _ in range(task.context.get("steps", 1)):
+            self.record_tokens(task.context.get("tokens", 0))
+            await asyncio.sleep(task.context.get("sleep", 0))
+        return AgentResult(success=True, output="done")
+
+
+def make_agent(**budget) -> SpendingAgent:
+    agent = SpendingAgent(AgentConfig(
+        name="spender",
+        full_name="Spending Agent",
+        role="tester",
+        category="test",
+        description="Agent used by budget tests",
+        **budget
+    ))
+    agent._metrics = AgentMetrics()
+    return agent
+
+
+def run(agent: SpendingAgent, **context) -> AgentResult:
+    return asyncio.run(agent.execute_with_hooks(AgentTask(id="t1", description="spend", context=context)))
+
+
+# ========== Time budget ==========
+
+def test_time_budget_cancels_slow_execution():
+    agent = make_agent(max_execution_seconds=0.05)
+    result = run(agent, sleep=1.0)
+
+    assert not result.success
+    assert "time budget" in result.error
+    assert result.duration < 1.0
+    assert agent.get_metrics()["executions"] == {"budget_exceeded": 1}
+
+
+def test_time_budget_allows_fast_execution():
+    agent = make_agent(max_execution_seconds=1.0)
+    result = run(agent)
+
+    assert result.success
+    assert agent.get_metrics()["executions"] == {"success": 1}
+
+
+def test_timeout_raised_by_agent_is_a_failure():
+    class UpstreamTimeoutAgent(SpendingAgent):
+        async def execute(self, task):
+            raise asyncio.TimeoutError("upstream request timed out")
+
+    for budget in ({}, {"max_execution_seconds": 10.0}):
+        agent = UpstreamTimeoutAgent(make_agent(**budget).config)
+        agent._metrics = AgentMetrics()
+        result = run(agent)
+
+        assert not result.success
+        assert result.error == "upstream request timed out"
+        assert agent.get_metrics()["executions"] == {"failure": 1}
+
+
+# ========== Token budget ==========
+
+def test_token_budget_cancels_at_first_step_over_limit():
+    agent = make_agent(max_execution_tokens=250)
+    result = run(agent, steps=10, tokens=100)
+
+    assert not result.success
+    assert "token budget of 250 (300 used)" in result.error
+    metrics = agent.get_metrics()
+    assert metrics["executions"] == {"budget_exceeded": 1}
+    assert metrics["tokens"] == {"execution": 300}
+    assert metrics["tokens_per_execution"]["max"] == 300
+
+
+def test_token_budget_resets_between_executions():
+    agent = make_agent(max_execution_tokens=250)
+
+    assert run(agent, steps=2, tokens=100).success
+    assert run(agent, steps=2, tokens=100).success
+    assert agent.get_metrics()["tokens"] == {"execution": 400}
+
+
+def test_reported_tokens_not_double_counted():
+    class ReportingAgent(SpendingAgent):
+        async def execute(self, task):
+            self.record_tokens(100)
+            return AgentResult(success=True, output="done", metadata={"tokens_used": 150})
+
+    agent = ReportingAgent(make_agent().config)
+    agent._metrics = AgentMetrics()
+    assert run(agent).success
+    assert agent.get_metrics()["tokens"] == {"execution": 150}
+
+
+def test_record_tokens_outside_execution_is_not_budgeted():
+    agent = make_agent(max_execution_tokens=10)
+    agent.record_tokens(100)
+
+    assert agent.get_metrics()["tokens"] == {"execution": 100}
+
+
+def test_concurrent_executions_keep_separate_budgets():
+    agent = make_agent(max_execution_tokens=250)
+
+    async def both():
+        spender = agent.execute_with_hooks(
+            AgentTask(id="big", description="spend", context={"steps": 5, "tokens": 100, "sleep": 0.01})
+        )
+        # Finishes while the other execution is still spending
+        quick = agent.execute_with_hooks(
+            AgentTask(id="small", description="spend", context={"steps": 1, "tokens": 10})
+        )
+        return await asyncio.gather(spender, quick)
+
+    big, small = asyncio.run(both())
+
+    assert not big.success
+    assert "(300 used)" in big.error
+    assert small.success
+    summary = agent.get_metrics()["tokens_per_execution"]
+    assert summary["count"] == 2
+    assert summary["max"] == 300
+
+
+# ========== Metrics export ==========
+
+def test_histogram_percentiles_within_bucket_ratio():
+    histogram = Histogram()
+    for value in range(1, 1001):
+        histogram.record(value / 1000.0)
+
+    ratio = 2 ** (1 / histogram.buckets_per_octave)
+    for p, exact in ((50, 0.5), (95, 0.95), (99, 0.99)):
+        estimate = histogram.percentile(p)
+        assert exact <= estimate <= exact * ratio
+    assert histogram.percentile(100) == pytest.approx(1.0)
+
+
+def test_export_reports_span_and_token_percentiles():
+    metrics = AgentMetrics()
+    for ms in range(1, 101):
+        metrics.record_span("architect", "execute", ms / 1000.0)
+    metrics.record_execution("architect", "success", 1000)
+    metrics.record_execution("architect", "failure", 10)
+    metrics.record_span("other", "execute", 1.0)
+
+    exported = metrics.export("architect")
+
+    assert set(exported) == {"architect"}
+    span = exported["architect"]["spans"]["execute"]
+    assert span["count"] == 100
+    assert span["max"] == pytest.approx(0.1)
+    assert span["p50"] <= span["p95"] <= span["p99"] <= span["max"]
+    assert 0.05 <= span["p50"] < 0.06
+    assert 0.095 <= span["p95"] <= 0.1
+    assert exported["architect"]["executions"] == {"success": 1, "failure": 1}
+    assert exported["architect"]["tokens_per_execution"]["p99"] == 1000
+
+
+def test_export_of_empty_histogram_is_zero():
+    assert Histogram().summary() == {
+        "count": 0, "mean": 0.0, "max": 0.0, "p50": 0.0, "p95": 0.0, "p99": 0.0
+    }
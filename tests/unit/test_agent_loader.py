@@ -0,0 +1,204 @@
+#!/usr/bin/env python3
+"""
+Tests for lazy agent discovery in AgentLoader
+
+Covers the persisted AST manifest (reuse, stat and hash invalidation,
+version checks), lazy import of agent modules on first lookup, and the
+read-only LazyAgentRegistry mapping returned by load_all().
+"""
+
+import asyncio
+import json
+import os
+import sys
+from collections.abc import Mapping
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from agents.framework.agent_loader import MANIFEST_VERSION, AgentLoader, LazyAgentRegistry
+
+AGENT_MODULE = """
+from agents.framework.base_agent import AgentResult, BaseAgent
+
+
+class {name}(BaseAgent):
+    async def think(self, task):
+        return []
+
+    async def execute(self, task):
+        return AgentResult(success=True, output={output!r})
+"""
+
+SUBCLASS_MODULE = """
+from base_agents import CoreAgent
+
+
+class ChildAgent(CoreAgent):
+    pass
+
+
+class _PrivateAgent(CoreAgent):
+    pass
+
+
+class Helper:
+    pass
+"""
+
+
+@pytest.fixture
+def agents_dir(tmp_path):
+    path = tmp_path / "agents"
+    path.mkdir()
+    return path
+
+
+def write_agent(agents_dir, filename, name, output="v1"):
+    path = agents_dir / filename
+    path.write_text(AGENT_MODULE.format(name=name, output=output))
+    return path
+
+
+def load(agents_dir, manifest_path):
+    loader = AgentLoader(agents_dir, manifest_path=manifest_path)
+    return loader, asyncio.run(loader.load_all())
+
+
+def imported(rel_path):
+    return "_blackbox5_agents." + rel_path.replace(".py", "") in sys.modules
+
+
+@pytest.fixture
+def manifest_path(tmp_path):
+    yield tmp_path / "cache" / "manifest.json"
+    for name in [m for m in sys.modules if m.startswith("_blackbox5_agents.")]:
+        del sys.modules[name]
+
+
+# ========== Registry ==========
+
+def test_load_all_returns_lazy_read_only_mapping(agents_dir, manifest_path):
+    write_agent(agents_dir, "echo_lazy.py", "EchoAgent")
+
+    loader, agents = load(agents_dir, manifest_path)
+
+    assert isinstance(agents, Mapping)
+    assert isinstance(agents, LazyAgentRegistry)
+    assert not isinstance(agents, dict)
+    assert list(agents) == ["EchoAgent"]
+    assert len(agents) == 1
+    with pytest.raises(TypeError):
+        agents["Other"] = None
+    # Listing agents does not import their modules
+    assert not imported("echo_lazy.py")
+
+    agent = agents["EchoAgent"]
+    assert imported("echo_lazy.py")
+    assert agents.get("EchoAgent") is agent
+    assert "Missing" not in agents
+    with pytest.raises(KeyError):
+        agents["Missing"]
+
+
+def test_subclasses_of_scanned_agents_are_found(agents_dir, manifest_path):
+    write_agent(agents_dir, "base_agents.py", "CoreAgent")
+    (agents_dir / "children.py").write_text(SUBCLASS_MODULE)
+    sys.path.insert(0, str(agents_dir))
+    try:
+        loader, agents = load(agents_dir, manifest_path)
+        assert sorted(agents) == ["ChildAgent", "CoreAgent"]
+        assert type(agents["ChildAgent"]).__name__ == "ChildAgent"
+    finally:
+        sys.path.remove(str(agents_dir))
+        sys.modules.pop("base_agents", None)
+
+
+def test_agent_failing_to_import_is_a_missing_key(agents_dir, manifest_path):
+    path = write_agent(agents_dir, "broken.py", "BrokenAgent")
+    path.write_text(path.read_text() + "\nraise RuntimeError('boom')\n")
+
+    loader, agents = load(agents_dir, manifest_path)
+    assert "BrokenAgent" in list(agents)
+    with pytest.raises(KeyError):
+        agents["BrokenAgent"]
+    assert list(agents) == []
+
+    # Fixing the file clears the failure on the next scan
+    write_agent(agents_dir, "broken.py", "BrokenAgent")
+    asyncio.run(loader.load_all())
+    assert agents["BrokenAgent"] is not None
+
+
+# ========== Manifest ==========
+
+def test_manifest_persisted_and_reused(agents_dir, manifest_path):
+    write_agent(agents_dir, "one.py", "OneAgent")
+    write_agent(agents_dir, "two.py", "TwoAgent")
+
+    loader, _ = load(agents_dir, manifest_path)
+    assert loader._manifest.scanned == 2
+    data = json.loads(manifest_path.read_text())
+    assert data["version"] == MANIFEST_VERSION
+    assert data["files"]["one.py"]["classes"] == [["OneAgent", ["BaseAgent"]]]
+
+    reloaded, agents = load(agents_dir, manifest_path)
+    assert reloaded._manifest.scanned == 0
+    assert sorted(agents) == ["OneAgent", "TwoAgent"]
+
+
+def test_touched_file_is_rehashed_not_reparsed(agents_dir, manifest_path):
+    path = write_agent(agents_dir, "one.py", "OneAgent")
+    load(agents_dir, manifest_path)
+
+    st = path.stat()
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+    loader, _ = load(agents_dir, manifest_path)
+
+    assert loader._manifest.scanned == 0
+    entry = json.loads(manifest_path.read_text())["files"]["one.py"]
+    assert entry["mtime_ns"] == st.st_mtime_ns + 1_000_000
+
+
+def test_edited_and_removed_files_update_the_index(agents_dir, manifest_path):
+    write_agent(agents_dir, "one.py", "OneAgent")
+    two = write_agent(agents_dir, "two.py", "TwoAgent")
+    loader, agents = load(agents_dir, manifest_path)
+
+    write_agent(agents_dir, "one.py", "RenamedAgent", output="a longer output")
+    two.unlink()
+    asyncio.run(loader.load_all())
+
+    assert loader._manifest.scanned == 1
+    assert list(agents) == ["RenamedAgent"]
+    assert set(json.loads(manifest_path.read_text())["files"]) == {"one.py"}
+
+
+@pytest.mark.parametrize("content", [
+    json.dumps({"version": MANIFEST_VERSION + 1, "files": {"one.py": {}}}),
+    "{not json",
+])
+def test_unusable_manifest_is_rebuilt(agents_dir, manifest_path, content):
+    write_agent(agents_dir, "one.py", "OneAgent")
+    manifest_path.parent.mkdir(parents=True)
+    manifest_path.write_text(content)
+
+    loader, agents = load(agents_dir, manifest_path)
+
+    assert loader._manifest.scanned == 1
+    assert list(agents) == ["OneAgent"]
+    assert json.loads(manifest_path.read_text())["version"] == MANIFEST_VERSION
+
+
+def test_reload_agent_imports_edited_module(agents_dir, manifest_path):
+    write_agent(agents_dir, "echo.py", "EchoAgent", output="v1")
+    loader, agents = load(agents_dir, manifest_path)
+    first = agents["EchoAgent"]
+
+    write_agent(agents_dir, "echo.py", "EchoAgent", output="version two")
+    agent = asyncio.run(loader.reload_agent("EchoAgent"))
+
+    assert agent is not first
+    assert asyncio.run(agent.execute(None)).output == "version two"
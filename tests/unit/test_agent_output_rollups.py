@@ -0,0 +1,232 @@
+#!/usr/bin/env python3
+"""
+Tests for AgentOutputBus rollups and legacy schema migration
+
+Covers moving inline blobs out of a legacy agent_outputs table, the
+backfilled and incrementally maintained agent_output_totals and
+agent_output_buckets rollups, compressed blob storage, and rollup
+maintenance in clear_old_logs. Rollups are always checked against a full
+recomputation from agent_outputs.
+"""
+
+import sqlite3
+import sys
+import zlib
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2] / "interface"))
+
+from AgentOutputBus import AgentOutputBus, OutputEvent, OutputStatus
+from AgentOutputParser import create_agent_output
+
+
+LEGACY_SCHEMA = """
+    CREATE TABLE agent_outputs (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        timestamp DATETIME DEFAULT CURRENT_TIMESTAMP,
+        agent_name TEXT NOT NULL,
+        task_id TEXT,
+        status TEXT NOT NULL,
+        summary TEXT,
+        deliverables TEXT,
+        next_steps TEXT,
+        metadata TEXT,
+        human_content TEXT,
+        raw_output TEXT
+    )
+"""
+
+
+@pytest.fixture
+def open_bus(tmp_path):
+    opened = []
+
+    def factory():
+        bus = AgentOutputBus(db_path=tmp_path / "outputs.db", flush_interval_ms=10)
+        bus.initialize()
+        opened.append(bus)
+        return bus
+
+    yield factory
+    for bus in opened:
+        bus.close()
+
+
+@pytest.fixture
+def legacy_db(tmp_path):
+    """A pre-split database: inline text blobs and no rollup tables."""
+    path = tmp_path / "outputs.db"
+    conn = sqlite3.connect(path)
+    conn.execute(LEGACY_SCHEMA)
+    rows = []
+    for n in range(12):
+        rows.append((
+            f"datetime('now', '-{60 if n % 3 == 0 else 1} days', '-{n} hours')",
+            ("coder", "architect")[n % 2],
+            ("success", "partial", "failed")[n % 3],
+            f"human {n}" if n % 4 else None,
+            f"raw {n}",
+        ))
+    for timestamp, agent, status, human, raw in rows:
+        conn.execute(f"""
+            INSERT INTO agent_outputs
+            (timestamp, agent_name, task_id, status, summary, deliverables, next_steps,
+             metadata, human_content, raw_output)
+            VALUES ({timestamp}, ?, 'task', ?, 'summary', '[]', '[]', '{{}}', ?, ?)
+        """, (agent, status, human, raw))
+    conn.commit()
+    conn.close()
+    return path
+
+
+def query(bus, sql):
+    bus.flush()
+    conn = sqlite3.connect(bus.db_path)
+    try:
+        return sorted(conn.execute(sql).fetchall())
+    finally:
+        conn.close()
+
+
+def totals(bus):
+    return query(bus, "SELECT agent_name, status, count FROM agent_output_totals")
+
+
+def recomputed_totals(bus):
+    return query(bus, """
+        SELECT agent_name, status, COUNT(*) FROM agent_outputs GROUP BY agent_name, status
+    """)
+
+
+def buckets(bus):
+    return query(bus, "SELECT bucket, agent_name, status, count FROM agent_output_buckets")
+
+
+def recomputed_buckets(bus):
+    return query(bus, """
+        SELECT replace(substr(timestamp, 1, 13), ' ', 'T'), agent_name, status, COUNT(*)
+        FROM agent_outputs GROUP BY 1, agent_name, status
+    """)
+
+
+def log_event(bus, agent, status, age, raw="raw"):
+    bus._log_to_database(OutputEvent(
+        agent_name=agent,
+        task_id="task",
+        status=OutputStatus(status),
+        summary="summary",
+        deliverables=[],
+        next_steps=[],
+        metadata={},
+        human_content=f"human for {raw}",
+        raw_output=raw,
+        timestamp=datetime.now() - age
+    ))
+
+
+# ========== Legacy migration ==========
+
+def test_legacy_blobs_moved_and_compressed(legacy_db, open_bus):
+    bus = open_bus()
+
+    assert query(bus, """
+        SELECT id FROM agent_outputs WHERE human_content IS NOT NULL OR raw_output IS NOT NULL
+    """) == []
+    stored = query(bus, "SELECT output_id, human_content, raw_output FROM agent_output_blobs")
+    assert len(stored) == 12
+    for output_id, human, raw in stored:
+        n = output_id - 1
+        assert zlib.decompress(raw).decode() == f"raw {n}"
+        assert (zlib.decompress(human).decode() if human else None) == (f"human {n}" if n % 4 else None)
+
+    outputs = {o["id"]: o for o in bus.get_recent_outputs(limit=100)}
+    assert outputs[2]["raw_output"] == "raw 1"
+    assert outputs[2]["human_content"] == "human 1"
+    assert outputs[1]["human_content"] is None
+
+
+def test_legacy_rollups_backfilled_once(legacy_db, open_bus):
+    bus = open_bus()
+    assert totals(bus) == recomputed_totals(bus)
+    assert buckets(bus) == recomputed_buckets(bus)
+    assert sum(row[2] for row in totals(bus)) == 12
+    bus.close()
+
+    # Reopening a migrated database must not add the rows a second time
+    reopened = open_bus()
+    assert totals(reopened) == recomputed_totals(reopened)
+    assert buckets(reopened) == recomputed_buckets(reopened)
+    assert reopened.get_agent_stats()["total"] == 12
+
+
+# ========== Incremental rollups ==========
+
+def test_rollups_track_new_outputs(legacy_db, open_bus):
+    bus = open_bus()
+    for n in range(30):
+        log_event(bus, ("coder", "tester")[n % 2], ("success", "failed")[n % 3 == 0],
+                  timedelta(hours=n % 5), raw=f"new {n}")
+    bus.receive(create_agent_output(
+        status="partial",
+        summary="Half done",
+        deliverables=["a.py"],
+        next_steps=[],
+        human_content="Explanation",
+        agent_name="coder",
+        task_id="task-1"
+    ))
+
+    assert totals(bus) == recomputed_totals(bus)
+    assert buckets(bus) == recomputed_buckets(bus)
+
+    stats = bus.get_agent_stats("coder")
+    expected = dict((status, count) for agent, status, count in recomputed_totals(bus) if agent == "coder")
+    assert stats["total"] == sum(expected.values())
+    assert stats["partial_count"] == expected["partial"]
+
+    timeline = bus.get_stats_by_bucket(agent_name="tester")
+    assert sum(entry["total"] for entry in timeline) == 15
+    assert [entry["bucket"] for entry in timeline] == sorted(entry["bucket"] for entry in timeline)
+
+
+def test_new_outputs_store_compressed_blobs(open_bus):
+    bus = open_bus()
+    log_event(bus, "coder", "success", timedelta(0), raw="x" * 10000)
+
+    ((raw,),) = query(bus, "SELECT raw_output FROM agent_output_blobs")
+    assert len(raw) < 1000
+    assert bus.get_recent_outputs()[0]["raw_output"] == "x" * 10000
+
+
+# ========== Retention ==========
+
+def test_clear_old_logs_keeps_rollups_consistent(legacy_db, open_bus):
+    bus = open_bus()
+    for n in range(6):
+        log_event(bus, "coder", "success", timedelta(days=90 if n % 2 else 0), raw=f"new {n}")
+    history = buckets(bus)
+
+    deleted = bus.clear_old_logs(days_to_keep=30)
+
+    assert deleted == 4 + 3
+    assert totals(bus) == recomputed_totals(bus)
+    assert all(count > 0 for _, _, count in totals(bus))
+    # Blobs of deleted rows are gone; hourly buckets are kept as history
+    assert query(bus, """
+        SELECT output_id FROM agent_output_blobs
+        WHERE output_id NOT IN (SELECT id FROM agent_outputs)
+    """) == []
+    assert buckets(bus) == history
+
+
+def test_clear_old_logs_drops_emptied_totals(open_bus):
+    bus = open_bus()
+    log_event(bus, "retired", "failed", timedelta(days=90))
+    log_event(bus, "coder", "success", timedelta(0))
+
+    assert bus.clear_old_logs(days_to_keep=30) == 1
+    assert totals(bus) == [("coder", "success", 1)]
+    assert bus.get_agent_stats("retired") == {"total": 0, "success_rate": 0}
@@ -0,0 +1,208 @@
+#!/usr/bin/env python3
+"""
+Tests for the compiled definition snapshot
+
+Covers snapshot reuse across instances, invalidation of changed, new and
+removed files, cached parse errors, rejection of stale or foreign snapshot
+files, and encode/decode of object results such as AgentSkill.
+"""
+
+import json
+import os
+import pickle
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from agents.framework.definition_cache import (
+    SNAPSHOT_VERSION,
+    DefinitionCache,
+    parse_json_file,
+    snapshot_path,
+)
+from agents.framework.skill_manager import AgentSkill
+
+
+class CountingParser:
+    """parse_json_file that records which files it parsed."""
+
+    def __init__(self, parse=parse_json_file):
+        self.parse = parse
+        self.calls = []
+
+    def __call__(self, path):
+        self.calls.append(path.name)
+        return self.parse(path)
+
+
+@pytest.fixture
+def source(tmp_path):
+    path = tmp_path / "defs"
+    path.mkdir()
+    return path
+
+
+@pytest.fixture
+def cache_file(tmp_path, source):
+    return snapshot_path("test_defs", source, tmp_path / "cache")
+
+
+def write(source, name, data):
+    path = source / name
+    path.write_text(json.dumps(data))
+    return path
+
+
+def files(source):
+    return sorted(source.glob("*.json"))
+
+
+def results(cache, source):
+    return {path.name: (data, error) for path, data, error in cache.load(files(source))}
+
+
+# ========== Reuse ==========
+
+def test_warm_start_reuses_snapshot(source, cache_file):
+    write(source, "a.json", {"name": "a"})
+    write(source, "b.json", {"name": "b", "tags": ["x"]})
+    DefinitionCache(cache_file, CountingParser()).load(files(source))
+
+    parser = CountingParser()
+    cache = DefinitionCache(cache_file, parser)
+    loaded = results(cache, source)
+
+    assert parser.calls == []
+    assert (cache.parsed, cache.reused) == (0, 2)
+    assert loaded == {"a.json": ({"name": "a"}, None), "b.json": ({"name": "b", "tags": ["x"]}, None)}
+
+
+def test_snapshot_is_versioned_json(source, cache_file):
+    write(source, "a.json", {"name": "a"})
+    DefinitionCache(cache_file, parse_json_file).load(files(source))
+
+    assert cache_file.suffix == ".json"
+    data = json.loads(cache_file.read_text())
+    assert data["version"] == SNAPSHOT_VERSION
+    assert list(data["entries"]) == [str(source / "a.json")]
+
+
+def test_parse_errors_are_cached(source, cache_file):
+    (source / "broken.json").write_text("{not json")
+    DefinitionCache(cache_file, CountingParser()).load(files(source))
+
+    parser = CountingParser()
+    ((data, error),) = results(DefinitionCache(cache_file, parser), source).values()
+
+    assert parser.calls == []
+    assert data is None
+    assert error.startswith("JSONDecodeError")
+
+
+# ========== Invalidation ==========
+
+def test_changed_new_and_removed_files(source, cache_file):
+    a = write(source, "a.json", {"v": 1})
+    b = write(source, "b.json", {"v": 1})
+    DefinitionCache(cache_file, parse_json_file).load(files(source))
+
+    write(source, "a.json", {"v": 22})
+    b.unlink()
+    write(source, "c.json", {"v": 3})
+    parser = CountingParser()
+    cache = DefinitionCache(cache_file, parser)
+    loaded = results(cache, source)
+
+    assert sorted(parser.calls) == ["a.json", "c.json"]
+    assert loaded == {"a.json": ({"v": 22}, None), "c.json": ({"v": 3}, None)}
+    assert set(json.loads(cache_file.read_text())["entries"]) == {str(a), str(source / "c.json")}
+
+
+def test_same_size_edit_detected_by_mtime(source, cache_file):
+    path = write(source, "a.json", {"v": 1})
+    DefinitionCache(cache_file, parse_json_file).load(files(source))
+
+    write(source, "a.json", {"v": 2})
+    st = path.stat()
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+
+    assert results(DefinitionCache(cache_file, parse_json_file), source) == {"a.json": ({"v": 2}, None)}
+
+
+@pytest.mark.parametrize("content", [
+    json.dumps({"version": SNAPSHOT_VERSION - 1, "entries": {}}),
+    "{not json",
+    json.dumps({"version": SNAPSHOT_VERSION, "entries": {"x": "not a list"}}),
+])
+def test_unusable_snapshot_is_rebuilt(source, cache_file, content):
+    write(source, "a.json", {"v": 1})
+    cache_file.parent.mkdir(parents=True)
+    cache_file.write_text(content)
+
+    parser = CountingParser()
+    assert results(DefinitionCache(cache_file, parser), source) == {"a.json": ({"v": 1}, None)}
+    assert parser.calls == ["a.json"]
+    assert json.loads(cache_file.read_text())["version"] == SNAPSHOT_VERSION
+
+
+class _Payload:
+    ran = False
+
+    def __reduce__(self):
+        return (setattr, (_Payload, "ran", True))
+
+
+def test_pickled_snapshot_is_never_unpickled(source, cache_file):
+    write(source, "a.json", {"v": 1})
+    cache_file.parent.mkdir(parents=True)
+    cache_file.write_bytes(pickle.dumps({"version": SNAPSHOT_VERSION, "entries": _Payload()}))
+
+    assert results(DefinitionCache(cache_file, parse_json_file), source) == {"a.json": ({"v": 1}, None)}
+    assert _Payload.ran is False
+
+
+# ========== Object results ==========
+
+SKILL_MD = """---
+name: {name}
+description: Demo skill
+tags: [demo]
+---
+
+Body of {name}
+"""
+
+
+def test_agent_skills_round_trip_through_snapshot(source, cache_file):
+    path = source / "SKILL.md"
+    path.write_text(SKILL_MD.format(name="demo"))
+    options = {"encode": AgentSkill.to_dict, "decode": AgentSkill.from_dict}
+    (_, first, _), = DefinitionCache(cache_file, AgentSkill.from_markdown, **options).load([path])
+
+    parser = CountingParser(AgentSkill.from_markdown)
+    (_, skill, error), = DefinitionCache(cache_file, parser, **options).load([path])
+
+    assert parser.calls == []
+    assert error is None
+    assert skill == first
+    assert isinstance(skill.file_path, Path)
+
+
+def test_unserializable_results_are_reparsed(source, cache_file):
+    write(source, "plain.json", {"v": 1})
+    write(source, "odd.json", {"v": 2})
+
+    def parse(path):
+        data = parse_json_file(path)
+        return {"v": {data["v"]}} if path.name == "odd.json" else data
+
+    DefinitionCache(cache_file, parse).load(files(source))
+    assert set(json.loads(cache_file.read_text())["entries"]) == {str(source / "plain.json")}
+
+    parser = CountingParser(parse)
+    loaded = results(DefinitionCache(cache_file, parser), source)
+    assert parser.calls == ["odd.json"]
+    assert loaded["odd.json"] == ({"v": {2}}, None)
@@ -0,0 +1,163 @@
+#!/usr/bin/env python3
+"""
+Tests for ManagementMemory event indexes and retention
+
+Covers indexed event queries, max_events trimming with slack, age-based
+retention, the event_rollup metrics entry, and trimming and recreation of
+task histories.
+"""
+
+import json
+import sys
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from agents.definitions.managerial.memory.management_memory import EventType, ManagementMemory
+
+
+@pytest.fixture
+def open_memory(tmp_path):
+    opened = []
+
+    def factory(**kwargs):
+        kwargs.setdefault("background_compaction", False)
+        memory = ManagementMemory(memory_path=str(tmp_path), **kwargs)
+        opened.append(memory)
+        return memory
+
+    yield factory
+    for memory in opened:
+        memory.close()
+
+
+def rollups(memory):
+    return [m for m in memory.get_metrics_history() if m.get("kind") == "event_rollup"]
+
+
+# ========== Indexes ==========
+
+def test_get_events_uses_type_and_task_indexes(open_memory):
+    memory = open_memory()
+    for n in range(5):
+        memory.record_event(EventType.TASK_STARTED, task_id=f"task-{n % 2}", step=n)
+        memory.record_event(EventType.TASK_MONITORED, task_id=f"task-{n % 2}", step=n)
+    memory.record_event(EventType.AGENT_SPAWNED)
+
+    assert [e.details["step"] for e in memory.get_events(EventType.TASK_STARTED)] == [4, 3, 2, 1, 0]
+    assert [e.details["step"] for e in memory.get_events(task_id="task-1")] == [3, 3, 1, 1]
+    assert [e.details["step"] for e in memory.get_events(EventType.TASK_MONITORED, "task-0", limit=2)] == [4, 2]
+    assert memory.get_events()[0].event_type == EventType.AGENT_SPAWNED
+    assert len(memory.get_events(limit=3)) == 3
+    assert memory.get_events(EventType.MERGE_FAILED) == []
+    assert memory.get_events(EventType.TASK_STARTED, "missing") == []
+
+
+def test_indexes_rebuilt_on_reload(open_memory):
+    memory = open_memory()
+    memory.record_event(EventType.TASK_STARTED, task_id="task-1")
+    memory.record_event(EventType.TASK_COMPLETED, task_id="task-1")
+    memory.close()
+
+    reloaded = open_memory()
+    assert [e.event_type for e in reloaded.get_events(task_id="task-1")] == [
+        EventType.TASK_COMPLETED, EventType.TASK_STARTED
+    ]
+    assert len(reloaded.get_events(EventType.TASK_STARTED)) == 1
+
+
+# ========== Retention ==========
+
+def test_max_events_trims_in_batches_with_slack(open_memory):
+    memory = open_memory(max_events=20)
+
+    # 10% slack: nothing is dropped until the limit plus two is exceeded
+    for n in range(22):
+        memory.record_event(EventType.TASK_MONITORED, task_id="task-1", step=n)
+    assert len(memory.get_events(limit=100)) == 22
+    assert rollups(memory) == []
+
+    memory.record_event(EventType.TASK_MONITORED, task_id="task-1", step=22)
+    events = memory.get_events(limit=100)
+    assert len(events) == 20
+    assert events[-1].details["step"] == 3
+    assert len(memory.get_events(task_id="task-1", limit=100)) == 20
+    assert len(memory.get_events(EventType.TASK_MONITORED, limit=100)) == 20
+
+
+def test_expired_events_rolled_up_into_metrics(open_memory):
+    memory = open_memory(max_events=10)
+    for _ in range(8):
+        memory.record_event(EventType.TASK_STARTED)
+    for _ in range(4):
+        memory.record_event(EventType.AGENT_SPAWNED)
+
+    (rollup,) = rollups(memory)
+    assert rollup["events"] == 2
+    assert rollup["by_type"] == {"task_started": 2}
+    assert rollup["period_start"] <= rollup["period_end"]
+    assert EventType.TASK_STARTED in memory._events_by_type
+    assert len(memory.get_events(EventType.TASK_STARTED)) == 6
+
+
+def test_age_retention_drops_old_events_on_load(tmp_path, open_memory):
+    now = datetime.now(timezone.utc)
+    events = [
+        {"event_type": "task_started", "timestamp": (now - timedelta(days=days)).isoformat(),
+         "task_id": "task-1", "task_title": None, "details": {"age": days}}
+        for days in (10, 5, 0)
+    ]
+    (tmp_path / "events.json").write_text(json.dumps(events))
+
+    memory = open_memory(event_retention_days=7)
+
+    assert [e.details["age"] for e in memory.get_events()] == [0, 5]
+    (rollup,) = rollups(memory)
+    assert rollup["events"] == 1
+    assert rollup["by_type"] == {"task_started": 1}
+
+
+def test_retention_persists_across_reload(open_memory):
+    memory = open_memory(max_events=10)
+    for n in range(12):
+        memory.record_event(EventType.TASK_STARTED, step=n)
+    memory.close()
+
+    reloaded = open_memory()
+    assert [e.details["step"] for e in reloaded.get_events()] == list(range(11, 1, -1))
+    assert len(rollups(reloaded)) == 1
+
+
+# ========== Task histories ==========
+
+def test_expired_events_dropped_from_task_history(open_memory):
+    memory = open_memory(max_events=10)
+    memory.create_task_history("task-1", "One")
+    for n in range(6):
+        memory.record_event(EventType.TASK_MONITORED, task_id="task-1", step=n)
+        memory.record_event(EventType.TASK_MONITORED, task_id="task-2", step=n)
+
+    history = memory.get_task_history("task-1")
+    assert [e.details["step"] for e in history.events] == [1, 2, 3, 4, 5]
+    memory.close()
+
+    reloaded = open_memory()
+    history = reloaded.get_task_history("task-1")
+    assert [e.details["step"] for e in history.events] == [1, 2, 3, 4, 5]
+
+
+def test_recreated_history_starts_empty_after_reload(open_memory):
+    memory = open_memory()
+    memory.create_task_history("task-1", "One")
+    memory.record_event(EventType.TASK_STARTED, task_id="task-1")
+    memory.create_task_history("task-1", "One again")
+    assert memory.get_task_history("task-1").events == []
+    memory.close()
+
+    reloaded = open_memory()
+    history = reloaded.get_task_history("task-1")
+    assert history.title == "One again"
+    assert history.events == []
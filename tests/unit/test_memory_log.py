@@ -0,0 +1,161 @@
+#!/usr/bin/env python3
+"""
+Tests for the ManagementMemory append-only log
+
+Covers segment rotation, synchronous and background compaction, replay of
+the log tail after a crash, and migration of legacy per-collection files.
+"""
+
+import json
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from agents.definitions.managerial.memory.memory_log import MemoryLog, empty_state
+
+
+def event(n, task_id=None):
+    return {"event_type": "task_created", "timestamp": f"2026-01-01T00:00:{n:02d}", "task_id": task_id}
+
+
+def open_log(path, **kwargs):
+    kwargs.setdefault("background", False)
+    log = MemoryLog(path, **kwargs)
+    return log, log.load()
+
+
+def wait_for(condition, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        if time.monotonic() > deadline:
+            return False
+        time.sleep(0.01)
+    return True
+
+
+# ========== Rotation and compaction ==========
+
+def test_empty_directory_loads_empty_state(tmp_path):
+    log, state = open_log(tmp_path)
+    log.close()
+
+    assert state == empty_state()
+
+
+def test_segments_rotate_and_fold_into_snapshot(tmp_path):
+    log, _ = open_log(tmp_path, segment_max_bytes=200)
+    for n in range(20):
+        log.append("event", v=event(n))
+
+    # Each full segment was compacted synchronously; only the live one remains
+    assert len(log._segments()) == 1
+    snapshot = json.loads(log.snapshot_file.read_text())
+    assert snapshot["next_segment"] == log._segment
+    assert 0 < len(snapshot["state"]["events"]) <= 20
+    log.close()
+
+    reopened, state = open_log(tmp_path)
+    reopened.close()
+    assert [e["timestamp"] for e in state["events"]] == [event(n)["timestamp"] for n in range(20)]
+
+
+def test_background_compaction_deletes_closed_segments(tmp_path):
+    log, _ = open_log(tmp_path, segment_max_bytes=200, background=True)
+    for n in range(20):
+        log.append("event", v=event(n))
+
+    assert wait_for(lambda: log._segments() == [log._segment] and log.pending_records == 0)
+    log.close()
+
+    reopened, state = open_log(tmp_path)
+    reopened.close()
+    assert len(state["events"]) == 20
+
+
+def test_close_with_compact_leaves_only_snapshot(tmp_path):
+    log, _ = open_log(tmp_path)
+    log.append("merge", k="task-1", v={"status": "merged"})
+    log.close(compact=True)
+
+    # Only the fresh, empty live segment is left
+    assert [p.stat().st_size for p in (tmp_path / "log").glob("*.jsonl")] == [0]
+    snapshot = json.loads((tmp_path / "snapshot.json").read_text())
+    assert snapshot["state"]["merge_decisions"] == {"task-1": {"status": "merged"}}
+
+
+# ========== Crash recovery ==========
+
+def test_replays_tail_after_crash(tmp_path):
+    log, _ = open_log(tmp_path)
+    log.append("history", k="task-1", v={"task_id": "task-1", "title": "One"})
+    log.append("event", v=event(1, "task-1"))
+    log.append("dep_add", k="task-2", v="task-1")
+    # Crash: no close, no compaction, and a torn final write
+    with open(log._segment_path(log._segment), "a") as f:
+        f.write('{"op":"event","v":{"event_t')
+
+    reopened, state = open_log(tmp_path)
+    reopened.close()
+
+    assert len(state["events"]) == 1
+    assert state["task_histories"]["task-1"]["events"] == [event(1, "task-1")]
+    assert state["dependency_graph"]["dependencies"] == {"task-2": ["task-1"]}
+    # The replayed tail was folded into the snapshot on load
+    assert json.loads((tmp_path / "snapshot.json").read_text())["state"]["events"] == [event(1, "task-1")]
+
+
+def test_interrupted_compaction_does_not_replay_twice(tmp_path):
+    log, _ = open_log(tmp_path)
+    log.append("event", v=event(1))
+    folded = log._segment
+    leftover = log._segment_path(folded).read_text()
+    log.close(compact=True)
+
+    # Crash between writing the snapshot and deleting the folded segment
+    log._segment_path(folded).write_text(leftover)
+
+    reopened, state = open_log(tmp_path)
+    reopened.close()
+
+    assert len(state["events"]) == 1
+    assert not log._segment_path(folded).exists()
+
+
+# ========== Legacy migration ==========
+
+def test_migrates_legacy_files(tmp_path):
+    (tmp_path / "events.json").write_text(json.dumps([event(1), event(2)]))
+    (tmp_path / "merge_decisions.json").write_text(json.dumps({"task-1": {"status": "merged"}}))
+
+    log, state = open_log(tmp_path)
+    assert len(state["events"]) == 2
+    assert state["merge_decisions"] == {"task-1": {"status": "merged"}}
+    assert state["task_histories"] == {}
+
+    log.append("event", v=event(3))
+    log.close(compact=True)
+
+    # Once a snapshot exists the legacy files are no longer read
+    (tmp_path / "events.json").write_text(json.dumps([]))
+    reopened, state = open_log(tmp_path)
+    reopened.close()
+    assert [e["timestamp"] for e in state["events"]] == [event(n)["timestamp"] for n in (1, 2, 3)]
+
+
+def test_expire_and_clear_records(tmp_path):
+    log, _ = open_log(tmp_path)
+    for n in range(5):
+        log.append("event", v=event(n))
+    log.append("expire", v=3)
+    log.close()
+
+    reopened, state = open_log(tmp_path)
+    assert [e["timestamp"] for e in state["events"]] == [event(n)["timestamp"] for n in (3, 4)]
+    reopened.append("clear")
+    reopened.close()
+
+    final, state = open_log(tmp_path)
+    final.close()
+    assert state == empty_state()
@@ -0,0 +1,178 @@
+#!/usr/bin/env python3
+"""
+Tests for the batched OutputLogWriter
+
+Covers batching by size and interval, flush, close, inline writes when
+the writer is not running, failed batches and the read-connection pool.
+"""
+
+import sqlite3
+import sys
+import threading
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2] / "interface"))
+
+from AgentOutputBus import OutputLogWriter
+
+
+class Recorder:
+    """apply_batch callback that inserts items and remembers batch sizes."""
+
+    def __init__(self, fail_on=None):
+        self.batches = []
+        self.fail_on = fail_on
+
+    def __call__(self, conn, items):
+        self.batches.append(len(items))
+        if self.fail_on is not None and self.fail_on in items:
+            raise RuntimeError("bad item")
+        conn.executemany("INSERT INTO items (value) VALUES (?)", [(i,) for i in items])
+
+
+@pytest.fixture
+def db_path(tmp_path):
+    path = tmp_path / "outputs.db"
+    conn = sqlite3.connect(path)
+    conn.execute("CREATE TABLE items (value INTEGER)")
+    conn.commit()
+    conn.close()
+    return path
+
+
+def stored(db_path):
+    conn = sqlite3.connect(db_path)
+    try:
+        return [row[0] for row in conn.execute("SELECT value FROM items ORDER BY rowid")]
+    finally:
+        conn.close()
+
+
+def make_writer(db_path, recorder, **kwargs):
+    kwargs.setdefault("flush_interval_ms", 60000)
+    writer = OutputLogWriter(db_path, recorder, **kwargs)
+    writer.start()
+    return writer
+
+
+def test_items_wait_for_flush_and_commit_as_one_batch(db_path):
+    recorder = Recorder()
+    writer = make_writer(db_path, recorder, max_batch=100)
+    try:
+        for n in range(10):
+            writer.submit(n)
+        assert writer.stats == {"submitted": 10, "committed": 0, "pending": 10}
+        assert stored(db_path) == []
+
+        assert writer.flush(timeout=5)
+        assert stored(db_path) == list(range(10))
+        assert recorder.batches == [10]
+        assert writer.stats == {"submitted": 10, "committed": 10, "pending": 0}
+    finally:
+        writer.close()
+
+
+def test_full_batch_commits_without_flush(db_path):
+    recorder = Recorder()
+    writer = make_writer(db_path, recorder, max_batch=5)
+    try:
+        for n in range(5):
+            writer.submit(n)
+        with writer._cond:
+            assert writer._cond.wait_for(lambda: writer._committed == 5, 5)
+        assert stored(db_path) == list(range(5))
+    finally:
+        writer.close()
+
+
+def test_flush_interval_commits_partial_batch(db_path):
+    writer = make_writer(db_path, Recorder(), flush_interval_ms=10, max_batch=100)
+    try:
+        writer.submit(1)
+        with writer._cond:
+            assert writer._cond.wait_for(lambda: writer._committed == 1, 5)
+        assert stored(db_path) == [1]
+    finally:
+        writer.close()
+
+
+def test_close_flushes_pending_items(db_path):
+    writer = make_writer(db_path, Recorder(), max_batch=100)
+    for n in range(3):
+        writer.submit(n)
+    writer.close()
+
+    assert stored(db_path) == [0, 1, 2]
+    assert writer._conn is None
+    writer.close()  # idempotent
+
+
+def test_not_started_writes_inline(db_path):
+    recorder = Recorder()
+    writer = OutputLogWriter(db_path, recorder)
+
+    writer.submit(7)
+    assert writer.flush() is True
+    assert stored(db_path) == [7]
+    assert writer.stats["submitted"] == 0
+
+    # After close the writer falls back to inline writes too
+    writer.start()
+    writer.close()
+    writer.submit(8)
+    assert stored(db_path) == [7, 8]
+
+
+def test_failed_batch_is_logged_and_does_not_block(db_path, caplog):
+    recorder = Recorder(fail_on=2)
+    writer = make_writer(db_path, recorder, max_batch=100)
+    try:
+        for n in range(3):
+            writer.submit(n)
+        assert writer.flush(timeout=5)
+        # The failed batch was rolled back as a whole
+        assert stored(db_path) == []
+        assert "Batch write of 3 items failed" in caplog.text
+
+        writer.submit(5)
+        assert writer.flush(timeout=5)
+        assert stored(db_path) == [5]
+    finally:
+        writer.close()
+
+
+def test_execute_write_runs_after_pending_items(db_path):
+    writer = make_writer(db_path, Recorder(), max_batch=100)
+    try:
+        writer.submit(1)
+        count = writer.execute_write(lambda conn: conn.execute("SELECT COUNT(*) FROM items").fetchone()[0])
+        assert count == 1
+    finally:
+        writer.close()
+
+
+def test_reader_pool_is_bounded_and_reused(db_path):
+    writer = make_writer(db_path, Recorder(), read_pool_size=2)
+    try:
+        with writer.reader() as first, writer.reader() as second:
+            assert first is not second
+            borrowed = threading.Event()
+            got = []
+
+            def third():
+                with writer.reader() as conn:
+                    got.append(conn)
+                borrowed.set()
+
+            thread = threading.Thread(target=third)
+            thread.start()
+            # The pool is exhausted, so the third reader waits
+            assert not borrowed.wait(0.1)
+        thread.join(timeout=5)
+        assert got[0] in (first, second)
+        assert writer._reader_count == 2
+    finally:
+        writer.close()
+    assert writer._reader_count == 0
@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""
+Tests for the tiered skill cache
+
+Covers sharing one cache directory between processes (modelled as separate
+SkillCache instances) and SkillManager.get_skill_body freshness.
+"""
+
+import sys
+import tempfile
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from agents.framework.skill_cache import SkillCache
+from agents.framework.skill_manager import AgentSkill, SkillManager
+
+SKILL_MD = """---
+name: demo
+description: Demo skill
+---
+
+{body}
+"""
+
+
+@pytest.fixture
+def cache_dir():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        yield Path(tmpdir)
+
+
+def test_flush_keeps_other_processes_entries(cache_dir):
+    first = SkillCache(cache_dir)
+    second = SkillCache(cache_dir)
+
+    first.put("skill:a", "alpha")
+    second.put("skill:b", "beta")
+
+    fresh = SkillCache(cache_dir)
+    assert fresh.get("skill:a") == "alpha"
+    assert fresh.get("skill:b") == "beta"
+
+
+def test_shared_blob_survives_other_key_removal(cache_dir):
+    first = SkillCache(cache_dir)
+    second = SkillCache(cache_dir)
+
+    first.put("skill:a", "same body")
+    second.put("skill:b", "same body")
+    first.invalidate("skill:a")
+
+    fresh = SkillCache(cache_dir)
+    assert fresh.get("skill:a") is None
+    assert fresh.get("skill:b") == "same body"
+    assert second.get("skill:b") == "same body"
+
+
+def test_unreferenced_blob_is_deleted(cache_dir):
+    cache = SkillCache(cache_dir)
+    digest = cache.put("skill:a", "body")
+    assert cache._blob_path(digest).exists()
+
+    cache.invalidate("skill:a")
+    assert not cache._blob_path(digest).exists()
+
+
+def test_removal_does_not_drop_newer_version(cache_dir):
+    first = SkillCache(cache_dir)
+    first.put("skill:a", "v1")
+    second = SkillCache(cache_dir)
+
+    second.put("skill:a", "v2")
+    first.invalidate("skill:a")
+
+    assert SkillCache(cache_dir).get("skill:a") == "v2"
+
+
+def test_fingerprint_mismatch_is_a_miss(cache_dir):
+    cache = SkillCache(cache_dir)
+    cache.put("skill:a", "v1", fingerprint=[1, 2])
+    assert cache.get("skill:a", fingerprint=[1, 2]) == "v1"
+    assert cache.get("skill:a", fingerprint=[1, 3]) is None
+
+
+def test_skill_body_follows_file_edits(cache_dir):
+    skill_file = cache_dir / "demo" / "SKILL.md"
+    skill_file.parent.mkdir()
+    skill_file.write_text(SKILL_MD.format(body="version one"))
+
+    manager = SkillManager(skills_path=cache_dir / "tier1")
+    manager._cache_manager = SkillCache(cache_dir / "cache")
+    manager._index_tier2_skill(AgentSkill.from_markdown(skill_file))
+    assert manager.get_skill_body("demo") == "version one"
+
+    # Edited after the skill was loaded: the body must come from the file
+    skill_file.write_text(SKILL_MD.format(body="version two, longer"))
+    assert manager.get_skill_body("demo") == "version two, longer"
+
+    other = SkillManager(skills_path=cache_dir / "tier1")
+    other._cache_manager = SkillCache(cache_dir / "cache")
+    other._index_tier2_skill(AgentSkill.from_markdown(skill_file))
+    assert other.get_skill_body("demo") == "version two, longer"
@@ -0,0 +1,218 @@
+#!/usr/bin/env python3
+"""
+Tests for skill search and the SkillManager indexes
+
+Covers BM25Index ranking and incremental maintenance, the category, tag
+and search indexes kept by SkillManager across add, remove and reload,
+and the shared manager returned by get_skill_manager().
+"""
+
+import asyncio
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from agents.framework import definition_cache, skill_manager
+from agents.framework.skill_manager import Skill, SkillManager, get_skill_manager
+from agents.framework.skill_search import BM25Index, tokenize
+
+DOCS = {
+    "git-commit": "git commit Write conventional commit messages",
+    "git-rebase": "git rebase Rewrite branch history interactively",
+    "pytest": "pytest Run python tests with fixtures",
+    "docs": "docs Write documentation pages for python packages and the git workflow",
+    "deploy": "deploy Ship containers to production",
+}
+
+SKILL_MD = """---
+name: {name}
+description: {description}
+tags: [{tags}]
+---
+
+Body
+"""
+
+
+def build(docs):
+    index = BM25Index()
+    for doc_id, text in docs.items():
+        index.add(doc_id, text)
+    return index
+
+
+def ids(results):
+    return [doc_id for doc_id, _ in results]
+
+
+# ========== BM25 ranking ==========
+
+def test_tokenize_lowercases_and_splits():
+    assert tokenize("Git-Commit: v2 MSGs!") == ["git", "commit", "v2", "msgs"]
+
+
+def test_repeated_term_ranks_first():
+    assert ids(build(DOCS).search("commit")) == ["git-commit"]
+
+
+def test_rare_terms_outweigh_common_ones():
+    results = build(DOCS).search("git fixtures")
+    # "fixtures" appears once in the corpus, "git" three times
+    assert ids(results)[0] == "pytest"
+    assert set(ids(results)) == {"pytest", "git-commit", "git-rebase", "docs"}
+
+
+def test_shorter_document_ranks_higher_for_same_term_frequency():
+    index = build({"short": "python", "long": "python with many other unrelated words here"})
+    (first, first_score), (second, second_score) = index.search("python")
+    assert (first, second) == ("short", "long")
+    assert first_score > second_score
+
+
+def test_partial_words_expand_by_prefix():
+    index = build(DOCS)
+    assert ids(index.search("rebas")) == ["git-rebase"]
+    assert set(ids(index.search("doc"))) == {"docs"}
+    assert index.search("zzz") == []
+
+
+def test_prefix_expansion_is_bounded():
+    index = BM25Index(max_expansions=2)
+    for n in range(5):
+        index.add(f"d{n}", f"term{n}")
+    assert ids(index.search("term")) == ["d0", "d1"]
+
+
+def test_ties_break_by_id_and_limit_applies():
+    index = build({"b": "same words", "a": "same words", "c": "same words"})
+    assert ids(index.search("same")) == ["a", "b", "c"]
+    assert ids(index.search("same", limit=2)) == ["a", "b"]
+    assert BM25Index().search("anything") == []
+
+
+# ========== BM25 maintenance ==========
+
+def test_incremental_updates_match_a_rebuild():
+    index = build(DOCS)
+    index.remove("pytest")
+    index.add("docs", "docs Write reference documentation")
+    index.add("lint", "lint Check python style")
+
+    expected = dict(DOCS, docs="docs Write reference documentation", lint="lint Check python style")
+    del expected["pytest"]
+    rebuilt = build(expected)
+
+    assert len(index) == len(rebuilt) == 5
+    for query in ("git", "python", "write docs", "deplo", "fixtures"):
+        assert ids(index.search(query)) == ids(rebuilt.search(query))
+        for (_, got), (_, want) in zip(index.search(query), rebuilt.search(query)):
+            assert got == pytest.approx(want)
+
+
+def test_remove_drops_unused_terms():
+    index = build(DOCS)
+    assert index.remove("pytest") is True
+    assert index.remove("pytest") is False
+
+    assert "pytest" not in index
+    assert "fixtures" not in index._vocabulary
+    assert index.search("fixt") == []
+    assert index._total_len == sum(len(tokenize(t)) for k, t in DOCS.items() if k != "pytest")
+
+
+# ========== SkillManager indexes ==========
+
+@pytest.fixture
+def manager(tmp_path, monkeypatch):
+    monkeypatch.setattr(definition_cache, "DEFAULT_CACHE_DIR", tmp_path / "cache")
+    (tmp_path / "tier1").mkdir()
+    (tmp_path / "tier2").mkdir()
+    manager = SkillManager(skills_path=tmp_path / "tier1")
+    manager.set_tier2_path(tmp_path / "tier2")
+    return manager
+
+
+def write_tier1(manager, name, description, category="general", capabilities=()):
+    (manager.skills_path / f"{name}.json").write_text(json.dumps({
+        "name": name, "description": description,
+        "category": category, "capabilities": list(capabilities)
+    }))
+
+
+def write_tier2(manager, name, description, tags):
+    path = manager._tier2_skills_path / name / "SKILL.md"
+    path.parent.mkdir(exist_ok=True)
+    path.write_text(SKILL_MD.format(name=name, description=description, tags=", ".join(tags)))
+
+
+def names(skills):
+    return [skill.name for skill in skills]
+
+
+def test_loaded_skills_are_searchable_across_tiers(manager):
+    write_tier1(manager, "deploy", "Ship containers to production", category="ops")
+    write_tier2(manager, "git-commit", "Write conventional commit messages", ["git", "vcs"])
+    asyncio.run(manager.load_all())
+
+    assert names(manager.search_skills("containers")) == ["deploy"]
+    assert names(manager.search_skills("commi")) == ["git-commit"]
+    assert names(manager.search_skills_by_tag("vcs")) == ["git-commit"]
+    assert names(manager.get_skills_by_category("ops")) == ["deploy"]
+    assert manager.list_categories() == ["ops"]
+
+
+def test_register_and_unregister_maintain_indexes(manager):
+    manager.register_skill(Skill("lint", "Check python style", "quality", capabilities=["ruff"]))
+    manager.register_skill(Skill("format", "Format python code", "quality"))
+    assert manager.map_skill_to_agent("lint", "reviewer")
+    assert names(manager.get_skills_for_agent("reviewer")) == ["lint"]
+    assert names(manager.search_skills("ruff")) == ["lint"]
+
+    # Re-registering under another category moves the skill
+    manager.register_skill(Skill("lint", "Check python style", "style"))
+    assert names(manager.get_skills_by_category("quality")) == ["format"]
+    assert names(manager.get_skills_by_category("style")) == ["lint"]
+    assert manager.search_skills("ruff") == []
+
+    assert manager.unregister_skill("lint") is True
+    assert manager.unregister_skill("lint") is False
+    assert manager.search_skills("style") == []
+    assert manager.list_categories() == ["quality"]
+    assert manager.get_skills_for_agent("reviewer") == []
+    assert names(manager.get_skills_for_agent("anyone")) == ["format"]
+
+
+def test_reload_replaces_edited_skills(manager):
+    write_tier1(manager, "deploy", "Ship containers", category="ops")
+    write_tier2(manager, "git-commit", "Write commit messages", ["git"])
+    asyncio.run(manager.load_all())
+    before = manager.get_skills_for_agent("anyone")
+
+    write_tier1(manager, "deploy", "Roll out serverless functions", category="cloud")
+    write_tier2(manager, "git-commit", "Write commit messages", ["vcs"])
+    asyncio.run(manager.load_all())
+
+    assert manager.search_skills("containers") == []
+    assert names(manager.search_skills("serverless")) == ["deploy"]
+    assert manager.list_categories() == ["cloud"]
+    assert manager.search_skills_by_tag("git") == []
+    assert names(manager.search_skills_by_tag("vcs")) == ["git-commit"]
+    assert len(manager._search_index) == 2
+    # Resolved skill lists are rebuilt after a reload
+    after = manager.get_skills_for_agent("anyone")
+    assert names(after) == names(before)
+    assert after[0].description == "Roll out serverless functions"
+
+
+# ========== Shared manager ==========
+
+def test_get_skill_manager_returns_one_shared_instance(monkeypatch):
+    monkeypatch.setattr(skill_manager, "_skill_manager", None)
+
+    first = get_skill_manager()
+    assert isinstance(first, SkillManager)
+    assert get_skill_manager() is first
@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+"""
+Tests for TaskRegistry indexes and the task stores
+
+Covers priority heaps, claim_next, direct edits of registered tasks and the
+JSON and SQLite backends.
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from agents.framework.task_schema import Task, TaskRegistry, TaskState
+from agents.framework.stores.json_store import JSONTaskStore
+from agents.framework.stores.sqlite_store import SQLiteTaskStore
+
+
+@pytest.fixture(params=["json", "sqlite"])
+def registry(request, tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    return TaskRegistry(backend=request.param)
+
+
+def pending(registry, title, priority=5, task_type="development"):
+    return registry.create(title=title, priority=priority, type=task_type, state=TaskState.PENDING)
+
+
+def test_available_by_priority_then_age(registry):
+    pending(registry, "low", priority=2)
+    pending(registry, "high-old", priority=8)
+    pending(registry, "high-new", priority=8)
+    pending(registry, "other", priority=9, task_type="testing")
+
+    titles = [t.title for t in registry.get_available("agent-1", ["development"])]
+    assert titles == ["high-old", "high-new", "low"]
+    assert [t.title for t in registry.get_available("agent-1", ["development", "testing"], limit=2)] == [
+        "other", "high-old"
+    ]
+
+
+def test_claim_next_assigns_best_task(registry):
+    pending(registry, "low", priority=1)
+    pending(registry, "high", priority=9)
+
+    claimed = registry.claim_next("agent-1", ["development"])
+    assert claimed.title == "high"
+    assert claimed.state == TaskState.ASSIGNED
+    assert claimed.assignee == "agent-1"
+    assert [t.title for t in registry.get_available("agent-1", ["development"])] == ["low"]
+    assert registry.claim_next("agent-1", ["development"]).title == "low"
+    assert registry.claim_next("agent-1", ["development"]) is None
+
+
+def test_direct_priority_edit_is_reindexed(registry):
+    task = pending(registry, "bumped", priority=1)
+    pending(registry, "other", priority=5)
+
+    task.priority = 9
+    assert [t.title for t in registry.get_available("agent-1", ["development"])] == ["bumped", "other"]
+
+
+def test_direct_state_and_type_edits_are_reindexed(registry):
+    task = registry.create(title="later", type="development")
+    assert registry.get_available("agent-1", ["development"]) == []
+
+    task.state = TaskState.PENDING
+    assert registry.get_available("agent-1", ["development"]) == [task]
+    assert registry.get_by_state(TaskState.PENDING) == [task]
+
+    task.type = "testing"
+    assert registry.get_available("agent-1", ["development"]) == []
+    assert registry.get_available("agent-1", ["testing"]) == [task]
+
+
+def test_deleted_task_is_not_available(registry):
+    task = pending(registry, "gone")
+    registry.delete(task.id)
+    assert registry.get_available("agent-1", ["development"]) == []
+    assert registry.get(task.id) is None
+
+
+def test_stale_heap_entries_are_compacted(registry):
+    task = pending(registry, "churn")
+    for priority in range(200):
+        task.priority = priority % 10 + 1
+    heap = registry._pending_heaps["development"]
+    assert len(heap) < 200
+    assert registry.get_available("agent-1", ["development"]) == [task]
+
+
+def test_registry_reloads_from_store(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    first = TaskRegistry(backend="sqlite")
+    task = pending(first, "persisted", priority=7)
+
+    second = TaskRegistry(backend="sqlite")
+    assert [t.id for t in second.get_available("agent-2", ["development"])] == [task.id]
+
+
+@pytest.mark.parametrize("store_class, location", [
+    (JSONTaskStore, "tasks"),
+    (SQLiteTaskStore, "tasks.db"),
+])
+def test_store_round_trip(tmp_path, store_class, location):
+    store = store_class(tmp_path / location)
+    task = Task(title="stored", priority=4, type="testing", state=TaskState.PENDING, tags=["a"])
+    store.save(task)
+
+    loaded = store.load(task.id)
+    assert (loaded.title, loaded.priority, loaded.type, loaded.state, loaded.tags) == (
+        "stored", 4, "testing", TaskState.PENDING, ["a"]
+    )
+    assert [t.id for t in store.load_all()] == [task.id]
+
+    task.title = "renamed"
+    store.save(task)
+    assert store.load(task.id).title == "renamed"
+    assert len(store.load_all()) == 1
+
+    store.delete(task.id)
+    assert store.load(task.id) is None
+    assert store.load_all() == []
+
+
+def test_sqlite_load_available(tmp_path):
+    store = SQLiteTaskStore(tmp_path / "tasks.db")
+    for title, priority, task_type, state in [
+        ("a", 3, "development", TaskState.PENDING),
+        ("b", 8, "development", TaskState.PENDING),
+        ("c", 9, "development", TaskState.DONE),
+        ("d", 5, "testing", TaskState.PENDING),
+    ]:
+        store.save(Task(title=title, priority=priority, type=task_type, state=state))
+
+    assert [t.title for t in store.load_available(["development"])] == ["b", "a"]
+    assert [t.title for t in store.load_available(["development", "testing"], limit=2)] == ["b", "d"]
+    store.close()